@@ -0,0 +1,42 @@
+"""Add partial indexes for the upload reaper.
+
+Revision ID: 012_add_upload_reaper_indexes
+Revises: 011_expand_tag_color
+Create Date: 2026-10-19
+
+Adds:
+- idx_uploads_reapable: terminal uploads (EXPIRED/FAILED/DELETED) by updated_at
+- idx_attachments_deleted: soft-deleted attachments by deleted_at
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '012_add_upload_reaper_indexes'
+down_revision: Union[str, None] = '011_expand_tag_color'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_uploads_reapable',
+        'uploads',
+        ['updated_at'],
+        unique=False,
+        postgresql_where="status IN ('EXPIRED', 'FAILED', 'DELETED')",
+    )
+    op.create_index(
+        'idx_attachments_deleted',
+        'item_attachments',
+        ['deleted_at'],
+        unique=False,
+        postgresql_where='deleted_at IS NOT NULL',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_attachments_deleted', table_name='item_attachments')
+    op.drop_index('idx_uploads_reapable', table_name='uploads')
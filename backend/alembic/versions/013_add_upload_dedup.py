@@ -0,0 +1,44 @@
+"""Allow uploads to share stored objects for checksum-based dedup.
+
+Revision ID: 013_add_upload_dedup
+Revises: 012_add_upload_reaper_indexes
+Create Date: 2026-10-19
+
+Changes:
+- uploads.object_key is no longer unique (deduplicated uploads reuse the key)
+- idx_uploads_object_key: reference lookup used by the reaper
+- idx_uploads_checksum: completed uploads by (user_id, checksum, size_bytes)
+- uploads.dedup_source_id: upload whose stored object is reused
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '013_add_upload_dedup'
+down_revision: Union[str, None] = '012_add_upload_reaper_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('uploads', sa.Column('dedup_source_id', sa.String(length=36), nullable=True))
+    op.drop_constraint('uploads_object_key_key', 'uploads', type_='unique')
+    op.create_index('idx_uploads_object_key', 'uploads', ['object_key'], unique=False)
+    op.create_index(
+        'idx_uploads_checksum',
+        'uploads',
+        ['user_id', 'checksum', 'size_bytes'],
+        unique=False,
+        postgresql_where="status = 'COMPLETED' AND deleted_at IS NULL AND checksum IS NOT NULL",
+    )
+
+
+def downgrade() -> None:
+    # Fails if deduplicated uploads still share keys; purge them first
+    op.drop_index('idx_uploads_checksum', table_name='uploads')
+    op.drop_index('idx_uploads_object_key', table_name='uploads')
+    op.create_unique_constraint('uploads_object_key_key', 'uploads', ['object_key'])
+    op.drop_column('uploads', 'dedup_source_id')
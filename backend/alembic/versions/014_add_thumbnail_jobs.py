@@ -0,0 +1,41 @@
+"""Add thumbnail derivative support.
+
+Revision ID: 014_add_thumbnail_jobs
+Revises: 013_add_upload_dedup
+Create Date: 2026-10-19
+
+Adds:
+- uploads.thumb_key: derived thumbnail object for image uploads
+- enrichment_outbox.upload_id: target upload for job_type='thumbnail'
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '014_add_thumbnail_jobs'
+down_revision: Union[str, None] = '013_add_upload_dedup'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('uploads', sa.Column('thumb_key', sa.String(length=500), nullable=True))
+    op.add_column('enrichment_outbox', sa.Column('upload_id', sa.String(length=36), nullable=True))
+    op.create_foreign_key(
+        'fk_enrichment_outbox_upload_id',
+        'enrichment_outbox',
+        'uploads',
+        ['upload_id'],
+        ['id'],
+        ondelete='CASCADE',
+    )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM enrichment_outbox WHERE job_type = 'thumbnail'")
+    op.drop_constraint('fk_enrichment_outbox_upload_id', 'enrichment_outbox', type_='foreignkey')
+    op.drop_column('enrichment_outbox', 'upload_id')
+    op.drop_column('uploads', 'thumb_key')
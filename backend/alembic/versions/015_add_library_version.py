@@ -0,0 +1,32 @@
+"""Add per-user library version counter.
+
+Revision ID: 015_add_library_version
+Revises: 014_add_thumbnail_jobs
+Create Date: 2026-10-19
+
+Adds:
+- users.library_version: bumped whenever the user's library changes;
+  drives library ETags and page cache keys
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '015_add_library_version'
+down_revision: Union[str, None] = '014_add_thumbnail_jobs'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'users',
+        sa.Column('library_version', sa.BigInteger(), nullable=False, server_default='0'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'library_version')
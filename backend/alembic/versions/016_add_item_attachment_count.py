@@ -0,0 +1,45 @@
+"""Add denormalized attachment count to items.
+
+Revision ID: 016_add_item_attachment_count
+Revises: 015_add_library_version
+Create Date: 2026-10-19
+
+Adds:
+- items.attachment_count: live (non-deleted) attachments, maintained by
+  the attachment repository; backfilled here from item_attachments
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '016_add_item_attachment_count'
+down_revision: Union[str, None] = '015_add_library_version'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'items',
+        sa.Column('attachment_count', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.execute(
+        """
+        UPDATE items
+        SET attachment_count = counts.n
+        FROM (
+            SELECT item_id, COUNT(*) AS n
+            FROM item_attachments
+            WHERE deleted_at IS NULL
+            GROUP BY item_id
+        ) AS counts
+        WHERE items.id = counts.item_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('items', 'attachment_count')
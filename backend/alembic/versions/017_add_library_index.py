@@ -0,0 +1,46 @@
+"""Replace the archived-items index with a keyset-ordered library index.
+
+Revision ID: 017_add_library_index
+Revises: 016_add_item_attachment_count
+Create Date: 2026-10-19
+
+Adds:
+- idx_items_library: (user_id, confirmed_at DESC, id DESC) for ARCHIVED
+  items, matching library/search keyset order including the id tiebreaker
+
+Drops:
+- idx_items_user_archived: (user_id, confirmed_at) prefix of the above
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '017_add_library_index'
+down_revision: Union[str, None] = '016_add_item_attachment_count'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_items_library',
+        'items',
+        ['user_id', sa.text('confirmed_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where="status = 'ARCHIVED'",
+    )
+    op.drop_index('idx_items_user_archived', table_name='items')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'idx_items_user_archived',
+        'items',
+        ['user_id', 'confirmed_at'],
+        unique=False,
+        postgresql_where="status = 'ARCHIVED'",
+    )
+    op.drop_index('idx_items_library', table_name='items')
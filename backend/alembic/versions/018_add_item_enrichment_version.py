@@ -0,0 +1,34 @@
+"""Record which model and prompt enriched each item.
+
+Revision ID: 018_add_item_enrichment_version
+Revises: 017_add_library_index
+Create Date: 2026-10-19
+
+Adds:
+- items.enrichment_version: "<model>#<system prompt digest>" of the last
+  enrichment, set by the worker; NULL for items enriched before this
+  revision. The re-enrichment backfill selects items by it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '018_add_item_enrichment_version'
+down_revision: Union[str, None] = '017_add_library_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'items',
+        sa.Column('enrichment_version', sa.String(length=150), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM enrichment_outbox WHERE job_type = 'reenrichment'")
+    op.drop_column('items', 'enrichment_version')
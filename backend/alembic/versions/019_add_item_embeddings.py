@@ -0,0 +1,87 @@
+"""Add item embeddings for semantic search (pgvector).
+
+Revision ID: 019_add_item_embeddings
+Revises: 018_add_item_enrichment_version
+Create Date: 2026-10-19
+
+Requires the pgvector extension (0.8+) to be available on the server
+(docker-compose uses the pgvector/pgvector image).
+
+Adds:
+- vector extension
+- item_embeddings: one 256-dimension title+summary vector per ARCHIVED
+  item, written by the worker's 'embedding' outbox jobs
+- ix_item_embeddings_user_id
+- idx_item_embeddings_hnsw: HNSW index for cosine distance
+- Database defaults hnsw.ef_search = 100 and hnsw.iterative_scan =
+  relaxed_order, so per-user filtered nearest-neighbour queries keep
+  scanning the index until they have enough of that user's rows. Set as
+  defaults because read sessions autocommit (SET LOCAL would not reach
+  the query); they apply to new connections.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '019_add_item_embeddings'
+down_revision: Union[str, None] = '018_add_item_enrichment_version'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+    op.create_table(
+        'item_embeddings',
+        sa.Column('item_id', sa.String(length=36), nullable=False),
+        sa.Column('user_id', sa.String(length=36), nullable=False),
+        sa.Column('model', sa.String(length=150), nullable=False),
+        sa.Column('content_hash', sa.String(length=64), nullable=False),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(['item_id'], ['items.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('item_id'),
+    )
+    # pgvector type; kept out of create_table to avoid importing the app's Vector type
+    op.execute("ALTER TABLE item_embeddings ADD COLUMN embedding vector(256) NOT NULL")
+    op.create_index('ix_item_embeddings_user_id', 'item_embeddings', ['user_id'])
+    op.execute(
+        "CREATE INDEX idx_item_embeddings_hnsw ON item_embeddings "
+        "USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64)"
+    )
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            EXECUTE format(
+                'ALTER DATABASE %I SET hnsw.ef_search = 100', current_database()
+            );
+            EXECUTE format(
+                'ALTER DATABASE %I SET hnsw.iterative_scan = relaxed_order', current_database()
+            );
+        END $$
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            EXECUTE format('ALTER DATABASE %I RESET hnsw.ef_search', current_database());
+            EXECUTE format('ALTER DATABASE %I RESET hnsw.iterative_scan', current_database());
+        END $$
+        """
+    )
+    op.execute("DELETE FROM enrichment_outbox WHERE job_type = 'embedding'")
+    op.drop_table('item_embeddings')
+    # Note: the vector extension is left installed
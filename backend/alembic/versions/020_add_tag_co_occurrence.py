@@ -0,0 +1,55 @@
+"""Add the tag co-occurrence matrix.
+
+Revision ID: 020_add_tag_co_occurrence
+Revises: 019_add_item_embeddings
+Create Date: 2026-10-19
+
+Adds:
+- tag_co_occurrence: for each ordered pair of tags applied to the same
+  non-discarded item, the number of such items (both directions are
+  stored, so a tag's row range holds all its related tags). Maintained
+  by SQLAlchemyItemTagRepository as item_tags rows come and go; powers
+  GET /tags/{id}/related and search tag facets.
+- Backfill from existing item_tags (one self-join, here only).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '020_add_tag_co_occurrence'
+down_revision: Union[str, None] = '019_add_item_embeddings'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'tag_co_occurrence',
+        sa.Column('tag_id', sa.String(length=36), nullable=False),
+        sa.Column('related_tag_id', sa.String(length=36), nullable=False),
+        sa.Column('item_count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['tag_id'], ['tags.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['related_tag_id'], ['tags.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('tag_id', 'related_tag_id'),
+    )
+    op.create_index(
+        'ix_tag_co_occurrence_related_tag_id', 'tag_co_occurrence', ['related_tag_id']
+    )
+    op.execute(
+        """
+        INSERT INTO tag_co_occurrence (tag_id, related_tag_id, item_count)
+        SELECT a.tag_id, b.tag_id, count(*)
+        FROM item_tags a
+        JOIN item_tags b ON b.item_id = a.item_id AND b.tag_id <> a.tag_id
+        JOIN items i ON i.id = a.item_id
+        WHERE i.status <> 'DISCARDED'
+        GROUP BY a.tag_id, b.tag_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('tag_co_occurrence')
@@ -0,0 +1,50 @@
+"""Raise the HNSW iterative scan budget for per-user vector search.
+
+Revision ID: 021_set_hnsw_max_scan_tuples
+Revises: 020_add_tag_co_occurrence
+Create Date: 2026-10-19
+
+idx_item_embeddings_hnsw holds every user's vectors and the user filter
+applies to the rows it yields, so an iterative scan visits about
+(limit / user's share of the table) tuples before it has limit rows of
+one user. pgvector stops at hnsw.max_scan_tuples (default 20000).
+
+Users with at most SEMANTIC_SEARCH_EXACT_MAX_ITEMS vectors are searched
+exactly and never reach the index. Larger users hold a bigger share;
+raising the budget to 100000 lets 100 candidates of a 10000-vector user
+be found in a table of about 10M vectors. Set as a database default for
+the same reason as the 019 settings (read sessions autocommit).
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '021_set_hnsw_max_scan_tuples'
+down_revision: str | None = '020_add_tag_co_occurrence'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            EXECUTE format(
+                'ALTER DATABASE %I SET hnsw.max_scan_tuples = 100000', current_database()
+            );
+        END $$
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            EXECUTE format('ALTER DATABASE %I RESET hnsw.max_scan_tuples', current_database());
+        END $$
+        """
+    )
@@ -1,12 +1,17 @@
 """API dependencies for dependency injection."""
 
-from typing import Annotated
+from typing import Annotated, AsyncGenerator
 
 from fastapi import Depends, Header, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings, AuthMode
-from app.infrastructure.persistence.database import get_db_session
+from app.infrastructure.persistence.database import (
+    DatabaseRole,
+    get_db_session,
+    get_db_session_context,
+    get_read_session_context,
+)
 from app.infrastructure.persistence.repositories.user_repository_impl import (
     SQLAlchemyUserRepository,
 )
@@ -22,14 +27,46 @@ from app.infrastructure.persistence.repositories.outbox_repository_impl import (
 from app.infrastructure.auth.clerk import (
     ClerkJWTVerifier,
     ClerkJWTVerificationError,
+    ClerkPrincipal,
     get_clerk_verifier,
 )
 from app.domain.entities.user import User
 from app.domain.exceptions import UnauthorizedException
 
 
-# Session dependency type alias
+def query_budget(max_statements: int):
+    """Declare the most SQL statements a route may run per request.
+    
+    Checked by QueryProfileMiddleware. Budgets count every statement,
+    including auth (up to 3 when a user is created on first request),
+    so a route that scales with page size will blow through them.
+    
+    Usage:
+        @router.get("", dependencies=[query_budget(6)])
+    """
+    def _declare_budget(request: Request) -> None:
+        request.state.query_budget = max_statements
+    return Depends(_declare_budget)
+
+
+async def get_db_read_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for read-only endpoints.
+    
+    Routed to a read replica, or to the primary while the requesting
+    user is pinned after a recent write (read-your-writes).
+    """
+    try:
+        pin_key = _principal_pin_key(_resolve_principal(request))
+    except UnauthorizedException:
+        # Auth fails later in get_current_user_for_read; route anywhere
+        pin_key = None
+    async with get_read_session_context(pin_key) as session:
+        yield session
+
+
+# Session dependency type aliases
 DbSession = Annotated[AsyncSession, Depends(get_db_session)]
+DbReadSession = Annotated[AsyncSession, Depends(get_db_read_session)]
 
 
 def get_user_repository(session: DbSession) -> SQLAlchemyUserRepository:
@@ -84,18 +121,65 @@ def get_ai_usage_repository(session: DbSession):
     return SQLAlchemyAIUsageRepository(session)
 
 
-async def get_current_user(
-    request: Request,
-    session: DbSession,
-) -> User:
-    """
-    Get current user with auth precedence:
+def get_read_item_repository(session: DbReadSession) -> SQLAlchemyItemRepository:
+    """Get item repository on the read-only session."""
+    return SQLAlchemyItemRepository(session)
+
+
+def get_read_tag_repository(session: DbReadSession):
+    """Get tag repository on the read-only session."""
+    from app.infrastructure.persistence.repositories.tag_repository_impl import (
+        SQLAlchemyTagRepository,
+    )
+    return SQLAlchemyTagRepository(session)
+
+
+def get_read_item_embedding_repository(session: DbReadSession):
+    """Get item embedding repository on the read-only session."""
+    from app.infrastructure.persistence.repositories.item_embedding_repository_impl import (
+        SQLAlchemyItemEmbeddingRepository,
+    )
+    return SQLAlchemyItemEmbeddingRepository(session)
+
+
+def get_read_item_tag_suggestion_repository(session: DbReadSession):
+    """Get item_tag_suggestion repository on the read-only session."""
+    from app.infrastructure.persistence.repositories.item_tag_suggestion_repository_impl import (
+        SQLAlchemyItemTagSuggestionRepository,
+    )
+    return SQLAlchemyItemTagSuggestionRepository(session)
+
+
+def _resolve_principal(request: Request) -> ClerkPrincipal | str:
+    """Authenticate the request without touching the database.
+    
+    Auth precedence:
     1. Authorization: Bearer <Clerk JWT> (if AUTH_MODE is clerk or mixed)
     2. X-Dev-User-Id header (if AUTH_MODE is mixed or dev)
     3. 401 Unauthorized
-    """
-    user_repo = SQLAlchemyUserRepository(session)
     
+    The result is cached on request.state, so the JWT is verified once
+    per request even when several dependencies need the principal.
+    
+    Returns:
+        Verified Clerk principal, or the dev user ID.
+    """
+    principal = getattr(request.state, "principal", None)
+    if not isinstance(principal, (ClerkPrincipal, str)):
+        principal = _authenticate(request)
+        request.state.principal = principal
+    return principal
+
+
+def _principal_pin_key(principal: ClerkPrincipal | str) -> str:
+    """Stable per-user key for read-your-writes replica pinning."""
+    if isinstance(principal, ClerkPrincipal):
+        return f"clerk:{principal.clerk_user_id}"
+    return f"dev:{principal}"
+
+
+def _authenticate(request: Request) -> ClerkPrincipal | str:
+    """Verify request credentials (see _resolve_principal)."""
     # 1. Try Clerk JWT from Authorization header
     auth_header = request.headers.get("Authorization")
     if auth_header and auth_header.startswith("Bearer "):
@@ -106,8 +190,7 @@ async def get_current_user(
             token = auth_header[7:]
             try:
                 verifier = get_clerk_verifier(settings)
-                principal = verifier.verify_token(token)
-                return await user_repo.get_or_create_from_clerk(principal)
+                return verifier.verify_token(token)
             except ClerkJWTVerificationError as e:
                 raise UnauthorizedException(f"Invalid authentication token: {e}")
     
@@ -115,10 +198,63 @@ async def get_current_user(
     if settings.allows_dev_fallback:
         dev_user_id = request.headers.get("X-Dev-User-Id")
         if dev_user_id:
-            return await user_repo.get_or_create_dev_user(dev_user_id)
+            return dev_user_id
     
     # 3. No valid auth
     if settings.auth_mode == AuthMode.DEV:
         raise UnauthorizedException("Missing X-Dev-User-Id header")
     else:
         raise UnauthorizedException("Missing or invalid authentication")
+
+
+async def _get_or_create_user(
+    user_repo: SQLAlchemyUserRepository, principal: ClerkPrincipal | str
+) -> User:
+    """Just-in-time user upsert for an authenticated principal."""
+    if isinstance(principal, ClerkPrincipal):
+        return await user_repo.get_or_create_from_clerk(principal)
+    return await user_repo.get_or_create_dev_user(principal)
+
+
+async def get_current_user(
+    request: Request,
+    session: DbSession,
+) -> User:
+    """Get current user, creating or syncing the user row if needed.
+    
+    Tags the session with the user's pin key so a committed write pins
+    their subsequent reads to the primary.
+    """
+    principal = _resolve_principal(request)
+    session.info["pin_key"] = _principal_pin_key(principal)
+    return await _get_or_create_user(SQLAlchemyUserRepository(session), principal)
+
+
+async def get_current_user_for_read(
+    request: Request,
+    session: DbReadSession,
+) -> User:
+    """Get current user for read-only endpoints.
+    
+    Looks the user up on the read-only session. Only when the row is
+    missing or its Clerk profile changed does it fall back to a short
+    read-write session on the primary to upsert it.
+    """
+    principal = _resolve_principal(request)
+    user_repo = SQLAlchemyUserRepository(session)
+    
+    if isinstance(principal, ClerkPrincipal):
+        user = await user_repo.get_by_clerk_user_id(principal.clerk_user_id)
+        in_sync = user is not None and (
+            (not principal.email or user.email == principal.email)
+            and (not principal.name or user.display_name == principal.name)
+        )
+    else:
+        user = await user_repo.get_by_id(principal)
+        in_sync = user is not None
+    if in_sync:
+        return user
+    
+    async with get_db_session_context(DatabaseRole.API) as write_session:
+        write_session.info["pin_key"] = _principal_pin_key(principal)
+        return await _get_or_create_user(SQLAlchemyUserRepository(write_session), principal)
@@ -1,11 +1,23 @@
 """Request ID middleware and context management."""
 
 import contextvars
+import logging
+import random
+import time
 from uuid import uuid4
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+from app.infrastructure.metrics import HTTP_REQUEST_DURATION
+from app.infrastructure.persistence.query_profiler import (
+    QueryProfile,
+    start_profile,
+    stop_profile,
+)
+
+logger = logging.getLogger(__name__)
 
 # Context variable for request ID
 request_id_var: contextvars.ContextVar[str] = contextvars.ContextVar(
@@ -18,23 +30,131 @@ def get_request_id() -> str:
     return request_id_var.get()
 
 
-class RequestIdMiddleware(BaseHTTPMiddleware):
-    """Middleware to generate and propagate request IDs."""
+class RequestIdMiddleware:
+    """Pure ASGI middleware to generate and propagate request IDs.
+
+    Runs in the request's own task (no BaseHTTPMiddleware task/stream
+    wrapping), so request_id_var is visible to handlers and streaming
+    responses pass through untouched. Also times each request from
+    receipt to the last body chunk, exporting it per route template and
+    logging slow ones.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
         # Get from header or generate new
-        request_id = request.headers.get("X-Request-Id")
-        if not request_id:
-            request_id = f"req-{uuid4()}"
+        request_id = Headers(scope=scope).get("x-request-id") or f"req-{uuid4()}"
 
         # Store in context and request state
-        request_id_var.set(request_id)
-        request.state.request_id = request_id
+        token = request_id_var.set(request_id)
+        scope.setdefault("state", {})["request_id"] = request_id
+        status_code = 500
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message)["X-Request-Id"] = request_id
+            elif message["type"] == "http.response.body" and not message.get("more_body"):
+                _record_timing(scope, status_code, request_id, start)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
+
+
+def _record_timing(scope: Scope, status_code: int, request_id: str, start: float) -> None:
+    """Record how long a request took; warn above the slow threshold."""
+    elapsed = time.perf_counter() - start
+    elapsed_ms = elapsed * 1000
+    scope["state"]["duration_ms"] = elapsed_ms
+    # Route template (set by the router), not the raw path: bounded labels
+    route = getattr(scope.get("route"), "path", "unmatched")
+    HTTP_REQUEST_DURATION.labels(scope["method"], route, str(status_code)).observe(elapsed)
+    if elapsed_ms >= settings.http_slow_request_ms:
+        logger.warning(
+            f"Slow request {scope['method']} {scope['path']} -> {status_code} "
+            f"in {elapsed_ms:.0f}ms ({request_id})"
+        )
+    elif logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"{scope['method']} {scope['path']} -> {status_code} "
+            f"in {elapsed_ms:.1f}ms ({request_id})"
+        )
+
+
+class QueryBudgetExceeded(Exception):
+    """A route ran more SQL statements than its declared budget."""
+
+
+class QueryProfileMiddleware:
+    """Pure ASGI middleware counting SQL statements and DB time per request.
+
+    Outside production the totals are returned in a Server-Timing header
+    (visible in browser devtools). Routes may declare a budget with the
+    query_budget() dependency: exceeding it logs a warning, or raises
+    QueryBudgetExceeded when DB_QUERY_BUDGET_ENFORCE is set (tests), so
+    N+1 regressions fail CI. A sample of slow requests is logged with
+    their statements.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        sample = random.random() < settings.db_slow_request_sql_sample_rate
+        profile, token = start_profile(record_statements=sample)
+        state = scope.setdefault("state", {})
+        server_timing = settings.env != "production"
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start" and server_timing:
+                MutableHeaders(scope=message).append(
+                    "Server-Timing",
+                    f'db;dur={profile.total_secs * 1000:.1f};desc="{profile.count} queries"',
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            stop_profile(token)
 
-        # Process request
-        response = await call_next(request)
+        # duration_ms is set by RequestIdMiddleware once the body is sent
+        if profile.statements and state.get("duration_ms", 0) >= settings.http_slow_request_ms:
+            _dump_statements(scope, profile)
+        budget = state.get("query_budget")
+        if budget is not None and profile.count > budget:
+            route = getattr(scope.get("route"), "path", scope["path"])
+            message = (
+                f"{scope['method']} {route} ran {profile.count} SQL statements "
+                f"(budget {budget})"
+            )
+            if settings.db_query_budget_enforce:
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
 
-        # Add to response headers
-        response.headers["X-Request-Id"] = request_id
 
-        return response
+def _dump_statements(scope: Scope, profile: QueryProfile) -> None:
+    """Log a slow request's statements with their durations."""
+    lines = "\n".join(
+        f"  {secs * 1000:8.1f}ms  {' '.join(statement.split())[:500]}"
+        for statement, secs in profile.statements
+    )
+    logger.warning(
+        f"Slow request SQL {scope['method']} {scope['path']}: {profile.count} statements, "
+        f"{profile.total_secs * 1000:.0f}ms in DB ({get_request_id()})\n{lines}"
+    )
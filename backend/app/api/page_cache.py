@@ -0,0 +1,14 @@
+"""Bounded in-process cache for rendered response bodies."""
+
+from app.infrastructure.lru_cache import VersionedLRUCache
+
+
+class PageCache(VersionedLRUCache[bytes]):
+    """LRU cache of serialized response pages.
+
+    Keys embed the library version (see VersionedLRUCache), so a page
+    is never served after the library it renders has changed.
+    """
+
+    def __init__(self, max_entries: int, name: str = "page"):
+        super().__init__(max_entries, name)
@@ -9,7 +9,8 @@ from app.api.schemas.items import TagInItem
 class LibraryItemResponse(BaseModel):
     """Item in library response."""
     id: str
-    rawText: str
+    rawText: str  # Preview; see rawTextTruncated
+    rawTextTruncated: bool = False  # Fetch GET /items/{id} for the full text
     title: str | None
     summary: str | None
     tags: list[TagInItem]
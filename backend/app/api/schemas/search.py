@@ -18,6 +18,14 @@ class SearchResultItem(BaseModel):
     attachmentCount: int = Field(default=0, alias="attachmentCount")
 
 
+class TagFacet(BaseModel):
+    """Tag with its count over the search results."""
+    id: str
+    name: str
+    color: str = "gray"
+    count: int
+
+
 class SearchPaginationInfo(BaseModel):
     """Pagination info for search results."""
     cursor: str | None
@@ -27,7 +35,9 @@ class SearchPaginationInfo(BaseModel):
 class SearchResponse(BaseModel):
     """Response body for GET /search."""
     items: list[SearchResultItem]
-    mode: str  # 'tag_only' or 'combined'
+    mode: str  # 'tag_only', 'combined', 'semantic' or 'hybrid'
     pagination: SearchPaginationInfo
     total: int | None = None  # Optional total count
+    # First page of tag-only, semantic and hybrid searches only
+    facets: list[TagFacet] | None = None
 
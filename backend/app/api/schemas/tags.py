@@ -14,6 +14,16 @@ class TagResponse(BaseModel):
     color: str = "gray"  # Color ID or hex
 
 
+class RelatedTagResponse(TagResponse):
+    """A tag applied together with another tag."""
+    itemCount: int  # Items carrying both tags
+
+
+class RelatedTagsResponse(BaseModel):
+    """Response body for GET /tags/:id/related."""
+    tags: list[RelatedTagResponse]
+
+
 class CreateTagRequest(BaseModel):
     """Request body for POST /tags."""
     name: str = Field(..., min_length=1, max_length=50)
@@ -36,3 +46,23 @@ class UpdateTagRequest(BaseModel):
     # Accept color IDs (e.g., 'blue', 'red') or hex values
     color: str | None = Field(None, min_length=1, max_length=20)
 
+
+
+class SuggestTagsRequest(BaseModel):
+    """Request body for POST /tags/suggestions."""
+    text: str = Field(..., min_length=1, max_length=10000)
+    tagIds: list[str] = Field(default_factory=list)  # Tags already chosen (excluded)
+    limit: int = Field(5, ge=1, le=20)
+
+
+class TagSuggestionResponse(BaseModel):
+    """An existing tag suggested for some text."""
+    id: str
+    name: str
+    color: str = "gray"
+    confidence: float
+
+
+class TagSuggestionsResponse(BaseModel):
+    """Response body for POST /tags/suggestions."""
+    suggestions: list[TagSuggestionResponse]
@@ -23,10 +23,11 @@ class InitiateUploadResponse(BaseModel):
     
     upload_id: str = Field(..., alias="uploadId")
     object_key: str = Field(..., alias="objectKey")
-    presigned_put_url: str = Field(..., alias="presignedPutUrl")
+    presigned_put_url: str | None = Field(..., alias="presignedPutUrl")  # None when deduplicated
     headers_to_include: dict[str, str] = Field(..., alias="headersToInclude")
     expires_at: datetime = Field(..., alias="expiresAt")
     status: str
+    deduplicated: bool = False
 
 
 class CompleteUploadRequest(BaseModel):
@@ -94,6 +95,7 @@ class DownloadUrlResponse(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
     
     download_url: str = Field(..., alias="downloadUrl")
+    variant: str = "original"  # 'original' or 'thumb' (what downloadUrl points to)
     expires_at: datetime = Field(..., alias="expiresAt")
     filename: str
     mime_type: str = Field(..., alias="mimeType")
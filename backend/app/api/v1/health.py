@@ -1,10 +1,11 @@
 """Health check endpoint."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.infrastructure.persistence.database import get_db_session
+from app.infrastructure.persistence.database import get_db_session, get_pool_metrics
 
 router = APIRouter()
 
@@ -25,3 +26,15 @@ async def readiness_check(
         return {"status": "ok", "db": "connected"}
     except Exception as e:
         return {"status": "error", "db": "disconnected", "detail": str(e)}
+
+
+@router.get("/health/db-pools")
+async def db_pool_stats() -> dict:
+    """Connection pool occupancy and checkout-wait metrics per role."""
+    return {"pools": get_pool_metrics()}
+
+
+@router.get("/metrics", include_in_schema=False)
+async def prometheus_metrics() -> Response:
+    """Prometheus metrics for this process (request, worker, outbox, LLM, pools)."""
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
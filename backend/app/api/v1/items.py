@@ -14,8 +14,15 @@ from app.api.dependencies import (
     get_item_tag_repository,
     get_item_tag_suggestion_repository,
     get_ai_usage_repository,
-    DbSession,
+    get_user_repository,
+    get_current_user_for_read,
+    get_read_item_repository,
+    get_read_tag_repository,
+    get_read_item_tag_suggestion_repository,
+    DbReadSession,
+    query_budget,
 )
+from app.api.responses import ORJSONResponse
 from app.api.schemas.items import (
     CreateItemRequest,
     ItemResponse,
@@ -40,6 +47,9 @@ from app.infrastructure.persistence.repositories.outbox_repository_impl import (
 from app.infrastructure.persistence.repositories.ai_usage_repository_impl import (
     SQLAlchemyAIUsageRepository,
 )
+from app.infrastructure.persistence.repositories.user_repository_impl import (
+    SQLAlchemyUserRepository,
+)
 from app.application.items.create_item import CreateItemUseCase
 from app.application.items.get_pending_items import GetPendingItemsUseCase
 from app.application.items.get_item import GetItemUseCase
@@ -63,20 +73,39 @@ async def resolve_tags_to_objects(
 ) -> list[TagInItem]:
     """Resolve tag names to full TagInItem objects.
     
-    For each tag name, looks up the tag by name to get id and color.
+    Looks all names up in one query to get id and color.
     If tag not found (shouldn't happen), creates a minimal object.
     """
-    if not tag_names or not tag_repo:
-        return []
+    return (await resolve_tags_to_objects_batch([tag_names], user_id, tag_repo))[0]
+
+
+async def resolve_tags_to_objects_batch(
+    tag_lists: list[list[str]], user_id: str, tag_repo
+) -> list[list[TagInItem]]:
+    """Resolve several items' tag names with a single tag query.
+    
+    Returns one TagInItem list per input list, in the same order.
+    """
+    all_names = {name for names in tag_lists for name in names}
+    if not all_names or not tag_repo:
+        return [[] for _ in tag_lists]
+    
+    # Like get_by_name, soft-deleted tags still resolve to their id/color
+    tag_map = await tag_repo.get_by_names(list(all_names), user_id, include_deleted=True)
     
     result = []
-    for name in tag_names:
-        tag = await tag_repo.get_by_name(name, user_id)
-        if tag:
-            result.append(TagInItem(id=tag.id, name=tag.name, color=tag.color))
-        else:
-            # Fallback for tags not yet persisted
-            result.append(TagInItem(id="", name=name, color="gray"))
+    for names in tag_lists:
+        tag_objects = []
+        for name in names:
+            tag = tag_map.get(name.lower().strip())
+            if tag:
+                tag_objects.append(
+                    TagInItem.model_construct(id=tag.id, name=tag.name, color=tag.color)
+                )
+            else:
+                # Fallback for tags not yet persisted
+                tag_objects.append(TagInItem.model_construct(id="", name=name, color="gray"))
+        result.append(tag_objects)
     return result
 
 
@@ -92,6 +121,7 @@ async def create_item(
     ai_usage_repo: Annotated[SQLAlchemyAIUsageRepository, Depends(get_ai_usage_repository)],
     tag_repo: Annotated[object, Depends(get_tag_repository)],
     item_tag_repo: Annotated[object, Depends(get_item_tag_repository)],
+    user_repo: Annotated[SQLAlchemyUserRepository, Depends(get_user_repository)],
     idempotency_key: Annotated[str | None, Header(alias="Idempotency-Key")] = None,
 ) -> ItemResponse:
     """Create a new item.
@@ -100,7 +130,8 @@ async def create_item(
     If enrich=true (default), queues AI enrichment job.
     """
     use_case = CreateItemUseCase(
-        item_repo, idempotency_repo, outbox_repo, ai_usage_repo, tag_repo, item_tag_repo
+        item_repo, idempotency_repo, outbox_repo, ai_usage_repo, tag_repo, item_tag_repo,
+        user_repo,
     )
     output = await use_case.execute(
         CreateItemInput(
@@ -131,23 +162,30 @@ async def create_item(
     )
 
 
-@router.get("/pending", response_model=PendingItemsResponse)
+@router.get(
+    "/pending",
+    response_model=PendingItemsResponse,
+    response_class=ORJSONResponse,
+    dependencies=[query_budget(7)],
+)
 async def get_pending_items(
-    current_user: Annotated[User, Depends(get_current_user)],
-    item_repo: Annotated[SQLAlchemyItemRepository, Depends(get_item_repository)],
-    tag_repo: Annotated[object, Depends(get_tag_repository)],
-    suggestion_repo: Annotated[object, Depends(get_item_tag_suggestion_repository)],
-) -> PendingItemsResponse:
+    current_user: Annotated[User, Depends(get_current_user_for_read)],
+    item_repo: Annotated[SQLAlchemyItemRepository, Depends(get_read_item_repository)],
+    tag_repo: Annotated[object, Depends(get_read_tag_repository)],
+    suggestion_repo: Annotated[object, Depends(get_read_item_tag_suggestion_repository)],
+) -> ORJSONResponse:
     """Get pending items for current user."""
     use_case = GetPendingItemsUseCase(item_repo, suggestion_repo)
     output = await use_case.execute(GetPendingItemsInput(user_id=current_user.id))
     
+    tag_objects_per_item = await resolve_tags_to_objects_batch(
+        [item.tags for item in output.items], current_user.id, tag_repo
+    )
+    
     items = []
-    for item in output.items:
-        tag_objects = await resolve_tags_to_objects(item.tags, current_user.id, tag_repo)
-        
+    for item, tag_objects in zip(output.items, tag_objects_per_item, strict=True):
         suggested_tag_objects = [
-            SuggestedTagInItem(
+            SuggestedTagInItem.model_construct(
                 id=st.id,
                 name=st.name,
                 status=st.status,
@@ -157,7 +195,7 @@ async def get_pending_items(
         ]
         
         items.append(
-            ItemResponse(
+            ItemResponse.model_construct(
                 id=item.id,
                 rawText=item.raw_text,
                 title=item.title,
@@ -172,17 +210,17 @@ async def get_pending_items(
             )
         )
     
-    return PendingItemsResponse(items=items, total=output.total)
+    return ORJSONResponse(PendingItemsResponse.model_construct(items=items, total=output.total))
 
 
-@router.get("/{item_id}", response_model=ItemResponse)
+@router.get("/{item_id}", response_model=ItemResponse, dependencies=[query_budget(8)])
 async def get_item(
     item_id: str,
-    current_user: Annotated[User, Depends(get_current_user)],
-    item_repo: Annotated[SQLAlchemyItemRepository, Depends(get_item_repository)],
-    tag_repo: Annotated[object, Depends(get_tag_repository)],
-    suggestion_repo: Annotated[object, Depends(get_item_tag_suggestion_repository)],
-    db: DbSession,
+    current_user: Annotated[User, Depends(get_current_user_for_read)],
+    item_repo: Annotated[SQLAlchemyItemRepository, Depends(get_read_item_repository)],
+    tag_repo: Annotated[object, Depends(get_read_tag_repository)],
+    suggestion_repo: Annotated[object, Depends(get_read_item_tag_suggestion_repository)],
+    db: DbReadSession,
 ) -> ItemResponse:
     """Get item by ID."""
     use_case = GetItemUseCase(item_repo, suggestion_repo)
@@ -254,10 +292,11 @@ async def update_item(
     tag_repo: Annotated[object, Depends(get_tag_repository)],
     item_tag_repo: Annotated[object, Depends(get_item_tag_repository)],
     suggestion_repo: Annotated[object, Depends(get_item_tag_suggestion_repository)],
+    user_repo: Annotated[SQLAlchemyUserRepository, Depends(get_user_repository)],
 ) -> UpdateItemResponse:
     """Update item (confirm, discard, or edit)."""
     use_case = UpdateItemUseCase(
-        item_repo, outbox_repo, tag_repo, item_tag_repo, suggestion_repo
+        item_repo, outbox_repo, tag_repo, item_tag_repo, suggestion_repo, user_repo
     )
     output = await use_case.execute(
         UpdateItemInput(
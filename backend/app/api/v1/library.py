@@ -1,29 +1,43 @@
 """Library API endpoints."""
 
 import base64
+import hashlib
 import json
 from typing import Annotated
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select, func
-
-from app.api.dependencies import get_current_user, get_item_repository, get_tag_repository, DbSession
+from fastapi import APIRouter, Depends, Header, Query, Response
+from app.api.dependencies import (
+    get_current_user_for_read,
+    get_read_item_repository,
+    get_read_tag_repository,
+    query_budget,
+)
+from app.api.page_cache import PageCache
+from app.api.responses import ORJSONResponse
 from app.api.schemas.library import (
     LibraryResponse,
     LibraryItemResponse,
     PaginationInfo,
 )
 from app.api.schemas.items import TagInItem
+from app.config import settings
 from app.domain.entities.user import User
 from app.domain.exceptions import InvalidCursorException
+from app.domain.value_objects import ItemStatus
 from app.infrastructure.persistence.repositories.item_repository_impl import (
+    LIBRARY_PREVIEW_CHARS,
     SQLAlchemyItemRepository,
 )
-from app.infrastructure.persistence.models.item_attachment_model import ItemAttachmentModel
 
 router = APIRouter(prefix="/library", tags=["library"])
 
+# Rendered pages keyed by (user, library_version, cursor, limit)
+library_page_cache = PageCache(settings.library_page_cache_size, name="library")
+
+# Browsers may store the page but must revalidate it on every load
+LIBRARY_CACHE_CONTROL = "private, no-cache"
+
 
 def decode_cursor(cursor: str | None) -> tuple[datetime, str] | None:
     """Decode cursor to (confirmed_at, id) tuple."""
@@ -76,50 +90,66 @@ async def resolve_tags_to_objects_batch(
         for name in tags:
             tag = tag_map.get(name.lower().strip())
             if tag:
-                tag_objects.append(TagInItem(id=tag.id, name=tag.name, color=tag.color))
+                tag_objects.append(
+                    TagInItem.model_construct(id=tag.id, name=tag.name, color=tag.color)
+                )
             # Skip tags that don't exist (soft-deleted tags)
         result[item.id] = tag_objects
     
     return result
 
 
-async def get_attachment_counts(db, item_ids: list[str]) -> dict[str, int]:
-    """Get attachment counts for a list of item IDs."""
-    if not item_ids:
-        return {}
-    
-    stmt = (
-        select(
-            ItemAttachmentModel.item_id,
-            func.count(ItemAttachmentModel.id).label("count")
-        )
-        .where(ItemAttachmentModel.item_id.in_(item_ids))
-        .where(ItemAttachmentModel.deleted_at.is_(None))
-        .group_by(ItemAttachmentModel.item_id)
-    )
-    
-    result = await db.execute(stmt)
-    return {row.item_id: row.count for row in result}
+def library_etag(user: User, cursor: str | None, limit: int) -> str:
+    """Strong ETag for one library page at the user's current version."""
+    page = f"{user.id}:{user.library_version}:{cursor or ''}:{limit}"
+    return f'"lib-{hashlib.sha256(page.encode()).hexdigest()[:32]}"'
+
 
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header (list of tags or "*") against an ETag."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
 
-@router.get("", response_model=LibraryResponse)
+
+@router.get(
+    "",
+    response_model=LibraryResponse,
+    response_class=ORJSONResponse,
+    dependencies=[query_budget(6)],
+)
 async def get_library(
-    current_user: Annotated[User, Depends(get_current_user)],
-    item_repo: Annotated[SQLAlchemyItemRepository, Depends(get_item_repository)],
-    tag_repo: Annotated[object, Depends(get_tag_repository)],
-    db: DbSession,
+    current_user: Annotated[User, Depends(get_current_user_for_read)],
+    item_repo: Annotated[SQLAlchemyItemRepository, Depends(get_read_item_repository)],
+    tag_repo: Annotated[object, Depends(get_read_tag_repository)],
     cursor: str | None = Query(None, description="Pagination cursor"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
-) -> LibraryResponse:
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
     """Get archived items (library) with cursor pagination.
     
     Ordered by (confirmed_at DESC, id DESC) for stable pagination.
+    
+    Pages are versioned by the user's library_version (loaded with the
+    user): a matching If-None-Match returns 304, and a rendered page in
+    the page cache is returned without querying items.
     """
     # Decode cursor if provided
     cursor_data = decode_cursor(cursor)
     
-    # Fetch items from repository
-    items = await item_repo.get_archived_by_user(
+    etag = library_etag(current_user, cursor, limit)
+    headers = {"ETag": etag, "Cache-Control": LIBRARY_CACHE_CONTROL}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    
+    cache_key = (current_user.id, current_user.library_version, cursor, limit)
+    body = library_page_cache.get(cache_key)
+    if body is not None:
+        return Response(content=body, media_type="application/json", headers=headers)
+    
+    # Fetch card rows (projection, not entities) from repository
+    items = await item_repo.list_library_rows(
         user_id=current_user.id,
         cursor=cursor_data,
         limit=limit + 1,  # Fetch one extra to check hasMore
@@ -138,36 +168,38 @@ async def get_library(
             next_cursor = encode_cursor(last_item.confirmed_at, last_item.id)
     
     # Batch resolve all tags in a single query
-    items_with_tags = [(item, item.tags) for item in items]
+    items_with_tags = [(item, item.tags or []) for item in items]
     tag_objects_map = await resolve_tags_to_objects_batch(items_with_tags, current_user.id, tag_repo)
     
-    # Get attachment counts for all items
-    item_ids = [item.id for item in items]
-    attachment_counts = await get_attachment_counts(db, item_ids)
-    
-    # Build response
+    # Build response (fields are trusted: construct without validation)
     response_items = [
-        LibraryItemResponse(
+        LibraryItemResponse.model_construct(
             id=item.id,
-            rawText=item.raw_text,
+            rawText=item.raw_text_preview[:LIBRARY_PREVIEW_CHARS],
+            rawTextTruncated=len(item.raw_text_preview) > LIBRARY_PREVIEW_CHARS,
             title=item.title,
             summary=item.summary,
             tags=tag_objects_map.get(item.id, []),
-            status=item.status.value,
-            sourceType=item.source_type.value if item.source_type else None,
+            status=ItemStatus.ARCHIVED.value,
+            sourceType=item.source_type,
             createdAt=item.created_at,
             confirmedAt=item.confirmed_at,
-            attachmentCount=attachment_counts.get(item.id, 0),
+            attachmentCount=item.attachment_count,
         )
         for item in items
     ]
     
-    return LibraryResponse(
-        items=response_items,
-        pagination=PaginationInfo(
-            cursor=next_cursor,
-            hasMore=has_more,
+    response = ORJSONResponse(
+        LibraryResponse.model_construct(
+            items=response_items,
+            pagination=PaginationInfo.model_construct(
+                cursor=next_cursor,
+                hasMore=has_more,
+            ),
         ),
+        headers=headers,
     )
+    library_page_cache.put(cache_key, response.body)
+    return response
 
 
@@ -2,27 +2,47 @@
 
 import base64
 import json
-from typing import Annotated
+import logging
+from typing import Annotated, Literal
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select, or_, func, text
+from sqlalchemy import select, or_, func, case
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_current_user, DbSession, get_tag_repository
+from app.api.dependencies import (
+    get_current_user_for_read,
+    DbReadSession,
+    get_read_item_embedding_repository,
+    get_read_tag_repository,
+    query_budget,
+)
+from app.api.responses import ORJSONResponse
 from app.api.schemas.search import (
     SearchResponse,
     SearchResultItem,
     SearchPaginationInfo,
+    TagFacet,
 )
 from app.api.schemas.items import TagInItem
 from app.domain.entities.user import User
-from app.domain.exceptions import ValidationException, InvalidCursorException
+from app.config import settings
+from app.domain.exceptions import (
+    AIServiceUnavailableException,
+    InvalidCursorException,
+    ValidationException,
+)
+from app.infrastructure.embeddings.provider_interface import EmbeddingError
+from app.infrastructure.embeddings.service import get_embedding_provider, query_embedding_cache
 from app.infrastructure.persistence.models.item_model import ItemModel
-from app.infrastructure.persistence.models.item_attachment_model import ItemAttachmentModel
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/search", tags=["search"])
 
+# Reciprocal rank fusion damping: higher flattens the weight of top ranks
+RRF_K = 60
+
 
 def parse_search_mode(query: str) -> tuple[str, str]:
     """Parse search query into (mode, search_term).
@@ -73,100 +93,199 @@ def encode_cursor(confirmed_at: datetime, item_id: str) -> str:
     return base64.b64encode(json.dumps(data).encode("utf-8")).decode("utf-8")
 
 
-async def resolve_tags_to_objects(
-    tag_names: list[str], user_id: str, tag_repo
-) -> list[TagInItem]:
-    """Resolve tag names to full TagInItem objects."""
-    if not tag_names or not tag_repo:
-        return []
-    
-    result = []
-    for name in tag_names:
-        tag = await tag_repo.get_by_name(name, user_id)
-        if tag:
-            result.append(TagInItem(id=tag.id, name=tag.name, color=tag.color))
-        else:
-            result.append(TagInItem(id="", name=name, color="gray"))
-    return result
+def decode_offset_cursor(cursor: str | None) -> int:
+    """Decode a ranked-search cursor to its result offset (0 without one)."""
+    if not cursor:
+        return 0
+    try:
+        decoded = base64.b64decode(cursor, validate=True).decode("utf-8")
+        offset = json.loads(decoded)["offset"]
+        if not isinstance(offset, int) or offset < 0:
+            raise ValueError(offset)
+        return offset
+    except Exception:
+        raise InvalidCursorException(
+            "Invalid pagination cursor",
+            details={"cursor": cursor},
+        )
 
 
-async def get_attachment_counts(db, item_ids: list[str]) -> dict[str, int]:
-    """Get attachment counts for a list of item IDs."""
-    if not item_ids:
-        return {}
+def encode_offset_cursor(offset: int) -> str:
+    """Encode a ranked-search result offset to a cursor string."""
+    return base64.b64encode(json.dumps({"offset": offset}).encode("utf-8")).decode("utf-8")
+
+
+def reciprocal_rank_fusion(rankings: list[list[str]], k: int = RRF_K) -> list[str]:
+    """Merge ranked ID lists by summed 1 / (k + rank).
     
-    stmt = (
-        select(
-            ItemAttachmentModel.item_id,
-            func.count(ItemAttachmentModel.id).label("count")
-        )
-        .where(ItemAttachmentModel.item_id.in_(item_ids))
-        .where(ItemAttachmentModel.deleted_at.is_(None))
-        .group_by(ItemAttachmentModel.item_id)
+    Only ranks matter, so vector distances and lexical positions need no
+    common scale. IDs found by several rankings rise; ties keep the order
+    in which IDs were first seen.
+    """
+    scores: dict[str, float] = {}
+    for ranking in rankings:
+        for rank, item_id in enumerate(ranking, start=1):
+            scores[item_id] = scores.get(item_id, 0.0) + 1.0 / (k + rank)
+    return sorted(scores, key=lambda item_id: -scores[item_id])
+
+
+def _lexical_filter(search_term: str):
+    """Combined-mode match: text fields OR tags."""
+    like_pattern = f"%{search_term}%"
+    return or_(
+        ItemModel.title.ilike(like_pattern),
+        ItemModel.summary.ilike(like_pattern),
+        ItemModel.raw_text.ilike(like_pattern),
+        func.array_to_string(ItemModel.tags, ',').ilike(like_pattern),
     )
-    
-    result = await db.execute(stmt)
-    return {row.item_id: row.count for row in result}
 
 
-@router.get("", response_model=SearchResponse)
-async def search_library(
-    current_user: Annotated[User, Depends(get_current_user)],
-    db: DbSession,
-    tag_repo: Annotated[object, Depends(get_tag_repository)],
-    q: str = Query(..., min_length=0, description="Search query"),
-    cursor: str | None = Query(None, description="Pagination cursor"),
-    limit: int = Query(20, ge=1, le=100, description="Items per page"),
-) -> SearchResponse:
-    """Search archived items in library.
+async def _lexical_ranked_ids(
+    db: AsyncSession, user_id: str, search_term: str, limit: int
+) -> list[str]:
+    """Combined-mode matches ranked by where they match, then recency."""
+    like_pattern = f"%{search_term}%"
+    field_rank = case(
+        (ItemModel.title.ilike(like_pattern), 0),
+        (func.array_to_string(ItemModel.tags, ',').ilike(like_pattern), 1),
+        (ItemModel.summary.ilike(like_pattern), 2),
+        else_=3,
+    )
+    result = await db.execute(
+        select(ItemModel.id)
+        .where(ItemModel.user_id == user_id)
+        .where(ItemModel.status == "ARCHIVED")
+        .where(_lexical_filter(search_term))
+        .order_by(field_rank, ItemModel.confirmed_at.desc(), ItemModel.id.desc())
+        .limit(limit)
+    )
+    return list(result.scalars().all())
+
+
+async def _ranked_item_ids(
+    mode: str, search_term: str, user_id: str, db: AsyncSession, embedding_repo
+) -> list[str]:
+    """Candidate IDs for semantic or hybrid mode, best first."""
+    candidates = settings.semantic_search_candidates
+    try:
+        vector = await query_embedding_cache.embed(get_embedding_provider(), search_term)
+    except EmbeddingError as e:
+        if mode == "semantic":
+            raise AIServiceUnavailableException(
+                "Semantic search is temporarily unavailable",
+                details={"reason": e.error_code},
+            )
+        logger.warning(f"Query embedding failed ({e.error_code}); hybrid search is lexical only")
+        vector = None
+    vector_ids = []
+    if vector is not None and any(vector):
+        vector_ids = [
+            item_id
+            for item_id, _ in await embedding_repo.nearest(
+                user_id,
+                vector,
+                candidates,
+                settings.semantic_search_max_distance,
+                exact_max_items=settings.semantic_search_exact_max_items,
+            )
+        ]
+    if mode == "semantic":
+        return vector_ids
+    lexical_ids = await _lexical_ranked_ids(db, user_id, search_term, candidates)
+    return reciprocal_rank_fusion([vector_ids, lexical_ids])
+
+
+async def resolve_tags_to_objects_batch(
+    tag_lists: list[list[str]], user_id: str, tag_repo
+) -> list[list[TagInItem]]:
+    """Resolve tag names to full TagInItem objects for every result.
     
-    Two modes based on query prefix:
-    - Tag-only mode: query starts with '#' -> matches tag names only
-    - Combined mode: otherwise -> matches title/summary/rawText OR tags
+    Uses a single query for the whole page instead of one per tag.
+    """
+    all_names = {name for names in tag_lists for name in names}
+    if not all_names or not tag_repo:
+        return [[] for _ in tag_lists]
+    
+    tag_map = await tag_repo.get_by_names(list(all_names), user_id, include_deleted=True)
+    
+    result = []
+    for names in tag_lists:
+        tag_objects = []
+        for name in names:
+            tag = tag_map.get(name.lower().strip())
+            if tag:
+                tag_objects.append(
+                    TagInItem.model_construct(id=tag.id, name=tag.name, color=tag.color)
+                )
+            else:
+                tag_objects.append(TagInItem.model_construct(id="", name=name, color="gray"))
+        result.append(tag_objects)
+    return result
+
+
+async def _tag_facets(
+    mode: str,
+    search_term: str,
+    ranked_ids: list[str],
+    user_id: str,
+    db: AsyncSession,
+    tag_repo,
+) -> list[TagFacet]:
+    """Tag counts over the results of a search.
     
-    Ordered by (confirmed_at DESC, id DESC) for stable pagination.
+    Tag-only searches read the co-occurrence matrix of the matching
+    tags; ranked searches count tags over their bounded candidate set.
+    Combined-mode result sets are unbounded, so their tags are counted
+    over the same number of best lexical matches.
     """
-    # Parse query mode
-    mode, search_term = parse_search_mode(q)
-    
-    # Decode cursor if provided
-    cursor_data = decode_cursor(cursor)
-    
-    # Empty search term in combined mode returns empty results
-    if mode == "combined" and not search_term:
-        return SearchResponse(
-            items=[],
-            mode=mode,
-            pagination=SearchPaginationInfo(cursor=None, hasMore=False),
-            total=0,
+    if mode == "tag_only":
+        counts = await tag_repo.count_related_to_name(
+            search_term, user_id, settings.search_facet_limit
+        )
+    else:
+        if mode == "combined":
+            ranked_ids = await _lexical_ranked_ids(
+                db, user_id, search_term, settings.semantic_search_candidates
+            )
+        counts = await tag_repo.count_for_items(
+            ranked_ids, user_id, settings.search_facet_limit
         )
+    return [
+        TagFacet.model_construct(id=tag.id, name=tag.name, color=tag.color, count=count)
+        for tag, count in counts
+    ]
+
+
+async def _lexical_page(
+    mode: str,
+    search_term: str,
+    cursor_data: tuple[datetime, str] | None,
+    limit: int,
+    user_id: str,
+    db: AsyncSession,
+) -> tuple[list[ItemModel], bool, str | None]:
+    """One keyset page of tag-only or combined matches.
     
+    Returns:
+        (items, has_more, next_cursor)
+    """
     # Build base query for archived items
     stmt = (
         select(ItemModel)
-        .where(ItemModel.user_id == current_user.id)
+        .where(ItemModel.user_id == user_id)
         .where(ItemModel.status == "ARCHIVED")
     )
     
     # Apply search filter based on mode
-    like_pattern = f"%{search_term}%"
-    
     if mode == "tag_only":
         # Tag-only: match any tag in the tags array (case-insensitive)
         # Use PostgreSQL array functions with ILIKE
         stmt = stmt.where(
-            func.array_to_string(ItemModel.tags, ',').ilike(like_pattern)
+            func.array_to_string(ItemModel.tags, ',').ilike(f"%{search_term}%")
         )
     else:
         # Combined: match text fields OR tags
-        stmt = stmt.where(
-            or_(
-                ItemModel.title.ilike(like_pattern),
-                ItemModel.summary.ilike(like_pattern),
-                ItemModel.raw_text.ilike(like_pattern),
-                func.array_to_string(ItemModel.tags, ',').ilike(like_pattern),
-            )
-        )
+        stmt = stmt.where(_lexical_filter(search_term))
     
     # Apply cursor pagination
     if cursor_data:
@@ -198,16 +317,96 @@ async def search_library(
         last_item = items[-1]
         if last_item.confirmed_at:
             next_cursor = encode_cursor(last_item.confirmed_at, last_item.id)
+    return items, has_more, next_cursor
+
+
+@router.get(
+    "",
+    response_model=SearchResponse,
+    response_class=ORJSONResponse,
+    dependencies=[query_budget(8)],
+)
+async def search_library(
+    current_user: Annotated[User, Depends(get_current_user_for_read)],
+    db: DbReadSession,
+    tag_repo: Annotated[object, Depends(get_read_tag_repository)],
+    embedding_repo: Annotated[object, Depends(get_read_item_embedding_repository)],
+    q: str = Query(..., min_length=0, description="Search query"),
+    mode: Literal["lexical", "semantic", "hybrid"] = Query(
+        "lexical", description="Ranking for non-tag queries"
+    ),
+    cursor: str | None = Query(None, description="Pagination cursor"),
+    limit: int = Query(20, ge=1, le=100, description="Items per page"),
+) -> ORJSONResponse:
+    """Search archived items in library.
     
-    # Build response with resolved tag objects
-    item_ids = [item.id for item in items]
-    attachment_counts = await get_attachment_counts(db, item_ids)
+    Modes based on query prefix and the mode parameter:
+    - Tag-only mode: query starts with '#' -> matches tag names only
+    - Combined mode (mode=lexical): matches title/summary/rawText OR tags,
+      ordered by (confirmed_at DESC, id DESC) for stable pagination
+    - Semantic mode (mode=semantic): nearest title+summary embeddings
+    - Hybrid mode (mode=hybrid): semantic and combined matches merged by
+      reciprocal rank fusion
+    
+    Semantic and hybrid results are ranked (best first) over the top
+    SEMANTIC_SEARCH_CANDIDATES matches and paginated by offset.
     
+    The first page carries tag facets: counts over all results of
+    tag-only searches, and over the top SEMANTIC_SEARCH_CANDIDATES
+    matches of other searches.
+    """
+    # Parse query mode
+    query_mode, search_term = parse_search_mode(q)
+    if query_mode == "combined" and mode != "lexical":
+        query_mode = mode
+    ranked = query_mode in ("semantic", "hybrid")
+    
+    # Decode cursor if provided (ranked modes page by offset)
+    offset = decode_offset_cursor(cursor) if ranked else 0
+    cursor_data = None if ranked else decode_cursor(cursor)
+    
+    # Empty search term outside tag-only mode returns empty results
+    if query_mode != "tag_only" and not search_term:
+        return ORJSONResponse(
+            SearchResponse.model_construct(
+                items=[],
+                mode=query_mode,
+                pagination=SearchPaginationInfo.model_construct(cursor=None, hasMore=False),
+                total=0,
+            )
+        )
+    
+    ranked_ids: list[str] = []
+    if ranked:
+        ranked_ids = await _ranked_item_ids(
+            query_mode, search_term, current_user.id, db, embedding_repo
+        )
+        page_ids = ranked_ids[offset:offset + limit]
+        has_more = offset + limit < len(ranked_ids)
+        next_cursor = encode_offset_cursor(offset + limit) if has_more else None
+        items = []
+        if page_ids:
+            result = await db.execute(
+                select(ItemModel)
+                .where(ItemModel.id.in_(page_ids))
+                .where(ItemModel.user_id == current_user.id)
+                .where(ItemModel.status == "ARCHIVED")
+            )
+            by_id = {item.id: item for item in result.scalars().all()}
+            items = [by_id[item_id] for item_id in page_ids if item_id in by_id]
+    else:
+        items, has_more, next_cursor = await _lexical_page(
+            query_mode, search_term, cursor_data, limit, current_user.id, db
+        )
+    
+    # Build response with resolved tag objects
+    tag_objects_per_item = await resolve_tags_to_objects_batch(
+        [item.tags or [] for item in items], current_user.id, tag_repo
+    )
     response_items = []
-    for item in items:
-        tag_objects = await resolve_tags_to_objects(item.tags or [], current_user.id, tag_repo)
+    for item, tag_objects in zip(items, tag_objects_per_item, strict=True):
         response_items.append(
-            SearchResultItem(
+            SearchResultItem.model_construct(
                 id=item.id,
                 title=item.title,
                 summary=item.summary,
@@ -215,16 +414,27 @@ async def search_library(
                 sourceType=item.source_type,
                 confirmedAt=item.confirmed_at,
                 createdAt=item.created_at,
-                attachmentCount=attachment_counts.get(item.id, 0),
+                attachmentCount=item.attachment_count,
             )
         )
     
-    return SearchResponse(
-        items=response_items,
-        mode=mode,
-        pagination=SearchPaginationInfo(
-            cursor=next_cursor,
-            hasMore=has_more,
-        ),
-        total=len(items) if not has_more else None,  # Only return total if we have all items
+    # Facets describe the whole result set: computed once, with the first page
+    facets = None
+    if cursor is None:
+        facets = await _tag_facets(
+            query_mode, search_term, ranked_ids, current_user.id, db, tag_repo
+        )
+    
+    # Models are built from trusted rows: skip validation and serialize with orjson
+    return ORJSONResponse(
+        SearchResponse.model_construct(
+            items=response_items,
+            mode=query_mode,
+            pagination=SearchPaginationInfo.model_construct(
+                cursor=next_cursor,
+                hasMore=has_more,
+            ),
+            total=len(items) if not has_more else None,  # Only return total if we have all items
+            facets=facets,
+        )
     )
@@ -6,20 +6,39 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query, Response, status
 
-from app.api.dependencies import get_current_user, get_db_session
+from app.api.dependencies import (
+    get_current_user,
+    get_current_user_for_read,
+    get_db_session,
+    DbReadSession,
+    get_read_tag_repository,
+    get_user_repository,
+    query_budget,
+)
+from app.api.responses import ORJSONResponse
 from app.api.schemas.tags import (
     TagResponse,
     TagsListResponse,
+    RelatedTagResponse,
+    RelatedTagsResponse,
     CreateTagRequest,
     RenameTagRequest,
     UpdateTagRequest,
+    SuggestTagsRequest,
+    TagSuggestionResponse,
+    TagSuggestionsResponse,
 )
+from app.config import settings
 from app.domain.entities.user import User
 from app.domain.entities.tag import Tag
 from app.domain.exceptions import TagExistsException, TagNotFoundException
 from app.infrastructure.persistence.repositories.tag_repository_impl import (
     SQLAlchemyTagRepository,
 )
+from app.infrastructure.persistence.repositories.user_repository_impl import (
+    SQLAlchemyUserRepository,
+)
+from app.infrastructure.tagging.service import get_tag_vocabulary
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(prefix="/tags", tags=["tags"])
@@ -34,7 +53,7 @@ async def get_tag_repository(
 
 def tag_to_response(tag: Tag) -> TagResponse:
     """Convert Tag entity to response."""
-    return TagResponse(
+    return TagResponse.model_construct(
         id=tag.id,
         name=tag.name,
         usageCount=tag.usage_count,
@@ -44,15 +63,20 @@ def tag_to_response(tag: Tag) -> TagResponse:
     )
 
 
-@router.get("", response_model=TagsListResponse)
+@router.get(
+    "",
+    response_model=TagsListResponse,
+    response_class=ORJSONResponse,
+    dependencies=[query_budget(6)],
+)
 async def get_tags(
-    current_user: Annotated[User, Depends(get_current_user)],
-    tag_repo: Annotated[SQLAlchemyTagRepository, Depends(get_tag_repository)],
+    current_user: Annotated[User, Depends(get_current_user_for_read)],
+    tag_repo: Annotated[SQLAlchemyTagRepository, Depends(get_read_tag_repository)],
     q: str | None = Query(None, description="Search by name"),
     sort: str = Query("name", description="Sort by: name, usage, lastUsed"),
     unused: bool | None = Query(None, description="Filter by unused (usageCount=0)"),
     limit: int = Query(50, ge=1, le=100, description="Items per page"),
-) -> TagsListResponse:
+) -> ORJSONResponse:
     """List tags for current user with filtering and sorting."""
     tags = await tag_repo.list_by_user(
         user_id=current_user.id,
@@ -63,9 +87,88 @@ async def get_tags(
     )
     total = await tag_repo.count_by_user(current_user.id)
     
-    return TagsListResponse(
-        tags=[tag_to_response(tag) for tag in tags],
-        total=total,
+    return ORJSONResponse(
+        TagsListResponse.model_construct(
+            tags=[tag_to_response(tag) for tag in tags],
+            total=total,
+        )
+    )
+
+
+@router.get(
+    "/{tag_id}/related",
+    response_model=RelatedTagsResponse,
+    response_class=ORJSONResponse,
+    dependencies=[query_budget(6)],
+)
+async def get_related_tags(
+    tag_id: str,
+    current_user: Annotated[User, Depends(get_current_user_for_read)],
+    tag_repo: Annotated[SQLAlchemyTagRepository, Depends(get_read_tag_repository)],
+    limit: int = Query(10, ge=1, le=50, description="Max related tags"),
+) -> ORJSONResponse:
+    """Tags most often applied to the same items as this tag.
+    
+    Read from the incrementally maintained co-occurrence matrix.
+    """
+    tag = await tag_repo.get_by_id(tag_id, current_user.id)
+    if not tag:
+        raise TagNotFoundException("Tag not found", details={"tagId": tag_id})
+    related = await tag_repo.get_related(tag_id, current_user.id, limit)
+    return ORJSONResponse(
+        RelatedTagsResponse.model_construct(
+            tags=[
+                RelatedTagResponse.model_construct(
+                    id=related_tag.id,
+                    name=related_tag.name,
+                    usageCount=related_tag.usage_count,
+                    lastUsed=related_tag.last_used,
+                    createdAt=related_tag.created_at or datetime.now(timezone.utc),
+                    color=related_tag.color,
+                    itemCount=item_count,
+                )
+                for related_tag, item_count in related
+            ]
+        )
+    )
+
+
+@router.post(
+    "/suggestions",
+    response_model=TagSuggestionsResponse,
+    response_class=ORJSONResponse,
+    dependencies=[query_budget(5)],
+)
+async def suggest_tags(
+    request: SuggestTagsRequest,
+    current_user: Annotated[User, Depends(get_current_user_for_read)],
+    db: DbReadSession,
+) -> ORJSONResponse:
+    """Suggest existing tags for text, e.g. a note being saved without AI.
+    
+    Ranked locally from the user's tags and the items they were applied
+    to (no LLM call); tags already chosen in tagIds are excluded and
+    boost the tags they usually appear with.
+    """
+    vocabulary = await get_tag_vocabulary(db, current_user.id, current_user.library_version)
+    scores = vocabulary.suggest(
+        request.text,
+        request.tagIds,
+        limit=request.limit,
+        min_confidence=settings.tag_suggestion_min_confidence,
+    )
+    return ORJSONResponse(
+        TagSuggestionsResponse.model_construct(
+            suggestions=[
+                TagSuggestionResponse.model_construct(
+                    id=score.tag.id,
+                    name=score.tag.name,
+                    color=score.tag.color,
+                    confidence=score.confidence,
+                )
+                for score in scores
+            ]
+        )
     )
 
 
@@ -119,6 +222,7 @@ async def update_tag(
     request: UpdateTagRequest,
     current_user: Annotated[User, Depends(get_current_user)],
     tag_repo: Annotated[SQLAlchemyTagRepository, Depends(get_tag_repository)],
+    user_repo: Annotated[SQLAlchemyUserRepository, Depends(get_user_repository)],
 ) -> TagResponse:
     """Update a tag (name and/or color)."""
     # Get existing tag
@@ -145,6 +249,8 @@ async def update_tag(
         tag.color = request.color
     
     updated = await tag_repo.update(tag)
+    # Library cards render tag names and colors
+    await user_repo.bump_library_version(current_user.id)
     return tag_to_response(updated)
 
 
@@ -153,8 +259,10 @@ async def delete_tag(
     tag_id: str,
     current_user: Annotated[User, Depends(get_current_user)],
     tag_repo: Annotated[SQLAlchemyTagRepository, Depends(get_tag_repository)],
+    user_repo: Annotated[SQLAlchemyUserRepository, Depends(get_user_repository)],
 ) -> None:
     """Delete a tag."""
     deleted = await tag_repo.delete(tag_id, current_user.id)
     if not deleted:
         raise TagNotFoundException("Tag not found", details={"tagId": tag_id})
+    await user_repo.bump_library_version(current_user.id)
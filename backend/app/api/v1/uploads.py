@@ -1,12 +1,13 @@
 """Uploads API endpoints."""
 
-from typing import Annotated
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Header, status
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, status
 
 from app.api.dependencies import (
     get_current_user,
     get_db_session,
+    query_budget,
 )
 from app.api.schemas.uploads import (
     InitiateUploadRequest,
@@ -27,6 +28,12 @@ from app.infrastructure.persistence.repositories.upload_repository_impl import (
 from app.infrastructure.persistence.repositories.item_attachment_repository_impl import (
     SQLAlchemyItemAttachmentRepository,
 )
+from app.infrastructure.persistence.repositories.outbox_repository_impl import (
+    SQLAlchemyOutboxRepository,
+)
+from app.infrastructure.persistence.repositories.user_repository_impl import (
+    SQLAlchemyUserRepository,
+)
 from app.application.uploads.upload_service import (
     UploadService,
     FileTooLargeError,
@@ -47,7 +54,9 @@ async def get_upload_service(
     """Dependency to get UploadService instance."""
     upload_repo = SQLAlchemyUploadRepository(session)
     attachment_repo = SQLAlchemyItemAttachmentRepository(session)
-    return UploadService(upload_repo, attachment_repo)
+    outbox_repo = SQLAlchemyOutboxRepository(session)
+    user_repo = SQLAlchemyUserRepository(session)
+    return UploadService(upload_repo, attachment_repo, outbox_repo, user_repo)
 
 
 @router.post(
@@ -85,6 +94,7 @@ async def initiate_upload(
             headers_to_include=result["headers_to_include"],
             expires_at=result["expires_at"],
             status=result["status"],
+            deduplicated=result["deduplicated"],
         )
     except FileTooLargeError as e:
         raise HTTPException(
@@ -217,16 +227,20 @@ async def get_download_url(
     current_user: Annotated[User, Depends(get_current_user)],
     upload_service: Annotated[UploadService, Depends(get_upload_service)],
     preview: bool = False,
+    variant: Literal["original", "thumb"] = Query(
+        "original", description="'thumb' for an image thumbnail (falls back to original)"
+    ),
 ):
     """Get presigned download URL for an attachment.
     
     Args:
         attachment_id: Attachment ID
         preview: If true, returns inline URL for in-browser viewing (PDF preview)
+        variant: 'thumb' returns the derived thumbnail for images when ready
     """
     try:
         result = await upload_service.get_download_url(
-            current_user.id, attachment_id, preview=preview
+            current_user.id, attachment_id, preview=preview, variant=variant
         )
         return DownloadUrlResponse(**result)
     except AttachmentNotFoundError:
@@ -262,6 +276,7 @@ items_attachments_router = APIRouter(prefix="/items", tags=["items"])
 @items_attachments_router.get(
     "/{item_id}/attachments",
     response_model=AttachmentListResponse,
+    dependencies=[query_budget(6)],
 )
 async def list_item_attachments(
     item_id: str,
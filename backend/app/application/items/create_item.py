@@ -9,6 +9,7 @@ from app.domain.repositories.item_repository import ItemRepository
 from app.domain.repositories.idempotency_repository import IdempotencyRepository
 from app.domain.repositories.outbox_repository import OutboxRepository
 from app.domain.repositories.ai_usage_repository import AIUsageRepository
+from app.domain.repositories.user_repository import UserRepository
 from app.domain.services.quota_service import QuotaService, UserPlan
 from app.domain.exceptions import ValidationException, QuotaExceededException, ConcurrencyLimitExceededException
 from app.application.items.dtos import CreateItemInput, CreateItemOutput
@@ -28,6 +29,7 @@ class CreateItemUseCase:
         ai_usage_repo: AIUsageRepository,
         tag_repo=None,  # Optional: TagRepository for tag validation
         item_tag_repo=None,  # Optional: ItemTagRepository for associations
+        user_repo: UserRepository | None = None,  # Optional: library version bumps
     ):
         self.item_repo = item_repo
         self.idempotency_repo = idempotency_repo
@@ -35,6 +37,7 @@ class CreateItemUseCase:
         self.ai_usage_repo = ai_usage_repo
         self.tag_repo = tag_repo
         self.item_tag_repo = item_tag_repo
+        self.user_repo = user_repo
 
     async def execute(self, input: CreateItemInput) -> CreateItemOutput:
         """Execute the use case."""
@@ -144,7 +147,7 @@ class CreateItemUseCase:
             # Queue enrichment job
             await self.outbox_repo.create(item.id)
         else:
-            # Direct save flow: ARCHIVED immediately, no job
+            # Direct save flow: ARCHIVED immediately, no enrichment job
             title = self._generate_manual_title(raw_text)
             item = Item(
                 id=str(uuid4()),
@@ -167,7 +170,10 @@ class CreateItemUseCase:
                     await self.item_tag_repo.create(item.id, tag.id)
                     if self.tag_repo:
                         await self.tag_repo.increment_usage(tag.id)
-            # No outbox job created for direct save
+            # Embed for semantic search, as confirm does for enriched items
+            await self.outbox_repo.create(item.id, job_type="embedding")
+            if self.user_repo:
+                await self.user_repo.bump_library_version(input.user_id)
 
         # Save idempotency key
         if input.idempotency_key:
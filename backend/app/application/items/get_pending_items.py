@@ -27,11 +27,12 @@ class GetPendingItemsUseCase:
         """Execute the use case."""
         items = await self.item_repo.get_pending_by_user(input.user_id)
         
-        dtos = []
-        for item in items:
-            suggestions = await self.suggestion_repo.get_by_item_id(item.id, input.user_id)
-            dtos.append(self._to_dto(item, suggestions))
-            
+        # One query for every item's suggestions (not one per item)
+        suggestions = await self.suggestion_repo.get_by_item_ids(
+            [item.id for item in items], input.user_id
+        )
+        dtos = [self._to_dto(item, suggestions.get(item.id, [])) for item in items]
+        
         return GetPendingItemsOutput(
             items=dtos,
             total=len(items),
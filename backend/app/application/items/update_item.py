@@ -4,9 +4,11 @@ from app.domain.repositories.item_repository import ItemRepository
 from app.domain.repositories.outbox_repository import OutboxRepository
 from app.domain.repositories.item_tag_repository import ItemTagRepository
 from app.domain.repositories.item_tag_suggestion_repository import ItemTagSuggestionRepository
+from app.domain.repositories.user_repository import UserRepository
 from app.domain.exceptions import ItemNotFoundException
 from app.application.items.dtos import UpdateItemInput, UpdateItemOutput
 from app.domain.entities.item import Item
+from app.domain.value_objects import ItemStatus
 
 
 class UpdateItemUseCase:
@@ -19,12 +21,14 @@ class UpdateItemUseCase:
         tag_repo=None,
         item_tag_repo: ItemTagRepository | None = None,
         suggestion_repo: ItemTagSuggestionRepository | None = None,
+        user_repo: UserRepository | None = None,
     ):
         self.item_repo = item_repo
         self.outbox_repo = outbox_repo
         self.tag_repo = tag_repo
         self.item_tag_repo = item_tag_repo
         self.suggestion_repo = suggestion_repo
+        self.user_repo = user_repo
 
     async def execute(self, input: UpdateItemInput) -> UpdateItemOutput:
         """Execute the use case."""
@@ -37,15 +41,30 @@ class UpdateItemUseCase:
         if input.action == "confirm":
             await self._handle_confirm(item, input)
         elif input.action == "discard":
+            was_archived = item.status == ItemStatus.ARCHIVED
             item.discard()
             # Delete any pending outbox jobs
             await self.outbox_repo.delete_by_item_id(item.id)
+            if was_archived:
+                # The embedding job drops the item's search vector
+                await self.outbox_repo.create(item.id, job_type="embedding")
+                if self.item_tag_repo:
+                    await self.item_tag_repo.remove_from_co_occurrence(item.id)
         else:
             # Edit action (for ARCHIVED items)
             await self._handle_edit(item, input)
+            if any(
+                field is not None
+                for field in (input.title, input.summary, input.original_text)
+            ):
+                # Re-embed; the worker skips it if the embedded text is unchanged
+                await self.outbox_repo.create(item.id, job_type="embedding")
 
         # Save
         await self.item_repo.update(item)
+        # Confirm/discard/edit all change what the library shows
+        if self.user_repo:
+            await self.user_repo.bump_library_version(input.user_id)
 
         return UpdateItemOutput(
             id=item.id,
@@ -130,6 +149,8 @@ class UpdateItemUseCase:
 
         # Confirm with collected tags
         item.confirm(tags=collected_tag_names if collected_tag_names else input.tags)
+        # Semantic search vector for the archived title and summary
+        await self.outbox_repo.create(item.id, job_type="embedding")
 
     async def _handle_edit(self, item: Item, input: UpdateItemInput) -> None:
         """Handle edit action for ARCHIVED items."""
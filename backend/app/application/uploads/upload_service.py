@@ -1,10 +1,12 @@
 """Upload service for file upload workflow."""
 
 import re
+import time
 from datetime import datetime, timezone, timedelta
 from uuid import uuid4
 
 from app.config import settings
+from app.infrastructure.metrics import UPLOAD_VERIFY_DURATION
 from app.infrastructure.storage.s3_client import (
     generate_presigned_put_url,
     generate_presigned_get_url,
@@ -16,6 +18,12 @@ from app.infrastructure.persistence.repositories.upload_repository_impl import (
 from app.infrastructure.persistence.repositories.item_attachment_repository_impl import (
     SQLAlchemyItemAttachmentRepository,
 )
+from app.infrastructure.persistence.repositories.outbox_repository_impl import (
+    SQLAlchemyOutboxRepository,
+)
+from app.infrastructure.persistence.repositories.user_repository_impl import (
+    SQLAlchemyUserRepository,
+)
 
 
 class UploadServiceError(Exception):
@@ -74,9 +82,13 @@ class UploadService:
         self,
         upload_repo: SQLAlchemyUploadRepository,
         attachment_repo: SQLAlchemyItemAttachmentRepository,
+        outbox_repo: SQLAlchemyOutboxRepository | None = None,
+        user_repo: SQLAlchemyUserRepository | None = None,
     ):
         self.upload_repo = upload_repo
         self.attachment_repo = attachment_repo
+        self.outbox_repo = outbox_repo
+        self.user_repo = user_repo
 
     def _sanitize_filename(self, filename: str) -> str:
         """Sanitize filename for use in object key."""
@@ -120,12 +132,13 @@ class UploadService:
             size_bytes: File size in bytes
             kind: 'image' or 'file'
             item_id: Optional item to attach to
-            checksum: Optional content hash
+            checksum: Optional content hash (enables dedup against completed uploads)
             idempotency_key: Optional dedup key
             request_id: Request ID for tracing
             
         Returns:
-            Dict with upload_id, presigned_url, object_key, expires_at
+            Dict with upload_id, presigned_url, object_key, expires_at;
+            presigned_url is None when the content was deduplicated
             
         Raises:
             FileTooLargeError: If size exceeds limit
@@ -148,9 +161,19 @@ class UploadService:
                 # Return existing upload info
                 return self._format_initiate_response(existing)
         
+        # Content dedup: reuse the stored object of an identical completed upload
+        dedup_source = None
+        if checksum:
+            dedup_source = await self.upload_repo.get_completed_by_checksum(
+                user_id, checksum, size_bytes
+            )
+        
         # Generate IDs and object key
         upload_id = str(uuid4())
-        object_key = self._generate_object_key(user_id, upload_id, filename)
+        if dedup_source:
+            object_key = dedup_source.object_key
+        else:
+            object_key = self._generate_object_key(user_id, upload_id, filename)
         expires_at = datetime.now(timezone.utc) + timedelta(
             seconds=settings.upload_presigned_url_expiry_seconds
         )
@@ -169,18 +192,26 @@ class UploadService:
             idempotency_key=idempotency_key,
             request_id=request_id,
             expires_at=expires_at,
+            dedup_source_id=dedup_source.id if dedup_source else None,
         )
         
         return self._format_initiate_response(upload)
 
     def _format_initiate_response(self, upload) -> dict:
-        """Format upload model to initiate response."""
-        # Generate presigned URL
-        presigned = generate_presigned_put_url(
-            object_key=upload.object_key,
-            content_type=upload.mime_type,
-            content_length=upload.size_bytes,
-        )
+        """Format upload model to initiate response.
+        
+        Deduplicated uploads already have their bytes in storage, so no
+        presigned PUT URL is issued; the client goes straight to complete.
+        """
+        deduplicated = upload.dedup_source_id is not None
+        if deduplicated:
+            presigned = {"presigned_url": None, "headers_to_include": {}}
+        else:
+            presigned = generate_presigned_put_url(
+                object_key=upload.object_key,
+                content_type=upload.mime_type,
+                content_length=upload.size_bytes,
+            )
         
         return {
             "upload_id": upload.id,
@@ -189,6 +220,7 @@ class UploadService:
             "headers_to_include": presigned["headers_to_include"],
             "expires_at": upload.expires_at,
             "status": upload.status,
+            "deduplicated": deduplicated,
         }
 
     async def complete_upload(
@@ -236,7 +268,11 @@ class UploadService:
             raise UploadExpiredError("Presigned URL has expired")
         
         # Verify object exists in S3
+        start = time.perf_counter()
         obj_meta = head_object(upload.object_key)
+        UPLOAD_VERIFY_DURATION.labels("found" if obj_meta else "missing").observe(
+            time.perf_counter() - start
+        )
         if not obj_meta:
             await self.upload_repo.mark_failed(upload_id)
             raise UploadVerificationError("Object not found in storage")
@@ -255,6 +291,18 @@ class UploadService:
             kind=upload.kind,
         )
         
+        # Queue thumbnail derivation for images (same transaction as completion)
+        if (
+            upload.kind == "image"
+            and settings.upload_thumbnails_enabled
+            and self.outbox_repo is not None
+        ):
+            await self.outbox_repo.create(item_id, job_type="thumbnail", upload_id=upload_id)
+        
+        # Attachment counts show on library cards
+        if self.user_repo is not None:
+            await self.user_repo.bump_library_version(user_id)
+        
         return self._format_complete_response(upload, attachment)
 
     def _format_complete_response(self, upload, attachment) -> dict:
@@ -304,7 +352,11 @@ class UploadService:
         return await self.upload_repo.soft_delete(upload_id, user_id)
 
     async def get_download_url(
-        self, user_id: str, attachment_id: str, preview: bool = False
+        self,
+        user_id: str,
+        attachment_id: str,
+        preview: bool = False,
+        variant: str = "original",
     ) -> dict:
         """Get presigned download URL for attachment.
         
@@ -312,9 +364,11 @@ class UploadService:
             user_id: User requesting download
             attachment_id: Attachment to download
             preview: If True, use inline disposition for in-browser viewing
+            variant: 'original' or 'thumb'; falls back to the original
+                while the thumbnail is not (yet) available
             
         Returns:
-            Dict with download_url and metadata
+            Dict with download_url, served variant and attachment metadata
             
         Raises:
             AttachmentNotFoundError: If attachment not found
@@ -329,14 +383,19 @@ class UploadService:
             raise AttachmentNotFoundError("Associated upload not found")
         
         # Generate presigned GET URL
-        presigned = generate_presigned_get_url(
-            object_key=upload.object_key,
-            filename=upload.filename,
-            inline=preview,
-        )
+        if variant == "thumb" and upload.thumb_key:
+            presigned = generate_presigned_get_url(object_key=upload.thumb_key)
+        else:
+            variant = "original"
+            presigned = generate_presigned_get_url(
+                object_key=upload.object_key,
+                filename=upload.filename,
+                inline=preview,
+            )
         
         return {
             "download_url": presigned["presigned_url"],
+            "variant": variant,
             "expires_at": datetime.now(timezone.utc) + timedelta(
                 seconds=presigned["expires_in_seconds"]
             ),
@@ -350,10 +409,13 @@ class UploadService:
     ) -> list[dict]:
         """List all attachments for an item."""
         attachments = await self.attachment_repo.list_by_item(item_id, user_id)
+        uploads = await self.upload_repo.get_by_ids(
+            [att.upload_id for att in attachments], user_id
+        )
         
         result = []
         for att in attachments:
-            upload = await self.upload_repo.get_by_id(att.upload_id, user_id)
+            upload = uploads.get(att.upload_id)
             result.append({
                 "id": att.id,
                 "upload_id": att.upload_id,
@@ -368,4 +430,7 @@ class UploadService:
 
     async def delete_attachment(self, user_id: str, attachment_id: str) -> bool:
         """Soft delete an attachment."""
-        return await self.attachment_repo.soft_delete(attachment_id, user_id)
+        deleted = await self.attachment_repo.soft_delete(attachment_id, user_id)
+        if deleted and self.user_repo is not None:
+            await self.user_repo.bump_library_version(user_id)
+        return deleted
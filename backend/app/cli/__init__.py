@@ -0,0 +1 @@
+"""Admin command-line tools (run as python -m app.cli.<name>)."""
@@ -0,0 +1,207 @@
+"""Re-enrich archived items after an LLM_MODEL or system prompt change.
+
+Selects ARCHIVED items, optionally one user's, confirmed within a date
+range, or enriched with a given enrichment version, in keyset-paginated
+chunks. MANUAL items (saved without AI) are never selected. For each it queues a 'reenrichment' outbox job. The worker's
+batch lane runs these at the lowest priority, JOB_BATCH_SIZE items per
+LLM call. Results only fill missing fields and add new tag suggestions;
+confirmed titles, summaries and tags are never overwritten.
+
+By default, items already at the current enrichment version (LLM_MODEL
+plus system prompt digest, see get_enrichment_version) are skipped.
+Items enriched before versions were recorded count as stale.
+
+Throttling: at most --rate jobs are queued per minute, and queueing
+pauses while --max-queued re-enrichment jobs are waiting or running.
+
+After each chunk, the last item ID, the count so far and the filters
+are checkpointed to --checkpoint. Running the same command again
+resumes from there; --restart starts over.
+
+--embeddings queues 'embedding' jobs instead, to build semantic search
+vectors for items archived before embeddings existed (or after an
+EMBEDDING_MODEL change), MANUAL items included. The worker skips items whose vector is current.
+
+Usage:
+    uv run python -m app.cli.reenrich --dry-run
+    uv run python -m app.cli.reenrich --user-id USER --confirmed-from 2026-01-01
+    uv run python -m app.cli.reenrich --rate 120 --max-queued 200
+    uv run python -m app.cli.reenrich --version "openai/gpt-4o-mini#0123456789ab"
+    uv run python -m app.cli.reenrich --embeddings --checkpoint embed_checkpoint.json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from app.infrastructure.enrichment.prompt_loader import PromptLoader
+from app.infrastructure.enrichment.prompts import get_enrichment_version
+from app.infrastructure.persistence.database import (
+    DatabaseRole,
+    dispose_engines,
+    get_db_session_context,
+)
+from app.infrastructure.persistence.repositories.item_repository_impl import (
+    SQLAlchemyItemRepository,
+)
+from app.infrastructure.persistence.repositories.outbox_repository_impl import (
+    SQLAlchemyOutboxRepository,
+)
+
+JOB_TYPE = "reenrichment"
+EMBEDDING_JOB_TYPE = "embedding"
+QUEUE_POLL_SECS = 5.0
+
+
+def _parse_date(value: str) -> datetime:
+    """ISO date or datetime; naive values are UTC."""
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _load_checkpoint(path: Path, filters: dict, restart: bool) -> dict:
+    """Checkpoint for these filters, or a fresh one."""
+    fresh = {"filters": filters, "after_id": None, "queued": 0}
+    if restart or not path.exists():
+        return fresh
+    checkpoint = json.loads(path.read_text())
+    if checkpoint.get("filters") != filters:
+        sys.exit(
+            f"{path} was written for other filters ({checkpoint.get('filters')}); "
+            "pass --restart or another --checkpoint"
+        )
+    return checkpoint
+
+
+def _save_checkpoint(path: Path, checkpoint: dict) -> None:
+    """Write the checkpoint atomically."""
+    checkpoint["updated_at"] = datetime.now(timezone.utc).isoformat()
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(checkpoint, indent=2))
+    tmp.replace(path)
+
+
+async def _queue_room(job_type: str, max_queued: int) -> tuple[int, int]:
+    """Wait until fewer than max_queued jobs are active.
+
+    Returns:
+        (free slots, active jobs)
+    """
+    while True:
+        async with get_db_session_context(DatabaseRole.MAINTENANCE) as session:
+            active = await SQLAlchemyOutboxRepository(session).count_active(job_type)
+        if active < max_queued:
+            return max_queued - active, active
+        await asyncio.sleep(QUEUE_POLL_SECS)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--user-id", help="Only this user's items")
+    parser.add_argument("--confirmed-from", type=_parse_date, help="Inclusive, ISO date")
+    parser.add_argument("--confirmed-to", type=_parse_date, help="Exclusive, ISO date")
+    versions = parser.add_mutually_exclusive_group()
+    versions.add_argument("--version", help="Only items enriched with this version")
+    versions.add_argument(
+        "--all-versions", action="store_true", help="Include items at the current version"
+    )
+    versions.add_argument(
+        "--embeddings", action="store_true", help="Queue semantic search embedding jobs"
+    )
+    parser.add_argument("--chunk-size", type=int, default=100)
+    parser.add_argument("--rate", type=float, default=300.0, help="Max jobs queued per minute")
+    parser.add_argument(
+        "--max-queued", type=int, default=500, help="Pause while this many jobs are active"
+    )
+    parser.add_argument("--checkpoint", type=Path, default=Path("reenrich_checkpoint.json"))
+    parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint")
+    parser.add_argument("--dry-run", action="store_true", help="Count matching items only")
+    args = parser.parse_args()
+
+    PromptLoader.load()
+    current = get_enrichment_version()
+    job_type = EMBEDDING_JOB_TYPE if args.embeddings else JOB_TYPE
+    filters = {
+        "user_id": args.user_id,
+        "confirmed_from": args.confirmed_from,
+        "confirmed_to": args.confirmed_to,
+        "version": args.version,
+        "exclude_version": (
+            None if args.version or args.all_versions or args.embeddings else current
+        ),
+    }
+    # Checkpoints compare filters as JSON
+    saved_filters = {
+        key: value.isoformat() if isinstance(value, datetime) else value
+        for key, value in filters.items()
+    }
+    if args.embeddings:
+        saved_filters["job_type"] = job_type  # Never resume a re-enrichment checkpoint
+    checkpoint = _load_checkpoint(args.checkpoint, saved_filters, args.restart)
+
+    try:
+        async with get_db_session_context(DatabaseRole.MAINTENANCE) as session:
+            remaining = await SQLAlchemyItemRepository(session).count_for_reenrichment_system(
+                checkpoint["after_id"], ai_only=not args.embeddings, **filters
+            )
+        total = checkpoint["queued"] + remaining
+        print(f"current enrichment version {current}")
+        print(
+            f"{remaining} items to queue"
+            + (f" (resuming after {checkpoint['queued']} queued)" if checkpoint["queued"] else "")
+        )
+        if args.dry_run or not remaining:
+            return
+
+        started = time.monotonic()
+        queued_this_run = 0
+        while True:
+            room, active = await _queue_room(job_type, args.max_queued)
+            async with get_db_session_context(DatabaseRole.MAINTENANCE) as session:
+                item_ids = await SQLAlchemyItemRepository(
+                    session
+                ).list_ids_for_reenrichment_system(
+                    checkpoint["after_id"],
+                    min(args.chunk_size, room),
+                    ai_only=not args.embeddings,
+                    **filters,
+                )
+                outbox_repo = SQLAlchemyOutboxRepository(session)
+                for item_id in item_ids:
+                    await outbox_repo.create(item_id, job_type=job_type)
+            if not item_ids:
+                break
+
+            # The chunk is committed; record it before anything else can fail
+            checkpoint["after_id"] = item_ids[-1]
+            checkpoint["queued"] += len(item_ids)
+            _save_checkpoint(args.checkpoint, checkpoint)
+
+            queued_this_run += len(item_ids)
+            elapsed = time.monotonic() - started
+            print(
+                f"queued {checkpoint['queued']}/{total} "
+                f"({checkpoint['queued'] / total:.0%}), "
+                f"{queued_this_run / max(elapsed, 1e-9) * 60:.0f}/min, "
+                f"{active + len(item_ids)} active jobs"
+            )
+            # Rate cap: stay at or below --rate jobs per minute on average
+            ahead = queued_this_run * 60 / args.rate - elapsed
+            if ahead > 0:
+                await asyncio.sleep(ahead)
+
+        lane = "interactive" if args.embeddings else "batch"
+        print(
+            f"done: {checkpoint['queued']} items queued; the worker {lane} lane "
+            f"processes them (outbox job_type {job_type!r})"
+        )
+    finally:
+        await dispose_engines()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
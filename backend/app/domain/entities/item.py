@@ -23,6 +23,8 @@ class Item:
     confirmed_at: datetime | None = None
     tags: list[str] = field(default_factory=list)
     enrichment_mode: EnrichmentMode = EnrichmentMode.AI
+    attachment_count: int = 0
+    enrichment_version: str | None = None  # Model and prompt of the last AI enrichment
 
     # State transition rules per state_machine.md
     _ALLOWED_TRANSITIONS: dict[ItemStatus, dict[str, ItemStatus]] = field(
@@ -85,6 +87,7 @@ class Item:
         summary: str,
         suggested_tags: list[str],  # No longer stored on item; kept for API compatibility
         source_type: SourceType,
+        enrichment_version: str | None = None,
     ) -> None:
         """Mark item as enriched (called by worker).
         
@@ -98,9 +101,35 @@ class Item:
         # NOTE: tags are NOT set here - they go to item_tag_suggestions table
         # self.tags remains empty until user confirms with accepted suggestions
         self.source_type = source_type
+        self.enrichment_version = enrichment_version
         self.status = ItemStatus.READY_TO_CONFIRM
         self.updated_at = datetime.now(timezone.utc)
 
+    def apply_reenrichment(
+        self,
+        title: str,
+        summary: str,
+        source_type: SourceType,
+        enrichment_version: str | None = None,
+    ) -> bool:
+        """Apply a re-enrichment of an archived item (called by worker).
+        
+        Confirmed content is kept: title, summary and source type are only
+        filled where missing. New tags go to item_tag_suggestions.
+        
+        Returns:
+            True if any of title, summary or source type was filled.
+        """
+        if self.status != ItemStatus.ARCHIVED:
+            return False  # Silently skip if discarded meanwhile
+        before = (self.title, self.summary, self.source_type)
+        self.title = self.title or title
+        self.summary = self.summary or summary
+        self.source_type = self.source_type or source_type
+        self.enrichment_version = enrichment_version
+        self.updated_at = datetime.now(timezone.utc)
+        return (self.title, self.summary, self.source_type) != before
+
     def mark_failed(self) -> None:
         """Mark item as failed enrichment."""
         if self.status != ItemStatus.ENRICHING:
@@ -49,6 +49,7 @@ class User:
     avatar_url: str | None = None  # User-set override for avatar
     bio: str | None = None
     preferences: UserPreferences = field(default_factory=UserPreferences)
+    library_version: int = 0  # Bumped whenever archived items change
 
     def get_display_name(self) -> str:
         """Get display name with fallback chain: nickname > display_name > email prefix > 'Member'."""
@@ -0,0 +1,50 @@
+"""Item embedding repository interface."""
+
+from abc import ABC, abstractmethod
+
+
+class ItemEmbeddingRepository(ABC):
+    """Abstract repository for item embedding vectors (semantic search)."""
+
+    @abstractmethod
+    async def get_fingerprint(self, item_id: str) -> tuple[str, str] | None:
+        """(model, content_hash) of the stored vector, or None if there is none."""
+        pass
+
+    @abstractmethod
+    async def upsert(
+        self,
+        item_id: str,
+        user_id: str,
+        model: str,
+        content_hash: str,
+        embedding: list[float],
+    ) -> None:
+        """Store or replace the vector for an item."""
+        pass
+
+    @abstractmethod
+    async def delete_by_item_id(self, item_id: str) -> None:
+        """Delete the vector for an item, if any."""
+        pass
+
+    @abstractmethod
+    async def nearest(
+        self,
+        user_id: str,
+        embedding: list[float],
+        limit: int,
+        max_distance: float,
+        *,
+        exact_max_items: int,
+    ) -> list[tuple[str, float]]:
+        """A user's ARCHIVED items closest to embedding.
+
+        Users with at most exact_max_items vectors are searched exactly
+        rather than through the approximate index.
+
+        Returns:
+            Up to limit (item_id, cosine distance) pairs within
+            max_distance, nearest first.
+        """
+        pass
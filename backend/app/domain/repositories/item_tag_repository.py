@@ -8,7 +8,11 @@ class ItemTagRepository(ABC):
 
     @abstractmethod
     async def create(self, item_id: str, tag_id: str) -> None:
-        """Create an association between item and tag."""
+        """Create an association between item and tag.
+        
+        Implementations keep the tag co-occurrence counts in step with
+        associations (here and in delete_by_item_id).
+        """
         pass
 
     @abstractmethod
@@ -21,6 +25,11 @@ class ItemTagRepository(ABC):
         """Delete all tag associations for an item."""
         pass
 
+    @abstractmethod
+    async def remove_from_co_occurrence(self, item_id: str) -> None:
+        """Uncount an item's tag pairs, keeping its associations (library discard)."""
+        pass
+
     @abstractmethod
     async def get_tag_ids_by_item_id(self, item_id: str) -> list[str]:
         """Get all tag IDs associated with an item."""
@@ -35,3 +44,15 @@ class ItemTagRepository(ABC):
     async def count_by_tag_id(self, tag_id: str) -> int:
         """Count items associated with a tag."""
         pass
+
+    @abstractmethod
+    async def get_recent_tagged_items(
+        self, user_id: str, limit: int, raw_text_chars: int
+    ) -> list[tuple[str | None, str | None, str, list[str]]]:
+        """A user's most recently confirmed ARCHIVED items with their tags.
+
+        Returns:
+            (title, summary, first raw_text_chars of raw_text, tag ids)
+            per item, untagged items included.
+        """
+        pass
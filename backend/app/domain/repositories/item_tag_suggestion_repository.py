@@ -33,6 +33,13 @@ class ItemTagSuggestionRepository(ABC):
         """Get all suggestions for an item."""
         ...
 
+    @abstractmethod
+    async def get_by_item_ids(
+        self, item_ids: list[str], user_id: str
+    ) -> dict[str, list[ItemTagSuggestion]]:
+        """Get suggestions for several items in one query, keyed by item ID."""
+        ...
+
     @abstractmethod
     async def update(self, suggestion: ItemTagSuggestion) -> ItemTagSuggestion:
         """Update an existing suggestion."""
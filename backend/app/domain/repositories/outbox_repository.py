@@ -4,6 +4,9 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
 
+# Claimed in groups by the worker's batch lane, in this priority order
+BATCH_LANE_JOB_TYPES = ("enrichment_batch", "reenrichment")
+
 
 @dataclass
 class OutboxJob:
@@ -11,7 +14,8 @@ class OutboxJob:
 
     id: str
     item_id: str
-    job_type: str  # 'enrichment' (extensible)
+    # 'enrichment', 'thumbnail', 'embedding'; batch lane: 'enrichment_batch', 'reenrichment'
+    job_type: str
     status: str  # PENDING, IN_PROGRESS, DONE, FAILED, DEAD
     attempt_count: int
     run_at: datetime
@@ -21,13 +25,24 @@ class OutboxJob:
     last_error_code: str | None
     last_error_message: str | None
     created_at: datetime
+    upload_id: str | None = None  # Set for thumbnail jobs
+
+
+@dataclass
+class OutboxQueueStats:
+    """Outbox depth snapshot (for metrics)."""
+
+    counts_by_status: dict[str, int]
+    oldest_pending_run_at: datetime | None  # Oldest runnable PENDING job
 
 
 class OutboxRepository(ABC):
     """Abstract repository for enrichment outbox with lease-based claiming."""
 
     @abstractmethod
-    async def create(self, item_id: str, job_type: str = "enrichment") -> OutboxJob:
+    async def create(
+        self, item_id: str, job_type: str = "enrichment", upload_id: str | None = None
+    ) -> OutboxJob:
         """Create a new outbox job."""
         ...
 
@@ -44,6 +59,26 @@ class OutboxRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def claim_pending_batch(
+        self, worker_id: str, job_type: str, limit: int, lease_seconds: int = 300
+    ) -> list[OutboxJob]:
+        """Claim up to limit runnable jobs of one type, oldest first.
+        
+        Used by the batch lane; claim_next_pending() never returns
+        BATCH_LANE_JOB_TYPES jobs.
+        
+        Args:
+            worker_id: Identifier for the worker claiming the jobs.
+            job_type: Job type to claim.
+            limit: Maximum number of jobs.
+            lease_seconds: How long the leases are valid.
+            
+        Returns:
+            The claimed jobs (empty if none are runnable).
+        """
+        ...
+
     @abstractmethod
     async def mark_completed(self, job_id: str) -> None:
         """Mark job as completed and delete."""
@@ -91,7 +126,17 @@ class OutboxRepository(ABC):
         """Delete outbox job by item ID (when item is discarded)."""
         ...
 
+    @abstractmethod
+    async def count_active(self, job_type: str) -> int:
+        """Count PENDING and IN_PROGRESS jobs of one type (backfill throttling)."""
+        ...
+
     @abstractmethod
     async def get_pending_count(self) -> int:
         """Get count of pending jobs (for metrics)."""
         ...
+
+    @abstractmethod
+    async def get_queue_stats(self) -> OutboxQueueStats:
+        """Get job counts by status and the oldest runnable PENDING job."""
+        ...
@@ -22,3 +22,8 @@ class UserRepository(ABC):
     async def get_or_create_dev_user(self, user_id: str) -> User:
         """Get or create a dev user (for X-Dev-User-Id auth)."""
         ...
+
+    @abstractmethod
+    async def bump_library_version(self, user_id: str) -> None:
+        """Mark the user's library as changed (invalidates cached pages)."""
+        ...
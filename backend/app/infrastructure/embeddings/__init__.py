@@ -0,0 +1 @@
+"""Embedding infrastructure package (semantic search)."""
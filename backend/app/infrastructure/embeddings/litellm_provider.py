@@ -0,0 +1,65 @@
+"""LiteLLM embedding provider implementation."""
+
+import logging
+import math
+import time
+
+import litellm
+
+from app.config import settings
+from app.infrastructure.embeddings.provider_interface import (
+    EMBEDDING_DIMENSIONS,
+    EmbeddingError,
+    EmbeddingProvider,
+)
+from app.infrastructure.metrics import EMBEDDING_REQUEST_DURATION
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize(vector: list[float]) -> list[float]:
+    norm = math.sqrt(sum(x * x for x in vector))
+    return [x / norm for x in vector] if norm else vector
+
+
+class LiteLLMEmbeddingProvider(EmbeddingProvider):
+    """Embeddings from EMBEDDING_MODEL through LiteLLM.
+
+    Requests EMBEDDING_DIMENSIONS-wide vectors, so the model must support
+    shortened output (OpenAI text-embedding-3-*, Gemini, Voyage, ...).
+    """
+
+    def __init__(self):
+        self.model_label = settings.embedding_model
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts with one API call."""
+        start = time.perf_counter()
+        try:
+            response = await litellm.aembedding(
+                model=settings.embedding_model,
+                input=texts,
+                dimensions=EMBEDDING_DIMENSIONS,
+                timeout=settings.embedding_timeout_seconds,
+            )
+        except litellm.exceptions.RateLimitError as e:
+            logger.warning(f"Embedding rate limited: {e}")
+            raise EmbeddingError(
+                "Embedding rate limited", error_code="EMBEDDING_RATE_LIMITED"
+            ) from e
+        except Exception as e:
+            logger.error(f"Embedding call failed: {e}")
+            raise EmbeddingError("Embedding API error", error_code="EMBEDDING_API_ERROR") from e
+        finally:
+            EMBEDDING_REQUEST_DURATION.labels(settings.embedding_model).observe(
+                time.perf_counter() - start
+            )
+
+        data = sorted(response.data, key=lambda entry: entry["index"])
+        vectors = [_normalize(list(entry["embedding"])) for entry in data]
+        if len(vectors) != len(texts) or any(len(v) != EMBEDDING_DIMENSIONS for v in vectors):
+            raise EmbeddingError(
+                f"Expected {len(texts)} vectors of {EMBEDDING_DIMENSIONS} dimensions",
+                error_code="EMBEDDING_SHAPE_MISMATCH",
+            )
+        return vectors
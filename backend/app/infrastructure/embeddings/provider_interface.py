@@ -0,0 +1,55 @@
+"""Embedding provider interface and embedding input."""
+
+import hashlib
+from abc import ABC, abstractmethod
+
+from app.infrastructure.enrichment.input_compaction import clean_text
+
+# Width of item_embeddings.embedding (migration 019); providers must match
+EMBEDDING_DIMENSIONS = 256
+
+# Raw text stands in for items without title and summary (manual captures)
+RAW_TEXT_FALLBACK_CHARS = 2000
+
+
+class EmbeddingProvider(ABC):
+    """Abstract base class for embedding providers."""
+
+    # Recorded with each stored vector; a change re-embeds items on their next job
+    model_label: str
+
+    @abstractmethod
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts.
+
+        Args:
+            texts: Texts to embed (item title and summary, or a query).
+
+        Returns:
+            One unit-length vector of EMBEDDING_DIMENSIONS floats per text,
+            in order.
+
+        Raises:
+            EmbeddingError: If the request fails.
+        """
+        pass
+
+
+class EmbeddingError(Exception):
+    """Base exception for embedding failures."""
+
+    def __init__(self, message: str, error_code: str = "EMBEDDING_ERROR"):
+        super().__init__(message)
+        self.error_code = error_code
+        self.message = message
+
+
+def embedding_text(title: str | None, summary: str | None, raw_text: str = "") -> str:
+    """Text embedded for an item: title and summary, else the start of the raw text."""
+    text = "\n\n".join(part.strip() for part in (title, summary) if part and part.strip())
+    return text or clean_text(raw_text)[:RAW_TEXT_FALLBACK_CHARS]
+
+
+def content_hash(text: str) -> str:
+    """Digest of the embedded text; unchanged text is not re-embedded."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
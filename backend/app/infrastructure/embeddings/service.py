@@ -0,0 +1,51 @@
+"""Embedding provider selection and cached query embeddings."""
+
+from app.config import LLMProvider, settings
+from app.infrastructure.embeddings.provider_interface import EmbeddingProvider
+from app.infrastructure.embeddings.stub_provider import StubEmbeddingProvider
+from app.infrastructure.lru_cache import VersionedLRUCache
+
+_provider: EmbeddingProvider | None = None
+
+
+def get_embedding_provider() -> EmbeddingProvider:
+    """The configured provider, built on first use (LiteLLM loads lazily)."""
+    global _provider
+    if _provider is None:
+        if settings.embedding_provider == LLMProvider.LITELLM:
+            from app.infrastructure.embeddings.litellm_provider import (
+                LiteLLMEmbeddingProvider,
+            )
+            _provider = LiteLLMEmbeddingProvider()
+        else:
+            _provider = StubEmbeddingProvider()
+    return _provider
+
+
+class QueryEmbeddingCache:
+    """LRU cache of query vectors, keyed by model and normalized query.
+
+    Paging through semantic results and repeated searches reuse the
+    vector instead of paying an embedding call per request.
+    """
+
+    def __init__(self, max_entries: int):
+        self._vectors = VersionedLRUCache[list[float]](max_entries, name="query_embedding")
+
+    async def embed(self, provider: EmbeddingProvider, query: str) -> list[float]:
+        """Vector for query, from the cache or one provider call."""
+        key = (provider.model_label, " ".join(query.split()))
+        vector = self._vectors.get(key)
+        if vector is None:
+            [vector] = await provider.embed([key[1]])
+            self._vectors.put(key, vector)
+        return vector
+
+    def clear(self) -> None:
+        self._vectors.clear()
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+
+query_embedding_cache = QueryEmbeddingCache(settings.embedding_query_cache_size)
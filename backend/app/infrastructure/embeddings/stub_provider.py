@@ -0,0 +1,65 @@
+"""Deterministic local embedding provider (no API calls)."""
+
+import hashlib
+import math
+import re
+
+from app.infrastructure.embeddings.provider_interface import (
+    EMBEDDING_DIMENSIONS,
+    EmbeddingProvider,
+)
+
+MODEL_LABEL = "stub-hashing-v1"
+
+# Character trigrams count for less than whole words
+TRIGRAM_WEIGHT = 0.5
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from in is it of on or that the this to was with".split()
+)
+
+
+def _features(text: str) -> dict[str, float]:
+    """Weighted words and word trigrams (so 'meeting' is near 'meetings')."""
+    features: dict[str, float] = {}
+    for word in _TOKEN.findall(text.lower()):
+        if word in _STOPWORDS:
+            continue
+        features[word] = features.get(word, 0.0) + 1.0
+        padded = f"<{word}>"
+        for i in range(len(padded) - 2):
+            gram = "#" + padded[i:i + 3]
+            features[gram] = features.get(gram, 0.0) + TRIGRAM_WEIGHT
+    return features
+
+
+def hash_embedding(text: str, dimensions: int = EMBEDDING_DIMENSIONS) -> list[float]:
+    """Signed feature-hashing embedding, L2-normalized.
+
+    Stable across processes and runs (blake2b, not hash()), so vectors
+    stored by the worker match queries embedded by the API. Texts with no
+    features embed to the zero vector.
+    """
+    vector = [0.0] * dimensions
+    for feature, weight in _features(text).items():
+        digest = int.from_bytes(
+            hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        vector[digest % dimensions] += weight if digest >> 63 else -weight
+    norm = math.sqrt(sum(x * x for x in vector))
+    return [x / norm for x in vector] if norm else vector
+
+
+class StubEmbeddingProvider(EmbeddingProvider):
+    """Lexical-overlap embeddings for development and tests.
+
+    Items sharing words or word fragments with the query rank closer; no
+    synonyms or meaning. Set EMBEDDING_PROVIDER=litellm for real models.
+    """
+
+    model_label = MODEL_LABEL
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """Hash each text locally."""
+        return [hash_embedding(text) for text in texts]
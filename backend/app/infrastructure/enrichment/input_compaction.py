@@ -0,0 +1,178 @@
+"""Token-budgeted compaction of captured text before the LLM call.
+
+Captures can be up to 10,000 characters. Enrichment only needs enough
+of the text to title, summarize and tag it, so the prompt gets:
+
+1. The text with boilerplate removed: URL tracking parameters, markdown
+   decoration (images, rules, emphasis markers, HTML comments) and
+   repeated whitespace.
+2. If that still exceeds the token budget, the opening and closing
+   sentences plus the highest-scoring sentences from the middle (term
+   frequency over the whole text), in original order, with omissions
+   marked "[...]".
+
+Tokens are counted with the caller's tokenizer (the model's, for
+LiteLLM) or estimate_tokens(), which treats CJK characters as a token
+each. Results are memoized per (text, budget, tokenizer), so retries of
+an item reuse the work.
+"""
+
+import re
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+TokenCounter = Callable[[str], int]
+
+# Share of the budget kept from the start and the end of the text
+HEAD_SHARE = 0.4
+TAIL_SHARE = 0.2
+OMISSION = "[...]"
+
+_TRACKING_PARAMS = re.compile(
+    r"^(utm_\w+|fbclid|gclid|dclid|msclkid|mc_cid|mc_eid|igshid|si"
+    r"|ref_src|ref_url|_hsenc|_hsmi)$",
+    re.IGNORECASE,
+)
+_URL = re.compile(r"https?://[^\s<>()\[\]\"']+")
+_MD_IMAGE = re.compile(r"!\[([^\]]*)\]\([^)]*\)")
+_MD_RULE = re.compile(r"^\s*([-*_])(\s*\1){2,}\s*$", re.MULTILINE)
+_MD_EMPHASIS = re.compile(r"(\*\*|__|~~)(?=\S)(.+?)(?<=\S)\1")
+_HTML_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+_INLINE_SPACE = re.compile(r"[ \t\u00a0\u3000]+")
+_BLANK_LINES = re.compile(r"\n\s*\n(\s*\n)+")
+_SENTENCE = re.compile(r"[^.!?。！？\n]+(?:[.!?。！？]+|\n|$)")
+_WORD = re.compile(r"[^\W\d_]{3,}", re.UNICODE)
+_CJK = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff]")
+
+_STOPWORDS = frozenset(
+    "the and for that this with from have are was were but not you your they them "
+    "their there what when which will would about into than then also just can "
+    "could should been being more most some such only other over very".split()
+)
+
+
+@dataclass(frozen=True)
+class CompactedInput:
+    """Text to send to the LLM, with its token count."""
+
+    text: str
+    tokens: int
+    original_tokens: int
+    excerpted: bool  # Parts were dropped to fit the budget
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count without a tokenizer.
+
+    CJK characters are about one token each; other text about four
+    characters per token.
+    """
+    cjk = len(_CJK.findall(text))
+    return cjk + (len(text) - cjk + 3) // 4
+
+
+def _strip_tracking(match: re.Match) -> str:
+    url = match.group(0)
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _TRACKING_PARAMS.match(key)
+    ]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def clean_text(text: str) -> str:
+    """Remove boilerplate that costs tokens but carries no meaning."""
+    text = _HTML_COMMENT.sub("", text)
+    text = _MD_IMAGE.sub(r"\1", text)
+    text = _MD_RULE.sub("", text)
+    text = _MD_EMPHASIS.sub(r"\2", text)
+    text = _URL.sub(_strip_tracking, text)
+    text = _INLINE_SPACE.sub(" ", text)
+    text = "\n".join(line.strip() for line in text.split("\n"))
+    return _BLANK_LINES.sub("\n\n", text).strip()
+
+
+def _sentences(text: str) -> list[str]:
+    return [s.strip() for s in _SENTENCE.findall(text) if s.strip()]
+
+
+def _terms(sentence: str) -> list[str]:
+    """Words for scoring; CJK runs contribute character bigrams."""
+    terms = [w.lower() for w in _WORD.findall(sentence) if w.lower() not in _STOPWORDS]
+    cjk = "".join(_CJK.findall(sentence))
+    terms.extend(cjk[i:i + 2] for i in range(len(cjk) - 1))
+    return terms
+
+
+def _excerpt(sentences: list[str], max_tokens: int, count_tokens: TokenCounter) -> str:
+    """Head, tail and key middle sentences within max_tokens."""
+    costs = [count_tokens(s) + 1 for s in sentences]  # +1 for the separator
+    keep: set[int] = set()
+    used = 0
+
+    def take(index: int, limit: int, extra: int = 0) -> bool:
+        nonlocal used
+        if used + costs[index] + extra > limit:
+            return False
+        keep.add(index)
+        used += costs[index] + extra
+        return True
+
+    head_limit = int(max_tokens * HEAD_SHARE)
+    for i in range(len(sentences)):
+        if not take(i, head_limit):
+            break
+    tail_limit = used + int(max_tokens * TAIL_SHARE)
+    for i in reversed(range(len(sentences))):
+        if i in keep or not take(i, tail_limit):
+            break
+
+    frequencies = Counter(term for s in sentences for term in set(_terms(s)))
+
+    def score(index: int) -> float:
+        terms = _terms(sentences[index])
+        return sum(frequencies[t] for t in terms) / (len(terms) + 1) if terms else 0.0
+
+    # Every middle sentence may open one more gap; reserve its marker too
+    marker = count_tokens(OMISSION) + 1
+    used += marker
+    for i in sorted(set(range(len(sentences))) - keep, key=score, reverse=True):
+        take(i, max_tokens, extra=marker)
+
+    pieces = []
+    for i in range(len(sentences)):
+        if i in keep:
+            pieces.append(sentences[i])
+        elif not pieces or pieces[-1] != OMISSION:
+            pieces.append(OMISSION)
+    return " ".join(pieces)
+
+
+@lru_cache(maxsize=256)
+def compact(
+    text: str, max_tokens: int, count_tokens: TokenCounter = estimate_tokens
+) -> CompactedInput:
+    """Clean text and, if it exceeds max_tokens, reduce it to key excerpts."""
+    original_tokens = count_tokens(text)
+    cleaned = clean_text(text)
+    tokens = count_tokens(cleaned)
+    if tokens <= max_tokens:
+        return CompactedInput(cleaned, tokens, original_tokens, excerpted=False)
+
+    excerpt = _excerpt(_sentences(cleaned), max_tokens, count_tokens)
+    if not excerpt.replace(OMISSION, "").strip():
+        excerpt = cleaned  # No sentence fits (e.g. no punctuation)
+    result, tokens, chars = excerpt, count_tokens(excerpt), len(excerpt)
+    # Still over budget: cut the end off
+    while tokens > max_tokens and chars > 0:
+        chars = int(chars * max_tokens / tokens * 0.9)
+        result = f"{excerpt[:chars].rstrip()} {OMISSION}"
+        tokens = count_tokens(result)
+    return CompactedInput(result, tokens, original_tokens, excerpted=True)
@@ -2,10 +2,14 @@
 
 import asyncio
 import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 
 import instructor
 import litellm
+from litellm.integrations.custom_logger import CustomLogger
 from pydantic import ValidationError
 
 from app.config import settings
@@ -14,22 +18,72 @@ from app.infrastructure.enrichment.provider_interface import (
     EnrichmentProvider,
     EnrichmentResult,
     EnrichmentError,
+    TitleCallback,
+)
+from app.infrastructure.enrichment.schemas import EnrichmentBatchSchema, EnrichmentSchema
+from app.infrastructure.metrics import (
+    LLM_ERRORS,
+    LLM_REQUEST_DURATION,
+    LLM_TIME_TO_FIRST_TOKEN,
+    LLM_TOKENS,
 )
-from app.infrastructure.enrichment.schemas import EnrichmentSchema
 from app.infrastructure.enrichment.prompts import (
-    get_system_prompt,
-    build_enrichment_user_prompt,
+    build_batch_enrichment_messages,
+    build_enrichment_messages,
 )
 
 
 logger = logging.getLogger(__name__)
 
 
+def _usage_token_counts(usage: Any) -> dict[str, int]:
+    """Token counts by metric kind from a LiteLLM usage block.
+    
+    Cache reads are reported as prompt_tokens_details.cached_tokens
+    (OpenAI-style, which LiteLLM also fills for Anthropic and Gemini) or
+    cache_read_input_tokens; cache writes as cache_creation_input_tokens.
+    """
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", None) or getattr(
+        usage, "cache_read_input_tokens", None
+    )
+    return {
+        "prompt": getattr(usage, "prompt_tokens", None) or 0,
+        "completion": getattr(usage, "completion_tokens", None) or 0,
+        "cached_prompt": cached or 0,
+        "cache_write": getattr(usage, "cache_creation_input_tokens", None) or 0,
+    }
+
+
+class _UsageMetricsLogger(CustomLogger):
+    """Records provider-reported token usage for every LiteLLM call.
+    
+    Runs on each completion, including Instructor's validation retries,
+    and on streams once they finish (with the usage of the full stream).
+    """
+
+    async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
+        usage = getattr(response_obj, "usage", None)
+        if usage is None:
+            return
+        for kind, tokens in _usage_token_counts(usage).items():
+            if tokens:
+                LLM_TOKENS.labels(settings.llm_model, kind).inc(tokens)
+
+
+_usage_logger = _UsageMetricsLogger()
+
+
 class LiteLLMProvider(EnrichmentProvider):
     """LiteLLM + Instructor provider for real LLM enrichment.
     
     Uses LiteLLM for model-agnostic API calls and Instructor for
-    structured output validation.
+    structured output validation. With LLM_STREAM (default) the output
+    is streamed as partial objects: the title is available early, and
+    cancelling the call closes the stream so the model stops generating.
+    The static system prompt leads every request and, with
+    LLM_PROMPT_CACHE, is marked as a cache breakpoint; cached prompt
+    tokens are read from the provider's usage report.
     """
 
     def __init__(self):
@@ -39,12 +93,24 @@ class LiteLLMProvider(EnrichmentProvider):
         
         # Configure litellm
         litellm.set_verbose = False  # Reduce logging noise
+        if _usage_logger not in litellm.callbacks:
+            litellm.callbacks.append(_usage_logger)
+        
+        # Ask for usage in the final chunk where the provider needs it
+        # (OpenAI-style); others report stream usage unprompted
+        supported = litellm.get_supported_openai_params(model=settings.llm_model) or []
+        self._stream_kwargs: dict[str, Any] = (
+            {"stream_options": {"include_usage": True}} if "stream_options" in supported else {}
+        )
         
-    async def enrich_item(self, raw_text: str) -> EnrichmentResult:
+    async def enrich_item(
+        self, raw_text: str, on_title: TitleCallback | None = None
+    ) -> EnrichmentResult:
         """Enrich raw text using LLM.
         
         Args:
             raw_text: The original user input text.
+            on_title: Awaited with the title once streamed (LLM_STREAM only).
             
         Returns:
             EnrichmentResult with AI-generated fields.
@@ -52,31 +118,113 @@ class LiteLLMProvider(EnrichmentProvider):
         Raises:
             EnrichmentError: On LLM call failure.
         """
+        start = time.perf_counter()
         try:
-            # Build messages
-            messages = [
-                {"role": "system", "content": get_system_prompt()},
-                {"role": "user", "content": build_enrichment_user_prompt(raw_text)},
-            ]
+            return await self._enrich(raw_text, on_title)
+        except EnrichmentError as e:
+            LLM_ERRORS.labels(settings.llm_model, e.error_code).inc()
+            raise
+        finally:
+            LLM_REQUEST_DURATION.labels(settings.llm_model).observe(time.perf_counter() - start)
+
+    async def enrich_items(
+        self, raw_texts: list[str]
+    ) -> list[EnrichmentResult | EnrichmentError]:
+        """Enrich several texts with one multi-item LLM call (batch lane).
+        
+        The texts share one system prompt and one request, which cuts
+        prompt tokens and request count. An item the model leaves out
+        fails on its own with LLM_BATCH_ITEM_MISSING.
+        
+        Args:
+            raw_texts: The original user input texts.
+            
+        Returns:
+            One result or EnrichmentError per text, in order.
+            
+        Raises:
+            EnrichmentError: If the call fails or its output is invalid.
+        """
+        start = time.perf_counter()
+        try:
+            with self._translate_errors(settings.llm_batch_timeout_seconds):
+                messages = build_batch_enrichment_messages(
+                    raw_texts, self._count_tokens, cache_prefix=settings.llm_prompt_cache
+                )
+                response: EnrichmentBatchSchema = await asyncio.wait_for(
+                    self.client.create(
+                        model=settings.llm_model,
+                        messages=messages,
+                        response_model=EnrichmentBatchSchema,
+                        max_retries=settings.llm_max_retries,
+                        temperature=settings.llm_temperature,
+                        max_tokens=min(
+                            settings.llm_max_tokens * len(raw_texts),
+                            settings.llm_batch_max_tokens,
+                        ),
+                    ),
+                    timeout=settings.llm_batch_timeout_seconds,
+                )
+        except EnrichmentError as e:
+            LLM_ERRORS.labels(settings.llm_model, e.error_code).inc()
+            raise
+        finally:
+            LLM_REQUEST_DURATION.labels(settings.llm_model).observe(time.perf_counter() - start)
+
+        by_index = {entry.index: entry for entry in response.items}
+        results: list[EnrichmentResult | EnrichmentError] = []
+        for number in range(1, len(raw_texts) + 1):
+            entry = by_index.get(number)
+            if entry is None:
+                LLM_ERRORS.labels(settings.llm_model, "LLM_BATCH_ITEM_MISSING").inc()
+                results.append(EnrichmentError(
+                    "Item missing from batch response",
+                    error_code="LLM_BATCH_ITEM_MISSING",
+                ))
+            else:
+                results.append(self._to_result(entry))
+        return results
+
+    async def _enrich(
+        self, raw_text: str, on_title: TitleCallback | None
+    ) -> EnrichmentResult:
+        """Call the LLM and map its output (errors become EnrichmentError)."""
+        with self._translate_errors(settings.llm_timeout_seconds):
+            # Build messages; the static system prompt is the cacheable prefix
+            messages = build_enrichment_messages(
+                raw_text, self._count_tokens, cache_prefix=settings.llm_prompt_cache
+            )
             
             # Make async LLM call with Instructor schema validation
+            call = (
+                self._stream_llm(messages, on_title)
+                if settings.llm_stream
+                else self._call_llm(messages)
+            )
             response: EnrichmentSchema = await asyncio.wait_for(
-                self._call_llm(messages),
+                call,
                 timeout=settings.llm_timeout_seconds,
             )
-            
-            # Convert to EnrichmentResult
-            source_type = SourceType.ARTICLE if response.source_type == "ARTICLE" else SourceType.NOTE
-            
-            return EnrichmentResult(
-                title=response.title,
-                summary=response.summary,
-                suggested_tags=response.tags,
-                source_type=source_type,
-            )
-            
+            return self._to_result(response)
+
+    def _to_result(self, response: EnrichmentSchema) -> EnrichmentResult:
+        """Convert validated LLM output to an EnrichmentResult."""
+        source_type = SourceType.ARTICLE if response.source_type == "ARTICLE" else SourceType.NOTE
+        
+        return EnrichmentResult(
+            title=response.title,
+            summary=response.summary,
+            suggested_tags=response.tags,
+            source_type=source_type,
+        )
+
+    @contextmanager
+    def _translate_errors(self, timeout_seconds: int) -> Iterator[None]:
+        """Map LLM call failures in the block to EnrichmentError."""
+        try:
+            yield
         except asyncio.TimeoutError:
-            logger.error(f"LLM call timed out after {settings.llm_timeout_seconds}s")
+            logger.error(f"LLM call timed out after {timeout_seconds}s")
             raise EnrichmentError(
                 "LLM request timed out",
                 error_code="LLM_TIMEOUT"
@@ -87,6 +235,12 @@ class LiteLLMProvider(EnrichmentProvider):
                 "LLM output validation failed",
                 error_code="LLM_VALIDATION_ERROR"
             )
+        except litellm.exceptions.RateLimitError as e:
+            logger.warning(f"LLM rate limited: {e}")
+            raise EnrichmentError(
+                self._sanitize_error(str(e)),
+                error_code="LLM_RATE_LIMITED"
+            )
         except litellm.exceptions.APIError as e:
             logger.error(f"LLM API error: {e}")
             raise EnrichmentError(
@@ -109,8 +263,9 @@ class LiteLLMProvider(EnrichmentProvider):
         Returns:
             Validated EnrichmentSchema from LLM response.
         """
-        # Use instructor's create method with response_model
-        response = await self.client.create(
+        # Use instructor's create method with response_model; token usage
+        # is recorded by the LiteLLM callback
+        return await self.client.create(
             model=settings.llm_model,
             messages=messages,
             response_model=EnrichmentSchema,
@@ -118,8 +273,49 @@ class LiteLLMProvider(EnrichmentProvider):
             temperature=settings.llm_temperature,
             max_tokens=settings.llm_max_tokens,
         )
+
+    async def _stream_llm(
+        self, messages: list[dict[str, Any]], on_title: TitleCallback | None
+    ) -> EnrichmentSchema:
+        """Stream the response as partial objects and validate the last one.
         
-        return response
+        The title is final once the model has started the summary (schema
+        field order), and is passed to on_title at that point.
+        
+        Args:
+            messages: Chat messages for LLM.
+            on_title: Optional callback for the early title.
+            
+        Returns:
+            Validated EnrichmentSchema from the complete streamed output.
+        """
+        last = None
+        title_sent = False
+        start = time.perf_counter()
+        async for partial in self.client.create_partial(
+            model=settings.llm_model,
+            messages=messages,
+            response_model=EnrichmentSchema,
+            max_retries=settings.llm_max_retries,
+            temperature=settings.llm_temperature,
+            max_tokens=settings.llm_max_tokens,
+            **self._stream_kwargs,
+        ):
+            if last is None:
+                LLM_TIME_TO_FIRST_TOKEN.labels(settings.llm_model).observe(
+                    time.perf_counter() - start
+                )
+            last = partial
+            if on_title and not title_sent and partial.title and partial.summary is not None:
+                title_sent = True
+                await on_title(partial.title.strip()[:100])
+        if last is None:
+            raise ValueError("LLM stream ended without output")
+        return EnrichmentSchema.model_validate(last.model_dump())
+    
+    def _count_tokens(self, text: str) -> int:
+        """Count tokens with the configured model's tokenizer."""
+        return litellm.token_counter(model=settings.llm_model, text=text)
     
     def _sanitize_error(self, error_message: str) -> str:
         """Sanitize error message to remove sensitive info.
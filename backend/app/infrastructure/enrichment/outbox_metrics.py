@@ -0,0 +1,77 @@
+"""Periodic sampler for outbox depth gauges.
+
+Runs one grouped COUNT on the maintenance pool every
+METRICS_OUTBOX_SAMPLE_INTERVAL_SECS and publishes the result as gauges,
+so Prometheus scrapes read memory instead of querying the database.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+
+from app.config import settings
+from app.infrastructure.metrics import OUTBOX_JOBS, OUTBOX_OLDEST_PENDING_AGE
+from app.infrastructure.persistence.database import DatabaseRole, get_db_session_context
+from app.infrastructure.persistence.repositories.outbox_repository_impl import (
+    SQLAlchemyOutboxRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+# Always exported, so a drained queue reads 0 rather than disappearing
+OUTBOX_STATUSES = ("PENDING", "IN_PROGRESS", "DEAD")
+
+
+class OutboxMetricsSampler:
+    """Refreshes outbox gauges on a fixed interval."""
+
+    def __init__(self):
+        self.running = False
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Start the sampling loop (no-op when the interval is 0)."""
+        if settings.metrics_outbox_sample_interval_secs <= 0:
+            logger.info("Outbox metrics sampling disabled")
+            return
+        self.running = True
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Stop the sampling loop."""
+        self.running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _loop(self) -> None:
+        """Sample, then sleep for the configured interval."""
+        while self.running:
+            try:
+                await self.sample_once()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning(f"Outbox metrics sample failed: {e}")
+            try:
+                await asyncio.sleep(settings.metrics_outbox_sample_interval_secs)
+            except asyncio.CancelledError:
+                break
+
+    async def sample_once(self) -> None:
+        """Query queue stats and update the gauges."""
+        async with get_db_session_context(DatabaseRole.MAINTENANCE) as session:
+            stats = await SQLAlchemyOutboxRepository(session).get_queue_stats()
+
+        for status in {*OUTBOX_STATUSES, *stats.counts_by_status}:
+            OUTBOX_JOBS.labels(status).set(stats.counts_by_status.get(status, 0))
+        oldest = stats.oldest_pending_run_at
+        age = (datetime.now(timezone.utc) - oldest).total_seconds() if oldest else 0.0
+        OUTBOX_OLDEST_PENDING_AGE.set(max(age, 0.0))
+
+
+# Global sampler instance
+outbox_metrics_sampler = OutboxMetricsSampler()
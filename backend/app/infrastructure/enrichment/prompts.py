@@ -1,5 +1,14 @@
 """Centralized prompt templates for LLM enrichment."""
 
+import hashlib
+from typing import Any
+
+from app.config import LLMProvider, settings
+from app.infrastructure.enrichment.input_compaction import (
+    TokenCounter,
+    compact,
+    estimate_tokens,
+)
 from app.infrastructure.enrichment.prompt_loader import PromptLoader
 
 
@@ -12,27 +21,127 @@ def get_system_prompt() -> str:
     return PromptLoader.get_enrichment_prompt()
 
 
-def build_enrichment_user_prompt(raw_text: str) -> str:
+def get_enrichment_version() -> str:
+    """Identify the current enrichment setup, stored on enriched items.
+    
+    "<model>#<system prompt digest>" for LiteLLM, the provider name for
+    the stub and simulated providers (which ignore the prompt). Changes
+    when LLM_MODEL or the prompt file changes, so the re-enrichment
+    backfill can find items enriched with an older setup.
+    """
+    if settings.llm_provider != LLMProvider.LITELLM:
+        return settings.llm_provider.value
+    digest = hashlib.sha256(get_system_prompt().encode()).hexdigest()[:12]
+    return f"{settings.llm_model}#{digest}"
+
+
+def build_enrichment_messages(
+    raw_text: str,
+    count_tokens: TokenCounter = estimate_tokens,
+    cache_prefix: bool = False,
+) -> list[dict[str, Any]]:
+    """Build the chat messages for one enrichment call.
+    
+    The system prompt is identical on every call and comes first, so
+    providers with automatic prefix caching (OpenAI, DeepSeek, Gemini
+    implicit caching) can reuse it. With cache_prefix it is also marked
+    as an ephemeral cache breakpoint, which providers with explicit
+    caching (Anthropic, Bedrock, Gemini via LiteLLM) need. Providers only
+    cache prefixes above a minimum length (about 1024 tokens for most).
+    
+    Args:
+        raw_text: The original user content to enrich.
+        count_tokens: Tokenizer for the input budget.
+        cache_prefix: Mark the system prompt for provider-side caching.
+        
+    Returns:
+        System and user messages in chat-completions format.
+    """
+    return [
+        _system_message(cache_prefix),
+        {"role": "user", "content": build_enrichment_user_prompt(raw_text, count_tokens)},
+    ]
+
+
+def build_batch_enrichment_messages(
+    raw_texts: list[str],
+    count_tokens: TokenCounter = estimate_tokens,
+    cache_prefix: bool = False,
+) -> list[dict[str, Any]]:
+    """Build the chat messages for one multi-item (batch lane) call.
+    
+    Same system prompt as build_enrichment_messages(), so the cached
+    prefix is shared; the items are numbered in one user message and
+    each is compacted to LLM_INPUT_MAX_TOKENS.
+    
+    Args:
+        raw_texts: The original user contents to enrich.
+        count_tokens: Tokenizer for the input budget.
+        cache_prefix: Mark the system prompt for provider-side caching.
+        
+    Returns:
+        System and user messages in chat-completions format.
+    """
+    sections = []
+    for number, raw_text in enumerate(raw_texts, start=1):
+        compacted = compact(raw_text, settings.llm_input_max_tokens, count_tokens)
+        note = (
+            "(Excerpted from a longer text; [...] marks omissions.)\n"
+            if compacted.excerpted
+            else ""
+        )
+        sections.append(f"=== Item {number} ===\n{note}{compacted.text}")
+    items = "\n\n".join(sections)
+    
+    user_prompt = f"""Analyze each of the {len(raw_texts)} items below independently.
+For every item generate title, summary, tags (max 3), and source_type.
+Output each item in the SAME LANGUAGE as that item's text.
+
+{items}
+
+Respond with JSON: {{"items": [{{"index": 1, "title": "...", "summary": "...", "tags": [...], "source_type": "NOTE|ARTICLE"}}, ...]}} with exactly one entry per item."""
+    return [_system_message(cache_prefix), {"role": "user", "content": user_prompt}]
+
+
+def _system_message(cache_prefix: bool) -> dict[str, Any]:
+    """The static system prompt, optionally marked as a cache breakpoint."""
+    system_prompt = get_system_prompt()
+    if not cache_prefix:
+        return {"role": "system", "content": system_prompt}
+    return {
+        "role": "system",
+        "content": [
+            {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+        ],
+    }
+
+
+def build_enrichment_user_prompt(
+    raw_text: str, count_tokens: TokenCounter = estimate_tokens
+) -> str:
     """Build the user prompt for enrichment.
     
+    The text is compacted to LLM_INPUT_MAX_TOKENS (see input_compaction).
+    
     Args:
         raw_text: The original user content to enrich.
+        count_tokens: Tokenizer for the budget (the model's, if known).
         
     Returns:
         Formatted user prompt string.
     """
-    # Truncate very long text to avoid token limits
-    max_length = 8000  # Leave room for system prompt and response
-    if len(raw_text) > max_length:
-        truncated_text = raw_text[:max_length] + "\n\n[Content truncated...]"
-    else:
-        truncated_text = raw_text
+    compacted = compact(raw_text, settings.llm_input_max_tokens, count_tokens)
+    note = (
+        "The content below is excerpted from a longer text; [...] marks omissions.\n"
+        if compacted.excerpted
+        else ""
+    )
     
     return f"""Analyze this content. Generate title, summary, tags (max 3), and source_type.
 Output in the SAME LANGUAGE as the input text.
-
+{note}
 ---
-{truncated_text}
+{compacted.text}
 ---
 
 Respond with JSON: {{"title": "...", "summary": "...", "tags": [...], "source_type": "NOTE|ARTICLE"}}"""
@@ -1,10 +1,14 @@
 """Enrichment provider interface and result schema."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 
 from app.domain.value_objects import SourceType
 
+# Receives the title as soon as it is final, before the rest of the result
+TitleCallback = Callable[[str], Awaitable[None]]
+
 
 @dataclass
 class EnrichmentResult:
@@ -20,11 +24,15 @@ class EnrichmentProvider(ABC):
     """Abstract base class for enrichment providers."""
 
     @abstractmethod
-    async def enrich_item(self, raw_text: str) -> EnrichmentResult:
+    async def enrich_item(
+        self, raw_text: str, on_title: TitleCallback | None = None
+    ) -> EnrichmentResult:
         """Generate enrichment for raw text.
         
         Args:
             raw_text: The original user input text.
+            on_title: Awaited once with the title when a provider can
+                produce it before the full result (streaming); optional.
             
         Returns:
             EnrichmentResult with title, summary, tags, and source type.
@@ -34,6 +42,32 @@ class EnrichmentProvider(ABC):
         """
         pass
 
+    async def enrich_items(
+        self, raw_texts: list[str]
+    ) -> list["EnrichmentResult | EnrichmentError"]:
+        """Generate enrichment for several texts (batch lane).
+        
+        Providers that can answer for many texts in one request override
+        this; the default makes one enrich_item call per text.
+        
+        Args:
+            raw_texts: The original user input texts.
+            
+        Returns:
+            One entry per text, in order: the result, or the
+            EnrichmentError for a text that failed on its own.
+            
+        Raises:
+            EnrichmentError: If the request as a whole fails.
+        """
+        results: list[EnrichmentResult | EnrichmentError] = []
+        for raw_text in raw_texts:
+            try:
+                results.append(await self.enrich_item(raw_text))
+            except EnrichmentError as e:
+                results.append(e)
+        return results
+
 
 class EnrichmentError(Exception):
     """Base exception for enrichment failures."""
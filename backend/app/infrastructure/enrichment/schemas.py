@@ -77,3 +77,22 @@ class EnrichmentSchema(BaseModel):
             # Default to NOTE for unknown types
             return "NOTE"
         return v
+
+
+class BatchItemSchema(EnrichmentSchema):
+    """Enrichment for one item of a multi-item request."""
+    
+    index: int = Field(
+        ...,
+        ge=1,
+        description="Number of the input item this entry belongs to (1-based)"
+    )
+
+
+class EnrichmentBatchSchema(BaseModel):
+    """Instructor schema for multi-item (batch lane) enrichment output."""
+    
+    items: list[BatchItemSchema] = Field(
+        ...,
+        description="One entry per input item"
+    )
@@ -0,0 +1,101 @@
+"""Simulated AI provider with LLM-like latency and failures."""
+
+import asyncio
+import math
+import random
+import time
+from collections.abc import Awaitable, Callable
+
+from app.config import settings
+from app.infrastructure.enrichment.provider_interface import (
+    EnrichmentError,
+    EnrichmentProvider,
+    EnrichmentResult,
+    TitleCallback,
+)
+from app.infrastructure.enrichment.stub_provider import StubAIProvider
+from app.infrastructure.metrics import LLM_ERRORS, LLM_REQUEST_DURATION
+
+MODEL_LABEL = "simulated"
+
+# Share of the call latency after which a streamed title is complete
+TITLE_AT_FRACTION = 0.2
+
+
+class SimulatedAIProvider(EnrichmentProvider):
+    """Stub enrichment behind a simulated LLM call.
+
+    Each call sleeps for a lognormal latency (LLM_SIM_LATENCY_MEDIAN_SECS,
+    LLM_SIM_LATENCY_SIGMA) clamped to [LLM_SIM_LATENCY_MIN_SECS,
+    LLM_SIM_LATENCY_MAX_SECS], then fails with the configured error or
+    rate-limit probability or returns the stub result. Latencies above
+    LLM_TIMEOUT_SECONDS fail with LLM_TIMEOUT after the timeout, as the
+    LiteLLM provider would. With on_title, the title is delivered a fifth
+    of the way through, like a streamed response. A batch-lane call for
+    many texts costs the same as one. Used to benchmark the worker
+    without API calls.
+    """
+
+    def __init__(self, rng: random.Random | None = None):
+        self._stub = StubAIProvider()
+        self._rng = rng or random.Random()
+
+    def sample_latency(self) -> float:
+        """Draw one call latency in seconds."""
+        latency = self._rng.lognormvariate(
+            math.log(settings.llm_sim_latency_median_secs), settings.llm_sim_latency_sigma
+        )
+        return min(
+            max(latency, settings.llm_sim_latency_min_secs), settings.llm_sim_latency_max_secs
+        )
+
+    async def enrich_item(
+        self, raw_text: str, on_title: TitleCallback | None = None
+    ) -> EnrichmentResult:
+        """Wait out a simulated call, then fail or return the stub result."""
+        result = await self._stub.enrich_item(raw_text)
+        title_ready = None
+        if on_title is not None:
+            async def title_ready() -> None:
+                await on_title(result.title)
+        await self._simulate_call(title_ready)
+        return result
+
+    async def enrich_items(
+        self, raw_texts: list[str]
+    ) -> list[EnrichmentResult | EnrichmentError]:
+        """Wait out one simulated call for all texts (batch lane)."""
+        results: list[EnrichmentResult | EnrichmentError] = [
+            await self._stub.enrich_item(raw_text) for raw_text in raw_texts
+        ]
+        await self._simulate_call()
+        return results
+
+    async def _simulate_call(
+        self, title_ready: Callable[[], Awaitable[None]] | None = None
+    ) -> None:
+        """Sleep for one sampled call latency, then maybe fail."""
+        start = time.perf_counter()
+        try:
+            latency = self.sample_latency()
+            if latency > settings.llm_timeout_seconds:
+                await asyncio.sleep(settings.llm_timeout_seconds)
+                raise EnrichmentError("LLM request timed out", error_code="LLM_TIMEOUT")
+            if title_ready is not None:
+                await asyncio.sleep(latency * TITLE_AT_FRACTION)
+                await title_ready()
+                latency -= latency * TITLE_AT_FRACTION
+            await asyncio.sleep(latency)
+
+            roll = self._rng.random()
+            if roll < settings.llm_sim_rate_limit_rate:
+                raise EnrichmentError(
+                    "Simulated rate limit (429)", error_code="LLM_RATE_LIMITED"
+                )
+            if roll < settings.llm_sim_rate_limit_rate + settings.llm_sim_error_rate:
+                raise EnrichmentError("Simulated provider error", error_code="LLM_API_ERROR")
+        except EnrichmentError as e:
+            LLM_ERRORS.labels(MODEL_LABEL, e.error_code).inc()
+            raise
+        finally:
+            LLM_REQUEST_DURATION.labels(MODEL_LABEL).observe(time.perf_counter() - start)
@@ -6,6 +6,7 @@ from app.domain.value_objects import SourceType
 from app.infrastructure.enrichment.provider_interface import (
     EnrichmentProvider,
     EnrichmentResult,
+    TitleCallback,
 )
 
 
@@ -25,8 +26,10 @@ class StubAIProvider(EnrichmentProvider):
         ["design", "creative"],
     ]
 
-    async def enrich_item(self, raw_text: str) -> EnrichmentResult:
-        """Generate deterministic enrichment from raw text."""
+    async def enrich_item(
+        self, raw_text: str, on_title: TitleCallback | None = None
+    ) -> EnrichmentResult:
+        """Generate deterministic enrichment from raw text (no partial results)."""
         # Generate deterministic title from first line or first 50 chars
         lines = raw_text.strip().split("\n")
         first_line = lines[0][:50] if lines else raw_text[:50]
@@ -1,17 +1,35 @@
 """In-process enrichment worker with LISTEN/NOTIFY support.
 
-This worker processes enrichment jobs from the outbox table using:
+This worker processes enrichment (and image thumbnail and semantic
+search embedding) jobs from the outbox table using:
 1. LISTEN/NOTIFY for low-latency wakeups (when enabled)
 2. Fallback polling for reliability
 3. Lease-based claiming for crash recovery
+
+Non-interactive work runs on a separate batch lane: every
+JOB_BATCH_INTERVAL_SECS the worker claims up to JOB_BATCH_SIZE jobs of
+one type, enriches them with one multi-item provider call and writes all
+results in one transaction. 'enrichment_batch' jobs enrich ENRICHING
+items like the interactive path; 'reenrichment' jobs (queued by the
+app.cli.reenrich backfill, lowest priority) re-enrich ARCHIVED items
+without overwriting confirmed fields.
 """
 
 import asyncio
+import contextvars
 import logging
 import os
+from datetime import datetime, timezone
 from uuid import uuid4
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.config import settings, LLMProvider
+from app.infrastructure.metrics import (
+    LLM_CANCELLED,
+    OUTBOX_CLAIM_TO_COMPLETE,
+    OUTBOX_LEASE_RECLAIMS,
+)
 from app.infrastructure.persistence.database import get_db_session_context
 from app.infrastructure.persistence.repositories.item_repository_impl import (
     SQLAlchemyItemRepository,
@@ -22,14 +40,35 @@ from app.infrastructure.persistence.repositories.outbox_repository_impl import (
 from app.infrastructure.persistence.repositories.item_tag_suggestion_repository_impl import (
     SQLAlchemyItemTagSuggestionRepository,
 )
+from app.infrastructure.persistence.repositories.user_repository_impl import (
+    SQLAlchemyUserRepository,
+)
+from app.infrastructure.persistence.repositories.upload_repository_impl import (
+    SQLAlchemyUploadRepository,
+)
+from app.infrastructure.persistence.repositories.item_embedding_repository_impl import (
+    SQLAlchemyItemEmbeddingRepository,
+)
+from app.infrastructure.storage.thumbnails import ThumbnailError, generate_thumbnail
+from app.infrastructure.embeddings.provider_interface import (
+    EmbeddingError,
+    content_hash,
+    embedding_text,
+)
+from app.infrastructure.embeddings.service import get_embedding_provider
+from app.infrastructure.tagging.service import get_tag_vocabulary
+from app.infrastructure.tagging.vocabulary import item_text
 from app.infrastructure.enrichment.provider_interface import (
     EnrichmentProvider,
     EnrichmentError,
+    EnrichmentResult,
 )
+from app.infrastructure.enrichment.prompts import get_enrichment_version
 from app.infrastructure.enrichment.stub_provider import StubAIProvider
 from app.infrastructure.enrichment.job_notify import set_notify_callback, clear_notify_callback
 from app.domain.value_objects import ItemStatus
-from app.domain.repositories.outbox_repository import OutboxJob
+from app.domain.repositories.outbox_repository import BATCH_LANE_JOB_TYPES, OutboxJob
+from app.domain.entities.item import Item
 from app.domain.entities.item_tag_suggestion import ItemTagSuggestion, SuggestionSource
 
 logger = logging.getLogger(__name__)
@@ -40,6 +79,9 @@ def get_enrichment_provider() -> EnrichmentProvider:
     if settings.llm_provider == LLMProvider.LITELLM:
         from app.infrastructure.enrichment.litellm_provider import LiteLLMProvider
         return LiteLLMProvider()
+    elif settings.llm_provider == LLMProvider.SIMULATED:
+        from app.infrastructure.enrichment.simulated_provider import SimulatedAIProvider
+        return SimulatedAIProvider()
     else:
         return StubAIProvider()
 
@@ -60,11 +102,13 @@ class EnrichmentWorker:
     """
 
     def __init__(self):
-        self.ai_provider = get_enrichment_provider()
+        # Built in start(): the LiteLLM provider pulls in litellm/instructor
+        self.ai_provider: EnrichmentProvider | None = None
         self.worker_id = generate_worker_id()
         self.running = False
         self._poll_task: asyncio.Task | None = None
         self._reclaim_task: asyncio.Task | None = None
+        self._batch_task: asyncio.Task | None = None
         self._drain_lock = asyncio.Lock()
         # Semaphore to limit concurrent LLM calls
         self._semaphore = asyncio.Semaphore(settings.llm_concurrency)
@@ -72,6 +116,8 @@ class EnrichmentWorker:
     async def start(self) -> None:
         """Start the worker loops."""
         self.running = True
+        if self.ai_provider is None:
+            self.ai_provider = get_enrichment_provider()
         
         # Register NOTIFY callback
         set_notify_callback(self.trigger_drain)
@@ -91,6 +137,9 @@ class EnrichmentWorker:
         # Start lease reclaim loop
         self._reclaim_task = asyncio.create_task(self._reclaim_loop())
         
+        # Start batch lane loop
+        self._batch_task = asyncio.create_task(self._batch_loop())
+        
         logger.info(
             f"Enrichment worker {self.worker_id} started "
             f"(provider={settings.llm_provider.value}, "
@@ -117,14 +166,25 @@ class EnrichmentWorker:
             except asyncio.CancelledError:
                 pass
         
+        if self._batch_task:
+            self._batch_task.cancel()
+            try:
+                await self._batch_task
+            except asyncio.CancelledError:
+                pass
+        
         # Clear NOTIFY callback
         clear_notify_callback()
                 
         logger.info(f"Enrichment worker {self.worker_id} stopped")
 
     async def trigger_drain(self) -> None:
-        """Trigger a drain cycle (called externally by NOTIFY handler)."""
-        asyncio.create_task(self._drain_all())
+        """Trigger a drain cycle (called externally by NOTIFY handler).
+        
+        Runs in a fresh context: the caller is usually a request, whose
+        request ID and query profile must not follow the worker.
+        """
+        asyncio.create_task(self._drain_all(), context=contextvars.Context())
 
     async def _poll_loop(self, interval_seconds: int) -> None:
         """Fallback polling loop."""
@@ -141,26 +201,46 @@ class EnrichmentWorker:
         """Periodically reclaim expired leases."""
         while self.running:
             try:
-                # Run less frequently than poll (every 2 minutes)
-                await asyncio.sleep(120)
+                # Run less frequently than poll (every 2 minutes by default)
+                await asyncio.sleep(settings.job_reclaim_interval_secs)
                 await self._reclaim_expired()
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.exception(f"Error in reclaim loop: {e}")
 
+    async def _batch_loop(self) -> None:
+        """Batch lane: drain batch-lane jobs one batch at a time, by priority."""
+        while self.running:
+            try:
+                await asyncio.sleep(settings.job_batch_interval_secs)
+                for job_type in BATCH_LANE_JOB_TYPES:
+                    # A full batch suggests more are waiting
+                    while (
+                        self.running
+                        and await self._process_batch(job_type) >= settings.job_batch_size
+                    ):
+                        pass
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.exception(f"Error in batch loop: {e}")
+
     async def _reclaim_expired(self) -> None:
         """Reclaim jobs with expired leases."""
         async with get_db_session_context() as session:
             outbox_repo = SQLAlchemyOutboxRepository(session)
             count = await outbox_repo.reclaim_expired_leases()
             if count > 0:
+                OUTBOX_LEASE_RECLAIMS.inc(count)
                 logger.info(f"Reclaimed {count} jobs with expired leases")
                 # Trigger drain to process reclaimed jobs
                 await self._drain_all()
 
-    async def _drain_all(self, batch_size: int = 10) -> int:
-        """Drain pending jobs up to batch_size."""
+    async def _drain_all(self, batch_size: int | None = None) -> int:
+        """Drain pending jobs up to batch_size (JOB_DRAIN_BATCH_SIZE by default)."""
+        if batch_size is None:
+            batch_size = settings.job_drain_batch_size
         async with self._drain_lock:
             processed = 0
             while processed < batch_size and self.running:
@@ -173,6 +253,12 @@ class EnrichmentWorker:
     async def _process_one_job(self) -> bool:
         """Process one job from the outbox.
         
+        Enrichment runs in three steps so no connection or item row lock
+        is held while the LLM works: claim the job and read the item
+        (committed, the lease protects the claim), call the provider, then
+        write the result in a new transaction. The call is cancelled if
+        the item leaves ENRICHING meanwhile (e.g. the user discards it).
+        
         Returns:
             True if a job was processed, False if no jobs available.
         """
@@ -188,76 +274,31 @@ class EnrichmentWorker:
             if job is None:
                 return False
 
+            if job.job_type == "thumbnail":
+                await self._process_thumbnail_job(job, session, outbox_repo)
+                return True
+            if job.job_type == "embedding":
+                await self._process_embedding_job(job, session, outbox_repo)
+                return True
+
             logger.info(
                 f"Processing job {job.id} for item {job.item_id} "
                 f"(attempt {job.attempt_count}, worker={self.worker_id})"
             )
 
             try:
-                # Get item with row lock (system method - no user scoping)
                 item = await item_repo.get_by_id_for_update_system(job.item_id)
                 if item is None:
                     # Item was deleted, remove job
-                    await outbox_repo.mark_completed(job.id)
+                    await self._mark_completed(outbox_repo, job)
                     logger.warning(f"Item {job.item_id} not found, removing job")
                     return True
 
                 # Idempotency check: skip if not in ENRICHING state
                 if item.status != ItemStatus.ENRICHING:
-                    await outbox_repo.mark_completed(job.id)
+                    await self._mark_completed(outbox_repo, job)
                     logger.info(f"Item {job.item_id} is {item.status.value}, skipping (idempotent)")
                     return True
-
-                # Perform enrichment with concurrency limit
-                async with self._semaphore:
-                    result = await self.ai_provider.enrich_item(item.raw_text)
-
-                # Re-check item status under lock before writing results
-                item = await item_repo.get_by_id_for_update_system(job.item_id)
-                if item is None or item.status != ItemStatus.ENRICHING:
-                    await outbox_repo.mark_completed(job.id)
-                    logger.info(f"Item {job.item_id} state changed during enrichment, skipping write")
-                    return True
-
-                # Update item with enrichment results
-                item.mark_enriched(
-                    title=result.title,
-                    summary=result.summary,
-                    suggested_tags=result.suggested_tags,
-                    source_type=result.source_type,
-                )
-                await item_repo.update(item)
-                
-                # Create tag suggestions in separate table
-                if result.suggested_tags:
-                    suggestion_repo = SQLAlchemyItemTagSuggestionRepository(session)
-                    suggestions = [
-                        ItemTagSuggestion.create(
-                            id=str(uuid4()),
-                            user_id=item.user_id,
-                            item_id=item.id,
-                            suggested_name=tag_name,
-                            confidence=None,  # AI provider could return confidence in future
-                            source=SuggestionSource.AI,
-                        )
-                        for tag_name in result.suggested_tags
-                    ]
-                    await suggestion_repo.create_many(suggestions)
-                    logger.info(f"Created {len(suggestions)} tag suggestions for item {job.item_id}")
-
-                # Mark job completed (delete)
-                await outbox_repo.mark_completed(job.id)
-                logger.info(f"Enrichment completed for item {job.item_id}")
-                return True
-
-            except EnrichmentError as e:
-                logger.error(f"Enrichment error for job {job.id}: {e.error_code} - {e.message}")
-                await self._handle_failure(
-                    job, item_repo, outbox_repo,
-                    error_code=e.error_code,
-                    error_message=e.message,
-                )
-                return True
             except Exception as e:
                 logger.exception(f"Unexpected error for job {job.id}: {e}")
                 await self._handle_failure(
@@ -266,6 +307,503 @@ class EnrichmentWorker:
                     error_message=str(e)[:200],
                 )
                 return True
+            raw_text = item.raw_text
+
+        try:
+            # Perform enrichment with concurrency limit
+            async with self._semaphore:
+                result = await self._enrich_unless_cancelled(job, raw_text)
+        except asyncio.CancelledError:
+            # Shutting down: hand the job back rather than wait out the lease
+            async with get_db_session_context() as session:
+                await SQLAlchemyOutboxRepository(session).release_claim(job.id)
+            raise
+        except EnrichmentError as e:
+            logger.error(f"Enrichment error for job {job.id}: {e.error_code} - {e.message}")
+            await self._fail_in_new_session(job, e.error_code, e.message)
+            return True
+        except Exception as e:
+            logger.exception(f"Unexpected error for job {job.id}: {e}")
+            await self._fail_in_new_session(job, "ENRICHMENT_ERROR", str(e)[:200])
+            return True
+
+        try:
+            await self._store_result(job, result)
+        except Exception as e:
+            logger.exception(f"Unexpected error for job {job.id}: {e}")
+            await self._fail_in_new_session(job, "ENRICHMENT_ERROR", str(e)[:200])
+        return True
+
+    async def _process_batch(self, job_type: str = "enrichment_batch") -> int:
+        """Process up to JOB_BATCH_SIZE batch-lane jobs with one provider call.
+        
+        Same three steps as _process_one_job: claim the jobs and read
+        their items (committed), call the provider without a transaction,
+        then write every result and complete or fail every job in one
+        transaction. A failure of the call as a whole fails each job.
+        
+        Args:
+            job_type: 'enrichment_batch' (ENRICHING items) or
+                'reenrichment' (ARCHIVED items).
+        
+        Returns:
+            Number of jobs claimed (0 if none were runnable).
+        """
+        async with get_db_session_context() as session:
+            outbox_repo = SQLAlchemyOutboxRepository(session)
+            item_repo = SQLAlchemyItemRepository(session)
+
+            jobs = await outbox_repo.claim_pending_batch(
+                worker_id=self.worker_id,
+                job_type=job_type,
+                limit=settings.job_batch_size,
+                lease_seconds=settings.job_lease_seconds,
+            )
+            expected = (
+                ItemStatus.ARCHIVED if job_type == "reenrichment" else ItemStatus.ENRICHING
+            )
+            work: list[tuple[OutboxJob, str]] = []
+            for job in jobs:
+                item = await item_repo.get_by_id_for_update_system(job.item_id)
+                if item is None or item.status != expected:
+                    # Deleted or no longer waiting: nothing to do (idempotent)
+                    await self._mark_completed(outbox_repo, job)
+                    continue
+                work.append((job, item.raw_text))
+        if not work:
+            return len(jobs)
+
+        logger.info(
+            f"Processing batch of {len(work)} {job_type} jobs (worker={self.worker_id})"
+        )
+        try:
+            async with self._semaphore:
+                results = await self.ai_provider.enrich_items([text for _, text in work])
+        except asyncio.CancelledError:
+            async with get_db_session_context() as session:
+                outbox_repo = SQLAlchemyOutboxRepository(session)
+                for job, _ in work:
+                    await outbox_repo.release_claim(job.id)
+            raise
+        except EnrichmentError as e:
+            logger.error(f"Batch enrichment error: {e.error_code} - {e.message}")
+            results = [e] * len(work)
+        except Exception as e:
+            logger.exception(f"Unexpected batch enrichment error: {e}")
+            results = [EnrichmentError(str(e)[:200], error_code="ENRICHMENT_ERROR")] * len(work)
+
+        try:
+            await self._store_batch_results(work, results)
+        except Exception as e:
+            logger.exception(f"Failed to store batch results: {e}")
+            for job, _ in work:
+                await self._fail_in_new_session(job, "ENRICHMENT_ERROR", str(e)[:200])
+        return len(jobs)
+
+    async def _store_batch_results(
+        self,
+        work: list[tuple[OutboxJob, str]],
+        results: list[EnrichmentResult | EnrichmentError],
+    ) -> None:
+        """Write a batch's results and settle all its jobs in one transaction."""
+        async with get_db_session_context() as session:
+            outbox_repo = SQLAlchemyOutboxRepository(session)
+            item_repo = SQLAlchemyItemRepository(session)
+            changed_libraries = set()
+            for (job, _), result in zip(work, results, strict=True):
+                if isinstance(result, EnrichmentError):
+                    await self._handle_failure(
+                        job, item_repo, outbox_repo,
+                        error_code=result.error_code,
+                        error_message=result.message,
+                    )
+                elif job.job_type == "reenrichment":
+                    user_id = await self._apply_reenrichment(
+                        job, result, session, item_repo, outbox_repo
+                    )
+                    if user_id:
+                        changed_libraries.add(user_id)
+                else:
+                    await self._apply_result(job, result, session, item_repo, outbox_repo)
+            # Once per user, after the batch: each bump also invalidates the
+            # tag vocabulary that _tag_suggestions loads per item
+            user_repo = SQLAlchemyUserRepository(session)
+            for user_id in sorted(changed_libraries):
+                await user_repo.bump_library_version(user_id)
+
+    async def _enrich_unless_cancelled(
+        self, job: OutboxJob, raw_text: str
+    ) -> EnrichmentResult | None:
+        """Run the provider, cancelling it if the item leaves ENRICHING.
+        
+        Returns:
+            The enrichment result, or None if the call was cancelled.
+        """
+        on_title = None
+        if settings.llm_publish_partial_title:
+            async def on_title(title: str) -> None:
+                await self._publish_title(job.item_id, title)
+
+        enrich = asyncio.create_task(self.ai_provider.enrich_item(raw_text, on_title=on_title))
+        watch = asyncio.create_task(self._wait_until_not_enriching(job.item_id))
+        try:
+            await asyncio.wait({enrich, watch}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in (enrich, watch):
+                task.cancel()
+            await asyncio.gather(enrich, watch, return_exceptions=True)
+
+        if enrich.cancelled():
+            LLM_CANCELLED.inc()
+            logger.info(f"Item {job.item_id} left ENRICHING, cancelled enrichment call")
+            return None
+        return enrich.result()
+
+    async def _wait_until_not_enriching(self, item_id: str) -> None:
+        """Return once the item is gone or no longer ENRICHING."""
+        while True:
+            await asyncio.sleep(settings.llm_cancel_check_interval_secs)
+            try:
+                async with get_db_session_context() as session:
+                    status = await SQLAlchemyItemRepository(session).get_status_system(item_id)
+            except Exception as e:
+                logger.warning(f"Cancellation check failed for item {item_id}: {e}")
+                continue
+            if status != ItemStatus.ENRICHING:
+                return
+
+    async def _publish_title(self, item_id: str, title: str) -> None:
+        """Save a streamed title early (best-effort)."""
+        try:
+            async with get_db_session_context() as session:
+                await SQLAlchemyItemRepository(session).set_title_if_enriching_system(
+                    item_id, title
+                )
+        except Exception as e:
+            logger.warning(f"Failed to publish partial title for item {item_id}: {e}")
+
+    async def _store_result(self, job: OutboxJob, result: EnrichmentResult | None) -> None:
+        """Write enrichment results and complete the job."""
+        async with get_db_session_context() as session:
+            await self._apply_result(
+                job,
+                result,
+                session,
+                SQLAlchemyItemRepository(session),
+                SQLAlchemyOutboxRepository(session),
+            )
+
+    async def _apply_result(
+        self,
+        job: OutboxJob,
+        result: EnrichmentResult | None,
+        session: AsyncSession,
+        item_repo: SQLAlchemyItemRepository,
+        outbox_repo: SQLAlchemyOutboxRepository,
+    ) -> None:
+        """Write one item's results and complete its job (caller's transaction)."""
+        # Re-check item status under lock before writing results
+        item = await item_repo.get_by_id_for_update_system(job.item_id)
+        if result is None or item is None or item.status != ItemStatus.ENRICHING:
+            await self._mark_completed(outbox_repo, job)
+            logger.info(f"Item {job.item_id} state changed during enrichment, skipping write")
+            return
+
+        # Update item with enrichment results
+        item.mark_enriched(
+            title=result.title,
+            summary=result.summary,
+            suggested_tags=result.suggested_tags,
+            source_type=result.source_type,
+            enrichment_version=get_enrichment_version(),
+        )
+        await item_repo.update(item)
+        
+        # Create tag suggestions in separate table
+        suggestions = await self._tag_suggestions(session, item, result.suggested_tags, set())
+        if suggestions:
+            await SQLAlchemyItemTagSuggestionRepository(session).create_many(suggestions)
+            logger.info(f"Created {len(suggestions)} tag suggestions for item {job.item_id}")
+
+        # Mark job completed (delete)
+        await self._mark_completed(outbox_repo, job)
+        logger.info(f"Enrichment completed for item {job.item_id}")
+
+    async def _apply_reenrichment(
+        self,
+        job: OutboxJob,
+        result: EnrichmentResult,
+        session: AsyncSession,
+        item_repo: SQLAlchemyItemRepository,
+        outbox_repo: SQLAlchemyOutboxRepository,
+    ) -> str | None:
+        """Apply a re-enrichment to an archived item (caller's transaction).
+        
+        Confirmed fields are kept (see Item.apply_reenrichment); tags the
+        item lacks become new PENDING suggestions, except names already
+        suggested for it before (including rejected ones). An item whose
+        content was filled in is queued for re-embedding.
+        
+        Returns:
+            The owner's user ID if the item's content changed (the caller
+            bumps their library version), else None.
+        """
+        item = await item_repo.get_by_id_for_update_system(job.item_id)
+        if item is None or item.status != ItemStatus.ARCHIVED:
+            await self._mark_completed(outbox_repo, job)
+            logger.info(f"Item {job.item_id} no longer archived, skipping re-enrichment")
+            return None
+
+        version = get_enrichment_version()
+        changed = item.apply_reenrichment(
+            title=result.title,
+            summary=result.summary,
+            source_type=result.source_type,
+            enrichment_version=version,
+        )
+        await item_repo.update(item)
+        if changed:
+            await outbox_repo.create(item.id, job_type="embedding")
+
+        suggestion_repo = SQLAlchemyItemTagSuggestionRepository(session)
+        known = {tag.lower() for tag in item.tags} | {
+            suggestion.normalized_name
+            for suggestion in await suggestion_repo.get_by_item_id(item.id, item.user_id)
+        }
+        suggestions = await self._tag_suggestions(
+            session, item, result.suggested_tags, known, meta={"reenrichment": version}
+        )
+        await suggestion_repo.create_many(suggestions)
+
+        await self._mark_completed(outbox_repo, job)
+        logger.info(
+            f"Re-enrichment completed for item {job.item_id} "
+            f"({len(suggestions)} new tag suggestions)"
+        )
+        return item.user_id if changed else None
+
+    async def _tag_suggestions(
+        self,
+        session: AsyncSession,
+        item: Item,
+        suggested_names: list[str],
+        known: set[str],
+        meta: dict | None = None,
+    ) -> list[ItemTagSuggestion]:
+        """Tag suggestions for an item, scored against the user's vocabulary.
+        
+        LLM names that mean an existing tag ("Meeting" for "meetings")
+        are replaced by that tag, keeping the LLM's spelling in meta.
+        The vocabulary then adds its own likely tags (source SYSTEM).
+        Names in known (lowercase) are skipped; known is updated.
+        """
+        vocabulary = await get_tag_vocabulary(session, item.user_id)
+        text = item_text(item.title, item.summary, item.raw_text)
+        current_tag_ids = [tag.id for name in item.tags if (tag := vocabulary.get(name))]
+        ranked = vocabulary.rank(text, current_tag_ids)
+        confidences = {score.tag.id: score.confidence for score in ranked}
+        suggestions = []
+
+        def add(name: str, confidence: float | None, source: SuggestionSource, extra: dict) -> None:
+            if name.lower() in known:
+                return
+            known.add(name.lower())
+            suggestion = ItemTagSuggestion.create(
+                id=str(uuid4()),
+                user_id=item.user_id,
+                item_id=item.id,
+                suggested_name=name,
+                confidence=confidence,
+                source=source,
+            )
+            suggestion.meta = {**(meta or {}), **extra}
+            suggestions.append(suggestion)
+
+        for name in suggested_names:
+            tag = vocabulary.closest(name)
+            if tag is None:
+                add(name, vocabulary.name_confidence(name, text), SuggestionSource.AI, {})
+                continue
+            renamed = tag.name_lower != name.strip().lower()
+            extra = {"suggested_as": name} if renamed else {}
+            add(tag.name, confidences.get(tag.id), SuggestionSource.AI, extra)
+        likely = [s for s in ranked if s.confidence >= settings.tag_suggestion_min_confidence]
+        for score in likely[:settings.tag_suggestion_limit]:
+            add(score.tag.name, score.confidence, SuggestionSource.SYSTEM, {})
+        return suggestions
+
+    async def _fail_in_new_session(
+        self, job: OutboxJob, error_code: str, error_message: str
+    ) -> None:
+        """Record a failed attempt in its own transaction."""
+        async with get_db_session_context() as session:
+            await self._handle_failure(
+                job,
+                SQLAlchemyItemRepository(session),
+                SQLAlchemyOutboxRepository(session),
+                error_code=error_code,
+                error_message=error_message,
+            )
+
+    async def _process_thumbnail_job(
+        self,
+        job: OutboxJob,
+        session: AsyncSession,
+        outbox_repo: SQLAlchemyOutboxRepository,
+    ) -> None:
+        """Derive the thumbnail for an image upload.
+        
+        Image work is CPU/IO bound and blocking, so it runs in a thread.
+        As with embeddings, the claim commits first, no connection is held
+        while the image is downloaded, resized and stored, and the result
+        is written in a new transaction. Failures never touch the item's
+        enrichment state.
+        """
+        upload_repo = SQLAlchemyUploadRepository(session)
+        try:
+            upload = await upload_repo.get_by_id_system(job.upload_id) if job.upload_id else None
+            if upload is None or upload.status != "COMPLETED" or upload.kind != "image":
+                await self._mark_completed(outbox_repo, job)
+                logger.info(f"Upload {job.upload_id} not eligible for thumbnail, skipping")
+                return
+            if upload.thumb_key:
+                await self._mark_completed(outbox_repo, job)
+                return
+        except Exception as e:
+            logger.exception(f"Thumbnail error for job {job.id}: {e}")
+            await self._retry_or_dead(outbox_repo, job, "THUMBNAIL_ERROR", str(e)[:200])
+            return
+        # Release the connection while the image is processed
+        await session.commit()
+
+        try:
+            thumb_key = await asyncio.to_thread(generate_thumbnail, upload.object_key)
+        except asyncio.CancelledError:
+            async with get_db_session_context() as release_session:
+                await SQLAlchemyOutboxRepository(release_session).release_claim(job.id)
+            raise
+        except ThumbnailError as e:
+            # Undecodable or oversized original: retrying will not help
+            logger.warning(f"Thumbnail skipped for upload {job.upload_id}: {e}")
+            async with get_db_session_context() as fail_session:
+                await SQLAlchemyOutboxRepository(fail_session).mark_dead(
+                    job.id, "THUMBNAIL_UNSUPPORTED", str(e)[:200]
+                )
+            return
+        except Exception as e:
+            logger.exception(f"Thumbnail error for job {job.id}: {e}")
+            async with get_db_session_context() as fail_session:
+                await self._retry_or_dead(
+                    SQLAlchemyOutboxRepository(fail_session), job, "THUMBNAIL_ERROR", str(e)[:200]
+                )
+            return
+
+        async with get_db_session_context() as write_session:
+            await SQLAlchemyUploadRepository(write_session).set_thumb_key(
+                upload.object_key, thumb_key
+            )
+            await self._mark_completed(SQLAlchemyOutboxRepository(write_session), job)
+        logger.info(f"Thumbnail ready for upload {upload.id}")
+
+    async def _process_embedding_job(
+        self,
+        job: OutboxJob,
+        session: AsyncSession,
+        outbox_repo: SQLAlchemyOutboxRepository,
+    ) -> None:
+        """Store, refresh or drop the semantic search vector for an item.
+        
+        ARCHIVED items get a vector of their title and summary; anything
+        else (discarded, deleted) loses it. As with enrichment, the claim
+        commits before the provider call and the vector is written in a
+        new transaction. Unchanged text under the same model is skipped.
+        """
+        item_repo = SQLAlchemyItemRepository(session)
+        embedding_repo = SQLAlchemyItemEmbeddingRepository(session)
+        provider = get_embedding_provider()
+        try:
+            item = await item_repo.get_by_id_for_update_system(job.item_id)
+            text = (
+                embedding_text(item.title, item.summary, item.raw_text)
+                if item is not None and item.status == ItemStatus.ARCHIVED
+                else ""
+            )
+            if not text:
+                await embedding_repo.delete_by_item_id(job.item_id)
+                await self._mark_completed(outbox_repo, job)
+                return
+            fingerprint = (provider.model_label, content_hash(text))
+            if await embedding_repo.get_fingerprint(job.item_id) == fingerprint:
+                await self._mark_completed(outbox_repo, job)
+                return
+        except Exception as e:
+            logger.exception(f"Embedding error for job {job.id}: {e}")
+            await self._retry_or_dead(outbox_repo, job, "EMBEDDING_ERROR", str(e)[:200])
+            return
+        # Release the connection and item lock while the provider works
+        await session.commit()
+
+        try:
+            [vector] = await provider.embed([text])
+        except asyncio.CancelledError:
+            async with get_db_session_context() as release_session:
+                await SQLAlchemyOutboxRepository(release_session).release_claim(job.id)
+            raise
+        except Exception as e:
+            error_code = e.error_code if isinstance(e, EmbeddingError) else "EMBEDDING_ERROR"
+            logger.warning(f"Embedding failed for job {job.id}: {error_code} - {e}")
+            async with get_db_session_context() as fail_session:
+                await self._retry_or_dead(
+                    SQLAlchemyOutboxRepository(fail_session), job, error_code, str(e)[:200]
+                )
+            return
+
+        async with get_db_session_context() as write_session:
+            write_outbox_repo = SQLAlchemyOutboxRepository(write_session)
+            # Locked re-check: a discard meanwhile queues its own embedding job
+            item = await SQLAlchemyItemRepository(
+                write_session
+            ).get_by_id_for_update_system(job.item_id)
+            if item is not None and item.status == ItemStatus.ARCHIVED:
+                await SQLAlchemyItemEmbeddingRepository(write_session).upsert(
+                    item.id, item.user_id, fingerprint[0], fingerprint[1], vector
+                )
+            await self._mark_completed(write_outbox_repo, job)
+        logger.info(f"Embedding stored for item {job.item_id}")
+
+    async def _retry_or_dead(
+        self,
+        outbox_repo: SQLAlchemyOutboxRepository,
+        job: OutboxJob,
+        error_code: str,
+        error_message: str,
+    ) -> None:
+        """Schedule a retry of a derivative job, or mark it dead after the last attempt."""
+        if job.attempt_count >= settings.enrichment_max_retries:
+            await outbox_repo.mark_dead(job.id, error_code, error_message)
+        else:
+            await outbox_repo.mark_failed(
+                job.id,
+                error_code=error_code,
+                error_message=error_message,
+                backoff_seconds=self._backoff_for(job),
+            )
+
+    async def _mark_completed(
+        self, outbox_repo: SQLAlchemyOutboxRepository, job: OutboxJob
+    ) -> None:
+        """Complete (delete) a job and record its claim-to-complete latency."""
+        await outbox_repo.mark_completed(job.id)
+        if job.claimed_at:
+            OUTBOX_CLAIM_TO_COMPLETE.labels(job.job_type).observe(
+                (datetime.now(timezone.utc) - job.claimed_at).total_seconds()
+            )
+
+    def _backoff_for(self, job: OutboxJob) -> int:
+        """Backoff before the next attempt, from config."""
+        backoff_list = settings.job_backoff_seconds
+        backoff_idx = min(job.attempt_count, len(backoff_list) - 1)
+        return backoff_list[backoff_idx] if backoff_list else 0
 
     async def _handle_failure(
         self,
@@ -288,10 +826,7 @@ class EnrichmentWorker:
                 f"{error_code} - {error_message}"
             )
         else:
-            # Calculate backoff from config
-            backoff_list = settings.job_backoff_seconds
-            backoff_idx = min(job.attempt_count, len(backoff_list) - 1)
-            backoff = backoff_list[backoff_idx] if backoff_list else 0
+            backoff = self._backoff_for(job)
             
             await outbox_repo.mark_failed(
                 job.id,
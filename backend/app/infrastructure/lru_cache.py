@@ -0,0 +1,53 @@
+"""Bounded in-process LRU cache for version-keyed values."""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+from app.infrastructure.metrics import CACHE_REQUESTS
+
+V = TypeVar("V")
+
+
+class VersionedLRUCache(Generic[V]):
+    """LRU cache whose keys embed a version counter.
+
+    Entries are never invalidated explicitly: a version bump makes old
+    keys unreachable and LRU eviction reclaims them. Safe across
+    processes for the same reason.
+    """
+
+    def __init__(self, max_entries: int, name: str):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, V] = OrderedDict()
+        self._hits = CACHE_REQUESTS.labels(name, "hit")
+        self._misses = CACHE_REQUESTS.labels(name, "miss")
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(self, key: Hashable) -> V | None:
+        """Return the cached value, marking it most recently used."""
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+            self._hits.inc()
+        elif self.enabled:
+            self._misses.inc()
+        return value
+
+    def put(self, key: Hashable, value: V) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        if not self.enabled:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,111 @@
+"""Prometheus metrics for the API, enrichment worker and outbox.
+
+Metrics live in the default registry and are exposed by GET /metrics.
+Request, LLM, pool and cache metrics are recorded inline where the work
+happens; outbox gauges are refreshed by OutboxMetricsSampler on an
+interval so scrapes never touch the database.
+
+Each process exports its own values (no multiprocess aggregation);
+scrape every API replica.
+"""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# Latency buckets (seconds)
+_FAST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+_JOB_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+# API
+HTTP_REQUEST_DURATION = Histogram(
+    "litevault_http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=_FAST_BUCKETS,
+)
+
+# Outbox (sampled)
+OUTBOX_JOBS = Gauge(
+    "litevault_outbox_jobs",
+    "Outbox jobs by status",
+    ["status"],
+)
+OUTBOX_OLDEST_PENDING_AGE = Gauge(
+    "litevault_outbox_oldest_pending_age_seconds",
+    "Time the oldest runnable PENDING job has been waiting",
+)
+OUTBOX_CLAIM_TO_COMPLETE = Histogram(
+    "litevault_outbox_claim_to_complete_seconds",
+    "Time from claiming an outbox job to completing it",
+    ["job_type"],
+    buckets=_JOB_BUCKETS,
+)
+OUTBOX_LEASE_RECLAIMS = Counter(
+    "litevault_outbox_lease_reclaims_total",
+    "Outbox jobs returned to PENDING after their lease expired",
+)
+
+# LLM
+LLM_REQUEST_DURATION = Histogram(
+    "litevault_llm_request_duration_seconds",
+    "LLM enrichment call latency",
+    ["model"],
+    buckets=_JOB_BUCKETS,
+)
+LLM_TIME_TO_FIRST_TOKEN = Histogram(
+    "litevault_llm_time_to_first_token_seconds",
+    "Time until the first streamed partial of an LLM call",
+    ["model"],
+    buckets=_FAST_BUCKETS,
+)
+LLM_TOKENS = Counter(
+    "litevault_llm_tokens_total",
+    "LLM tokens used (prompt, completion; cached_prompt and cache_write are "
+    "the prompt tokens read from and written to the provider prompt cache)",
+    ["model", "kind"],
+)
+LLM_ERRORS = Counter(
+    "litevault_llm_errors_total",
+    "Failed LLM enrichment calls",
+    ["model", "error_code"],
+)
+LLM_CANCELLED = Counter(
+    "litevault_llm_cancelled_total",
+    "LLM calls cancelled because the item left ENRICHING",
+)
+
+# Embeddings
+EMBEDDING_REQUEST_DURATION = Histogram(
+    "litevault_embedding_request_duration_seconds",
+    "Embedding call latency (items in the worker, queries in the API)",
+    ["model"],
+    buckets=_FAST_BUCKETS,
+)
+
+# Database pools
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "litevault_db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection",
+    ["pool"],
+    buckets=_WAIT_BUCKETS,
+)
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "litevault_db_pool_checkout_timeouts_total",
+    "Connection checkouts that hit pool_timeout",
+    ["pool"],
+)
+
+# Caches
+CACHE_REQUESTS = Counter(
+    "litevault_cache_requests_total",
+    "In-process cache lookups by result (hit/miss)",
+    ["cache", "result"],
+)
+
+# Uploads
+UPLOAD_VERIFY_DURATION = Histogram(
+    "litevault_upload_verify_duration_seconds",
+    "Storage HEAD latency when completing an upload",
+    ["result"],
+    buckets=_FAST_BUCKETS,
+)
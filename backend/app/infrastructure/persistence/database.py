@@ -1,16 +1,42 @@
-"""Database engine and session management."""
+"""Database engine and session management.
 
+Each workload role gets its own engine and connection pool:
+- api: request handlers (FastAPI dependency)
+- worker: outbox job processing
+- maintenance: background cleanup (upload reaper)
+- read: read-only endpoints (autocommit on the primary)
+
+Read-only sessions are routed by ReplicaRouter: to configured replicas
+(round-robin), or to the primary read engine while the requesting user
+is pinned after a write (read-your-writes).
+
+Separate pools mean a worker backlog or a long maintenance pass can
+never hold the connections request handlers need.
+"""
+
+import logging
+import time
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import Enum
+from uuid import uuid4
 
+from sqlalchemy import event, exc
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, ORMExecuteState, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import settings
+from app.infrastructure.metrics import DB_POOL_CHECKOUT_TIMEOUTS, DB_POOL_CHECKOUT_WAIT
+from app.infrastructure.persistence.read_routing import ReplicaRouter
+
+logger = logging.getLogger(__name__)
 
 
 class Base(DeclarativeBase):
@@ -19,23 +45,185 @@ class Base(DeclarativeBase):
     pass
 
 
-# Create async engine
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.is_development,
-    pool_pre_ping=True,
-)
+class DatabaseRole(str, Enum):
+    """Workload role owning a connection pool."""
+    API = "api"
+    WORKER = "worker"
+    MAINTENANCE = "maintenance"
+    READ = "read"
+
+
+@dataclass
+class PoolCheckoutMetrics:
+    """Connection checkout wait statistics for one pool."""
+
+    checkouts: int = 0
+    timeouts: int = 0
+    total_wait_secs: float = 0.0
+    max_wait_secs: float = 0.0
+
+    def record(self, wait_secs: float) -> None:
+        self.checkouts += 1
+        self.total_wait_secs += wait_secs
+        self.max_wait_secs = max(self.max_wait_secs, wait_secs)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long callers wait for a connection."""
+
+    role: str = "unknown"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_metrics = PoolCheckoutMetrics()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.role = self.role
+        pool.checkout_metrics = self.checkout_metrics
+        return pool
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.checkout_metrics.timeouts += 1
+            DB_POOL_CHECKOUT_TIMEOUTS.labels(self.role).inc()
+            logger.warning(
+                f"DB pool '{self.role}' checkout timed out after {self._timeout}s "
+                f"({self.status()})"
+            )
+            raise
+        wait_secs = time.perf_counter() - start
+        self.checkout_metrics.record(wait_secs)
+        DB_POOL_CHECKOUT_WAIT.labels(self.role).observe(wait_secs)
+        if wait_secs * 1000 >= settings.db_pool_slow_checkout_ms:
+            logger.warning(
+                f"DB pool '{self.role}' checkout waited {wait_secs * 1000:.0f}ms "
+                f"({self.status()})"
+            )
+        return connection
+
+
+_POOL_SIZES = {
+    DatabaseRole.API: lambda: (settings.db_api_pool_size, settings.db_api_max_overflow),
+    DatabaseRole.WORKER: lambda: (settings.db_worker_pool_size, settings.db_worker_max_overflow),
+    DatabaseRole.MAINTENANCE: lambda: (
+        settings.db_maintenance_pool_size,
+        settings.db_maintenance_max_overflow,
+    ),
+    DatabaseRole.READ: lambda: (settings.db_read_pool_size, settings.db_read_max_overflow),
+}
+
 
-# Session factory
-async_session_factory = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
+def _statement_cache_args() -> dict:
+    """asyncpg prepared-statement caching options.
+    
+    By default each connection keeps an LRU of server-side prepared
+    statements, so hot queries are parsed and planned once per connection.
+    PgBouncer in transaction mode hands each transaction a different server
+    connection, so named statements cannot be reused there: caching is
+    disabled and statement names are made unique to avoid collisions.
+    """
+    if settings.db_pgbouncer_transaction_mode:
+        return {
+            "prepared_statement_cache_size": 0,
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    return {"prepared_statement_cache_size": settings.db_prepared_statement_cache_size}
+
+
+def create_role_engine(
+    role: DatabaseRole, url: str | None = None, name: str | None = None
+) -> AsyncEngine:
+    """Create the engine for a workload role using pool settings.
+    
+    Read engines run in autocommit mode (no BEGIN/COMMIT round-trips)
+    and the server rejects writes on their connections.
+    
+    Args:
+        role: Workload role (selects pool sizing).
+        url: Database URL (default: primary database_url).
+        name: Pool name for metrics (default: role name).
+    """
+    pool_size, max_overflow = _POOL_SIZES[role]()
+    name = name or role.value
+    url = url or settings.database_url
+    server_settings = {"application_name": f"litevault-{name}"}
+    connect_args = {"server_settings": server_settings, **_statement_cache_args()}
+    options = {}
+    if role == DatabaseRole.READ:
+        server_settings["default_transaction_read_only"] = "on"
+        options["isolation_level"] = "AUTOCOMMIT"
+    
+    role_engine = create_async_engine(
+        url,
+        echo=settings.db_echo,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.db_pool_timeout_secs,
+        pool_recycle=settings.db_pool_recycle_secs,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        query_cache_size=settings.db_query_cache_size,
+        connect_args=connect_args,
+        **options,
+    )
+    role_engine.pool.role = name
+    return role_engine
+
+
+# Engines (connections are only opened on first use)
+engines: dict[DatabaseRole, AsyncEngine] = {
+    role: create_role_engine(role) for role in DatabaseRole
+}
+engine = engines[DatabaseRole.API]
+replica_engines: list[AsyncEngine] = [
+    create_role_engine(DatabaseRole.READ, url=url, name=f"replica-{index}")
+    for index, url in enumerate(settings.database_replica_url_list)
+]
+read_router = ReplicaRouter(
+    primary=engines[DatabaseRole.READ],
+    replicas=replica_engines,
+    pin_seconds=settings.db_replica_pin_secs,
 )
 
+# Session factories
+session_factories: dict[DatabaseRole, async_sessionmaker[AsyncSession]] = {
+    role: async_sessionmaker(role_engine, class_=AsyncSession, expire_on_commit=False)
+    for role, role_engine in engines.items()
+}
+async_session_factory = session_factories[DatabaseRole.API]
+read_session_factory = async_sessionmaker(class_=AsyncSession, expire_on_commit=False)
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush_writes(session: Session, flush_context) -> None:
+    """Record that the session wrote rows (ORM unit of work)."""
+    session.info["has_writes"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement_writes(state: ORMExecuteState) -> None:
+    """Record that the session wrote rows (bulk INSERT/UPDATE/DELETE)."""
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info["has_writes"] = True
+
+
+def _pin_if_written(session: AsyncSession) -> None:
+    """Pin the session's user to the primary after a committed write."""
+    if session.info.get("has_writes") and session.info.get("pin_key"):
+        read_router.pin(session.info["pin_key"])
+
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency for getting database session."""
+    """Dependency for getting database session (API pool).
+    
+    If the session wrote and knows its user (session.info["pin_key"]),
+    that user's reads are pinned to the primary for a short window.
+    """
     async with async_session_factory() as session:
         try:
             yield session
@@ -43,15 +231,62 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
+        _pin_if_written(session)
 
 
 @asynccontextmanager
-async def get_db_session_context() -> AsyncGenerator[AsyncSession, None]:
-    """Context manager for database session (for worker)."""
-    async with async_session_factory() as session:
+async def get_read_session_context(
+    pin_key: str | None = None,
+) -> AsyncGenerator[AsyncSession, None]:
+    """Read-only session routed to a replica or the primary.
+    
+    Autocommit connection: each statement runs on its own, so there is
+    no transaction to commit and writes are rejected.
+    
+    Args:
+        pin_key: Identity of the requesting user, for read-your-writes.
+    """
+    async with read_session_factory(bind=read_router.engine_for(pin_key)) as session:
+        yield session
+
+
+@asynccontextmanager
+async def get_db_session_context(
+    role: DatabaseRole = DatabaseRole.WORKER,
+) -> AsyncGenerator[AsyncSession, None]:
+    """Context manager for database session (for worker and maintenance)."""
+    async with session_factories[role]() as session:
         try:
             yield session
             await session.commit()
         except Exception:
             await session.rollback()
             raise
+        _pin_if_written(session)
+
+
+def get_pool_metrics() -> dict[str, dict]:
+    """Snapshot of pool occupancy and checkout waits per role."""
+    metrics = {}
+    for role_engine in [*engines.values(), *replica_engines]:
+        pool = role_engine.pool
+        stats: PoolCheckoutMetrics = pool.checkout_metrics
+        metrics[pool.role] = {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "checkouts": stats.checkouts,
+            "timeouts": stats.timeouts,
+            "avg_wait_ms": (
+                round(stats.total_wait_secs / stats.checkouts * 1000, 3)
+                if stats.checkouts else 0.0
+            ),
+            "max_wait_ms": round(stats.max_wait_secs * 1000, 3),
+        }
+    return metrics
+
+
+async def dispose_engines() -> None:
+    """Close all pooled connections (application shutdown)."""
+    for role_engine in [*engines.values(), *replica_engines]:
+        await role_engine.dispose()
@@ -6,6 +6,7 @@ from app.infrastructure.persistence.models.idempotency_model import IdempotencyK
 from app.infrastructure.persistence.models.outbox_model import EnrichmentOutboxModel
 from app.infrastructure.persistence.models.tag_model import TagModel
 from app.infrastructure.persistence.models.item_tag_model import ItemTagModel
+from app.infrastructure.persistence.models.tag_co_occurrence_model import TagCoOccurrenceModel
 from app.infrastructure.persistence.models.item_tag_suggestion_model import ItemTagSuggestionModel
 from app.infrastructure.persistence.models.ai_usage_model import (
     AiDailyUsageModel,
@@ -13,6 +14,7 @@ from app.infrastructure.persistence.models.ai_usage_model import (
 )
 from app.infrastructure.persistence.models.upload_model import UploadModel
 from app.infrastructure.persistence.models.item_attachment_model import ItemAttachmentModel
+from app.infrastructure.persistence.models.item_embedding_model import ItemEmbeddingModel
 
 __all__ = [
     "UserModel",
@@ -21,9 +23,11 @@ __all__ = [
     "EnrichmentOutboxModel",
     "TagModel",
     "ItemTagModel",
+    "TagCoOccurrenceModel",
     "ItemTagSuggestionModel",
     "AiDailyUsageModel",
     "AiUsageLedgerModel",
     "UploadModel",
     "ItemAttachmentModel",
+    "ItemEmbeddingModel",
 ]
@@ -75,4 +75,10 @@ class ItemAttachmentModel(Base):
             "created_at",
             postgresql_where="deleted_at IS NULL",
         ),
+        # Reaper purge scan (soft-deleted attachments)
+        Index(
+            "idx_attachments_deleted",
+            "deleted_at",
+            postgresql_where="deleted_at IS NOT NULL",
+        ),
     )
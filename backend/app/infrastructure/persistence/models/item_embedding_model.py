@@ -0,0 +1,102 @@
+"""Item embedding ORM model (pgvector)."""
+
+from datetime import datetime
+
+from sqlalchemy import DDL, DateTime, Float, ForeignKey, Index, String, cast, event, func
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import UserDefinedType
+
+from app.infrastructure.embeddings.provider_interface import EMBEDDING_DIMENSIONS
+from app.infrastructure.persistence.database import Base
+
+
+def format_vector(values: list[float]) -> str:
+    """pgvector text literal, e.g. '[0.1,-0.2]'."""
+    return "[" + ",".join(repr(float(x)) for x in values) + "]"
+
+
+def parse_vector(value: str) -> list[float]:
+    """Inverse of format_vector."""
+    return [float(x) for x in value.strip("[]").split(",") if x]
+
+
+class Vector(UserDefinedType):
+    """pgvector column type.
+
+    Values travel as text literals cast to vector, so no driver codec
+    (or pgvector Python package) is needed.
+    """
+
+    cache_ok = True
+
+    def __init__(self, dimensions: int):
+        self.dimensions = dimensions
+
+    def get_col_spec(self, **kw) -> str:
+        return f"vector({self.dimensions})"
+
+    def bind_processor(self, dialect):
+        def process(value):
+            return None if value is None else format_vector(value)
+        return process
+
+    def result_processor(self, dialect, coltype):
+        def process(value):
+            return None if value is None else parse_vector(value)
+        return process
+
+    def bind_expression(self, bindvalue):
+        return cast(bindvalue, self)
+
+    class comparator_factory(UserDefinedType.Comparator):
+        def cosine_distance(self, other):
+            """Cosine distance (pgvector <=>), served by vector_cosine_ops indexes."""
+            return self.op("<=>", return_type=Float)(other)
+
+
+class ItemEmbeddingModel(Base):
+    """SQLAlchemy model for item_embeddings (one vector per ARCHIVED item).
+
+    user_id is denormalized from items so nearest-neighbour queries
+    filter to one user's vectors without a join.
+    """
+
+    __tablename__ = "item_embeddings"
+
+    item_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("items.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    user_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    model: Mapped[str] = mapped_column(String(150), nullable=False)
+    # sha256 of the embedded text; unchanged items are not re-embedded
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    embedding: Mapped[list[float]] = mapped_column(Vector(EMBEDDING_DIMENSIONS), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    __table_args__ = (
+        Index(
+            "idx_item_embeddings_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        ),
+    )
+
+
+# create_all (tests, fresh dev databases) needs the extension first
+event.listen(
+    Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS vector")
+)
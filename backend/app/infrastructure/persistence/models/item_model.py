@@ -3,7 +3,7 @@
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import String, Text, DateTime, ForeignKey, Index, func
+from sqlalchemy import String, Text, DateTime, ForeignKey, Index, Integer, func, text
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -32,8 +32,14 @@ class ItemModel(Base):
     status: Mapped[str] = mapped_column(String(20), nullable=False, default="ENRICHING")
     source_type: Mapped[str | None] = mapped_column(String(20), nullable=True)
     enrichment_mode: Mapped[str] = mapped_column(String(10), nullable=False, default="AI")
+    # "<model>#<prompt digest>" of the last AI enrichment (NULL: unknown)
+    enrichment_version: Mapped[str | None] = mapped_column(String(150), nullable=True)
     # Store tags as array for simplicity in V1 (no separate item_tags table yet)
     tags: Mapped[list[str]] = mapped_column(ARRAY(String), nullable=False, default=[])
+    # Live attachments; maintained by SQLAlchemyItemAttachmentRepository
+    attachment_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -57,10 +63,12 @@ class ItemModel(Base):
             "created_at",
             postgresql_where="status IN ('ENRICHING', 'READY_TO_CONFIRM', 'FAILED')",
         ),
+        # Library pages: keyset order (confirmed_at DESC, id DESC)
         Index(
-            "idx_items_user_archived",
+            "idx_items_library",
             "user_id",
-            "confirmed_at",
+            text("confirmed_at DESC"),
+            text("id DESC"),
             postgresql_where="status = 'ARCHIVED'",
         ),
     )
@@ -32,6 +32,12 @@ class EnrichmentOutboxModel(Base):
         nullable=False,
         default="enrichment",
     )
+    # Target upload for derivative jobs (job_type='thumbnail')
+    upload_id: Mapped[str | None] = mapped_column(
+        String(36),
+        ForeignKey("uploads.id", ondelete="CASCADE"),
+        nullable=True,
+    )
     status: Mapped[str] = mapped_column(
         String(20),
         nullable=False,
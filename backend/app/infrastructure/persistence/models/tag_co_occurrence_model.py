@@ -0,0 +1,31 @@
+"""Tag co-occurrence SQLAlchemy model."""
+
+from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.persistence.database import Base
+
+
+class TagCoOccurrenceModel(Base):
+    """SQLAlchemy model for tag_co_occurrence table.
+
+    One row per ordered pair of tags applied to the same non-discarded
+    item, in both directions; item_count is the number of such items.
+    Tags belong to one user, so the matrix is per user. Maintained by
+    SQLAlchemyItemTagRepository; rows of deleted tags go by cascade.
+    """
+
+    __tablename__ = "tag_co_occurrence"
+
+    tag_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("tags.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    related_tag_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("tags.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    )
+    item_count: Mapped[int] = mapped_column(Integer, nullable=False)
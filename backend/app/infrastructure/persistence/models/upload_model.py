@@ -33,9 +33,13 @@ class UploadModel(Base):
         default="INITIATED",
     )
     
-    # Storage location
-    object_key: Mapped[str] = mapped_column(String(500), nullable=False, unique=True)
+    # Storage location (shared by uploads deduplicated onto the same object)
+    object_key: Mapped[str] = mapped_column(String(500), nullable=False)
     bucket: Mapped[str] = mapped_column(String(100), nullable=False)
+    # Upload whose stored object this upload reuses (content dedup), if any
+    dedup_source_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
+    # Derived thumbnail object (images only, set by the thumbnail job)
+    thumb_key: Mapped[str | None] = mapped_column(String(500), nullable=True)
     
     # File metadata
     filename: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -88,6 +92,22 @@ class UploadModel(Base):
             "expires_at",
             postgresql_where="status = 'INITIATED'",
         ),
+        # Reaper purge scan (terminal uploads past retention)
+        Index(
+            "idx_uploads_reapable",
+            "updated_at",
+            postgresql_where="status IN ('EXPIRED', 'FAILED', 'DELETED')",
+        ),
+        # Object reference lookup (reaper ref counting)
+        Index("idx_uploads_object_key", "object_key"),
+        # Content dedup lookup
+        Index(
+            "idx_uploads_checksum",
+            "user_id",
+            "checksum",
+            "size_bytes",
+            postgresql_where="status = 'COMPLETED' AND deleted_at IS NULL AND checksum IS NOT NULL",
+        ),
         # Idempotency lookup
         Index(
             "idx_uploads_idempotency",
@@ -4,7 +4,7 @@ from datetime import datetime
 from uuid import uuid4
 from typing import Any
 
-from sqlalchemy import String, DateTime, func, Index
+from sqlalchemy import BigInteger, String, DateTime, func, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -35,6 +35,10 @@ class UserModel(Base):
         JSONB, nullable=False, server_default="{}"
     )
     plan: Mapped[str] = mapped_column(String(20), nullable=False, default="free")
+    # Bumped on every library change (ETag / page cache key)
+    library_version: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, server_default="0"
+    )
     # password_hash kept for backward compatibility but not used with Clerk
     password_hash: Mapped[str | None] = mapped_column(String(255), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
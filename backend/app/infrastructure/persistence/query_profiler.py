@@ -0,0 +1,68 @@
+"""Per-request SQL statement counting and timing.
+
+Cursor-execute events on every engine add to the QueryProfile bound to
+the current context (one per HTTP request, see QueryProfileMiddleware).
+Work outside a profiled context (worker, reaper) pays a single
+ContextVar lookup per statement.
+"""
+
+import contextvars
+import time
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Statements kept for a slow-request dump (the count is always exact)
+MAX_RECORDED_STATEMENTS = 50
+
+
+@dataclass
+class QueryProfile:
+    """SQL statements run while handling one request."""
+
+    count: int = 0
+    total_secs: float = 0.0
+    record_statements: bool = False
+    statements: list[tuple[str, float]] = field(default_factory=list)
+
+    def record(self, statement: str, secs: float) -> None:
+        self.count += 1
+        self.total_secs += secs
+        if self.record_statements and len(self.statements) < MAX_RECORDED_STATEMENTS:
+            self.statements.append((statement, secs))
+
+
+_profile_var: contextvars.ContextVar[QueryProfile | None] = contextvars.ContextVar(
+    "query_profile", default=None
+)
+
+
+def start_profile(record_statements: bool = False) -> tuple[QueryProfile, contextvars.Token]:
+    """Bind a fresh profile to the current context."""
+    profile = QueryProfile(record_statements=record_statements)
+    return profile, _profile_var.set(profile)
+
+
+def stop_profile(token: contextvars.Token) -> None:
+    """Unbind the profile started with start_profile()."""
+    _profile_var.reset(token)
+
+
+def current_profile() -> QueryProfile | None:
+    """Profile for the current request, if one is active."""
+    return _profile_var.get()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _profile_var.get() is not None:
+        conn.info["query_started_at"] = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    profile = _profile_var.get()
+    started_at = conn.info.pop("query_started_at", None)
+    if profile is not None and started_at is not None:
+        profile.record(statement, time.perf_counter() - started_at)
@@ -0,0 +1,63 @@
+"""Read-replica routing with read-your-writes pinning.
+
+Reads go to replicas round-robin. After a user's request writes to the
+primary, that user is pinned to the primary for a short window (longer
+than typical replica lag) so they always see their own changes.
+
+Pins are kept in-process: with several API instances, a user's next read
+may land on an instance that never saw the write, so keep the window
+generous or route users stickily at the load balancer.
+"""
+
+import itertools
+import time
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Bound on tracked pins; expired entries are pruned once exceeded
+MAX_PINS = 10_000
+
+
+class ReplicaRouter:
+    """Chooses the engine for read-only sessions."""
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: list[AsyncEngine],
+        pin_seconds: float,
+    ):
+        self.primary = primary
+        self.replicas = replicas
+        self.pin_seconds = pin_seconds
+        self._pinned_until: dict[str, float] = {}
+        self._next_replica = itertools.cycle(replicas) if replicas else None
+
+    def pin(self, key: str) -> None:
+        """Route this user's reads to the primary for the pin window."""
+        if not self.replicas:
+            return
+        now = time.monotonic()
+        if len(self._pinned_until) >= MAX_PINS:
+            self._pinned_until = {
+                k: until for k, until in self._pinned_until.items() if until > now
+            }
+        self._pinned_until[key] = now + self.pin_seconds
+
+    def is_pinned(self, key: str | None) -> bool:
+        """Check whether the user is inside a post-write pin window."""
+        if key is None:
+            return False
+        until = self._pinned_until.get(key)
+        if until is None:
+            return False
+        if until <= time.monotonic():
+            self._pinned_until.pop(key, None)
+            return False
+        return True
+
+    def engine_for(self, key: str | None) -> AsyncEngine:
+        """Pick the engine for a read-only session."""
+        if self._next_replica is None or self.is_pinned(key):
+            return self.primary
+        return next(self._next_replica)
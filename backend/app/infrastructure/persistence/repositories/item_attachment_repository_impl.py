@@ -1,10 +1,16 @@
-"""SQLAlchemy ItemAttachment repository implementation."""
+"""SQLAlchemy ItemAttachment repository implementation.
 
+Every write here also maintains items.attachment_count in the same
+transaction, so list views never count attachments per page.
+"""
+
+from collections import Counter
 from datetime import datetime, timezone
-from sqlalchemy import select, update, func
+from sqlalchemy import select, update, delete, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infrastructure.persistence.models.item_attachment_model import ItemAttachmentModel
+from app.infrastructure.persistence.models.item_model import ItemModel
 
 
 class SQLAlchemyItemAttachmentRepository:
@@ -48,6 +54,7 @@ class SQLAlchemyItemAttachmentRepository:
         )
         self.session.add(model)
         await self.session.flush()
+        await self._adjust_item_count(item_id, 1)
         return model
 
     async def get_by_id(self, attachment_id: str, user_id: str) -> ItemAttachmentModel | None:
@@ -107,8 +114,13 @@ class SQLAlchemyItemAttachmentRepository:
                 ItemAttachmentModel.deleted_at.is_(None),
             )
             .values(deleted_at=now, updated_at=now)
+            .returning(ItemAttachmentModel.item_id)
         )
-        return result.rowcount > 0
+        item_id = result.scalar_one_or_none()
+        if item_id is None:
+            return False
+        await self._adjust_item_count(item_id, -1)
+        return True
 
     async def soft_delete_by_item(self, item_id: str, user_id: str) -> int:
         """Soft delete all attachments for an item."""
@@ -122,4 +134,85 @@ class SQLAlchemyItemAttachmentRepository:
             )
             .values(deleted_at=now, updated_at=now)
         )
+        if result.rowcount:
+            await self._adjust_item_count(item_id, -result.rowcount)
         return result.rowcount
+
+    async def list_deleted_before(
+        self, before: datetime, limit: int = 500
+    ) -> list[ItemAttachmentModel]:
+        """List attachments soft-deleted before cutoff (for reaper)."""
+        result = await self.session.execute(
+            select(ItemAttachmentModel)
+            .where(
+                ItemAttachmentModel.deleted_at.isnot(None),
+                ItemAttachmentModel.deleted_at < before,
+            )
+            .order_by(ItemAttachmentModel.deleted_at)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def hard_delete_by_upload_ids(self, upload_ids: list[str]) -> int:
+        """Permanently delete attachment rows for purged uploads."""
+        if not upload_ids:
+            return 0
+        result = await self.session.execute(
+            delete(ItemAttachmentModel)
+            .where(ItemAttachmentModel.upload_id.in_(upload_ids))
+            .returning(ItemAttachmentModel.item_id, ItemAttachmentModel.deleted_at)
+        )
+        rows = result.all()
+        # Normally only soft-deleted rows get here; keep counts right if not
+        live = Counter(item_id for item_id, deleted_at in rows if deleted_at is None)
+        for item_id, count in live.items():
+            await self._adjust_item_count(item_id, -count)
+        return len(rows)
+
+    async def reconcile_item_counts(
+        self, after_id: str | None, limit: int = 500
+    ) -> tuple[str | None, int]:
+        """Repair drifted items.attachment_count for one keyset page of items.
+        
+        Args:
+            after_id: Last item ID of the previous page (None to start).
+            limit: Items per page.
+            
+        Returns:
+            Tuple of (last item ID scanned or None when done, items fixed).
+        """
+        stmt = select(ItemModel.id).order_by(ItemModel.id).limit(limit)
+        if after_id is not None:
+            stmt = stmt.where(ItemModel.id > after_id)
+        item_ids = list((await self.session.execute(stmt)).scalars().all())
+        if not item_ids:
+            return None, 0
+        
+        actual = (
+            select(func.count())
+            .select_from(ItemAttachmentModel)
+            .where(
+                ItemAttachmentModel.item_id == ItemModel.id,
+                ItemAttachmentModel.deleted_at.is_(None),
+            )
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            update(ItemModel)
+            .where(ItemModel.id.in_(item_ids), ItemModel.attachment_count != actual)
+            .values(attachment_count=actual, updated_at=ItemModel.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        return item_ids[-1], result.rowcount
+
+    async def _adjust_item_count(self, item_id: str, delta: int) -> None:
+        """Atomically shift an item's attachment_count (never below zero)."""
+        await self.session.execute(
+            update(ItemModel)
+            .where(ItemModel.id == item_id)
+            .values(
+                attachment_count=func.greatest(ItemModel.attachment_count + delta, 0),
+                updated_at=ItemModel.updated_at,  # Not a content edit
+            )
+            .execution_options(synchronize_session=False)
+        )
@@ -0,0 +1,133 @@
+"""SQLAlchemy implementation of ItemEmbeddingRepository (pgvector)."""
+
+from sqlalchemy import delete, func, select, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.repositories.item_embedding_repository import ItemEmbeddingRepository
+from app.infrastructure.persistence.models.item_embedding_model import ItemEmbeddingModel
+from app.infrastructure.persistence.models.item_model import ItemModel
+
+
+class SQLAlchemyItemEmbeddingRepository(ItemEmbeddingRepository):
+    """SQLAlchemy implementation of ItemEmbeddingRepository."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_fingerprint(self, item_id: str) -> tuple[str, str] | None:
+        """(model, content_hash) of the stored vector, or None if there is none."""
+        result = await self.session.execute(
+            select(ItemEmbeddingModel.model, ItemEmbeddingModel.content_hash).where(
+                ItemEmbeddingModel.item_id == item_id
+            )
+        )
+        row = result.one_or_none()
+        return (row.model, row.content_hash) if row else None
+
+    async def upsert(
+        self,
+        item_id: str,
+        user_id: str,
+        model: str,
+        content_hash: str,
+        embedding: list[float],
+    ) -> None:
+        """Store or replace the vector for an item.
+
+        Uses INSERT ... ON CONFLICT DO UPDATE so a retried job is harmless.
+        """
+        stmt = pg_insert(ItemEmbeddingModel).values(
+            item_id=item_id,
+            user_id=user_id,
+            model=model,
+            content_hash=content_hash,
+            embedding=embedding,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["item_id"],
+            set_={
+                "model": stmt.excluded.model,
+                "content_hash": stmt.excluded.content_hash,
+                "embedding": stmt.excluded.embedding,
+                "updated_at": func.now(),
+            },
+        )
+        await self.session.execute(stmt)
+
+    async def delete_by_item_id(self, item_id: str) -> None:
+        """Delete the vector for an item, if any."""
+        await self.session.execute(
+            delete(ItemEmbeddingModel).where(ItemEmbeddingModel.item_id == item_id)
+        )
+
+    async def nearest(
+        self,
+        user_id: str,
+        embedding: list[float],
+        limit: int,
+        max_distance: float,
+        *,
+        exact_max_items: int,
+    ) -> list[tuple[str, float]]:
+        """A user's ARCHIVED items closest to embedding, nearest first.
+
+        The HNSW index is shared by all users, and the user filter only
+        applies to the rows it yields: once hnsw.max_scan_tuples is hit
+        (migration 021), a user holding a small share of the table gets
+        few or no rows back. So users with at most exact_max_items
+        vectors are searched exactly, via ix_item_embeddings_user_id
+        (a MATERIALIZED CTE the index cannot order). Larger users get a
+        plain ORDER BY distance LIMIT that the HNSW index serves, with
+        iterative scans continuing until limit rows of this user are
+        found. One statement: a bounded count of the user's vectors
+        gates which branch runs; the other is never executed. Distance and status filters, and the
+        exact re-sort that relaxed_order scans need, happen on those
+        rows.
+        """
+        distance = ItemEmbeddingModel.embedding.cosine_distance(embedding).label("distance")
+        user_vectors = (
+            select(ItemEmbeddingModel.item_id)
+            .where(ItemEmbeddingModel.user_id == user_id)
+            .limit(exact_max_items + 1)
+            .subquery("user_vectors")
+        )
+        # Referenced by both branches, so Postgres computes it once
+        user_size = select(func.count().label("vectors")).select_from(user_vectors).cte(
+            "user_size"
+        )
+        is_small = select(user_size.c.vectors).scalar_subquery() <= exact_max_items
+        user_distances = (
+            select(ItemEmbeddingModel.item_id, distance)
+            .where(ItemEmbeddingModel.user_id == user_id)
+            .cte("user_distances")
+            .prefix_with("MATERIALIZED")
+        )
+        exact = (
+            select(user_distances.c.item_id, user_distances.c.distance)
+            .where(is_small)
+            .order_by(user_distances.c.distance)
+            .limit(limit)
+        )
+        approximate = (
+            select(ItemEmbeddingModel.item_id, distance)
+            .where(ItemEmbeddingModel.user_id == user_id, ~is_small)
+            .order_by(distance)
+            .limit(limit)
+        )
+        candidates = (
+            union_all(exact.subquery().select(), approximate.subquery().select())
+            .cte("candidates")
+            .prefix_with("MATERIALIZED")
+        )
+        stmt = (
+            select(candidates.c.item_id, candidates.c.distance)
+            .join(ItemModel, ItemModel.id == candidates.c.item_id)
+            .where(
+                ItemModel.status == "ARCHIVED",
+                candidates.c.distance <= max_distance,
+            )
+            .order_by(candidates.c.distance, candidates.c.item_id)
+        )
+        result = await self.session.execute(stmt)
+        return [(row.item_id, row.distance) for row in result]
@@ -1,6 +1,14 @@
-"""SQLAlchemy Item repository implementation."""
+"""SQLAlchemy Item repository implementation.
 
-from sqlalchemy import select, update, func
+Hot read paths (get_by_id, library page) are lambda statements: SQLAlchemy
+caches their construction and compilation, so repeat calls only extract
+bound parameters.
+"""
+
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import Row, and_, func, lambda_stmt, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.item import Item
@@ -8,6 +16,10 @@ from app.domain.value_objects import ItemStatus, SourceType, EnrichmentMode
 from app.domain.repositories.item_repository import ItemRepository
 from app.infrastructure.persistence.models.item_model import ItemModel
 
+# Characters of raw_text shown on library cards
+LIBRARY_PREVIEW_CHARS = 500
+_PREVIEW_FETCH_CHARS = LIBRARY_PREVIEW_CHARS + 1  # One extra detects truncation
+
 
 class SQLAlchemyItemRepository(ItemRepository):
     """SQLAlchemy implementation of ItemRepository."""
@@ -26,6 +38,7 @@ class SQLAlchemyItemRepository(ItemRepository):
             status=item.status.value,
             source_type=item.source_type.value if item.source_type else None,
             enrichment_mode=item.enrichment_mode.value,
+            enrichment_version=item.enrichment_version,
             tags=item.tags,
             created_at=item.created_at,
             updated_at=item.updated_at,
@@ -38,9 +51,11 @@ class SQLAlchemyItemRepository(ItemRepository):
     async def get_by_id(self, item_id: str, user_id: str) -> Item | None:
         """Get item by ID, scoped to user."""
         result = await self.session.execute(
-            select(ItemModel).where(
-                ItemModel.id == item_id,
-                ItemModel.user_id == user_id,
+            lambda_stmt(
+                lambda: select(ItemModel).where(
+                    ItemModel.id == item_id,
+                    ItemModel.user_id == user_id,
+                )
             )
         )
         model = result.scalar_one_or_none()
@@ -78,6 +93,115 @@ class SQLAlchemyItemRepository(ItemRepository):
             return None
         return self._to_entity(model)
 
+    async def get_status_system(self, item_id: str) -> ItemStatus | None:
+        """Get only the item's status, without locking (no user scoping).
+        
+        For internal worker use only - polled to cancel enrichment early.
+        """
+        result = await self.session.execute(
+            select(ItemModel.status).where(ItemModel.id == item_id)
+        )
+        status = result.scalar_one_or_none()
+        return ItemStatus(status) if status else None
+
+    async def set_title_if_enriching_system(self, item_id: str, title: str) -> None:
+        """Store a provisional title while the item is still ENRICHING.
+        
+        For internal worker use only - publishes a streamed title early.
+        """
+        await self.session.execute(
+            update(ItemModel)
+            .where(ItemModel.id == item_id, ItemModel.status == ItemStatus.ENRICHING.value)
+            .values(title=title)
+        )
+
+    async def list_ids_for_reenrichment_system(
+        self,
+        after_id: str | None,
+        limit: int,
+        *,
+        user_id: str | None = None,
+        confirmed_from: datetime | None = None,
+        confirmed_to: datetime | None = None,
+        version: str | None = None,
+        exclude_version: str | None = None,
+        ai_only: bool = True,
+    ) -> list[str]:
+        """Next page of ARCHIVED item IDs matching the backfill filters.
+        
+        For the re-enrichment backfill only - no user scoping unless
+        user_id is given. Keyset-paginated by primary key, so a page
+        after after_id is an index range scan and resumes exactly.
+        
+        Args:
+            after_id: Last ID of the previous page (None for the first).
+            limit: Page size.
+            user_id: Only this user's items.
+            confirmed_from: Confirmed at or after (inclusive).
+            confirmed_to: Confirmed before (exclusive).
+            version: Only items enriched with this enrichment_version.
+            exclude_version: Skip items already at this version (items
+                with unknown version are included).
+            ai_only: Skip MANUAL items (saved without AI), which must
+                never be sent to the LLM. False to select every item.
+        """
+        conditions = self._reenrichment_conditions(
+            user_id, confirmed_from, confirmed_to, version, exclude_version, ai_only
+        )
+        if after_id is not None:
+            conditions.append(ItemModel.id > after_id)
+        result = await self.session.execute(
+            select(ItemModel.id).where(*conditions).order_by(ItemModel.id).limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def count_for_reenrichment_system(
+        self,
+        after_id: str | None = None,
+        *,
+        user_id: str | None = None,
+        confirmed_from: datetime | None = None,
+        confirmed_to: datetime | None = None,
+        version: str | None = None,
+        exclude_version: str | None = None,
+        ai_only: bool = True,
+    ) -> int:
+        """Count matching ARCHIVED items after after_id (backfill progress)."""
+        conditions = self._reenrichment_conditions(
+            user_id, confirmed_from, confirmed_to, version, exclude_version, ai_only
+        )
+        if after_id is not None:
+            conditions.append(ItemModel.id > after_id)
+        result = await self.session.execute(
+            select(func.count()).select_from(ItemModel).where(*conditions)
+        )
+        return result.scalar() or 0
+
+    @staticmethod
+    def _reenrichment_conditions(
+        user_id: str | None,
+        confirmed_from: datetime | None,
+        confirmed_to: datetime | None,
+        version: str | None,
+        exclude_version: str | None,
+        ai_only: bool,
+    ) -> list:
+        """WHERE clauses shared by the backfill queries."""
+        conditions = [ItemModel.status == ItemStatus.ARCHIVED.value]
+        if ai_only:
+            conditions.append(ItemModel.enrichment_mode == EnrichmentMode.AI.value)
+        if user_id is not None:
+            conditions.append(ItemModel.user_id == user_id)
+        if confirmed_from is not None:
+            conditions.append(ItemModel.confirmed_at >= confirmed_from)
+        if confirmed_to is not None:
+            conditions.append(ItemModel.confirmed_at < confirmed_to)
+        if version is not None:
+            conditions.append(ItemModel.enrichment_version == version)
+        if exclude_version is not None:
+            conditions.append(ItemModel.enrichment_version.is_distinct_from(exclude_version))
+        return conditions
+
     async def get_pending_by_user(self, user_id: str) -> list[Item]:
         """Get items with pending statuses for user."""
         pending_statuses = [
@@ -116,6 +240,7 @@ class SQLAlchemyItemRepository(ItemRepository):
                 summary=item.summary,
                 status=item.status.value,
                 source_type=item.source_type.value if item.source_type else None,
+                enrichment_version=item.enrichment_version,
                 tags=item.tags,
                 updated_at=item.updated_at,
                 confirmed_at=item.confirmed_at,
@@ -139,24 +264,39 @@ class SQLAlchemyItemRepository(ItemRepository):
             created_at=model.created_at,
             updated_at=model.updated_at,
             confirmed_at=model.confirmed_at,
+            attachment_count=model.attachment_count,
+            enrichment_version=model.enrichment_version,
         )
 
-    async def get_archived_by_user(
+    async def list_library_rows(
         self,
         user_id: str,
         cursor: tuple | None = None,
         limit: int = 20,
-    ) -> list[Item]:
-        """Get archived items for user with cursor pagination.
+    ) -> Sequence[Row]:
+        """Get library card rows for user with cursor pagination.
         
-        Ordered by (confirmed_at DESC, id DESC) for stable pagination.
-        Cursor is (confirmed_at, id) tuple.
-        """
-        from sqlalchemy import or_, and_
+        Projection only: rows carry id, title, summary, tags, source_type,
+        created_at, confirmed_at, attachment_count and raw_text_preview
+        (the first LIBRARY_PREVIEW_CHARS + 1 characters, so callers can
+        tell whether it was cut). Full raw_text never leaves Postgres.
         
-        query = (
-            select(ItemModel)
-            .where(
+        Ordered by (confirmed_at DESC, id DESC), matching idx_items_library.
+        Cursor is (confirmed_at, id) tuple. First and subsequent pages are
+        two cached statement shapes.
+        """
+        query = lambda_stmt(
+            lambda: select(
+                ItemModel.id,
+                ItemModel.title,
+                ItemModel.summary,
+                ItemModel.tags,
+                ItemModel.source_type,
+                ItemModel.created_at,
+                ItemModel.confirmed_at,
+                ItemModel.attachment_count,
+                func.left(ItemModel.raw_text, _PREVIEW_FETCH_CHARS).label("raw_text_preview"),
+            ).where(
                 ItemModel.user_id == user_id,
                 ItemModel.status == ItemStatus.ARCHIVED.value,
             )
@@ -165,7 +305,7 @@ class SQLAlchemyItemRepository(ItemRepository):
         # Apply cursor filter
         if cursor:
             last_confirmed_at, last_id = cursor
-            query = query.where(
+            query += lambda q: q.where(
                 or_(
                     ItemModel.confirmed_at < last_confirmed_at,
                     and_(
@@ -176,11 +316,10 @@ class SQLAlchemyItemRepository(ItemRepository):
             )
         
         # Order by (confirmed_at DESC, id DESC) for stable pagination
-        query = query.order_by(
+        query += lambda q: q.order_by(
             ItemModel.confirmed_at.desc(),
             ItemModel.id.desc(),
         ).limit(limit)
         
         result = await self.session.execute(query)
-        models = result.scalars().all()
-        return [self._to_entity(m) for m in models]
+        return result.all()
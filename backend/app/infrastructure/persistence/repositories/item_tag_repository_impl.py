@@ -1,11 +1,15 @@
 """SQLAlchemy implementation of ItemTagRepository."""
 
-from sqlalchemy import select, delete, func
+from itertools import permutations
+
+from sqlalchemy import select, delete, func, or_, tuple_, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.repositories.item_tag_repository import ItemTagRepository
+from app.infrastructure.persistence.models.item_model import ItemModel
 from app.infrastructure.persistence.models.item_tag_model import ItemTagModel
+from app.infrastructure.persistence.models.tag_co_occurrence_model import TagCoOccurrenceModel
 
 
 class SQLAlchemyItemTagRepository(ItemTagRepository):
@@ -17,13 +21,21 @@ class SQLAlchemyItemTagRepository(ItemTagRepository):
     async def create(self, item_id: str, tag_id: str) -> None:
         """Create an association between item and tag.
         
-        Uses INSERT ... ON CONFLICT DO NOTHING to handle duplicates.
+        Uses INSERT ... ON CONFLICT DO NOTHING to handle duplicates. A new
+        association counts the tag's pairs with the item's other tags.
         """
         stmt = pg_insert(ItemTagModel).values(
             item_id=item_id,
             tag_id=tag_id,
         ).on_conflict_do_nothing(index_elements=["item_id", "tag_id"])
-        await self.session.execute(stmt)
+        result = await self.session.execute(stmt.returning(ItemTagModel.tag_id))
+        if result.scalar_one_or_none() is None:
+            return
+        pairs = []
+        for other in await self.get_tag_ids_by_item_id(item_id):
+            if other != tag_id:
+                pairs += [(tag_id, other), (other, tag_id)]
+        await self._count_pairs(pairs, 1)
 
     async def exists(self, item_id: str, tag_id: str) -> bool:
         """Check if an association exists."""
@@ -35,14 +47,28 @@ class SQLAlchemyItemTagRepository(ItemTagRepository):
         return result.scalar_one_or_none() is not None
 
     async def delete_by_item_id(self, item_id: str) -> None:
-        """Delete all tag associations for an item."""
+        """Delete all tag associations for an item (and their pair counts)."""
         stmt = delete(ItemTagModel).where(ItemTagModel.item_id == item_id)
-        await self.session.execute(stmt)
+        result = await self.session.execute(stmt.returning(ItemTagModel.tag_id))
+        await self._count_pairs(list(permutations(result.scalars().all(), 2)), -1)
 
     async def delete_by_tag_id(self, tag_id: str) -> None:
-        """Delete all associations for a tag."""
+        """Delete all associations for a tag (and its pair counts)."""
         stmt = delete(ItemTagModel).where(ItemTagModel.tag_id == tag_id)
         await self.session.execute(stmt)
+        await self.session.execute(
+            delete(TagCoOccurrenceModel).where(
+                or_(
+                    TagCoOccurrenceModel.tag_id == tag_id,
+                    TagCoOccurrenceModel.related_tag_id == tag_id,
+                )
+            )
+        )
+
+    async def remove_from_co_occurrence(self, item_id: str) -> None:
+        """Uncount an item's tag pairs, keeping its associations."""
+        tag_ids = await self.get_tag_ids_by_item_id(item_id)
+        await self._count_pairs(list(permutations(tag_ids, 2)), -1)
 
     async def get_tag_ids_by_item_id(self, item_id: str) -> list[str]:
         """Get all tag IDs associated with an item."""
@@ -63,3 +89,70 @@ class SQLAlchemyItemTagRepository(ItemTagRepository):
         )
         result = await self.session.execute(stmt)
         return result.scalar() or 0
+
+    async def get_recent_tagged_items(
+        self, user_id: str, limit: int, raw_text_chars: int
+    ) -> list[tuple[str | None, str | None, str, list[str]]]:
+        """A user's most recently confirmed ARCHIVED items with their tags.
+
+        The inner query walks idx_items_library; tag ids are aggregated
+        per item so the sample costs one round trip.
+        """
+        recent = (
+            select(
+                ItemModel.id,
+                ItemModel.title,
+                ItemModel.summary,
+                func.left(ItemModel.raw_text, raw_text_chars).label("raw_text"),
+            )
+            .where(ItemModel.user_id == user_id, ItemModel.status == "ARCHIVED")
+            .order_by(ItemModel.confirmed_at.desc(), ItemModel.id.desc())
+            .limit(limit)
+            .subquery()
+        )
+        stmt = (
+            select(
+                recent.c.title,
+                recent.c.summary,
+                recent.c.raw_text,
+                func.array_remove(func.array_agg(ItemTagModel.tag_id), None).label("tag_ids"),
+            )
+            .outerjoin(ItemTagModel, ItemTagModel.item_id == recent.c.id)
+            .group_by(recent.c.id, recent.c.title, recent.c.summary, recent.c.raw_text)
+        )
+        result = await self.session.execute(stmt)
+        return [
+            (row.title, row.summary, row.raw_text, list(row.tag_ids)) for row in result
+        ]
+
+    async def _count_pairs(self, pairs: list[tuple[str, str]], delta: int) -> None:
+        """Add delta to the item count of each (tag, related tag) pair.
+        
+        Pairs are written in sorted order so concurrent transactions
+        lock rows in the same order; counts reaching zero are deleted.
+        """
+        if not pairs:
+            return
+        pairs = sorted(pairs)
+        if delta > 0:
+            stmt = pg_insert(TagCoOccurrenceModel).values([
+                {"tag_id": tag_id, "related_tag_id": related_id, "item_count": delta}
+                for tag_id, related_id in pairs
+            ])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["tag_id", "related_tag_id"],
+                set_={"item_count": TagCoOccurrenceModel.item_count + stmt.excluded.item_count},
+            )
+            await self.session.execute(stmt)
+            return
+        in_pairs = tuple_(
+            TagCoOccurrenceModel.tag_id, TagCoOccurrenceModel.related_tag_id
+        ).in_(pairs)
+        await self.session.execute(
+            update(TagCoOccurrenceModel)
+            .where(in_pairs)
+            .values(item_count=TagCoOccurrenceModel.item_count + delta)
+        )
+        await self.session.execute(
+            delete(TagCoOccurrenceModel).where(in_pairs, TagCoOccurrenceModel.item_count <= 0)
+        )
@@ -73,6 +73,25 @@ class SQLAlchemyItemTagSuggestionRepository(ItemTagSuggestionRepository):
         models = result.scalars().all()
         return [self._to_entity(m) for m in models]
 
+    async def get_by_item_ids(
+        self, item_ids: list[str], user_id: str
+    ) -> dict[str, list[ItemTagSuggestion]]:
+        """Get suggestions for several items in one query, keyed by item ID."""
+        if not item_ids:
+            return {}
+        result = await self.session.execute(
+            select(ItemTagSuggestionModel)
+            .where(
+                ItemTagSuggestionModel.item_id.in_(item_ids),
+                ItemTagSuggestionModel.user_id == user_id,
+            )
+            .order_by(ItemTagSuggestionModel.created_at)
+        )
+        by_item: dict[str, list[ItemTagSuggestion]] = {item_id: [] for item_id in item_ids}
+        for model in result.scalars().all():
+            by_item[model.item_id].append(self._to_entity(model))
+        return by_item
+
     async def update(self, suggestion: ItemTagSuggestion) -> ItemTagSuggestion:
         """Update an existing suggestion."""
         await self.session.execute(
@@ -3,10 +3,15 @@
 from datetime import datetime, timezone, timedelta
 from uuid import uuid4
 
-from sqlalchemy import select, delete, update, func
+from sqlalchemy import case, select, delete, update, func, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domain.repositories.outbox_repository import OutboxRepository, OutboxJob
+from app.domain.repositories.outbox_repository import (
+    BATCH_LANE_JOB_TYPES,
+    OutboxRepository,
+    OutboxJob,
+    OutboxQueueStats,
+)
 from app.infrastructure.persistence.models.outbox_model import EnrichmentOutboxModel
 from app.infrastructure.enrichment.job_notify import notify_job_created
 
@@ -17,12 +22,15 @@ class SQLAlchemyOutboxRepository(OutboxRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def create(self, item_id: str, job_type: str = "enrichment") -> OutboxJob:
+    async def create(
+        self, item_id: str, job_type: str = "enrichment", upload_id: str | None = None
+    ) -> OutboxJob:
         """Create a new outbox job and trigger NOTIFY."""
         model = EnrichmentOutboxModel(
             id=str(uuid4()),
             item_id=item_id,
             job_type=job_type,
+            upload_id=upload_id,
             status="PENDING",
             attempt_count=0,
             run_at=datetime.now(timezone.utc),
@@ -50,16 +58,19 @@ class SQLAlchemyOutboxRepository(OutboxRepository):
         """
         now = datetime.now(timezone.utc)
         
-        # Find and lock the next runnable job
+        # Find and lock the next runnable job (cached statement: runs every poll)
         result = await self.session.execute(
-            select(EnrichmentOutboxModel)
-            .where(
-                EnrichmentOutboxModel.status == "PENDING",
-                EnrichmentOutboxModel.run_at <= now,
+            lambda_stmt(
+                lambda: select(EnrichmentOutboxModel)
+                .where(
+                    EnrichmentOutboxModel.status == "PENDING",
+                    EnrichmentOutboxModel.run_at <= now,
+                    EnrichmentOutboxModel.job_type.not_in(BATCH_LANE_JOB_TYPES),
+                )
+                .order_by(EnrichmentOutboxModel.created_at)
+                .limit(1)
+                .with_for_update(skip_locked=True)
             )
-            .order_by(EnrichmentOutboxModel.created_at)
-            .limit(1)
-            .with_for_update(skip_locked=True)
         )
         model = result.scalar_one_or_none()
         if model is None:
@@ -74,6 +85,42 @@ class SQLAlchemyOutboxRepository(OutboxRepository):
         await self.session.flush()
         return self._to_job(model)
 
+    async def claim_pending_batch(
+        self, worker_id: str, job_type: str, limit: int, lease_seconds: int = 300
+    ) -> list[OutboxJob]:
+        """Claim up to limit runnable jobs of one type, oldest first.
+        
+        Args:
+            worker_id: Identifier for the worker claiming the jobs.
+            job_type: Job type to claim.
+            limit: Maximum number of jobs.
+            lease_seconds: How long the leases are valid.
+            
+        Returns:
+            The claimed jobs (empty if none are runnable).
+        """
+        now = datetime.now(timezone.utc)
+        result = await self.session.execute(
+            select(EnrichmentOutboxModel)
+            .where(
+                EnrichmentOutboxModel.status == "PENDING",
+                EnrichmentOutboxModel.run_at <= now,
+                EnrichmentOutboxModel.job_type == job_type,
+            )
+            .order_by(EnrichmentOutboxModel.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        models = list(result.scalars().all())
+        for model in models:
+            model.status = "IN_PROGRESS"
+            model.claimed_at = now
+            model.locked_by = worker_id
+            model.lease_expires_at = now + timedelta(seconds=lease_seconds)
+            model.attempt_count += 1
+        await self.session.flush()
+        return [self._to_job(model) for model in models]
+
     async def mark_completed(self, job_id: str) -> None:
         """Mark job as completed and delete."""
         await self.session.execute(
@@ -167,6 +214,16 @@ class SQLAlchemyOutboxRepository(OutboxRepository):
         )
         await self.session.flush()
 
+    async def count_active(self, job_type: str) -> int:
+        """Count PENDING and IN_PROGRESS jobs of one type (backfill throttling)."""
+        result = await self.session.execute(
+            select(func.count(EnrichmentOutboxModel.id)).where(
+                EnrichmentOutboxModel.job_type == job_type,
+                EnrichmentOutboxModel.status.in_(("PENDING", "IN_PROGRESS")),
+            )
+        )
+        return result.scalar() or 0
+
     async def get_pending_count(self) -> int:
         """Get count of pending jobs (for metrics)."""
         result = await self.session.execute(
@@ -176,6 +233,35 @@ class SQLAlchemyOutboxRepository(OutboxRepository):
         )
         return result.scalar() or 0
 
+    async def get_queue_stats(self) -> OutboxQueueStats:
+        """Get job counts by status and the oldest runnable PENDING job.
+        
+        One grouped scan; the outbox stays small because completed
+        jobs are deleted.
+        """
+        now = datetime.now(timezone.utc)
+        runnable_run_at = case(
+            (
+                (EnrichmentOutboxModel.status == "PENDING")
+                & (EnrichmentOutboxModel.run_at <= now),
+                EnrichmentOutboxModel.run_at,
+            ),
+        )
+        result = await self.session.execute(
+            select(
+                EnrichmentOutboxModel.status,
+                func.count(EnrichmentOutboxModel.id),
+                func.min(runnable_run_at),
+            ).group_by(EnrichmentOutboxModel.status)
+        )
+        counts: dict[str, int] = {}
+        oldest = None
+        for status, count, min_run_at in result.all():
+            counts[status] = count
+            if min_run_at is not None:
+                oldest = min_run_at
+        return OutboxQueueStats(counts_by_status=counts, oldest_pending_run_at=oldest)
+
     def _to_job(self, model: EnrichmentOutboxModel) -> OutboxJob:
         """Convert ORM model to domain job."""
         return OutboxJob(
@@ -191,4 +277,5 @@ class SQLAlchemyOutboxRepository(OutboxRepository):
             last_error_code=model.last_error_code,
             last_error_message=model.last_error_message,
             created_at=model.created_at,
+            upload_id=model.upload_id,
         )
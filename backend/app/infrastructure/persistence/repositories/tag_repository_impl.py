@@ -2,10 +2,13 @@
 
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import select, func, or_, and_
+from sqlalchemy import select, func, or_, and_, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.domain.entities.tag import Tag
+from app.infrastructure.persistence.models.item_tag_model import ItemTagModel
+from app.infrastructure.persistence.models.tag_co_occurrence_model import TagCoOccurrenceModel
 from app.infrastructure.persistence.models.tag_model import TagModel
 
 
@@ -53,23 +56,29 @@ class SQLAlchemyTagRepository:
         model = result.scalar_one_or_none()
         return self._to_entity(model) if model else None
 
-    async def get_by_names(self, names: list[str], user_id: str) -> dict[str, Tag]:
+    async def get_by_names(
+        self, names: list[str], user_id: str, include_deleted: bool = False
+    ) -> dict[str, Tag]:
         """Get tags by names (case-insensitive), scoped to user.
         
         Returns a dict mapping lowercase name to Tag for efficient lookup.
-        Only returns active (non-deleted) tags.
+        Only returns active (non-deleted) tags unless include_deleted is
+        set (matching get_by_name).
         """
         if not names:
             return {}
         
         name_lowers = [name.lower().strip() for name in names]
-        result = await self.session.execute(
-            select(TagModel).where(
+        # Cached statement: the IN list is one expanding parameter
+        stmt = lambda_stmt(
+            lambda: select(TagModel).where(
                 TagModel.user_id == user_id,
                 TagModel.name_lower.in_(name_lowers),
-                TagModel.deleted_at.is_(None),  # Only active tags
             )
         )
+        if not include_deleted:
+            stmt += lambda s: s.where(TagModel.deleted_at.is_(None))  # Only active tags
+        result = await self.session.execute(stmt)
         models = result.scalars().all()
         return {model.name_lower: self._to_entity(model) for model in models}
 
@@ -111,6 +120,16 @@ class SQLAlchemyTagRepository:
         models = result.scalars().all()
         return [self._to_entity(m) for m in models]
 
+    async def list_active(self, user_id: str) -> list[Tag]:
+        """All active tags for user, unordered (tag suggestion vocabulary)."""
+        result = await self.session.execute(
+            select(TagModel).where(
+                TagModel.user_id == user_id,
+                TagModel.deleted_at.is_(None),
+            )
+        )
+        return [self._to_entity(m) for m in result.scalars().all()]
+
     async def count_by_user(self, user_id: str) -> int:
         """Count total active tags for user (excludes soft-deleted)."""
         result = await self.session.execute(
@@ -219,7 +238,6 @@ class SQLAlchemyTagRepository:
 
     async def recalculate_usage(self, tag_id: str) -> int:
         """Recalculate usage_count from item_tags associations."""
-        from app.infrastructure.persistence.models.item_tag_model import ItemTagModel
         result = await self.session.execute(
             select(func.count()).select_from(ItemTagModel).where(
                 ItemTagModel.tag_id == tag_id
@@ -238,6 +256,86 @@ class SQLAlchemyTagRepository:
         
         return count
 
+    async def get_related(
+        self, tag_id: str, user_id: str, limit: int
+    ) -> list[tuple[Tag, int]]:
+        """Active tags most often applied together with a tag.
+        
+        Reads the tag's row range of tag_co_occurrence (no item_tags scan).
+        
+        Returns:
+            (tag, items carrying both tags) pairs, most shared first.
+        """
+        result = await self.session.execute(
+            select(TagModel, TagCoOccurrenceModel.item_count)
+            .join(TagCoOccurrenceModel, TagCoOccurrenceModel.related_tag_id == TagModel.id)
+            .where(
+                TagCoOccurrenceModel.tag_id == tag_id,
+                TagModel.user_id == user_id,
+                TagModel.deleted_at.is_(None),
+            )
+            .order_by(TagCoOccurrenceModel.item_count.desc(), TagModel.name.asc())
+            .limit(limit)
+        )
+        return [(self._to_entity(model), count) for model, count in result.all()]
+
+    async def count_related_to_name(
+        self, query: str, user_id: str, limit: int
+    ) -> list[tuple[Tag, int]]:
+        """Facet counts for a tag-name search.
+        
+        Active tags whose name contains query (as in tag-only search) are
+        the anchors; every other active tag is counted by the items it
+        shares with them, from tag_co_occurrence. Exact for one anchor,
+        an upper bound when items carry several anchors.
+        """
+        anchor = aliased(TagModel)
+        anchors = select(anchor.id).where(
+            anchor.user_id == user_id,
+            anchor.name_lower.contains(query.lower()),
+            # Soft-deleted tags keep their co-occurrence rows
+            anchor.deleted_at.is_(None),
+        )
+        item_count = func.sum(TagCoOccurrenceModel.item_count).label("item_count")
+        result = await self.session.execute(
+            select(TagModel, item_count)
+            .join(TagCoOccurrenceModel, TagCoOccurrenceModel.related_tag_id == TagModel.id)
+            .where(
+                TagCoOccurrenceModel.tag_id.in_(anchors),
+                TagCoOccurrenceModel.related_tag_id.not_in(anchors),
+                TagModel.deleted_at.is_(None),
+            )
+            .group_by(TagModel.id)
+            .order_by(item_count.desc(), TagModel.name.asc())
+            .limit(limit)
+        )
+        return [(self._to_entity(model), count) for model, count in result.all()]
+
+    async def count_for_items(
+        self, item_ids: list[str], user_id: str, limit: int
+    ) -> list[tuple[Tag, int]]:
+        """Facet counts over a bounded set of items (ranked search candidates).
+        
+        Returns:
+            (tag, items among item_ids carrying it) pairs, most frequent first.
+        """
+        if not item_ids:
+            return []
+        item_count = func.count().label("item_count")
+        result = await self.session.execute(
+            select(TagModel, item_count)
+            .join(ItemTagModel, ItemTagModel.tag_id == TagModel.id)
+            .where(
+                ItemTagModel.item_id.in_(item_ids),
+                TagModel.user_id == user_id,
+                TagModel.deleted_at.is_(None),
+            )
+            .group_by(TagModel.id)
+            .order_by(item_count.desc(), TagModel.name.asc())
+            .limit(limit)
+        )
+        return [(self._to_entity(model), count) for model, count in result.all()]
+
     def _to_entity(self, model: TagModel) -> Tag:
         """Convert ORM model to domain entity."""
         return Tag(
@@ -1,11 +1,14 @@
 """SQLAlchemy Upload repository implementation."""
 
 from datetime import datetime, timezone
-from sqlalchemy import select, update
+from sqlalchemy import select, update, delete, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infrastructure.persistence.models.upload_model import UploadModel
 
+# Terminal statuses whose rows and objects the reaper may purge
+REAPABLE_STATUSES = ("EXPIRED", "FAILED", "DELETED")
+
 
 class SQLAlchemyUploadRepository:
     """SQLAlchemy implementation of Upload repository."""
@@ -28,6 +31,7 @@ class SQLAlchemyUploadRepository:
         checksum: str | None = None,
         idempotency_key: str | None = None,
         request_id: str | None = None,
+        dedup_source_id: str | None = None,
     ) -> UploadModel:
         """Create a new upload record."""
         model = UploadModel(
@@ -44,6 +48,7 @@ class SQLAlchemyUploadRepository:
             idempotency_key=idempotency_key,
             request_id=request_id,
             expires_at=expires_at,
+            dedup_source_id=dedup_source_id,
         )
         self.session.add(model)
         await self.session.flush()
@@ -60,6 +65,19 @@ class SQLAlchemyUploadRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_by_ids(self, upload_ids: list[str], user_id: str) -> dict[str, UploadModel]:
+        """Get several uploads in one query, scoped to user, keyed by ID."""
+        if not upload_ids:
+            return {}
+        result = await self.session.execute(
+            select(UploadModel).where(
+                UploadModel.id.in_(upload_ids),
+                UploadModel.user_id == user_id,
+                UploadModel.deleted_at.is_(None),
+            )
+        )
+        return {upload.id: upload for upload in result.scalars().all()}
+
     async def get_by_id_for_update(self, upload_id: str, user_id: str) -> UploadModel | None:
         """Get upload by ID with row lock for update (user-scoped)."""
         result = await self.session.execute(
@@ -86,6 +104,29 @@ class SQLAlchemyUploadRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_completed_by_checksum(
+        self, user_id: str, checksum: str, size_bytes: int
+    ) -> UploadModel | None:
+        """Get a completed upload with identical content (for dedup).
+        
+        Takes a share lock so the reaper cannot purge the row (and its
+        object) while a new upload is being linked to it.
+        """
+        result = await self.session.execute(
+            select(UploadModel)
+            .where(
+                UploadModel.user_id == user_id,
+                UploadModel.checksum == checksum,
+                UploadModel.size_bytes == size_bytes,
+                UploadModel.status == "COMPLETED",
+                UploadModel.deleted_at.is_(None),
+            )
+            .order_by(UploadModel.completed_at)
+            .limit(1)
+            .with_for_update(read=True)
+        )
+        return result.scalar_one_or_none()
+
     async def mark_completed(
         self, upload_id: str, etag: str | None = None
     ) -> UploadModel | None:
@@ -150,3 +191,114 @@ class SQLAlchemyUploadRepository:
             .limit(limit)
         )
         return list(result.scalars().all())
+
+    async def expire_initiated(self, before: datetime, limit: int = 500) -> int:
+        """Mark one batch of INITIATED uploads past expiry as EXPIRED (for reaper).
+        
+        Returns:
+            Number of uploads expired.
+        """
+        now = datetime.now(timezone.utc)
+        candidates = (
+            select(UploadModel.id)
+            .where(
+                UploadModel.status == "INITIATED",
+                UploadModel.expires_at < before,
+            )
+            .order_by(UploadModel.expires_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(
+            update(UploadModel)
+            .where(UploadModel.id.in_(candidates))
+            .values(status="EXPIRED", updated_at=now)
+        )
+        return result.rowcount
+
+    async def list_reapable(self, before: datetime, limit: int = 500) -> list[UploadModel]:
+        """List terminal uploads last updated before cutoff, locked for purge."""
+        result = await self.session.execute(
+            select(UploadModel)
+            .where(
+                UploadModel.status.in_(REAPABLE_STATUSES),
+                UploadModel.updated_at < before,
+            )
+            .order_by(UploadModel.updated_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list(result.scalars().all())
+
+    async def get_by_ids_for_update_system(self, upload_ids: list[str]) -> list[UploadModel]:
+        """Get uploads by IDs with row lock (no user scoping).
+        
+        For internal reaper use only - bypasses user security check.
+        """
+        if not upload_ids:
+            return []
+        result = await self.session.execute(
+            select(UploadModel)
+            .where(UploadModel.id.in_(upload_ids))
+            .with_for_update(skip_locked=True)
+        )
+        return list(result.scalars().all())
+
+    async def get_by_id_system(self, upload_id: str) -> UploadModel | None:
+        """Get upload by ID (no user scoping).
+        
+        For internal worker use only - bypasses user security check.
+        """
+        result = await self.session.execute(
+            select(UploadModel).where(
+                UploadModel.id == upload_id,
+                UploadModel.deleted_at.is_(None),
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def set_thumb_key(self, object_key: str, thumb_key: str) -> int:
+        """Record the thumbnail for every upload sharing an object.
+        
+        Deduplicated uploads share the original, so they share its
+        thumbnail as well.
+        
+        Returns:
+            Number of uploads updated.
+        """
+        result = await self.session.execute(
+            update(UploadModel)
+            .where(UploadModel.object_key == object_key)
+            .values(thumb_key=thumb_key)
+        )
+        await self.session.flush()
+        return result.rowcount  # type: ignore
+
+    async def count_object_references(
+        self, object_keys: list[str], exclude_ids: list[str]
+    ) -> dict[str, int]:
+        """Count upload rows referencing each object key, excluding given uploads.
+        
+        The reaper uses this to delete bytes only when no surviving upload
+        (including deduplicated ones) still points at the object.
+        """
+        if not object_keys:
+            return {}
+        stmt = (
+            select(UploadModel.object_key, func.count(UploadModel.id))
+            .where(UploadModel.object_key.in_(object_keys))
+            .group_by(UploadModel.object_key)
+        )
+        if exclude_ids:
+            stmt = stmt.where(UploadModel.id.notin_(exclude_ids))
+        result = await self.session.execute(stmt)
+        return {key: count for key, count in result.all()}
+
+    async def hard_delete_many(self, upload_ids: list[str]) -> int:
+        """Permanently delete upload rows (attachments must be removed first)."""
+        if not upload_ids:
+            return 0
+        result = await self.session.execute(
+            delete(UploadModel).where(UploadModel.id.in_(upload_ids))
+        )
+        return result.rowcount
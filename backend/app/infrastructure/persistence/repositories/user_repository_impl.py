@@ -3,7 +3,7 @@
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.user import User, UserPreferences
@@ -143,6 +143,17 @@ class SQLAlchemyUserRepository(UserRepository):
         )
         return await self.create(user)
 
+    async def bump_library_version(self, user_id: str) -> None:
+        """Increment library_version in place (row lock held until commit)."""
+        await self.session.execute(
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(
+                library_version=UserModel.library_version + 1,
+                updated_at=UserModel.updated_at,  # Not a profile change
+            )
+        )
+
     def _to_entity(self, model: UserModel) -> User:
         """Convert ORM model to domain entity."""
         return User(
@@ -157,4 +168,5 @@ class SQLAlchemyUserRepository(UserRepository):
             plan=UserPlan(model.plan),
             created_at=model.created_at,
             updated_at=model.updated_at,
+            library_version=model.library_version,
         )
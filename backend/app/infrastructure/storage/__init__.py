@@ -6,7 +6,10 @@ from app.infrastructure.storage.s3_client import (
     generate_presigned_put_url,
     generate_presigned_get_url,
     head_object,
+    download_object_to_file,
+    put_object,
     delete_object,
+    delete_objects,
 )
 
 __all__ = [
@@ -15,5 +18,8 @@ __all__ = [
     "generate_presigned_put_url",
     "generate_presigned_get_url",
     "head_object",
+    "download_object_to_file",
+    "put_object",
     "delete_object",
+    "delete_objects",
 ]
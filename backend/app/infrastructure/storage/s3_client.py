@@ -2,7 +2,7 @@
 
 import logging
 from functools import lru_cache
-from typing import Any
+from typing import Any, BinaryIO
 
 import boto3
 from botocore.config import Config
@@ -13,6 +13,9 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# S3 DeleteObjects accepts at most 1,000 keys per request
+DELETE_OBJECTS_MAX_KEYS = 1000
+
 
 @lru_cache()
 def get_s3_client():
@@ -223,6 +226,44 @@ def head_object(object_key: str) -> dict[str, Any] | None:
         raise
 
 
+def download_object_to_file(object_key: str, fileobj: BinaryIO) -> None:
+    """Stream an object into a file-like object in chunks.
+    
+    Uses a managed transfer so the object is never held in memory whole.
+    
+    Args:
+        object_key: S3 object key.
+        fileobj: Writable binary file-like object.
+    """
+    client = get_s3_client()
+    client.download_fileobj(
+        Bucket=settings.s3_bucket_name,
+        Key=object_key,
+        Fileobj=fileobj,
+    )
+
+
+def put_object(object_key: str, body: bytes, content_type: str) -> str | None:
+    """Store a small object (e.g. a derived thumbnail) from the backend.
+    
+    Args:
+        object_key: S3 object key.
+        body: Object bytes.
+        content_type: MIME type to store with the object.
+    
+    Returns:
+        ETag of the stored object.
+    """
+    client = get_s3_client()
+    response = client.put_object(
+        Bucket=settings.s3_bucket_name,
+        Key=object_key,
+        Body=body,
+        ContentType=content_type,
+    )
+    return response.get("ETag")
+
+
 def delete_object(object_key: str) -> bool:
     """Delete an object from storage.
     
@@ -244,3 +285,49 @@ def delete_object(object_key: str) -> bool:
     except ClientError as e:
         logger.error(f"Failed to delete object {object_key}: {e}")
         return False
+
+
+def delete_objects(object_keys: list[str]) -> list[str]:
+    """Delete many objects from storage using batched DeleteObjects calls.
+    
+    Keys are sent in chunks of DELETE_OBJECTS_MAX_KEYS (the S3 per-request
+    limit). Keys that no longer exist count as deleted.
+    
+    Args:
+        object_keys: S3 object keys to delete.
+    
+    Returns:
+        Keys that could not be deleted (empty list on full success).
+    """
+    if not object_keys:
+        return []
+    
+    client = get_s3_client()
+    failed: list[str] = []
+    
+    for start in range(0, len(object_keys), DELETE_OBJECTS_MAX_KEYS):
+        chunk = object_keys[start:start + DELETE_OBJECTS_MAX_KEYS]
+        try:
+            response = client.delete_objects(
+                Bucket=settings.s3_bucket_name,
+                Delete={
+                    "Objects": [{"Key": key} for key in chunk],
+                    "Quiet": True,  # Only report errors
+                },
+            )
+        except ClientError as e:
+            logger.error(f"Failed to delete {len(chunk)} objects: {e}")
+            failed.extend(chunk)
+            continue
+        
+        for error in response.get("Errors", []):
+            if error.get("Code") == "NoSuchKey":
+                continue
+            logger.error(
+                f"Failed to delete object {error.get('Key')}: "
+                f"{error.get('Code')} - {error.get('Message')}"
+            )
+            failed.append(error.get("Key"))
+    
+    logger.info(f"Deleted {len(object_keys) - len(failed)}/{len(object_keys)} objects")
+    return failed
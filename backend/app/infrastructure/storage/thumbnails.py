@@ -0,0 +1,136 @@
+"""Thumbnail derivatives for image attachments.
+
+Thumbnails are produced by the worker (job_type='thumbnail') after an
+image upload completes:
+1. Stream the original into a spooled temp file (disk above a threshold)
+2. Decode at reduced scale where the codec supports it (JPEG draft mode)
+3. Downscale to a fixed bounding box and encode as WebP/JPEG
+4. Store under a key derived from the original's object key
+
+Deriving the key from the object key means deduplicated uploads sharing
+an original also share its thumbnail.
+"""
+
+import io
+import logging
+import tempfile
+from typing import BinaryIO
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from app.config import settings
+from app.infrastructure.storage.s3_client import (
+    download_object_to_file,
+    head_object,
+    put_object,
+)
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_CONTENT_TYPES = {
+    "WEBP": "image/webp",
+    "JPEG": "image/jpeg",
+}
+
+
+class ThumbnailError(Exception):
+    """Original cannot be turned into a thumbnail (permanent, do not retry)."""
+    pass
+
+
+def thumbnail_key(object_key: str, image_format: str | None = None) -> str:
+    """Derive the thumbnail object key for an original object key."""
+    image_format = (image_format or settings.upload_thumbnail_format).upper()
+    extension = "jpg" if image_format == "JPEG" else image_format.lower()
+    return f"derived/thumb/{object_key}.{extension}"
+
+
+def render_thumbnail(
+    source: BinaryIO,
+    *,
+    max_px: int,
+    image_format: str = "WEBP",
+    quality: int = 80,
+    max_source_pixels: int = 50_000_000,
+) -> bytes:
+    """Render a thumbnail that fits within max_px x max_px.
+    
+    Args:
+        source: Seekable binary stream with the original image.
+        max_px: Longest edge of the output.
+        image_format: Output format, WEBP or JPEG.
+        quality: Encoder quality (1-100).
+        max_source_pixels: Refuse originals larger than this (decompression bombs).
+    
+    Returns:
+        Encoded thumbnail bytes.
+    
+    Raises:
+        ThumbnailError: If the original is not a decodable image or too large.
+    """
+    image_format = image_format.upper()
+    if image_format not in THUMBNAIL_CONTENT_TYPES:
+        raise ThumbnailError(f"Unsupported thumbnail format {image_format}")
+    
+    try:
+        # Image.open only reads the header; pixels are decoded lazily
+        with Image.open(source) as image:
+            width, height = image.size
+            if width * height > max_source_pixels:
+                raise ThumbnailError(
+                    f"Image {width}x{height} exceeds {max_source_pixels} pixel limit"
+                )
+            
+            # JPEG can decode directly at 1/2, 1/4 or 1/8 scale
+            image.draft("RGB", (max_px, max_px))
+            image = ImageOps.exif_transpose(image)
+            image.thumbnail((max_px, max_px), Image.Resampling.LANCZOS)
+            
+            if image_format == "JPEG" or image.mode not in ("RGB", "RGBA"):
+                has_alpha = image_format == "WEBP" and "A" in image.getbands()
+                image = image.convert("RGBA" if has_alpha else "RGB")
+            
+            output = io.BytesIO()
+            image.save(output, format=image_format, quality=quality)
+            return output.getvalue()
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+        raise ThumbnailError(f"Cannot decode image: {e}") from e
+
+
+def generate_thumbnail(object_key: str) -> str:
+    """Create (or reuse) the thumbnail for a stored original.
+    
+    Blocking: run via asyncio.to_thread from async code.
+    
+    Args:
+        object_key: Object key of the original image.
+    
+    Returns:
+        Object key of the stored thumbnail.
+    
+    Raises:
+        ThumbnailError: If the original cannot be thumbnailed.
+    """
+    image_format = settings.upload_thumbnail_format.upper()
+    key = thumbnail_key(object_key, image_format)
+    
+    # Already derived (retry, or a deduplicated upload of the same object)
+    if head_object(key):
+        return key
+    
+    with tempfile.SpooledTemporaryFile(
+        max_size=settings.upload_thumbnail_spool_bytes
+    ) as original:
+        download_object_to_file(object_key, original)
+        original.seek(0)
+        data = render_thumbnail(
+            original,
+            max_px=settings.upload_thumbnail_max_px,
+            image_format=image_format,
+            quality=settings.upload_thumbnail_quality,
+            max_source_pixels=settings.upload_thumbnail_max_source_pixels,
+        )
+    
+    put_object(key, data, THUMBNAIL_CONTENT_TYPES[image_format])
+    logger.info(f"Stored thumbnail {key} ({len(data)} bytes)")
+    return key
@@ -0,0 +1,191 @@
+"""Background reaper for expired uploads and orphaned storage objects.
+
+Each pass runs two phases, each in chunked transactions:
+1. Expire: INITIATED uploads past expires_at (+ grace) become EXPIRED
+2. Purge: terminal uploads (EXPIRED/FAILED/DELETED) and uploads of
+   soft-deleted attachments past the retention window have their objects
+   removed with batched DeleteObjects calls, then their rows hard-deleted.
+   Objects shared with surviving uploads (checksum dedup) are left in place.
+3. Reconcile: repair drifted items.attachment_count in keyset pages
+   (optional; the counter is normally kept exact transactionally).
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from app.config import settings
+from app.infrastructure.persistence.database import DatabaseRole, get_db_session_context
+from app.infrastructure.persistence.repositories.item_attachment_repository_impl import (
+    SQLAlchemyItemAttachmentRepository,
+)
+from app.infrastructure.persistence.repositories.upload_repository_impl import (
+    SQLAlchemyUploadRepository,
+)
+from app.infrastructure.storage.s3_client import delete_objects
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReapResult:
+    """Counts from one reaper pass."""
+
+    expired: int = 0
+    purged: int = 0
+    failed_objects: int = 0
+    reconciled: int = 0
+
+
+class UploadReaper:
+    """Periodically expires stale uploads and purges deleted ones."""
+
+    def __init__(self):
+        self.running = False
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Start the reaper loop (no-op when disabled)."""
+        if not settings.upload_reaper_enabled:
+            logger.info("Upload reaper disabled")
+            return
+        self.running = True
+        self._task = asyncio.create_task(self._loop())
+        logger.info(
+            f"Upload reaper started (interval={settings.upload_reaper_interval_secs}s, "
+            f"batch={settings.upload_reaper_batch_size}, "
+            f"retention={settings.upload_deleted_retention_days}d)"
+        )
+
+    async def stop(self) -> None:
+        """Stop the reaper loop."""
+        self.running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        logger.info("Upload reaper stopped")
+
+    async def _loop(self) -> None:
+        """Run a pass, then sleep for the configured interval."""
+        while self.running:
+            try:
+                await self.run_once()
+                await asyncio.sleep(settings.upload_reaper_interval_secs)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.exception(f"Error in upload reaper loop: {e}")
+                await asyncio.sleep(settings.upload_reaper_interval_secs)
+
+    async def run_once(self) -> ReapResult:
+        """Run one full reaper pass until no more work is found."""
+        now = datetime.now(timezone.utc)
+        batch_size = settings.upload_reaper_batch_size
+        result = ReapResult()
+
+        expire_before = now - timedelta(seconds=settings.upload_expired_grace_secs)
+        while True:
+            count = await self._expire_batch(expire_before, batch_size)
+            result.expired += count
+            if count < batch_size:
+                break
+
+        purge_before = now - timedelta(days=settings.upload_deleted_retention_days)
+        while True:
+            scanned, purged, failed = await self._purge_batch(purge_before, batch_size)
+            result.purged += purged
+            result.failed_objects += failed
+            # Stop when the scan is exhausted or only undeletable rows remain
+            if scanned < batch_size or purged == 0:
+                break
+
+        if settings.upload_reconcile_attachment_counts:
+            after_id = None
+            while True:
+                after_id, fixed = await self._reconcile_batch(after_id, batch_size)
+                result.reconciled += fixed
+                if after_id is None:
+                    break
+            if result.reconciled:
+                logger.warning(f"Repaired attachment_count on {result.reconciled} items")
+
+        if result.expired or result.purged or result.failed_objects:
+            logger.info(
+                f"Upload reaper pass: expired={result.expired}, "
+                f"purged={result.purged}, failed_objects={result.failed_objects}"
+            )
+        return result
+
+    async def _expire_batch(self, before: datetime, limit: int) -> int:
+        """Expire one chunk of stale INITIATED uploads."""
+        async with get_db_session_context(DatabaseRole.MAINTENANCE) as session:
+            upload_repo = SQLAlchemyUploadRepository(session)
+            return await upload_repo.expire_initiated(before, limit)
+
+    async def _reconcile_batch(
+        self, after_id: str | None, limit: int
+    ) -> tuple[str | None, int]:
+        """Reconcile attachment counts for one page of items."""
+        async with get_db_session_context(DatabaseRole.MAINTENANCE) as session:
+            attachment_repo = SQLAlchemyItemAttachmentRepository(session)
+            return await attachment_repo.reconcile_item_counts(after_id, limit)
+
+    async def _purge_batch(self, before: datetime, limit: int) -> tuple[int, int, int]:
+        """Purge one chunk of uploads whose retention window has passed.
+
+        Objects are deleted before rows so a failed commit only leaves
+        already-deleted rows behind, which the next pass retries. Objects
+        still referenced by other uploads (content dedup) are kept.
+
+        Returns:
+            Tuple of (rows scanned, uploads purged, objects that failed to delete).
+        """
+        async with get_db_session_context(DatabaseRole.MAINTENANCE) as session:
+            upload_repo = SQLAlchemyUploadRepository(session)
+            attachment_repo = SQLAlchemyItemAttachmentRepository(session)
+
+            uploads = await upload_repo.list_reapable(before, limit)
+            remaining = limit - len(uploads)
+            if remaining > 0:
+                # Uploads whose (1:1) attachment was soft-deleted are unreferenced
+                seen = {u.id for u in uploads}
+                attachments = await attachment_repo.list_deleted_before(before, remaining)
+                orphan_ids = [a.upload_id for a in attachments if a.upload_id not in seen]
+                uploads += await upload_repo.get_by_ids_for_update_system(orphan_ids)
+
+            if not uploads:
+                return 0, 0, 0
+
+            # Deduplicated uploads share objects: only delete bytes no
+            # surviving upload row still references
+            keys = list(dict.fromkeys(u.object_key for u in uploads))
+            referenced = await upload_repo.count_object_references(
+                keys, [u.id for u in uploads]
+            )
+            unreferenced = [k for k in keys if not referenced.get(k)]
+            # Derived thumbnails go with their original
+            unreferenced_set = set(unreferenced)
+            thumb_keys = {
+                u.thumb_key for u in uploads
+                if u.thumb_key and u.object_key in unreferenced_set
+            }
+
+            failed = set(
+                await asyncio.to_thread(delete_objects, unreferenced + sorted(thumb_keys))
+            )
+            purge_ids = [
+                u.id for u in uploads
+                if u.object_key not in failed and u.thumb_key not in failed
+            ]
+
+            await attachment_repo.hard_delete_by_upload_ids(purge_ids)
+            await upload_repo.hard_delete_many(purge_ids)
+            return len(uploads), len(purge_ids), len(failed)
+
+
+# Global reaper instance
+upload_reaper = UploadReaper()
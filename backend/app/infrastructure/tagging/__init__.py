@@ -0,0 +1 @@
+"""Local tag suggestions from each user's existing tag vocabulary."""
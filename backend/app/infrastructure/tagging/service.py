@@ -0,0 +1,59 @@
+"""Cached per-user tag vocabularies."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.infrastructure.lru_cache import VersionedLRUCache
+from app.infrastructure.persistence.repositories.item_tag_repository_impl import (
+    SQLAlchemyItemTagRepository,
+)
+from app.infrastructure.persistence.repositories.tag_repository_impl import (
+    SQLAlchemyTagRepository,
+)
+from app.infrastructure.persistence.repositories.user_repository_impl import (
+    SQLAlchemyUserRepository,
+)
+from app.infrastructure.tagging.vocabulary import RAW_TEXT_CHARS, TagVocabulary, item_text
+
+# Keyed by (user_id, library_version). Confirming, editing or discarding
+# archived items and renaming or deleting tags bump the version, so stale
+# vocabularies are never returned. A tag created without being used
+# appears with the next library change.
+tag_vocabulary_cache = VersionedLRUCache[TagVocabulary](
+    settings.tag_vocabulary_cache_size, name="tag_vocabulary"
+)
+
+
+async def load_tag_vocabulary(session: AsyncSession, user_id: str) -> TagVocabulary:
+    """Build a user's vocabulary (two queries)."""
+    tags = await SQLAlchemyTagRepository(session).list_active(user_id)
+    if not tags:
+        return TagVocabulary([], [])
+    rows = await SQLAlchemyItemTagRepository(session).get_recent_tagged_items(
+        user_id, settings.tag_vocabulary_sample_items, RAW_TEXT_CHARS
+    )
+    tagged_items = [
+        (item_text(title, summary, raw_text), tag_ids)
+        for title, summary, raw_text, tag_ids in rows
+    ]
+    return TagVocabulary(tags, tagged_items)
+
+
+async def get_tag_vocabulary(
+    session: AsyncSession, user_id: str, library_version: int | None = None
+) -> TagVocabulary:
+    """A user's vocabulary from the cache, or built on this session.
+
+    Pass library_version when the caller already has the user loaded;
+    otherwise it is looked up.
+    """
+    if library_version is None:
+        user = await SQLAlchemyUserRepository(session).get_by_id(user_id)
+        if user is None:
+            return TagVocabulary([], [])
+        library_version = user.library_version
+    vocabulary = tag_vocabulary_cache.get((user_id, library_version))
+    if vocabulary is None:
+        vocabulary = await load_tag_vocabulary(session, user_id)
+        tag_vocabulary_cache.put((user_id, library_version), vocabulary)
+    return vocabulary
@@ -0,0 +1,206 @@
+"""Per-user tag vocabulary: term index, usage and co-occurrence of tags.
+
+Built from a user's active tags and a sample of their archived items,
+it ranks existing tags for new text and maps free-form tag names (from
+the LLM) onto tags the user already has. Pure Python, no I/O.
+"""
+
+import math
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from difflib import get_close_matches
+
+from app.domain.entities.tag import Tag
+
+RAW_TEXT_CHARS = 500  # Raw text indexed for items without a summary
+
+NAME_MATCH_CONFIDENCE = 0.9  # Every word of the tag name appears in the text
+EVIDENCE_PRIOR = 2  # Tagged items before a tag's term profile is fully trusted
+SEED_CONFIDENCE = 0.5  # Tags at least this likely pull in their co-occurring tags
+CO_OCCURRENCE_WEIGHT = 0.5
+FUZZY_CUTOFF = 0.85  # difflib ratio for near-duplicate tag names
+MIN_FUZZY_KEY_LENGTH = 5  # Shorter names only match exactly ("ai" is not "api")
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+STOPWORDS = frozenset(
+    "a about after all also an and any are as at be been but by can could did do does "
+    "for from had has have how if in into is it its just me more my no not of on one "
+    "or our out so some than that the their them then there these they this to up us "
+    "was we were what when where which who why will with would you your".split()
+)
+
+
+def _stem(word: str) -> str:
+    """Drop a plural 's' ("meetings" -> "meeting", but not "class")."""
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def terms(text: str) -> set[str]:
+    """Distinct lowercased, stemmed words of text (no stopwords or numbers)."""
+    return {
+        _stem(word)
+        for word in _WORD_RE.findall(text.lower())
+        if len(word) > 1 and not word.isdigit() and word not in STOPWORDS
+    }
+
+
+def tag_key(name: str) -> str:
+    """Spelling-insensitive key: "Machine-Learning" and "machine learnings" share one."""
+    return "".join(_stem(word) for word in _WORD_RE.findall(name.lower()))
+
+
+def item_text(title: str | None, summary: str | None, raw_text: str = "") -> str:
+    """Text indexed for an item: title and summary, else the start of the raw text."""
+    return "\n".join(filter(None, (title, summary or raw_text[:RAW_TEXT_CHARS])))
+
+
+def _name_match(name_terms: set[str], text_terms: set[str]) -> float:
+    """How strongly text naming these words signals the tag."""
+    if not name_terms:
+        return 0.0
+    matched = len(name_terms & text_terms) / len(name_terms)
+    return NAME_MATCH_CONFIDENCE * (matched if matched == 1 else matched / 2)
+
+
+def _either(p: float, q: float) -> float:
+    """Probability that at least one of two independent signals holds."""
+    return 1 - (1 - p) * (1 - q)
+
+
+@dataclass(frozen=True)
+class TagScore:
+    """An existing tag and how likely it applies to some text (0..1)."""
+
+    tag: Tag
+    confidence: float
+
+
+class TagVocabulary:
+    """Index of one user's tags over the items they were applied to."""
+
+    def __init__(self, tags: list[Tag], tagged_items: list[tuple[str, list[str]]]):
+        """
+        Args:
+            tags: The user's active tags
+            tagged_items: (text, tag ids) of sampled archived items,
+                including untagged ones (they weight common words down)
+        """
+        self.tags = {tag.id: tag for tag in tags}
+        self._by_name = {tag.name_lower: tag for tag in tags}
+        # Most used tag wins when names collide on a key
+        self._by_key = {
+            tag_key(tag.name): tag for tag in sorted(tags, key=lambda t: t.usage_count)
+        }
+        self._name_terms = {tag.id: terms(tag.name) for tag in tags}
+
+        self.item_count = len(tagged_items)
+        self._tag_items: Counter[str] = Counter()
+        self._document_frequency: Counter[str] = Counter()
+        self._postings: dict[str, Counter[str]] = defaultdict(Counter)  # term -> tag -> items
+        self._co_occurrence: dict[str, Counter[str]] = defaultdict(Counter)
+        for text, tag_ids in tagged_items:
+            tag_ids = [tag_id for tag_id in dict.fromkeys(tag_ids) if tag_id in self.tags]
+            item_terms = terms(text)
+            self._document_frequency.update(item_terms)
+            self._tag_items.update(tag_ids)
+            for tag_id in tag_ids:
+                for term in item_terms:
+                    self._postings[term][tag_id] += 1
+                for other in tag_ids:
+                    if other != tag_id:
+                        self._co_occurrence[tag_id][other] += 1
+
+    def get(self, name: str) -> Tag | None:
+        """Tag with exactly this name (case-insensitive)."""
+        return self._by_name.get(name.strip().lower())
+
+    def closest(self, name: str) -> Tag | None:
+        """The existing tag a free-form name most likely means, if any.
+
+        Exact name first, then the same key (case, separators and
+        plurals ignored), then a near-identical key.
+        """
+        tag = self.get(name)
+        if tag is not None:
+            return tag
+        key = tag_key(name)
+        tag = self._by_key.get(key)
+        if tag is not None or len(key) < MIN_FUZZY_KEY_LENGTH:
+            return tag
+        candidates = [k for k in self._by_key if len(k) >= MIN_FUZZY_KEY_LENGTH]
+        match = get_close_matches(key, candidates, n=1, cutoff=FUZZY_CUTOFF)
+        return self._by_key[match[0]] if match else None
+
+    @staticmethod
+    def name_confidence(name: str, text: str) -> float:
+        """Confidence for a tag the user does not have yet: its name in the text."""
+        return round(_name_match(terms(name), terms(text)), 3)
+
+    def rank(self, text: str, tag_ids: list[str] | tuple[str, ...] = ()) -> list[TagScore]:
+        """All tags but tag_ids, most likely first.
+
+        Confidence combines three signals: the tag's name appearing in
+        the text; the share of indexed items with the text's words that
+        carry the tag (IDF-weighted, damped for rarely used tags); and
+        co-occurrence with tag_ids (the item's current tags) and with
+        already likely tags.
+        """
+        text_terms = terms(text)
+        weights = {
+            term: self._idf(term) for term in text_terms if term in self._document_frequency
+        }
+        total_weight = sum(weights.values())
+        content: Counter[str] = Counter()
+        for term, weight in weights.items():
+            items = self._document_frequency[term]
+            for tag_id, count in self._postings.get(term, {}).items():
+                content[tag_id] += weight * count / items
+
+        confidence = {}
+        for tag_id in self.tags:
+            tagged = self._tag_items[tag_id]
+            content_confidence = (
+                content[tag_id] / total_weight * tagged / (tagged + EVIDENCE_PRIOR)
+                if total_weight
+                else 0.0
+            )
+            confidence[tag_id] = _either(
+                _name_match(self._name_terms[tag_id], text_terms), content_confidence
+            )
+
+        seeds = {tag_id: value for tag_id, value in confidence.items() if value >= SEED_CONFIDENCE}
+        seeds.update({tag_id: 1.0 for tag_id in tag_ids if tag_id in self.tags})
+        for seed, seed_confidence in seeds.items():
+            tagged = self._tag_items[seed]
+            for other, count in self._co_occurrence[seed].items():
+                confidence[other] = _either(
+                    confidence[other], CO_OCCURRENCE_WEIGHT * seed_confidence * count / tagged
+                )
+
+        excluded = set(tag_ids)
+        scores = [
+            TagScore(self.tags[tag_id], round(value, 3))
+            for tag_id, value in confidence.items()
+            if tag_id not in excluded
+        ]
+        scores.sort(key=lambda s: (-s.confidence, -s.tag.usage_count, s.tag.name_lower))
+        return scores
+
+    def suggest(
+        self,
+        text: str,
+        tag_ids: list[str] | tuple[str, ...] = (),
+        limit: int = 5,
+        min_confidence: float = 0.3,
+    ) -> list[TagScore]:
+        """Up to limit likely tags for the text, excluding tag_ids."""
+        return [
+            score for score in self.rank(text, tag_ids) if score.confidence >= min_confidence
+        ][:limit]
+
+    def _idf(self, term: str) -> float:
+        return math.log((self.item_count + 1) / (self._document_frequency[term] + 1))
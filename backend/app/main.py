@@ -6,7 +6,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
-from app.api.middleware import RequestIdMiddleware
+from app.api.middleware import QueryProfileMiddleware, RequestIdMiddleware
 from app.api.error_handlers import register_error_handlers
 from app.api.v1.health import router as health_router
 from app.api.v1.items import router as items_router
@@ -19,19 +19,30 @@ from app.api.v1.uploads import (
     attachments_router,
     items_attachments_router,
 )
-from app.infrastructure.enrichment.worker import worker
+from app.infrastructure.enrichment.outbox_metrics import outbox_metrics_sampler
 from app.infrastructure.enrichment.prompt_loader import PromptLoader
+from app.infrastructure.storage.upload_reaper import upload_reaper
+from app.infrastructure.persistence.database import dispose_engines
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
+    # Imported on startup, not with the app: the worker stack (LLM client,
+    # image libraries) stays out of imports by tests, tooling and alembic
+    from app.infrastructure.enrichment.worker import worker
+
     # Startup
     PromptLoader.load()  # Load and cache system prompts
     await worker.start()
+    await upload_reaper.start()
+    await outbox_metrics_sampler.start()
     yield
     # Shutdown
+    await outbox_metrics_sampler.stop()
+    await upload_reaper.stop()
     await worker.stop()
+    await dispose_engines()
 
 
 def create_app() -> FastAPI:
@@ -51,7 +62,8 @@ def create_app() -> FastAPI:
         allow_methods=["GET", "POST", "PATCH", "DELETE", "OPTIONS"],
         allow_headers=["*"],
     )
-    app.add_middleware(RequestIdMiddleware)
+    app.add_middleware(QueryProfileMiddleware)
+    app.add_middleware(RequestIdMiddleware)  # Outermost: times the whole request
 
     # Register error handlers
     register_error_handlers(app)
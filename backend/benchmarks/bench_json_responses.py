@@ -0,0 +1,141 @@
+"""Benchmark list-endpoint JSON serialization.
+
+Compares, per rendered page, FastAPI's default path (validated models,
+response_model re-validation, jsonable_encoder + json.dumps) with the
+path the list endpoints use (model_construct + ORJSONResponse).
+
+Usage:
+    uv run python -m benchmarks.bench_json_responses
+    uv run python -m benchmarks.bench_json_responses --items 100 --iterations 500
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+
+from app.api.responses import ORJSONResponse
+from app.api.schemas.items import TagInItem
+from app.api.schemas.library import LibraryItemResponse, LibraryResponse, PaginationInfo
+from app.api.schemas.search import SearchPaginationInfo, SearchResponse, SearchResultItem
+
+
+def _rows(count: int) -> list[dict]:
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "id": str(uuid4()),
+            "title": f"Item {i}",
+            "summary": "A short summary of the captured note. " * 4,
+            "raw_text": "Captured text " * 35,
+            "tags": [("python", "blue"), ("performance", "green"), ("notes", "gray")],
+            "confirmed_at": now - timedelta(minutes=i),
+            "created_at": now - timedelta(minutes=i, seconds=30),
+        }
+        for i in range(count)
+    ]
+
+
+def _library(rows: list[dict], construct: bool) -> LibraryResponse:
+    build = LibraryItemResponse.model_construct if construct else LibraryItemResponse
+    tag = TagInItem.model_construct if construct else TagInItem
+    items = [
+        build(
+            id=r["id"],
+            rawText=r["raw_text"],
+            rawTextTruncated=False,
+            title=r["title"],
+            summary=r["summary"],
+            tags=[tag(id=str(i), name=n, color=c) for i, (n, c) in enumerate(r["tags"])],
+            status="ARCHIVED",
+            sourceType="text",
+            confirmedAt=r["confirmed_at"],
+            createdAt=r["created_at"],
+            attachmentCount=0,
+        )
+        for r in rows
+    ]
+    if construct:
+        return LibraryResponse.model_construct(
+            items=items, pagination=PaginationInfo.model_construct(cursor="c", hasMore=True)
+        )
+    return LibraryResponse(items=items, pagination=PaginationInfo(cursor="c", hasMore=True))
+
+
+def _search(rows: list[dict], construct: bool) -> SearchResponse:
+    build = SearchResultItem.model_construct if construct else SearchResultItem
+    tag = TagInItem.model_construct if construct else TagInItem
+    items = [
+        build(
+            id=r["id"],
+            title=r["title"],
+            summary=r["summary"],
+            tags=[tag(id=str(i), name=n, color=c) for i, (n, c) in enumerate(r["tags"])],
+            sourceType="text",
+            confirmedAt=r["confirmed_at"],
+            createdAt=r["created_at"],
+            attachmentCount=0,
+        )
+        for r in rows
+    ]
+    if construct:
+        return SearchResponse.model_construct(
+            items=items,
+            mode="combined",
+            pagination=SearchPaginationInfo.model_construct(cursor=None, hasMore=False),
+            total=len(items),
+        )
+    return SearchResponse(
+        items=items,
+        mode="combined",
+        pagination=SearchPaginationInfo(cursor=None, hasMore=False),
+        total=len(items),
+    )
+
+
+def _default_path(build, model_cls, rows: list[dict]) -> bytes:
+    # What FastAPI does for a returned model: validate against response_model,
+    # then jsonable_encoder + json.dumps in JSONResponse.render()
+    model = model_cls.model_validate(build(rows, construct=False).model_dump())
+    return json.dumps(
+        jsonable_encoder(model), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _fast_path(build, rows: list[dict]) -> bytes:
+    return ORJSONResponse(build(rows, construct=True)).body
+
+
+def _time_per_call(fn, iterations: int) -> float:
+    start = time.process_time()
+    for _ in range(iterations):
+        fn()
+    return (time.process_time() - start) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=300)
+    args = parser.parse_args()
+
+    rows = _rows(args.items)
+    print(f"{'page':<10}{'default us':>12}{'orjson us':>11}{'speedup':>9}{'bytes':>9}")
+    for name, build, model_cls in (
+        ("library", _library, LibraryResponse),
+        ("search", _search, SearchResponse),
+    ):
+        default = _time_per_call(
+            lambda build=build, model_cls=model_cls: _default_path(build, model_cls, rows),
+            args.iterations,
+        )
+        fast = _time_per_call(lambda build=build: _fast_path(build, rows), args.iterations)
+        size = len(_fast_path(build, rows))
+        print(f"{name:<10}{default:>12.1f}{fast:>11.1f}{default / fast:>8.1f}x{size:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Benchmark the request ID middleware: BaseHTTPMiddleware vs pure ASGI.
+
+Drives the real application in-process through its ASGI interface (no
+server or socket), once with the previous BaseHTTPMiddleware version of
+RequestIdMiddleware and once with the current pure-ASGI one. Measures
+per-request latency (sequential) and throughput (--concurrency requests
+in flight) for /health and an authenticated GET /api/v1/tags. Auth and
+the tag repository are overridden with in-memory fakes so no database
+is needed; the dependency-injection and serialization path is real.
+
+Usage:
+    uv run python -m benchmarks.bench_middleware
+    uv run python -m benchmarks.bench_middleware --requests 5000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.api.dependencies import get_current_user_for_read, get_read_tag_repository
+from app.api.middleware import RequestIdMiddleware, request_id_var
+from app.domain.entities.tag import Tag
+from app.domain.entities.user import User
+from app.domain.value_objects import UserPlan
+from app.main import create_app
+
+
+class LegacyRequestIdMiddleware(BaseHTTPMiddleware):
+    """The BaseHTTPMiddleware implementation this replaced."""
+
+    async def dispatch(self, request, call_next):
+        request_id = request.headers.get("X-Request-Id") or f"req-{uuid4()}"
+        request_id_var.set(request_id)
+        request.state.request_id = request_id
+        response = await call_next(request)
+        response.headers["X-Request-Id"] = request_id
+        return response
+
+
+class _FakeTagRepo:
+    def __init__(self, user_id: str):
+        now = datetime.now(timezone.utc)
+        self._tags = [
+            Tag(id=str(uuid4()), user_id=user_id, name=f"tag-{i}", name_lower=f"tag-{i}",
+                usage_count=i, last_used=now, created_at=now)
+            for i in range(20)
+        ]
+
+    async def list_by_user(self, **kwargs):
+        return self._tags
+
+    async def count_by_user(self, user_id: str) -> int:
+        return len(self._tags)
+
+
+def _build_app(middleware_cls):
+    app = create_app()
+    for i, middleware in enumerate(app.user_middleware):
+        if middleware.cls is RequestIdMiddleware:
+            app.user_middleware[i] = type(middleware)(middleware_cls)
+    now = datetime.now(timezone.utc)
+    user = User(id=str(uuid4()), clerk_user_id=None, plan=UserPlan.FREE,
+                created_at=now, updated_at=now)
+    tag_repo = _FakeTagRepo(user.id)
+    app.dependency_overrides[get_current_user_for_read] = lambda: user
+    app.dependency_overrides[get_read_tag_repository] = lambda: tag_repo
+    return app
+
+
+def _scope(path: str) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench"), (b"authorization", b"Bearer bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+
+async def _request(app, path: str) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200, message
+
+    start = time.perf_counter()
+    await app(_scope(path), receive, send)
+    return time.perf_counter() - start
+
+
+async def _bench(app, path: str, requests: int, concurrency: int) -> tuple[float, float, float]:
+    for _ in range(50):  # warm up
+        await _request(app, path)
+    latencies = [await _request(app, path) for _ in range(requests)]
+
+    async def client(n: int) -> None:
+        for _ in range(n):
+            await _request(app, path)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(requests // concurrency) for _ in range(concurrency)))
+    throughput = (requests // concurrency) * concurrency / (time.perf_counter() - start)
+
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1e6
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1e6
+    return p50, p99, throughput
+
+
+async def run(requests: int, concurrency: int) -> None:
+    apps = {
+        "BaseHTTP": _build_app(LegacyRequestIdMiddleware),
+        "pure ASGI": _build_app(RequestIdMiddleware),
+    }
+    print(f"{'endpoint':<16}{'middleware':<12}{'p50 us':>9}{'p99 us':>9}{'req/s':>10}")
+    for path in ("/health", "/api/v1/tags"):
+        for name, app in apps.items():
+            p50, p99, rps = await _bench(app, path, requests, concurrency)
+            print(f"{path:<16}{name:<12}{p50:>9.1f}{p99:>9.1f}{rps:>10.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Benchmark semantic search: query embedding, rank fusion, vector lookup.
+
+Python side (no database needed): per-call cost of the stub query
+embedding and of reciprocal rank fusion over two candidate lists.
+
+Postgres side (--db): seeds one throwaway user with --items ARCHIVED
+items and stub embeddings (plus --noise-items spread over other users,
+so the HNSW scan has to filter), then times
+SQLAlchemyItemEmbeddingRepository.nearest() for random queries and
+prints the plan of one HNSW lookup. Users with at most
+SEMANTIC_SEARCH_EXACT_MAX_ITEMS items are searched exactly instead; pass
+a smaller --items to time that path. The target is single-digit
+milliseconds p95 at 100k items per user. Needs migrations 019 and 021
+(pgvector and the HNSW search defaults); the seeded users are deleted
+afterwards.
+
+Usage:
+    uv run python -m benchmarks.bench_semantic_search
+    uv run python -m benchmarks.bench_semantic_search --db --items 100000
+    uv run python -m benchmarks.bench_semantic_search --db --items 20000 --noise-items 200000
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from sqlalchemy import delete, insert, text
+
+from app.api.v1.search import reciprocal_rank_fusion
+from app.config import settings
+from app.infrastructure.embeddings.stub_provider import hash_embedding
+from app.infrastructure.persistence.database import (
+    DatabaseRole,
+    dispose_engines,
+    get_db_session_context,
+    get_read_session_context,
+)
+from app.infrastructure.persistence.models import ItemEmbeddingModel, ItemModel, UserModel
+from app.infrastructure.persistence.models.item_embedding_model import format_vector
+from app.infrastructure.persistence.repositories.item_embedding_repository_impl import (
+    SQLAlchemyItemEmbeddingRepository,
+)
+from benchmarks.seed_loadtest import BATCH_ROWS, TAG_NAMES, WORDS
+
+USER_ID_PREFIX = "bench-semantic-"
+NOISE_USERS = 100
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choices(WORDS + TAG_NAMES, k=words)).capitalize()
+
+
+def _time_per_call(fn, iterations: int) -> float:
+    start = time.process_time()
+    for _ in range(iterations):
+        fn()
+    return (time.process_time() - start) / iterations * 1e6
+
+
+def bench_python(iterations: int) -> None:
+    """Stub query embedding and rank fusion CPU per call."""
+    rng = random.Random(1)
+    queries = [_sentence(rng, 3) for _ in range(100)]
+    vector_ids = [str(uuid4()) for _ in range(settings.semantic_search_candidates)]
+    lexical_ids = vector_ids[::3] + [str(uuid4()) for _ in range(len(vector_ids) // 2)]
+    embed = _time_per_call(lambda: hash_embedding(rng.choice(queries)), iterations)
+    fuse = _time_per_call(lambda: reciprocal_rank_fusion([vector_ids, lexical_ids]), iterations)
+    print(f"{'stub query embedding':<24}{embed:>10.1f} us")
+    print(f"{'rank fusion (2 lists)':<24}{fuse:>10.1f} us")
+
+
+async def _seed(user_id: str, items: int, rng: random.Random) -> None:
+    """ARCHIVED items with title+summary stub embeddings, in batched INSERTs."""
+    now = datetime.now(timezone.utc)
+    async with get_db_session_context(DatabaseRole.MAINTENANCE) as session:
+        await session.execute(insert(UserModel).values(
+            id=user_id, email=f"{user_id}@bench.local", name=user_id
+        ))
+    for start in range(0, items, BATCH_ROWS):
+        item_rows, embedding_rows = [], []
+        for _ in range(min(BATCH_ROWS, items - start)):
+            item_id = str(uuid4())
+            title, summary = _sentence(rng, 6), _sentence(rng, 20)
+            item_rows.append({
+                "id": item_id, "user_id": user_id, "raw_text": summary, "title": title,
+                "summary": summary, "status": "ARCHIVED", "tags": [], "confirmed_at": now,
+            })
+            embedding_rows.append({
+                "item_id": item_id, "user_id": user_id, "model": "bench",
+                "content_hash": "", "embedding": hash_embedding(f"{title}\n\n{summary}"),
+            })
+        async with get_db_session_context(DatabaseRole.MAINTENANCE) as session:
+            await session.execute(insert(ItemModel), item_rows)
+            await session.execute(insert(ItemEmbeddingModel), embedding_rows)
+
+
+async def bench_db(items: int, noise_items: int, iterations: int) -> None:
+    """Time per-user nearest-neighbour lookups on a seeded index."""
+    rng = random.Random(7)
+    user_id = f"{USER_ID_PREFIX}{uuid4().hex[:8]}"
+    noise_ids = [f"{user_id}-noise-{i}" for i in range(NOISE_USERS if noise_items else 0)]
+    try:
+        started = time.perf_counter()
+        await _seed(user_id, items, rng)
+        for noise_id in noise_ids:
+            await _seed(noise_id, noise_items // NOISE_USERS, rng)
+        async with get_db_session_context(DatabaseRole.MAINTENANCE) as session:
+            await session.execute(text("ANALYZE item_embeddings"))
+        elapsed = time.perf_counter() - started
+        print(f"seeded {items} + {noise_items} noise items in {elapsed:.0f}s")
+
+        queries = [hash_embedding(_sentence(rng, 3)) for _ in range(iterations)]
+        nearest_args = {
+            "limit": settings.semantic_search_candidates,
+            "max_distance": 2.0,
+            "exact_max_items": settings.semantic_search_exact_max_items,
+        }
+        exact = items <= settings.semantic_search_exact_max_items
+        timings = []
+        # Autocommit read session, as in GET /search
+        async with get_read_session_context() as session:
+            repo = SQLAlchemyItemEmbeddingRepository(session)
+            for vector in queries[:10]:  # warm up the connection and index pages
+                await repo.nearest(user_id, vector, **nearest_args)
+            for vector in queries:
+                start = time.perf_counter()
+                found = await repo.nearest(user_id, vector, **nearest_args)
+                timings.append((time.perf_counter() - start) * 1000)
+            # The HNSW branch (users above SEMANTIC_SEARCH_EXACT_MAX_ITEMS)
+            plan = await session.execute(
+                text(
+                    "EXPLAIN SELECT item_id FROM item_embeddings WHERE user_id = :user_id "
+                    "ORDER BY embedding <=> CAST(:vector AS vector) LIMIT :limit"
+                ),
+                {
+                    "user_id": user_id,
+                    "vector": format_vector(queries[0]),
+                    "limit": settings.semantic_search_candidates,
+                },
+            )
+        quantiles = statistics.quantiles(timings, n=100)
+        print(
+            f"nearest({settings.semantic_search_candidates}) over {items} items: "
+            f"p50 {quantiles[49]:.2f} ms, p95 {quantiles[94]:.2f} ms, "
+            f"p99 {quantiles[98]:.2f} ms ({len(found)} rows last call, "
+            f"{'exact' if exact else 'HNSW'} search)"
+        )
+        print("HNSW plan:\n  " + "\n  ".join(row[0] for row in plan))
+    finally:
+        async with get_db_session_context(DatabaseRole.MAINTENANCE) as session:
+            await session.execute(
+                delete(UserModel).where(UserModel.id.in_([user_id, *noise_ids]))
+            )
+        await dispose_engines()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--db", action="store_true", help="Also benchmark against DATABASE_URL")
+    parser.add_argument("--items", type=int, default=100_000, help="Items of the searched user")
+    parser.add_argument("--noise-items", type=int, default=0, help="Items of other users")
+    args = parser.parse_args()
+
+    bench_python(args.iterations)
+    if args.db:
+        print()
+        asyncio.run(bench_db(args.items, args.noise_items, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
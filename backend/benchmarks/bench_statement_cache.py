@@ -0,0 +1,124 @@
+"""Benchmark statement caching for the hot repository queries.
+
+Python side (no database needed): per-call CPU to build a statement and
+derive its compiled-cache key, plain select() vs lambda_stmt(), plus the
+full compile cost paid on a cache miss.
+
+Postgres side (--db): executes get-item-by-id against DATABASE_URL with
+asyncpg prepared-statement caching off and on, reporting client CPU and
+wall time per call. Wall minus client CPU approximates the server and
+network share, which drops when the server reuses the prepared plan.
+
+Usage:
+    uv run python -m benchmarks.bench_statement_cache
+    uv run python -m benchmarks.bench_statement_cache --db --iterations 2000
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config import settings
+from app.infrastructure.persistence.models.item_model import ItemModel
+from app.infrastructure.persistence.models.outbox_model import EnrichmentOutboxModel
+from app.infrastructure.persistence.models.tag_model import TagModel
+
+
+def _plain_queries():
+    now = datetime.now(timezone.utc)
+    user_id, item_id = str(uuid4()), str(uuid4())
+    return {
+        "claim_job": lambda: (
+            select(EnrichmentOutboxModel)
+            .where(EnrichmentOutboxModel.status == "PENDING", EnrichmentOutboxModel.run_at <= now)
+            .order_by(EnrichmentOutboxModel.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        ),
+        "item_by_id": lambda: select(ItemModel).where(
+            ItemModel.id == item_id, ItemModel.user_id == user_id
+        ),
+        "tags_by_names": lambda: select(TagModel).where(
+            TagModel.user_id == user_id,
+            TagModel.name_lower.in_(["python", "rust", "go"]),
+            TagModel.deleted_at.is_(None),
+        ),
+    }
+
+
+def _time_per_call(fn, iterations: int) -> float:
+    start = time.process_time()
+    for _ in range(iterations):
+        fn()
+    return (time.process_time() - start) / iterations * 1e6
+
+
+def bench_python(iterations: int) -> None:
+    """Compare statement construction + cache-key cost, plain vs lambda."""
+    dialect = asyncpg_dialect()
+    print(f"{'query':<16}{'plain us':>10}{'lambda us':>11}{'compile us':>12}")
+    for name, build in _plain_queries().items():
+        plain = _time_per_call(lambda build=build: build()._generate_cache_key(), iterations)
+        cached = _time_per_call(
+            lambda build=build: lambda_stmt(build)._generate_cache_key(), iterations
+        )
+        compiled = _time_per_call(
+            lambda build=build: build().compile(dialect=dialect), iterations // 10
+        )
+        print(f"{name:<16}{plain:>10.1f}{cached:>11.1f}{compiled:>12.1f}")
+
+
+async def _bench_db_once(cache_size: int, iterations: int) -> tuple[float, float]:
+    engine = create_async_engine(
+        settings.database_url,
+        pool_size=1,
+        connect_args={"prepared_statement_cache_size": cache_size, "statement_cache_size": cache_size},
+    )
+    user_id, item_id = str(uuid4()), str(uuid4())
+    try:
+        async with engine.connect() as conn:
+            for _ in range(10):  # warm up the connection and caches
+                await conn.execute(select(ItemModel).where(ItemModel.id == item_id))
+            wall, cpu = time.perf_counter(), time.process_time()
+            for _ in range(iterations):
+                await conn.execute(
+                    lambda_stmt(
+                        lambda: select(ItemModel).where(
+                            ItemModel.id == item_id, ItemModel.user_id == user_id
+                        )
+                    )
+                )
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    finally:
+        await engine.dispose()
+    return wall / iterations * 1e6, cpu / iterations * 1e6
+
+
+async def bench_db(iterations: int) -> None:
+    """Compare item-by-id round trips with prepared-statement caching off/on."""
+    print(f"{'prepared cache':<16}{'wall us':>10}{'client us':>11}{'server+net us':>15}")
+    for label, size in (("off", 0), ("on", settings.db_prepared_statement_cache_size)):
+        wall, cpu = await _bench_db_once(size, iterations)
+        print(f"{label:<16}{wall:>10.1f}{cpu:>11.1f}{wall - cpu:>15.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--db", action="store_true", help="Also benchmark against DATABASE_URL")
+    args = parser.parse_args()
+
+    bench_python(args.iterations)
+    if args.db:
+        print()
+        asyncio.run(bench_db(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
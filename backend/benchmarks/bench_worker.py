@@ -0,0 +1,259 @@
+"""Benchmark enrichment worker throughput against a simulated LLM.
+
+Enqueues --jobs enrichment jobs for a dedicated bench user (ENRICHING
+items plus outbox rows, through the item and outbox repositories), then
+starts --workers processes, each running EnrichmentWorker with
+LLM_PROVIDER=simulated (see SimulatedAIProvider). While they drain the
+queue the parent polls the items table and pg_stat_activity and reports:
+
+- jobs/s (finished items over wall time) and outcomes
+- time-to-enriched p50/p95/p99 (enqueue until the item leaves ENRICHING)
+- DB connections held by the workers, peak and mean; "idle in
+  transaction" is a connection pinned while its job waits on the LLM
+- lease reclaims counted by the workers
+
+With --batch the jobs are enqueued as enrichment_batch jobs and run on
+the batch lane (JOB_BATCH_SIZE items per simulated call, polled every
+--poll-interval seconds) instead of one call per job.
+
+Other worker settings pass through --env, e.g. --env LLM_CONCURRENCY=8
+--env JOB_LEASE_SECONDS=60 --env JOB_DRAIN_BATCH_SIZE=50. Needs Postgres
+(DATABASE_URL) with migrations applied; use a database without other
+outbox traffic, since the workers claim any pending job.
+
+Usage:
+    uv run python -m benchmarks.bench_worker
+    uv run python -m benchmarks.bench_worker --jobs 500 --workers 4 --latency-median 5
+    uv run python -m benchmarks.bench_worker --rate-limit-rate 0.05 --env JOB_LEASE_SECONDS=30
+    uv run python -m benchmarks.bench_worker --batch --env JOB_BATCH_SIZE=20
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import statistics
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from sqlalchemy import delete, func, select, text
+
+from app.domain.entities.item import Item
+from app.domain.value_objects import ItemStatus
+from app.infrastructure.persistence.database import (
+    DatabaseRole,
+    dispose_engines,
+    get_db_session_context,
+)
+from app.infrastructure.persistence.models import EnrichmentOutboxModel, ItemModel
+from app.infrastructure.persistence.repositories.item_repository_impl import (
+    SQLAlchemyItemRepository,
+)
+from app.infrastructure.persistence.repositories.outbox_repository_impl import (
+    SQLAlchemyOutboxRepository,
+)
+from app.infrastructure.persistence.repositories.user_repository_impl import (
+    SQLAlchemyUserRepository,
+)
+
+BENCH_USER_ID = "bench-worker"
+SAMPLE_INTERVAL_SECS = 0.25
+
+_CONNECTIONS_SQL = text(
+    "SELECT state, count(*) FROM pg_stat_activity "
+    "WHERE datname = current_database() AND backend_type = 'client backend' "
+    "AND pid <> pg_backend_pid() GROUP BY state"
+)
+
+
+def _worker_main(ready, go, stop, results) -> None:
+    """Worker process entry point (settings come from the inherited env)."""
+    asyncio.run(_run_worker(ready, go, stop, results))
+
+
+async def _run_worker(ready, go, stop, results) -> None:
+    from prometheus_client import REGISTRY
+
+    from app.infrastructure.enrichment.worker import EnrichmentWorker
+
+    worker = EnrichmentWorker()
+    ready.put(worker.worker_id)
+    await asyncio.to_thread(go.wait)
+    start_task = asyncio.create_task(worker.start())
+    await asyncio.to_thread(stop.wait)
+    start_task.cancel()
+    await worker.stop()
+    await dispose_engines()
+    results.put({
+        "worker_id": worker.worker_id,
+        "reclaims": REGISTRY.get_sample_value("litevault_outbox_lease_reclaims_total") or 0,
+    })
+
+
+async def _reset_and_enqueue(jobs: int, job_type: str) -> list[str]:
+    """Create the bench user, drop its old items, enqueue fresh jobs."""
+    async with get_db_session_context(DatabaseRole.MAINTENANCE) as session:
+        await SQLAlchemyUserRepository(session).get_or_create_dev_user(BENCH_USER_ID)
+        await session.execute(delete(ItemModel).where(ItemModel.user_id == BENCH_USER_ID))
+
+    item_ids = []
+    async with get_db_session_context(DatabaseRole.MAINTENANCE) as session:
+        item_repo = SQLAlchemyItemRepository(session)
+        outbox_repo = SQLAlchemyOutboxRepository(session)
+        now = datetime.now(timezone.utc)
+        for n in range(jobs):
+            item = Item(
+                id=str(uuid4()),
+                user_id=BENCH_USER_ID,
+                raw_text=f"Benchmark note {n}: notes on queue latency and worker tuning.",
+                status=ItemStatus.ENRICHING,
+                created_at=now,
+                updated_at=now,
+            )
+            await item_repo.create(item)
+            await outbox_repo.create(item.id, job_type=job_type)
+            item_ids.append(item.id)
+    return item_ids
+
+
+async def _sample(finished: dict[str, tuple[str, float]], connections: list[dict]) -> None:
+    """Record newly finished items and the current worker connections."""
+    async with get_db_session_context(DatabaseRole.MAINTENANCE) as session:
+        rows = await session.execute(
+            select(ItemModel.id, ItemModel.status).where(
+                ItemModel.user_id == BENCH_USER_ID,
+                ItemModel.status != ItemStatus.ENRICHING.value,
+            )
+        )
+        now = time.perf_counter()
+        for item_id, status in rows:
+            finished.setdefault(item_id, (status, now))
+        states = await session.execute(_CONNECTIONS_SQL)
+        connections.append({state or "unknown": count for state, count in states})
+
+
+def _pct(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending, non-empty list."""
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=2, help="Worker processes")
+    parser.add_argument("--latency-median", type=float, default=5.0, help="Seconds")
+    parser.add_argument("--latency-sigma", type=float, default=0.6)
+    parser.add_argument("--latency-min", type=float, default=2.0)
+    parser.add_argument("--latency-max", type=float, default=20.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--poll-interval", type=int, default=1, help="Worker poll seconds")
+    parser.add_argument("--batch", action="store_true", help="Enqueue batch-lane jobs")
+    parser.add_argument("--timeout", type=float, default=900.0, help="Give up after seconds")
+    parser.add_argument(
+        "--env", action="append", default=[], metavar="KEY=VALUE",
+        help="Extra worker setting (repeatable)",
+    )
+    args = parser.parse_args()
+
+    worker_env = {
+        "LLM_PROVIDER": "simulated",
+        "LLM_SIM_LATENCY_MEDIAN_SECS": str(args.latency_median),
+        "LLM_SIM_LATENCY_SIGMA": str(args.latency_sigma),
+        "LLM_SIM_LATENCY_MIN_SECS": str(args.latency_min),
+        "LLM_SIM_LATENCY_MAX_SECS": str(args.latency_max),
+        "LLM_SIM_ERROR_RATE": str(args.error_rate),
+        "LLM_SIM_RATE_LIMIT_RATE": str(args.rate_limit_rate),
+        # NOTIFY is in-process only; separate worker processes poll
+        "JOB_NOTIFY_ENABLED": "false",
+        "ENRICHMENT_POLL_INTERVAL_SECS": str(args.poll_interval),
+        "JOB_BATCH_INTERVAL_SECS": str(args.poll_interval),
+        "LOG_LEVEL": "WARNING",
+        **dict(item.split("=", 1) for item in args.env),
+    }
+    # Spawned workers inherit the environment and build their own settings
+    os.environ.update(worker_env)
+
+    ctx = multiprocessing.get_context("spawn")
+    ready, results = ctx.Queue(), ctx.Queue()
+    go, stop = ctx.Event(), ctx.Event()
+    processes = [
+        ctx.Process(target=_worker_main, args=(ready, go, stop, results))
+        for _ in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+
+    finished: dict[str, tuple[str, float]] = {}
+    connections: list[dict] = []
+    try:
+        for _ in processes:
+            await asyncio.to_thread(ready.get)
+        item_ids = await _reset_and_enqueue(
+            args.jobs, "enrichment_batch" if args.batch else "enrichment"
+        )
+        # Only the monitoring connection should remain on our side
+        await dispose_engines()
+
+        print(
+            f"{args.jobs} jobs, {args.workers} workers, latency median "
+            f"{args.latency_median}s (sigma {args.latency_sigma}, "
+            f"[{args.latency_min}, {args.latency_max}]s), error rate {args.error_rate}, "
+            f"429 rate {args.rate_limit_rate}{', batch lane' if args.batch else ''}"
+        )
+        for key, value in sorted(worker_env.items()):
+            if key.startswith(("LLM_CONCURRENCY", "JOB_")):
+                print(f"  {key}={value}")
+
+        started = time.perf_counter()
+        go.set()
+        while len(finished) < len(item_ids):
+            if time.perf_counter() - started > args.timeout:
+                print(f"timed out with {len(item_ids) - len(finished)} jobs unfinished")
+                break
+            await _sample(finished, connections)
+            await asyncio.sleep(SAMPLE_INTERVAL_SECS)
+    finally:
+        stop.set()
+        go.set()
+        worker_stats = []
+        for process in processes:
+            process.join(timeout=30)
+        while not results.empty():
+            worker_stats.append(results.get())
+
+        async with get_db_session_context(DatabaseRole.MAINTENANCE) as session:
+            dead = await session.scalar(
+                select(func.count()).select_from(EnrichmentOutboxModel)
+                .join(ItemModel, ItemModel.id == EnrichmentOutboxModel.item_id)
+                .where(ItemModel.user_id == BENCH_USER_ID, EnrichmentOutboxModel.status == "DEAD")
+            )
+        await dispose_engines()
+
+    if not finished:
+        return
+    done_times = sorted(at - started for _, at in finished.values())
+    outcomes: dict[str, int] = {}
+    for status, _ in finished.values():
+        outcomes[status] = outcomes.get(status, 0) + 1
+    wall = done_times[-1]
+    totals = [sum(sample.values()) for sample in connections]
+    in_txn = [sample.get("idle in transaction", 0) for sample in connections]
+
+    print(f"\nthroughput     {len(finished) / wall:8.2f} jobs/s over {wall:.1f}s")
+    print(f"outcomes       {outcomes}, dead jobs {dead}")
+    print(
+        f"time-to-done   p50 {_pct(done_times, 50):6.1f}s  p95 {_pct(done_times, 95):6.1f}s  "
+        f"p99 {_pct(done_times, 99):6.1f}s"
+    )
+    print(
+        f"connections    peak {max(totals)}  mean {statistics.mean(totals):.1f}  "
+        f"(idle in transaction: peak {max(in_txn)}, mean {statistics.mean(in_txn):.1f})"
+    )
+    print(f"lease reclaims {int(sum(stats['reclaims'] for stats in worker_stats))}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,342 @@
+"""HTTP load test for the main API endpoints, with baseline comparison.
+
+Drives a running server with --concurrency async clients for --duration
+seconds, each request picking a scenario by weight and a random seeded
+user (see benchmarks.seed_loadtest):
+
+    create      POST  /api/v1/items (stub enrichment unless --no-enrich)
+    pending     GET   /api/v1/items/pending
+    confirm     PATCH /api/v1/items/{id} action=confirm (ids from pending)
+    library     GET   /api/v1/library, following cursors up to --max-pages
+    search      GET   /api/v1/search?q=<words>
+    search_tag  GET   /api/v1/search?q=#<tag>
+    tags        GET   /api/v1/tags
+
+Reports requests, errors, req/s and p50/p95/p99 latency per scenario.
+--save-baseline writes the results as JSON; --compare reads one back and
+exits 1 when a scenario's p95/p99 grew or its req/s dropped by more than
+--tolerance, so the same command works as a regression check.
+
+Run the server against the seeded database with the stub provider and
+the MinIO container (AUTH_MODE must allow X-Dev-User-Id):
+
+    docker compose up -d
+    LLM_PROVIDER=stub AUTH_MODE=dev uv run uvicorn app.main:app --port 8080
+
+Usage:
+    uv run python -m benchmarks.loadtest --duration 60 --concurrency 50
+    uv run python -m benchmarks.loadtest --save-baseline benchmarks/baseline.json
+    uv run python -m benchmarks.loadtest --compare benchmarks/baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from uuid import uuid4
+
+import httpx
+
+from benchmarks.seed_loadtest import TAG_NAMES, USER_ID_PREFIX, WORDS
+
+# Relative weight of each scenario in the request mix
+DEFAULT_MIX = {
+    "create": 10,
+    "pending": 10,
+    "confirm": 5,
+    "library": 30,
+    "search": 15,
+    "search_tag": 15,
+    "tags": 15,
+}
+
+
+@dataclass
+class ScenarioStats:
+    """Latencies and failures collected for one scenario."""
+
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    statuses: dict[int, int] = field(default_factory=dict)
+
+    def record(self, secs: float, status: int) -> None:
+        self.latencies.append(secs)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if status >= 400:
+            self.errors += 1
+
+
+@dataclass
+class LoadState:
+    """Per-run state shared by all clients."""
+
+    args: argparse.Namespace
+    rng: random.Random
+    stats: dict[str, ScenarioStats] = field(default_factory=dict)
+    library_cursors: dict[str, tuple[str, int]] = field(default_factory=dict)
+    pending_ids: dict[str, list[str]] = field(default_factory=dict)
+    recording: bool = False
+
+    def random_user(self) -> str:
+        return f"{USER_ID_PREFIX}{self.rng.randrange(self.args.users):05d}"
+
+
+async def _timed(
+    state: LoadState, scenario: str, client: httpx.AsyncClient, method: str, url: str,
+    user_id: str, **kwargs,
+) -> httpx.Response | None:
+    """Send one request and record it under the scenario."""
+    headers = {"X-Dev-User-Id": user_id, **kwargs.pop("headers", {})}
+    start = time.perf_counter()
+    try:
+        response = await client.request(method, url, headers=headers, **kwargs)
+        status = response.status_code
+    except httpx.HTTPError:
+        response, status = None, 599
+    if state.recording:
+        state.stats.setdefault(scenario, ScenarioStats()).record(
+            time.perf_counter() - start, status
+        )
+    return response
+
+
+async def run_create(state: LoadState, client: httpx.AsyncClient, user_id: str) -> None:
+    body = {
+        "rawText": " ".join(state.rng.choices(WORDS, k=state.rng.randint(20, 120))),
+        "enrich": state.args.enrich,
+    }
+    await _timed(
+        state, "create", client, "POST", "/api/v1/items", user_id,
+        json=body, headers={"Idempotency-Key": str(uuid4())},
+    )
+
+
+async def run_pending(state: LoadState, client: httpx.AsyncClient, user_id: str) -> None:
+    response = await _timed(state, "pending", client, "GET", "/api/v1/items/pending", user_id)
+    if response is not None and response.status_code == 200:
+        state.pending_ids[user_id] = [
+            item["id"] for item in response.json()["items"]
+            if item["status"] == "READY_TO_CONFIRM"
+        ]
+
+
+async def run_confirm(state: LoadState, client: httpx.AsyncClient, user_id: str) -> None:
+    # Prefer a user whose pending list is already known
+    candidates = [user for user, ids in state.pending_ids.items() if ids]
+    if candidates:
+        user_id = state.rng.choice(candidates)
+    else:
+        await run_pending(state, client, user_id)
+    ids = state.pending_ids.get(user_id)
+    if not ids:
+        return
+    item_id = ids.pop()
+    await _timed(
+        state, "confirm", client, "PATCH", f"/api/v1/items/{item_id}", user_id,
+        json={"action": "confirm"},
+    )
+
+
+async def run_library(state: LoadState, client: httpx.AsyncClient, user_id: str) -> None:
+    cursor, page = state.library_cursors.pop(user_id, (None, 0))
+    params = {"limit": 20, **({"cursor": cursor} if cursor else {})}
+    response = await _timed(
+        state, "library", client, "GET", "/api/v1/library", user_id, params=params
+    )
+    if response is not None and response.status_code == 200:
+        pagination = response.json()["pagination"]
+        if pagination["hasMore"] and page + 1 < state.args.max_pages:
+            state.library_cursors[user_id] = (pagination["cursor"], page + 1)
+
+
+async def run_search(state: LoadState, client: httpx.AsyncClient, user_id: str) -> None:
+    query = " ".join(state.rng.choices(WORDS, k=state.rng.randint(1, 2)))
+    await _timed(
+        state, "search", client, "GET", "/api/v1/search", user_id, params={"q": query}
+    )
+
+
+async def run_search_tag(state: LoadState, client: httpx.AsyncClient, user_id: str) -> None:
+    query = f"#{state.rng.choice(TAG_NAMES)}"
+    await _timed(
+        state, "search_tag", client, "GET", "/api/v1/search", user_id, params={"q": query}
+    )
+
+
+async def run_tags(state: LoadState, client: httpx.AsyncClient, user_id: str) -> None:
+    await _timed(state, "tags", client, "GET", "/api/v1/tags", user_id)
+
+
+SCENARIOS = {
+    "create": run_create,
+    "pending": run_pending,
+    "confirm": run_confirm,
+    "library": run_library,
+    "search": run_search,
+    "search_tag": run_search_tag,
+    "tags": run_tags,
+}
+
+
+async def _client_loop(
+    state: LoadState, client: httpx.AsyncClient, mix: dict[str, int], deadline: float
+) -> None:
+    names, weights = list(mix), list(mix.values())
+    while time.perf_counter() < deadline:
+        scenario = state.rng.choices(names, weights)[0]
+        await SCENARIOS[scenario](state, client, state.random_user())
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(stats: dict[str, ScenarioStats], elapsed: float) -> dict[str, dict]:
+    """Per-scenario and overall results in milliseconds and req/s."""
+    summary = {}
+    everything = ScenarioStats()
+    for name in [*SCENARIOS, "total"]:
+        if name == "total":
+            scenario = everything
+        elif name in stats:
+            scenario = stats[name]
+            everything.latencies.extend(scenario.latencies)
+            everything.errors += scenario.errors
+        else:
+            continue
+        latencies = sorted(scenario.latencies)
+        summary[name] = {
+            "requests": len(latencies),
+            "errors": scenario.errors,
+            "rps": round(len(latencies) / elapsed, 1),
+            "p50_ms": round(_percentile(latencies, 50) * 1000, 2),
+            "p95_ms": round(_percentile(latencies, 95) * 1000, 2),
+            "p99_ms": round(_percentile(latencies, 99) * 1000, 2),
+            "max_ms": round((latencies[-1] if latencies else 0.0) * 1000, 2),
+        }
+    return summary
+
+
+def print_summary(summary: dict[str, dict]) -> None:
+    print(
+        f"{'scenario':<12} {'requests':>9} {'errors':>7} {'req/s':>8} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}"
+    )
+    for name, row in summary.items():
+        print(
+            f"{name:<12} {row['requests']:>9} {row['errors']:>7} {row['rps']:>8.1f} "
+            f"{row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} "
+            f"{row['max_ms']:>8.1f}"
+        )
+
+
+def compare(summary: dict[str, dict], baseline: dict[str, dict], tolerance: float) -> list[str]:
+    """Regressions versus a baseline: slower p95/p99 or lower req/s."""
+    regressions = []
+    for name, base in baseline.items():
+        current = summary.get(name)
+        if current is None or not base["requests"]:
+            continue
+        for metric in ("p95_ms", "p99_ms"):
+            if current[metric] > base[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{name} {metric}: {base[metric]:.1f} -> {current[metric]:.1f}"
+                )
+        if current["rps"] < base["rps"] * (1 - tolerance):
+            regressions.append(f"{name} rps: {base['rps']:.1f} -> {current['rps']:.1f}")
+    return regressions
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    """Parse 'library=5,search=2' into scenario weights."""
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"unknown scenario {name!r}")
+        mix[name] = int(weight or 1)
+    return mix
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8080")
+    parser.add_argument("--users", type=int, default=10_000, help="Seeded users to pick from")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=60.0)
+    parser.add_argument("--warmup", type=float, default=5.0, help="Seconds not recorded")
+    parser.add_argument(
+        "--mix", type=parse_mix, default=DEFAULT_MIX,
+        help="Scenario weights, e.g. library=5,search=2 (default: all scenarios)",
+    )
+    parser.add_argument("--max-pages", type=int, default=5, help="Library pages per walk")
+    parser.add_argument("--no-enrich", dest="enrich", action="store_false")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--save-baseline", type=Path)
+    parser.add_argument("--compare", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    state = LoadState(args=args, rng=random.Random(args.seed))
+    limits = httpx.Limits(
+        max_connections=args.concurrency, max_keepalive_connections=args.concurrency
+    )
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=30.0) as client:
+        (await client.get("/health")).raise_for_status()
+        print(
+            f"{args.concurrency} clients, {args.warmup:.0f}s warmup + {args.duration:.0f}s "
+            f"against {args.base_url}"
+        )
+        warmup_end = time.perf_counter() + args.warmup
+        deadline = warmup_end + args.duration
+        clients = [
+            asyncio.create_task(_client_loop(state, client, args.mix, deadline))
+            for _ in range(args.concurrency)
+        ]
+        await asyncio.sleep(max(warmup_end - time.perf_counter(), 0))
+        state.recording = True
+        started = time.perf_counter()
+        await asyncio.gather(*clients)
+        elapsed = time.perf_counter() - started
+
+    summary = summarize(state.stats, elapsed)
+    print_summary(summary)
+
+    if args.save_baseline:
+        args.save_baseline.write_text(json.dumps({
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "config": {
+                "base_url": args.base_url,
+                "users": args.users,
+                "concurrency": args.concurrency,
+                "duration": args.duration,
+                "mix": args.mix,
+                "enrich": args.enrich,
+                "seed": args.seed,
+            },
+            "results": summary,
+        }, indent=2) + "\n")
+        print(f"baseline saved to {args.save_baseline}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare(summary, baseline["results"], args.tolerance)
+        if regressions:
+            print(f"regressions vs {args.compare} (tolerance {args.tolerance:.0%}):")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"no regressions vs {args.compare} (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,299 @@
+"""Seed Postgres with a realistic data volume for the load test.
+
+Creates --users users (ids bench-user-00000, ...; authenticate with
+X-Dev-User-Id), each with --tags-per-user tags and --items-per-user
+items: mostly ARCHIVED with 0-4 tags (items.tags and item_tags kept in
+sync, tag usage counts exact), --pending-per-user READY_TO_CONFIRM items
+for the confirm scenario, and a --attachment-ratio share of items with
+one COMPLETED upload and attachment. Text is drawn from a fixed
+vocabulary so combined and #tag searches hit. Output is deterministic
+for a given --seed.
+
+Users go through SQLAlchemyUserRepository. The other tables are written
+with batched multi-row INSERTs on the ORM models: one repository flush
+per row would take hours at 1M items.
+
+Usage:
+    docker compose up -d && uv run alembic upgrade head
+    uv run python -m benchmarks.seed_loadtest                  # 10k users, 1M items
+    uv run python -m benchmarks.seed_loadtest --users 100 --items-per-user 50
+    uv run python -m benchmarks.seed_loadtest --reset          # drop bench users first
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from sqlalchemy import delete, func, insert, select
+
+from app.config import settings
+from app.domain.entities.user import User, UserPreferences
+from app.domain.value_objects import UserPlan
+from app.infrastructure.persistence.database import (
+    DatabaseRole,
+    dispose_engines,
+    get_db_session_context,
+)
+from app.infrastructure.persistence.models import (
+    ItemAttachmentModel,
+    ItemModel,
+    ItemTagModel,
+    TagModel,
+    UploadModel,
+    UserModel,
+)
+from app.infrastructure.persistence.repositories.user_repository_impl import (
+    SQLAlchemyUserRepository,
+)
+
+USER_ID_PREFIX = "bench-user-"
+
+# Rows per INSERT; stays under asyncpg's 32767 bind parameter limit
+BATCH_ROWS = 2000
+
+TAG_NAMES = [
+    "python", "rust", "golang", "postgres", "redis", "kafka", "docker", "kubernetes",
+    "react", "typescript", "design", "ux", "career", "reading", "writing", "health",
+    "fitness", "running", "cooking", "travel", "finance", "investing", "startup",
+    "product", "marketing", "music", "photography", "history", "science", "math",
+    "ml", "llm", "security", "networking", "linux", "devops", "testing", "ideas",
+    "quotes", "books", "podcasts", "movies", "gardening", "parenting", "language",
+    "philosophy", "productivity", "meetings", "architecture", "performance",
+]
+TAG_COLORS = ["gray", "red", "orange", "amber", "green", "teal", "blue", "indigo", "purple"]
+
+WORDS = (
+    "the a of to and in for on with from about notes idea article thread link video "
+    "review summary draft plan question answer meeting follow up later read watch "
+    "learn build deploy debug index query cache latency throughput memory disk network "
+    "service client server request response queue worker retry timeout budget design "
+    "pattern tradeoff benchmark profile trace metric alert incident release migration "
+    "schema table column cursor page search vector tag library archive confirm pending"
+).split()
+
+ATTACHMENT_KINDS = [
+    ("image", "image/jpeg", ".jpg"),
+    ("image", "image/png", ".png"),
+    ("file", "application/pdf", ".pdf"),
+]
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(UUID(int=rng.getrandbits(128), version=4))
+
+
+def _sentence(rng: random.Random, min_words: int, max_words: int) -> str:
+    return " ".join(rng.choices(WORDS, k=rng.randint(min_words, max_words)))
+
+
+async def _insert(model, rows: list[dict]) -> None:
+    """Insert rows in batches, one transaction per batch."""
+    for start in range(0, len(rows), BATCH_ROWS):
+        async with get_db_session_context(DatabaseRole.MAINTENANCE) as session:
+            await session.execute(insert(model), rows[start:start + BATCH_ROWS])
+
+
+async def reset() -> int:
+    """Delete all seeded users; their rows go with them (ON DELETE CASCADE).
+
+    Attachments reference uploads with RESTRICT, so they go first.
+    """
+    bench_users = select(UserModel.id).where(UserModel.id.startswith(USER_ID_PREFIX))
+    async with get_db_session_context(DatabaseRole.MAINTENANCE) as session:
+        await session.execute(
+            delete(ItemAttachmentModel).where(ItemAttachmentModel.user_id.in_(bench_users))
+        )
+        await session.execute(delete(UploadModel).where(UploadModel.user_id.in_(bench_users)))
+        result = await session.execute(
+            delete(UserModel).where(UserModel.id.startswith(USER_ID_PREFIX))
+        )
+    return result.rowcount
+
+
+async def seed_users(user_ids: list[str], now: datetime) -> None:
+    """Create users through the repository, one transaction per batch."""
+    for start in range(0, len(user_ids), BATCH_ROWS):
+        async with get_db_session_context(DatabaseRole.MAINTENANCE) as session:
+            repo = SQLAlchemyUserRepository(session)
+            for user_id in user_ids[start:start + BATCH_ROWS]:
+                await repo.create(
+                    User(
+                        id=user_id,
+                        clerk_user_id=None,
+                        email=f"{user_id}@bench.litevault.local",
+                        display_name=f"Bench {user_id[len(USER_ID_PREFIX):]}",
+                        nickname=None,
+                        bio=None,
+                        preferences=UserPreferences(),
+                        plan=UserPlan.PRO,
+                        created_at=now,
+                        updated_at=now,
+                    )
+                )
+
+
+def build_user_rows(
+    rng: random.Random, user_id: str, args: argparse.Namespace, now: datetime
+) -> dict[str, list[dict]]:
+    """Generate one user's tags, items, item_tags, uploads and attachments."""
+    rows: dict[str, list[dict]] = {
+        "tags": [], "items": [], "item_tags": [], "uploads": [], "attachments": []
+    }
+    names = rng.sample(TAG_NAMES, min(args.tags_per_user, len(TAG_NAMES)))
+    tags = [
+        {
+            "id": _uuid(rng),
+            "user_id": user_id,
+            "name": name,
+            "name_lower": name,
+            "usage_count": 0,
+            "last_used": None,
+            "color": rng.choice(TAG_COLORS),
+            "created_at": now - timedelta(days=400),
+            "updated_at": now - timedelta(days=400),
+        }
+        for name in names
+    ]
+    rows["tags"] = tags
+
+    for n in range(args.items_per_user):
+        pending = n < args.pending_per_user
+        created_at = now - timedelta(seconds=rng.randint(60, 365 * 86400))
+        item_tags = rng.sample(tags, rng.randint(0, min(4, len(tags))))
+        item = {
+            "id": _uuid(rng),
+            "user_id": user_id,
+            "raw_text": _sentence(rng, 20, 200),
+            "title": _sentence(rng, 3, 8).capitalize(),
+            "summary": _sentence(rng, 10, 30),
+            "status": "READY_TO_CONFIRM" if pending else "ARCHIVED",
+            "source_type": rng.choice(["NOTE", "ARTICLE"]),
+            "enrichment_mode": "AI",
+            "tags": [tag["name"] for tag in item_tags],
+            "attachment_count": 0,
+            "created_at": created_at,
+            "updated_at": created_at,
+            "confirmed_at": None if pending else created_at + timedelta(seconds=30),
+        }
+        for tag in item_tags:
+            rows["item_tags"].append(
+                {"item_id": item["id"], "tag_id": tag["id"], "created_at": created_at}
+            )
+            if not pending:
+                tag["usage_count"] += 1
+                if tag["last_used"] is None or tag["last_used"] < item["confirmed_at"]:
+                    tag["last_used"] = item["confirmed_at"]
+
+        if rng.random() < args.attachment_ratio:
+            kind, mime_type, ext = rng.choice(ATTACHMENT_KINDS)
+            upload_id = _uuid(rng)
+            filename = f"{rng.choice(WORDS)}-{n}{ext}"
+            rows["uploads"].append({
+                "id": upload_id,
+                "user_id": user_id,
+                "status": "COMPLETED",
+                "object_key": f"bench/{user_id}/{upload_id}{ext}",
+                "bucket": settings.s3_bucket_name,
+                "filename": filename,
+                "mime_type": mime_type,
+                "size_bytes": rng.randint(20_000, 4_000_000),
+                "kind": kind,
+                "created_at": created_at,
+                "updated_at": created_at,
+                "completed_at": created_at,
+                "expires_at": created_at + timedelta(hours=1),
+            })
+            rows["attachments"].append({
+                "id": _uuid(rng),
+                "user_id": user_id,
+                "item_id": item["id"],
+                "upload_id": upload_id,
+                "display_name": filename,
+                "kind": kind,
+                "sort_order": 0,
+                "created_at": created_at,
+                "updated_at": created_at,
+            })
+            item["attachment_count"] = 1
+        rows["items"].append(item)
+    return rows
+
+
+async def seed(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    # Fixed clock so the same seed reproduces the same rows
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    user_ids = [f"{USER_ID_PREFIX}{i:05d}" for i in range(args.users)]
+
+    async with get_db_session_context(DatabaseRole.MAINTENANCE) as session:
+        existing = await session.scalar(
+            select(func.count()).where(UserModel.id.startswith(USER_ID_PREFIX))
+        )
+    if existing:
+        raise SystemExit(
+            f"{existing} bench users already exist; rerun with --reset to replace them"
+        )
+
+    started = time.perf_counter()
+    await seed_users(user_ids, now)
+    print(f"users        {len(user_ids):>10,}  ({time.perf_counter() - started:.1f}s)")
+
+    totals = dict.fromkeys(["tags", "items", "item_tags", "uploads", "attachments"], 0)
+    targets = [
+        ("tags", TagModel),
+        ("items", ItemModel),
+        ("item_tags", ItemTagModel),
+        ("uploads", UploadModel),
+        ("attachments", ItemAttachmentModel),
+    ]
+    # Generate and insert a chunk of users at a time to bound memory
+    for start in range(0, len(user_ids), args.chunk_users):
+        chunk: dict[str, list[dict]] = {name: [] for name in totals}
+        for user_id in user_ids[start:start + args.chunk_users]:
+            for name, rows in build_user_rows(rng, user_id, args, now).items():
+                chunk[name].extend(rows)
+        # Parents before children (FK order)
+        for name, model in targets:
+            await _insert(model, chunk[name])
+            totals[name] += len(chunk[name])
+        done = min(start + args.chunk_users, len(user_ids))
+        print(
+            f"  {done:>6}/{len(user_ids)} users, {totals['items']:,} items "
+            f"({time.perf_counter() - started:.0f}s)"
+        )
+
+    for name, count in totals.items():
+        print(f"{name:<12} {count:>10,}")
+    print(f"done in {time.perf_counter() - started:.1f}s; run ANALYZE before load testing")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--items-per-user", type=int, default=100)
+    parser.add_argument("--tags-per-user", type=int, default=20)
+    parser.add_argument(
+        "--pending-per-user", type=int, default=5,
+        help="READY_TO_CONFIRM items per user (consumed by the confirm scenario)",
+    )
+    parser.add_argument("--attachment-ratio", type=float, default=0.1)
+    parser.add_argument("--chunk-users", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reset", action="store_true", help="Delete bench users first")
+    args = parser.parse_args()
+
+    if settings.env == "production":
+        raise SystemExit("Refusing to seed a production database")
+    try:
+        if args.reset:
+            print(f"deleted {await reset()} bench users")
+        await seed(args)
+    finally:
+        await dispose_engines()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -9,12 +9,18 @@ from httpx import AsyncClient, ASGITransport
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from app.main import app
+from app.api.dependencies import get_db_read_session
+from app.api.v1.library import library_page_cache
 from app.infrastructure.persistence.database import Base, get_db_session
+from app.infrastructure.tagging.service import tag_vocabulary_cache
 from app.config import settings
 
 # Test database URL (use same as main for integration tests)
 TEST_DATABASE_URL = settings.database_url
 
+# Routes over their declared query budget fail the test (N+1 guard)
+settings.db_query_budget_enforce = True
+
 
 @pytest.fixture(scope="session")
 def event_loop():
@@ -61,6 +67,10 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
     
     app.dependency_overrides[get_db_session] = override_get_db_session
+    app.dependency_overrides[get_db_read_session] = override_get_db_session
+    # Library versions restart with each fresh database
+    library_page_cache.clear()
+    tag_vocabulary_cache.clear()
     
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
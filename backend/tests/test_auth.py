@@ -1,8 +1,14 @@
 """Auth endpoint integration tests."""
 
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 from httpx import AsyncClient
 
+from app.api.dependencies import get_current_user_for_read
+from app.infrastructure.persistence.database import DatabaseRole
+
 
 @pytest.mark.asyncio
 async def test_auth_me_requires_auth(client: AsyncClient) -> None:
@@ -87,3 +93,42 @@ async def test_items_still_work_with_dev_auth(
         headers=dev_user_headers
     )
     assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_read_user_lookup_skips_primary_for_existing_user() -> None:
+    """Test read endpoints resolve an existing user without a write session."""
+    user = MagicMock(id="test-user-123")
+    repo = MagicMock()
+    repo.get_by_id = AsyncMock(return_value=user)
+    write_context = MagicMock()
+    request = MagicMock(headers={"X-Dev-User-Id": "test-user-123"})
+
+    with patch("app.api.dependencies.SQLAlchemyUserRepository", return_value=repo), \
+         patch("app.api.dependencies.get_db_session_context", write_context):
+        assert await get_current_user_for_read(request, MagicMock()) is user
+
+    write_context.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_read_user_lookup_creates_missing_user_on_primary() -> None:
+    """Test a first-time user on a read endpoint is created via the write pool."""
+    created = MagicMock(id="new-user")
+    repo = MagicMock()
+    repo.get_by_id = AsyncMock(return_value=None)
+    repo.get_or_create_dev_user = AsyncMock(return_value=created)
+    roles = []
+
+    @asynccontextmanager
+    async def fake_context(role):
+        roles.append(role)
+        yield MagicMock()
+
+    request = MagicMock(headers={"X-Dev-User-Id": "new-user"})
+    with patch("app.api.dependencies.SQLAlchemyUserRepository", return_value=repo), \
+         patch("app.api.dependencies.get_db_session_context", fake_context):
+        assert await get_current_user_for_read(request, MagicMock()) is created
+
+    assert roles == [DatabaseRole.API]
+    repo.get_or_create_dev_user.assert_awaited_once_with("new-user")
@@ -0,0 +1,155 @@
+"""Tests for per-role database engines and pool instrumentation."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.util import greenlet_spawn
+
+from app.config import settings
+from app.infrastructure.persistence.database import (
+    DatabaseRole,
+    InstrumentedAsyncQueuePool,
+    _mark_statement_writes,
+    _statement_cache_args,
+    engines,
+    get_pool_metrics,
+    session_factories,
+)
+from app.infrastructure.persistence.read_routing import ReplicaRouter
+
+
+def _pool(pool_size: int = 1, timeout: float = 0.05) -> InstrumentedAsyncQueuePool:
+    return InstrumentedAsyncQueuePool(
+        creator=MagicMock, pool_size=pool_size, max_overflow=0, timeout=timeout
+    )
+
+
+class TestRoleEngines:
+    """Tests for engine-per-role configuration."""
+
+    def test_each_role_has_its_own_pool(self):
+        """API, worker and maintenance never share a pool."""
+        pools = {id(engines[role].pool) for role in DatabaseRole}
+        assert len(pools) == len(DatabaseRole)
+        assert {f.kw["bind"] for f in session_factories.values()} == set(engines.values())
+
+    def test_pool_sizes_come_from_settings(self):
+        """Pool size and pre-ping follow Settings per role."""
+        assert engines[DatabaseRole.API].pool.size() == settings.db_api_pool_size
+        assert engines[DatabaseRole.WORKER].pool.size() == settings.db_worker_pool_size
+        assert engines[DatabaseRole.MAINTENANCE].pool.size() == settings.db_maintenance_pool_size
+        assert engines[DatabaseRole.API].pool._pre_ping == settings.db_pool_pre_ping
+
+    def test_read_engine_is_autocommit_and_read_only(self):
+        """The read pool skips transactions and the server rejects writes."""
+        read_engine = engines[DatabaseRole.READ]
+        assert read_engine.sync_engine.dialect._on_connect_isolation_level == "AUTOCOMMIT"
+        assert read_engine.url.render_as_string(hide_password=False) == settings.database_url
+
+    def test_statement_cache_settings(self):
+        """Prepared statements are cached, except behind PgBouncer transaction pooling."""
+        assert _statement_cache_args() == {
+            "prepared_statement_cache_size": settings.db_prepared_statement_cache_size
+        }
+        assert engines[DatabaseRole.API].sync_engine._compiled_cache.capacity == (
+            settings.db_query_cache_size
+        )
+
+        with patch.object(settings, "db_pgbouncer_transaction_mode", True):
+            args = _statement_cache_args()
+        assert args["prepared_statement_cache_size"] == 0
+        assert args["statement_cache_size"] == 0
+        assert args["prepared_statement_name_func"]() != args["prepared_statement_name_func"]()
+
+    def test_metrics_snapshot_per_role(self):
+        """get_pool_metrics reports every role."""
+        metrics = get_pool_metrics()
+        assert set(metrics) == {"api", "worker", "maintenance", "read"}
+        assert metrics["worker"]["size"] == settings.db_worker_pool_size
+
+
+class TestInstrumentedPool:
+    """Tests for checkout-wait recording."""
+
+    @pytest.mark.asyncio
+    async def test_records_checkouts(self):
+        """Each checkout is counted with its wait time."""
+        pool = _pool()
+        conn = await greenlet_spawn(pool.connect)
+        await greenlet_spawn(conn.close)
+        conn = await greenlet_spawn(pool.connect)
+
+        assert pool.checkout_metrics.checkouts == 2
+        assert pool.checkout_metrics.max_wait_secs >= 0
+        await greenlet_spawn(conn.close)
+
+    @pytest.mark.asyncio
+    async def test_counts_timeouts_when_exhausted(self):
+        """Waiting past pool_timeout is counted and re-raised."""
+        pool = _pool(pool_size=1, timeout=0.01)
+        held = await greenlet_spawn(pool.connect)
+
+        with pytest.raises(exc.TimeoutError):
+            await greenlet_spawn(pool.connect)
+
+        assert pool.checkout_metrics.timeouts == 1
+        assert pool.checkout_metrics.checkouts == 1
+        await greenlet_spawn(held.close)
+
+
+def _engine(name: str):
+    return create_async_engine(f"postgresql+asyncpg://u:p@{name}:5432/db")
+
+
+class TestReplicaRouter:
+    """Tests for replica selection and read-your-writes pinning."""
+
+    def test_without_replicas_reads_use_primary(self):
+        """No replicas configured: every read goes to the primary."""
+        primary = _engine("primary")
+        router = ReplicaRouter(primary, [], pin_seconds=5)
+        router.pin("dev:u1")
+        assert router.engine_for("dev:u1") is primary
+        assert router.engine_for(None) is primary
+
+    def test_round_robin_across_replicas(self):
+        """Unpinned reads rotate over the replicas."""
+        replicas = [_engine("r0"), _engine("r1")]
+        router = ReplicaRouter(_engine("primary"), replicas, pin_seconds=5)
+        picks = [router.engine_for("dev:u1") for _ in range(4)]
+        assert picks == replicas * 2
+
+    def test_pinned_user_reads_primary_until_window_expires(self):
+        """After a write the user reads the primary; others stay on replicas."""
+        primary, replica = _engine("primary"), _engine("r0")
+        router = ReplicaRouter(primary, [replica], pin_seconds=5)
+        module = "app.infrastructure.persistence.read_routing.time.monotonic"
+
+        with patch(module, return_value=100.0):
+            router.pin("dev:u1")
+        with patch(module, return_value=104.0):
+            assert router.engine_for("dev:u1") is primary
+            assert router.engine_for("dev:u2") is replica
+        with patch(module, return_value=105.5):
+            assert router.engine_for("dev:u1") is replica
+            assert not router.is_pinned("dev:u1")
+
+
+class TestWriteDetection:
+    """Tests for the session write flag that triggers pinning."""
+
+    def test_write_statements_mark_session(self):
+        """INSERT/UPDATE/DELETE executions flag the session; SELECTs do not."""
+        def state(**kinds):
+            flags = {"is_insert": False, "is_update": False, "is_delete": False, **kinds}
+            return SimpleNamespace(session=SimpleNamespace(info={}), **flags)
+
+        select_state, update_state = state(), state(is_update=True)
+        _mark_statement_writes(select_state)
+        _mark_statement_writes(update_state)
+
+        assert "has_writes" not in select_state.session.info
+        assert update_state.session.info["has_writes"] is True
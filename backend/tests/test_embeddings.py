@@ -0,0 +1,253 @@
+"""Tests for embeddings, rank fusion and the worker's embedding jobs."""
+
+import math
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.api.v1.search import (
+    decode_offset_cursor,
+    encode_offset_cursor,
+    reciprocal_rank_fusion,
+)
+from app.domain.entities.item import Item
+from app.domain.exceptions import InvalidCursorException
+from app.domain.value_objects import ItemStatus
+from app.infrastructure.embeddings.provider_interface import (
+    EMBEDDING_DIMENSIONS,
+    EmbeddingError,
+    content_hash,
+    embedding_text,
+)
+from app.infrastructure.embeddings.service import QueryEmbeddingCache
+from app.infrastructure.embeddings.stub_provider import (
+    MODEL_LABEL,
+    StubEmbeddingProvider,
+    hash_embedding,
+)
+from app.infrastructure.enrichment.worker import EnrichmentWorker
+from app.infrastructure.persistence.models.item_embedding_model import (
+    Vector,
+    format_vector,
+    parse_vector,
+)
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    return sum(x * y for x, y in zip(a, b, strict=True))
+
+
+class TestStubEmbeddings:
+    """Tests for the deterministic hashing embedder."""
+
+    def test_deterministic_unit_vectors(self):
+        """Same text, same vector; vectors have unit length."""
+        vector = hash_embedding("Work meeting notes")
+        assert vector == hash_embedding("Work meeting notes")
+        assert len(vector) == EMBEDDING_DIMENSIONS
+        assert math.isclose(math.sqrt(sum(x * x for x in vector)), 1.0)
+
+    def test_overlap_ranks_closer(self):
+        """Shared words and word fragments score above unrelated text."""
+        query = hash_embedding("meetings")
+        related = hash_embedding("Work Meeting Notes\n\nDiscussion about project deadlines")
+        unrelated = hash_embedding("Code Review\n\nTechnical feedback about code quality")
+        assert _cosine(query, related) > _cosine(query, unrelated)
+
+    def test_empty_text_is_zero_vector(self):
+        """Text without words embeds to zeros (never stored or searched)."""
+        assert not any(hash_embedding("  ... "))
+
+    @pytest.mark.asyncio
+    async def test_provider_embeds_in_order(self):
+        """embed() returns one vector per text, in order."""
+        vectors = await StubEmbeddingProvider().embed(["alpha", "beta"])
+        assert vectors == [hash_embedding("alpha"), hash_embedding("beta")]
+
+
+class TestEmbeddingText:
+    """Tests for the text embedded per item."""
+
+    def test_title_and_summary(self):
+        assert embedding_text("Title", "Summary.", "raw") == "Title\n\nSummary."
+
+    def test_falls_back_to_raw_text(self):
+        """Items without title and summary embed their cleaned raw text."""
+        assert embedding_text(None, " ", "**Quick**   note") == "Quick note"
+
+
+class TestVectorType:
+    """Tests for the pgvector column type."""
+
+    def test_literal_round_trip(self):
+        values = [0.25, -1.0, 3e-05]
+        assert format_vector(values) == "[0.25,-1.0,3e-05]"
+        assert parse_vector(format_vector(values)) == values
+
+    def test_binds_as_text_cast_to_vector(self):
+        column_type = Vector(3)
+        assert column_type.get_col_spec() == "vector(3)"
+        assert column_type.bind_processor(None)([1, 2, 3]) == "[1.0,2.0,3.0]"
+
+
+class TestRankFusion:
+    """Tests for hybrid-mode reciprocal rank fusion."""
+
+    def test_items_in_both_rankings_rise(self):
+        """An item ranked by both lists beats items ranked first by one."""
+        fused = reciprocal_rank_fusion([["a", "b", "c"], ["d", "c", "e"]])
+        assert fused[0] == "c"
+        assert set(fused) == {"a", "b", "c", "d", "e"}
+
+    def test_ties_keep_first_seen_order(self):
+        assert reciprocal_rank_fusion([["a", "b"], ["c", "d"]]) == ["a", "c", "b", "d"]
+
+    def test_single_ranking_unchanged(self):
+        assert reciprocal_rank_fusion([["x", "y", "z"], []]) == ["x", "y", "z"]
+
+
+class TestOffsetCursor:
+    """Tests for ranked-search pagination cursors."""
+
+    def test_round_trip(self):
+        assert decode_offset_cursor(encode_offset_cursor(40)) == 40
+        assert decode_offset_cursor(None) == 0
+
+    @pytest.mark.parametrize("cursor", ["invalid", encode_offset_cursor(-1)])
+    def test_rejects_bad_cursor(self, cursor):
+        with pytest.raises(InvalidCursorException):
+            decode_offset_cursor(cursor)
+
+
+class TestQueryEmbeddingCache:
+    """Tests for the per-process query vector cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_query_skips_provider(self):
+        """Queries differing only in whitespace share one provider call."""
+        provider = StubEmbeddingProvider()
+        provider.embed = AsyncMock(wraps=provider.embed)
+        cache = QueryEmbeddingCache(max_entries=2)
+
+        first = await cache.embed(provider, "vector  search")
+        second = await cache.embed(provider, " vector search ")
+
+        assert first == second == hash_embedding("vector search")
+        provider.embed.assert_awaited_once_with(["vector search"])
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        provider = StubEmbeddingProvider()
+        provider.embed = AsyncMock(wraps=provider.embed)
+        cache = QueryEmbeddingCache(max_entries=2)
+        for query in ("a", "b", "a", "c"):
+            await cache.embed(provider, query)
+        provider.embed.reset_mock()
+
+        await cache.embed(provider, "a")
+        provider.embed.assert_not_awaited()
+        await cache.embed(provider, "b")
+        provider.embed.assert_awaited_once_with(["b"])
+        assert len(cache) == 2
+
+
+@asynccontextmanager
+async def _fake_session_context(role=None):
+    yield MagicMock()
+
+
+def _archived_item() -> Item:
+    now = datetime.now(timezone.utc)
+    return Item(
+        id="item-1",
+        user_id="user-1",
+        raw_text="Raw",
+        status=ItemStatus.ARCHIVED,
+        created_at=now,
+        updated_at=now,
+        title="Work Meeting Notes",
+        summary="Discussion about project deadlines",
+    )
+
+
+class TestEmbeddingJob:
+    """Tests for the worker's embedding jobs."""
+
+    JOB = SimpleNamespace(
+        id="job-1", item_id="item-1", job_type="embedding", attempt_count=1, claimed_at=None
+    )
+
+    async def _run(self, item, fingerprint=None, provider=None):
+        item_repo = MagicMock()
+        item_repo.get_by_id_for_update_system = AsyncMock(return_value=item)
+        embedding_repo = MagicMock()
+        embedding_repo.get_fingerprint = AsyncMock(return_value=fingerprint)
+        embedding_repo.upsert = AsyncMock()
+        embedding_repo.delete_by_item_id = AsyncMock()
+        outbox_repo = MagicMock()
+        outbox_repo.mark_completed = AsyncMock()
+        outbox_repo.mark_failed = AsyncMock()
+        provider = provider or StubEmbeddingProvider()
+
+        module = "app.infrastructure.enrichment.worker"
+        with patch(f"{module}.get_db_session_context", _fake_session_context), \
+             patch(f"{module}.get_embedding_provider", return_value=provider), \
+             patch(f"{module}.SQLAlchemyOutboxRepository", return_value=outbox_repo), \
+             patch(f"{module}.SQLAlchemyItemRepository", return_value=item_repo), \
+             patch(
+                 f"{module}.SQLAlchemyItemEmbeddingRepository", return_value=embedding_repo
+             ):
+            await EnrichmentWorker()._process_embedding_job(self.JOB, AsyncMock(), outbox_repo)
+        return embedding_repo, outbox_repo
+
+    @pytest.mark.asyncio
+    async def test_stores_vector_for_archived_item(self):
+        text = "Work Meeting Notes\n\nDiscussion about project deadlines"
+        embedding_repo, outbox_repo = await self._run(_archived_item())
+
+        embedding_repo.upsert.assert_awaited_once_with(
+            "item-1", "user-1", MODEL_LABEL, content_hash(text), hash_embedding(text)
+        )
+        outbox_repo.mark_completed.assert_awaited_once_with("job-1")
+
+    @pytest.mark.asyncio
+    async def test_unchanged_text_is_not_re_embedded(self):
+        item = _archived_item()
+        text = embedding_text(item.title, item.summary)
+        provider = StubEmbeddingProvider()
+        provider.embed = AsyncMock()
+
+        embedding_repo, outbox_repo = await self._run(
+            item, fingerprint=(MODEL_LABEL, content_hash(text)), provider=provider
+        )
+
+        provider.embed.assert_not_awaited()
+        embedding_repo.upsert.assert_not_awaited()
+        outbox_repo.mark_completed.assert_awaited_once_with("job-1")
+
+    @pytest.mark.asyncio
+    async def test_discarded_item_loses_vector(self):
+        item = _archived_item()
+        item.status = ItemStatus.DISCARDED
+
+        embedding_repo, outbox_repo = await self._run(item)
+
+        embedding_repo.delete_by_item_id.assert_awaited_once_with("item-1")
+        embedding_repo.upsert.assert_not_awaited()
+        outbox_repo.mark_completed.assert_awaited_once_with("job-1")
+
+    @pytest.mark.asyncio
+    async def test_provider_failure_is_retried(self):
+        provider = StubEmbeddingProvider()
+        provider.embed = AsyncMock(
+            side_effect=EmbeddingError("down", error_code="EMBEDDING_API_ERROR")
+        )
+
+        embedding_repo, outbox_repo = await self._run(_archived_item(), provider=provider)
+
+        embedding_repo.upsert.assert_not_awaited()
+        outbox_repo.mark_failed.assert_awaited_once()
+        assert outbox_repo.mark_failed.await_args.kwargs["error_code"] == "EMBEDDING_API_ERROR"
@@ -1,11 +1,24 @@
 """Tests for enrichment providers and schemas."""
 
+import asyncio
+import random
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 
+from app.config import LLMProvider, settings
 from app.infrastructure.enrichment.stub_provider import StubAIProvider
-from app.infrastructure.enrichment.provider_interface import EnrichmentResult
+from app.infrastructure.enrichment.simulated_provider import SimulatedAIProvider
+from app.infrastructure.enrichment.provider_interface import EnrichmentError, EnrichmentResult
+from app.infrastructure.enrichment.prompts import get_enrichment_version
 from app.infrastructure.enrichment.schemas import EnrichmentSchema
-from app.domain.value_objects import SourceType
+from app.infrastructure.enrichment.worker import EnrichmentWorker
+from app.infrastructure.tagging.vocabulary import TagVocabulary
+from app.domain.entities.item import Item
+from app.domain.value_objects import ItemStatus, SourceType
 
 
 class TestStubProvider:
@@ -54,6 +67,341 @@ class TestStubProvider:
         assert result.source_type == SourceType.NOTE
 
 
+@pytest.fixture
+def fast_simulation(monkeypatch):
+    """Millisecond latencies and no injected failures."""
+    monkeypatch.setattr(settings, "llm_sim_latency_median_secs", 0.002)
+    monkeypatch.setattr(settings, "llm_sim_latency_min_secs", 0.001)
+    monkeypatch.setattr(settings, "llm_sim_latency_max_secs", 0.005)
+    monkeypatch.setattr(settings, "llm_sim_error_rate", 0.0)
+    monkeypatch.setattr(settings, "llm_sim_rate_limit_rate", 0.0)
+
+
+class TestSimulatedProvider:
+    """Tests for SimulatedAIProvider."""
+
+    def test_latency_is_clamped(self, fast_simulation, monkeypatch):
+        """Sampled latencies stay within the configured bounds."""
+        monkeypatch.setattr(settings, "llm_sim_latency_sigma", 3.0)
+        provider = SimulatedAIProvider(random.Random(1))
+        samples = [provider.sample_latency() for _ in range(500)]
+
+        assert min(samples) == 0.001
+        assert max(samples) == 0.005
+
+    @pytest.mark.asyncio
+    async def test_returns_stub_result(self, fast_simulation):
+        """Successful calls return what the stub provider would."""
+        text = "A note about latency simulation."
+        result = await SimulatedAIProvider(random.Random(1)).enrich_item(text)
+
+        assert result == await StubAIProvider().enrich_item(text)
+
+    @pytest.mark.asyncio
+    async def test_injects_rate_limit(self, fast_simulation, monkeypatch):
+        """A rate-limit rate of 1 fails every call with LLM_RATE_LIMITED."""
+        monkeypatch.setattr(settings, "llm_sim_rate_limit_rate", 1.0)
+        with pytest.raises(EnrichmentError) as exc_info:
+            await SimulatedAIProvider(random.Random(1)).enrich_item("text")
+
+        assert exc_info.value.error_code == "LLM_RATE_LIMITED"
+
+    @pytest.mark.asyncio
+    async def test_injects_api_error(self, fast_simulation, monkeypatch):
+        """An error rate of 1 fails every call with LLM_API_ERROR."""
+        monkeypatch.setattr(settings, "llm_sim_error_rate", 1.0)
+        with pytest.raises(EnrichmentError) as exc_info:
+            await SimulatedAIProvider(random.Random(1)).enrich_item("text")
+
+        assert exc_info.value.error_code == "LLM_API_ERROR"
+
+    @pytest.mark.asyncio
+    async def test_times_out_like_a_real_call(self, fast_simulation, monkeypatch):
+        """Latencies above LLM_TIMEOUT_SECONDS surface as LLM_TIMEOUT."""
+        monkeypatch.setattr(settings, "llm_timeout_seconds", 0)
+        with pytest.raises(EnrichmentError) as exc_info:
+            await SimulatedAIProvider(random.Random(1)).enrich_item("text")
+
+        assert exc_info.value.error_code == "LLM_TIMEOUT"
+
+
+@asynccontextmanager
+async def _fake_session_context(role=None):
+    yield MagicMock()
+
+
+class _SlowProvider(StubAIProvider):
+    """Streams the title, then takes `delay` seconds to finish."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.cancelled = False
+
+    async def enrich_item(self, raw_text, on_title=None):
+        result = await super().enrich_item(raw_text)
+        if on_title:
+            await on_title(result.title)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return result
+
+
+class TestWorkerCancellation:
+    """Tests for cancelling in-flight enrichment calls."""
+
+    JOB = SimpleNamespace(id="job-1", item_id="item-1")
+
+    async def _run(self, provider, statuses):
+        item_repo = MagicMock()
+        item_repo.get_status_system = AsyncMock(side_effect=statuses)
+        item_repo.set_title_if_enriching_system = AsyncMock()
+        worker = EnrichmentWorker()
+        worker.ai_provider = provider
+
+        module = "app.infrastructure.enrichment.worker"
+        with patch(f"{module}.get_db_session_context", _fake_session_context), \
+             patch(f"{module}.SQLAlchemyItemRepository", return_value=item_repo):
+            result = await worker._enrich_unless_cancelled(self.JOB, "Some text")
+        return result, item_repo
+
+    @pytest.fixture(autouse=True)
+    def fast_checks(self, monkeypatch):
+        monkeypatch.setattr(settings, "llm_cancel_check_interval_secs", 0.01)
+
+    @pytest.mark.asyncio
+    async def test_discarded_item_cancels_call(self):
+        """The call is cancelled once the item leaves ENRICHING."""
+        provider = _SlowProvider(delay=10)
+        result, _ = await self._run(
+            provider, [ItemStatus.ENRICHING, ItemStatus.DISCARDED]
+        )
+
+        assert result is None
+        assert provider.cancelled
+
+    @pytest.mark.asyncio
+    async def test_completed_call_returns_result(self):
+        """A call that finishes first returns its result."""
+        result, _ = await self._run(_SlowProvider(delay=0), [ItemStatus.ENRICHING] * 100)
+
+        assert result == await StubAIProvider().enrich_item("Some text")
+
+    @pytest.mark.asyncio
+    async def test_publishes_partial_title_when_enabled(self, monkeypatch):
+        """The streamed title is stored while the item is still ENRICHING."""
+        monkeypatch.setattr(settings, "llm_publish_partial_title", True)
+        _, item_repo = await self._run(_SlowProvider(delay=0), [ItemStatus.ENRICHING] * 100)
+
+        item_repo.set_title_if_enriching_system.assert_awaited_once_with(
+            "item-1", "Some text"
+        )
+
+    @pytest.mark.asyncio
+    async def test_partial_title_not_published_by_default(self):
+        """Without LLM_PUBLISH_PARTIAL_TITLE no early write happens."""
+        _, item_repo = await self._run(_SlowProvider(delay=0), [ItemStatus.ENRICHING] * 100)
+
+        item_repo.set_title_if_enriching_system.assert_not_called()
+
+
+class _FlakyProvider(StubAIProvider):
+    """Fails texts containing "bad" on their own."""
+
+    async def enrich_item(self, raw_text, on_title=None):
+        if "bad" in raw_text:
+            raise EnrichmentError("Bad input", error_code="LLM_VALIDATION_ERROR")
+        return await super().enrich_item(raw_text)
+
+
+PROMPTS = "app.infrastructure.enrichment.prompts"
+
+
+def _item(item_id: str, status: ItemStatus) -> Item:
+    now = datetime.now(timezone.utc)
+    return Item(
+        id=item_id,
+        user_id="user-1",
+        raw_text=f"Text of {item_id}",
+        status=status,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+class TestBatchLane:
+    """Tests for multi-item enrichment on the batch lane."""
+
+    @pytest.mark.asyncio
+    async def test_default_enrich_items_keeps_order_and_errors(self):
+        """The fallback enriches each text and returns per-item failures."""
+        results = await _FlakyProvider().enrich_items(["first", "bad one", "third"])
+
+        assert [r.title for r in (results[0], results[2])] == ["first", "third"]
+        assert isinstance(results[1], EnrichmentError)
+        assert results[1].error_code == "LLM_VALIDATION_ERROR"
+
+    async def _process(self, items, provider, job_type="enrichment_batch", suggested=()):
+        jobs = [
+            SimpleNamespace(
+                id=f"job-{item.id}", item_id=item.id, attempt_count=1,
+                claimed_at=None, job_type=job_type,
+            )
+            for item in items
+        ]
+        by_id = {item.id: item for item in items}
+        outbox_repo = MagicMock()
+        outbox_repo.claim_pending_batch = AsyncMock(return_value=jobs)
+        outbox_repo.mark_completed = AsyncMock()
+        outbox_repo.mark_failed = AsyncMock()
+        outbox_repo.create = AsyncMock()
+        user_repo = MagicMock()
+        user_repo.bump_library_version = AsyncMock()
+        item_repo = MagicMock()
+        item_repo.get_by_id_for_update_system = AsyncMock(side_effect=lambda i: by_id[i])
+        item_repo.update = AsyncMock()
+        suggestion_repo = MagicMock()
+        suggestion_repo.create_many = AsyncMock()
+        suggestion_repo.get_by_item_id = AsyncMock(return_value=[
+            SimpleNamespace(normalized_name=name) for name in suggested
+        ])
+        worker = EnrichmentWorker()
+        worker.ai_provider = provider
+
+        module = "app.infrastructure.enrichment.worker"
+        with patch(f"{module}.get_db_session_context", _fake_session_context), \
+             patch(f"{module}.SQLAlchemyOutboxRepository", return_value=outbox_repo), \
+             patch(f"{module}.SQLAlchemyItemRepository", return_value=item_repo), \
+             patch(f"{module}.SQLAlchemyUserRepository", return_value=user_repo), \
+             patch(
+                 f"{module}.SQLAlchemyItemTagSuggestionRepository",
+                 return_value=suggestion_repo,
+             ), \
+             patch(
+                 f"{module}.get_tag_vocabulary",
+                 AsyncMock(return_value=TagVocabulary([], [])),
+             ):
+            claimed = await worker._process_batch(job_type)
+        self.suggestion_repo = suggestion_repo
+        self.user_repo = user_repo
+        return claimed, outbox_repo, item_repo
+
+    @pytest.mark.asyncio
+    async def test_batch_settles_every_job(self):
+        """Results are stored, failures retried and stale jobs completed."""
+        provider = _FlakyProvider()
+        provider.enrich_items = AsyncMock(wraps=provider.enrich_items)
+        items = [
+            _item("a", ItemStatus.ENRICHING),
+            _item("bad", ItemStatus.ENRICHING),
+            _item("c", ItemStatus.DISCARDED),
+        ]
+        claimed, outbox_repo, item_repo = await self._process(items, provider)
+
+        assert claimed == 3
+        provider.enrich_items.assert_awaited_once_with(["Text of a", "Text of bad"])
+        assert items[0].status == ItemStatus.READY_TO_CONFIRM
+        item_repo.update.assert_awaited_once_with(items[0])
+        completed = {call.args[0] for call in outbox_repo.mark_completed.await_args_list}
+        assert completed == {"job-a", "job-c"}
+        outbox_repo.mark_failed.assert_awaited_once()
+        assert outbox_repo.mark_failed.await_args.args[0] == "job-bad"
+
+    @pytest.mark.asyncio
+    async def test_failed_call_fails_each_job(self):
+        """An error for the whole call is recorded on every job."""
+        provider = StubAIProvider()
+        provider.enrich_items = AsyncMock(
+            side_effect=EnrichmentError("Rate limited", error_code="LLM_RATE_LIMITED")
+        )
+        items = [_item("a", ItemStatus.ENRICHING), _item("b", ItemStatus.ENRICHING)]
+        _, outbox_repo, item_repo = await self._process(items, provider)
+
+        assert outbox_repo.mark_failed.await_count == 2
+        assert {c.kwargs["error_code"] for c in outbox_repo.mark_failed.await_args_list} == {
+            "LLM_RATE_LIMITED"
+        }
+        item_repo.update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reenrichment_keeps_confirmed_fields(self):
+        """Archived items keep their content and gain only new suggestions."""
+        item = _item("a", ItemStatus.ARCHIVED)
+        item.title, item.tags = "My title", ["Ideas"]
+        provider = StubAIProvider()
+        provider.enrich_items = AsyncMock(return_value=[EnrichmentResult(
+            title="New title",
+            summary="New summary",
+            suggested_tags=["ideas", "notes", "python"],
+            source_type=SourceType.NOTE,
+        )])
+        _, outbox_repo, item_repo = await self._process(
+            [item], provider, job_type="reenrichment", suggested=["notes"]
+        )
+
+        assert (item.title, item.summary) == ("My title", "New summary")
+        assert item.status == ItemStatus.ARCHIVED
+        assert item.enrichment_version == settings.llm_provider.value
+        item_repo.update.assert_awaited_once_with(item)
+        created = self.suggestion_repo.create_many.await_args.args[0]
+        assert [s.suggested_name for s in created] == ["python"]
+        outbox_repo.mark_completed.assert_awaited_once()
+        # The filled-in summary is re-embedded and shown on the next page load
+        outbox_repo.create.assert_awaited_once_with("a", job_type="embedding")
+        self.user_repo.bump_library_version.assert_awaited_once_with("user-1")
+
+    @pytest.mark.asyncio
+    async def test_reenrichment_without_new_content_keeps_library_version(self):
+        """Items with all fields confirmed are not re-embedded."""
+        item = _item("a", ItemStatus.ARCHIVED)
+        item.title, item.summary, item.source_type = "T", "S", SourceType.NOTE
+        provider = StubAIProvider()
+        provider.enrich_items = AsyncMock(return_value=[EnrichmentResult(
+            title="New title",
+            summary="New summary",
+            suggested_tags=["notes"],
+            source_type=SourceType.ARTICLE,
+        )])
+        _, outbox_repo, _ = await self._process([item], provider, job_type="reenrichment")
+
+        assert (item.title, item.summary, item.source_type) == ("T", "S", SourceType.NOTE)
+        outbox_repo.create.assert_not_called()
+        self.user_repo.bump_library_version.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reenrichment_skips_items_not_archived(self):
+        """Re-enrichment jobs for items in other states just complete."""
+        provider = StubAIProvider()
+        provider.enrich_items = AsyncMock()
+        _, outbox_repo, _ = await self._process(
+            [_item("a", ItemStatus.DISCARDED)], provider, job_type="reenrichment"
+        )
+
+        provider.enrich_items.assert_not_called()
+        outbox_repo.mark_completed.assert_awaited_once()
+
+
+class TestEnrichmentVersion:
+    """Tests for get_enrichment_version()."""
+
+    def test_changes_with_model_and_prompt(self, monkeypatch):
+        """The LiteLLM version tracks both the model and the prompt text."""
+        monkeypatch.setattr(settings, "llm_provider", LLMProvider.LITELLM)
+        monkeypatch.setattr(settings, "llm_model", "openai/gpt-4o-mini")
+        prompt = "You are a helpful assistant."
+        with patch(f"{PROMPTS}.get_system_prompt", return_value=prompt):
+            version = get_enrichment_version()
+            monkeypatch.setattr(settings, "llm_model", "gemini/gemini-1.5-flash")
+            other_model = get_enrichment_version()
+        with patch(f"{PROMPTS}.get_system_prompt", return_value=prompt + " Be brief."):
+            other_prompt = get_enrichment_version()
+
+        assert version.startswith("openai/gpt-4o-mini#")
+        assert len({version, other_model, other_prompt}) == 3
+
+
 class TestEnrichmentSchema:
     """Tests for Instructor schema validation."""
 
@@ -18,3 +18,13 @@ async def test_health_check_has_request_id(client: AsyncClient) -> None:
     response = await client.get("/health")
     assert "X-Request-Id" in response.headers
     assert response.headers["X-Request-Id"].startswith("req-")
+
+
+@pytest.mark.asyncio
+async def test_db_pool_stats_lists_every_role(client: AsyncClient) -> None:
+    """Test pool stats endpoint reports the api, worker and maintenance pools."""
+    response = await client.get("/health/db-pools")
+    assert response.status_code == 200
+    pools = response.json()["pools"]
+    assert set(pools) == {"api", "worker", "maintenance", "read"}
+    assert "max_wait_ms" in pools["api"]
@@ -0,0 +1,54 @@
+"""Import-time budget for the API application module."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+# Loaded by the worker on startup, never by importing the app
+WORKER_ONLY_MODULES = {
+    "litellm",
+    "instructor",
+    "PIL",
+    "app.infrastructure.enrichment.worker",
+    "app.infrastructure.enrichment.litellm_provider",
+    "app.infrastructure.storage.thumbnails",
+}
+
+# Cumulative import time of app.main; generous so slow CI hosts pass
+IMPORT_BUDGET_SECS = 3.0
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Cumulative import time (microseconds) per module, via -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        env={**os.environ, "LLM_PROVIDER": "litellm"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestImportTime:
+    """Importing the app stays cheap, even with the LiteLLM provider configured."""
+
+    def test_worker_stack_not_imported(self):
+        """The worker, LLM client and image libraries load lazily."""
+        times = _import_times("app.main")
+        assert WORKER_ONLY_MODULES.isdisjoint(times)
+
+    def test_within_budget(self):
+        """app.main imports within the budget."""
+        times = _import_times("app.main")
+        assert times["app.main"] / 1e6 < IMPORT_BUDGET_SECS
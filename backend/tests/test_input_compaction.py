@@ -0,0 +1,121 @@
+"""Tests for token-budgeted input compaction."""
+
+import random
+
+from app.infrastructure.enrichment.input_compaction import (
+    OMISSION,
+    clean_text,
+    compact,
+    estimate_tokens,
+)
+from app.infrastructure.enrichment.prompt_loader import PromptLoader
+from app.infrastructure.enrichment.prompts import (
+    build_batch_enrichment_messages,
+    build_enrichment_messages,
+    build_enrichment_user_prompt,
+)
+
+
+def _long_text(sentences: int = 400) -> str:
+    rng = random.Random(7)
+    words = "queue worker latency cache index postgres budget the a of to".split()
+    return " ".join(
+        " ".join(rng.choices(words, k=12)).capitalize() + "." for _ in range(sentences)
+    )
+
+
+class TestCleanText:
+    """Tests for boilerplate removal."""
+
+    def test_strips_tracking_params(self):
+        """utm_* and click IDs go, other query params stay."""
+        text = "See https://example.com/post?id=42&utm_source=news&fbclid=abc"
+        assert clean_text(text) == "See https://example.com/post?id=42"
+
+    def test_strips_markdown_noise(self):
+        """Images keep their alt text; rules, emphasis and comments go."""
+        text = "**Bold** idea\n\n---\n![diagram](https://x.test/d.png)\n<!-- draft -->"
+        assert clean_text(text) == "Bold idea\n\ndiagram"
+
+    def test_collapses_whitespace(self):
+        """Runs of spaces and blank lines shrink to one."""
+        assert clean_text("a   b\t\tc\n\n\n\n\nd  ") == "a b c\n\nd"
+
+
+class TestCompact:
+    """Tests for compact()."""
+
+    def test_short_text_is_only_cleaned(self):
+        """Text within budget is returned cleaned, not excerpted."""
+        result = compact("A  short   note.", 100)
+        assert result.text == "A short note."
+        assert not result.excerpted
+
+    def test_long_text_fits_budget(self):
+        """Long input is excerpted to the budget, keeping head and tail."""
+        text = _long_text()
+        result = compact(text, 400)
+
+        assert result.excerpted
+        assert result.tokens <= 400 < result.original_tokens
+        assert result.text.startswith(text.split(". ")[0])
+        assert result.text.endswith(text.rsplit(". ", 1)[1])
+        assert OMISSION in result.text
+
+    def test_cjk_counts_denser(self):
+        """CJK characters are budgeted about one token each."""
+        assert estimate_tokens("数据库性能优化") == 7
+        result = compact("这是一个关于数据库性能优化的笔记。" * 200, 300)
+        assert result.tokens <= 300
+        assert len(result.text) < 400
+
+    def test_unpunctuated_text_is_cut(self):
+        """A single unbroken run is cut to the budget."""
+        result = compact("x" * 9000, 100)
+        assert result.tokens <= 100
+        assert result.text.endswith(OMISSION)
+
+    def test_uses_given_tokenizer(self):
+        """The budget is measured with the caller's counter."""
+        result = compact(_long_text(50), 60, lambda text: len(text.split()))
+        assert len(result.text.split()) <= 60
+
+
+class TestEnrichmentPrompt:
+    """Tests for the enrichment prompt and messages."""
+
+    def test_excerpt_is_flagged(self):
+        """Excerpted input is announced to the model."""
+        assert "excerpted" in build_enrichment_user_prompt(_long_text(2000))
+        assert "excerpted" not in build_enrichment_user_prompt("A short note.")
+
+    def test_system_prompt_is_cache_breakpoint(self):
+        """With cache_prefix the static system prompt carries cache_control."""
+        PromptLoader.load()
+        system, user = build_enrichment_messages("A short note.", cache_prefix=True)
+
+        assert system["content"] == [{
+            "type": "text",
+            "text": PromptLoader.get_enrichment_prompt(),
+            "cache_control": {"type": "ephemeral"},
+        }]
+        assert "A short note." in user["content"]
+
+    def test_prefix_identical_across_items(self):
+        """Different items share the same leading system message."""
+        PromptLoader.load()
+        first = build_enrichment_messages("First note.")
+        second = build_enrichment_messages("Second note.")
+
+        assert first[0] == second[0] == {
+            "role": "system", "content": PromptLoader.get_enrichment_prompt()
+        }
+
+    def test_batch_numbers_items_and_shares_prefix(self):
+        """Batch messages number each item after the same system message."""
+        PromptLoader.load()
+        system, user = build_batch_enrichment_messages(["First note.", _long_text(2000)])
+
+        assert system == build_enrichment_messages("First note.")[0]
+        assert "=== Item 1 ===\nFirst note." in user["content"]
+        assert "=== Item 2 ===\n(Excerpted" in user["content"]
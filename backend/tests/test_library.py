@@ -1,10 +1,17 @@
 """Library API integration tests."""
 
+from datetime import datetime, timezone
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import update
+from app.api.page_cache import PageCache
+from app.api.responses import ORJSONResponse
+from app.api.schemas.items import TagInItem
+from app.api.schemas.library import LibraryItemResponse, LibraryResponse, PaginationInfo
 from app.infrastructure.persistence.models.item_model import ItemModel
+from app.infrastructure.persistence.repositories.item_repository_impl import LIBRARY_PREVIEW_CHARS
 
 
 @pytest.fixture
@@ -153,3 +160,151 @@ class TestGetLibrary:
         # Check descending order by confirmedAt
         for i in range(len(items) - 1):
             assert items[i]["confirmedAt"] >= items[i + 1]["confirmedAt"]
+
+
+    async def test_library_returns_raw_text_preview(
+        self, client: AsyncClient, dev_user_headers: dict
+    ):
+        """Long texts are cut to a preview and flagged; short ones are whole."""
+        long_text = "x" * 2000
+        for text in (long_text, "short note"):
+            response = await client.post(
+                "/api/v1/items",
+                json={"rawText": text, "enrich": False},
+                headers=dev_user_headers,
+            )
+            assert response.status_code == 201
+
+        response = await client.get("/api/v1/library", headers=dev_user_headers)
+        by_text = {item["rawText"][:5]: item for item in response.json()["items"]}
+        assert len(by_text["xxxxx"]["rawText"]) == LIBRARY_PREVIEW_CHARS
+        assert by_text["xxxxx"]["rawTextTruncated"] is True
+        assert by_text["short"]["rawText"] == "short note"
+        assert by_text["short"]["rawTextTruncated"] is False
+
+class TestLibraryConditionalRequests:
+    """Tests for library ETags and the versioned page cache."""
+
+    async def test_library_returns_etag(
+        self, client: AsyncClient, archived_items: list, dev_user_headers: dict
+    ):
+        """Library pages carry a strong ETag and require revalidation."""
+        response = await client.get("/api/v1/library", headers=dev_user_headers)
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('"lib-')
+        assert response.headers["cache-control"] == "private, no-cache"
+
+    async def test_matching_if_none_match_returns_304(
+        self, client: AsyncClient, archived_items: list, dev_user_headers: dict
+    ):
+        """Unchanged library answers 304 with no body."""
+        first = await client.get("/api/v1/library", headers=dev_user_headers)
+        etag = first.headers["etag"]
+
+        response = await client.get(
+            "/api/v1/library",
+            headers={**dev_user_headers, "If-None-Match": etag},
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    async def test_etag_differs_per_page(
+        self, client: AsyncClient, archived_items: list, dev_user_headers: dict
+    ):
+        """Different limits (or cursors) are different representations."""
+        a = await client.get("/api/v1/library?limit=2", headers=dev_user_headers)
+        b = await client.get("/api/v1/library?limit=3", headers=dev_user_headers)
+        assert a.headers["etag"] != b.headers["etag"]
+
+    async def test_library_change_invalidates_etag(
+        self, client: AsyncClient, archived_items: list, dev_user_headers: dict
+    ):
+        """Discarding an archived item bumps the version and the ETag."""
+        first = await client.get("/api/v1/library", headers=dev_user_headers)
+        etag = first.headers["etag"]
+
+        response = await client.patch(
+            f"/api/v1/items/{archived_items[0]['id']}",
+            json={"action": "discard"},
+            headers=dev_user_headers,
+        )
+        assert response.status_code == 200
+
+        response = await client.get(
+            "/api/v1/library",
+            headers={**dev_user_headers, "If-None-Match": etag},
+        )
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        ids = [item["id"] for item in response.json()["items"]]
+        assert archived_items[0]["id"] not in ids
+
+    async def test_direct_save_invalidates_cached_page(
+        self, client: AsyncClient, dev_user_headers: dict
+    ):
+        """A direct save is visible immediately despite the page cache."""
+        first = await client.get("/api/v1/library", headers=dev_user_headers)
+        assert first.json()["items"] == []
+
+        response = await client.post(
+            "/api/v1/items",
+            json={"rawText": "Saved directly", "enrich": False},
+            headers=dev_user_headers,
+        )
+        assert response.status_code == 201
+        item_id = response.json()["id"]
+
+        response = await client.get("/api/v1/library", headers=dev_user_headers)
+        assert [item["id"] for item in response.json()["items"]] == [item_id]
+
+
+class TestPageCache:
+    """Unit tests for the bounded page cache."""
+
+    def test_evicts_least_recently_used(self):
+        """Oldest untouched entry goes first once full."""
+        cache = PageCache(max_entries=2)
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        cache.get("a")
+        cache.put("c", b"3")
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1"
+        assert len(cache) == 2
+
+    def test_zero_size_disables(self):
+        """A size of 0 never stores anything."""
+        cache = PageCache(max_entries=0)
+        cache.put("a", b"1")
+        assert cache.get("a") is None
+
+
+class TestORJSONResponse:
+    """Unit tests for the orjson list-endpoint response."""
+
+    def test_matches_pydantic_json(self):
+        """Constructed models render byte-for-byte like model_dump_json()."""
+        now = datetime(2026, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc)
+        page = LibraryResponse.model_construct(
+            items=[
+                LibraryItemResponse.model_construct(
+                    id="item-1",
+                    rawText="héllo \"world\"",
+                    title=None,
+                    summary="s",
+                    tags=[TagInItem.model_construct(id="t1", name="python", color="blue")],
+                    status="ARCHIVED",
+                    sourceType=None,
+                    createdAt=now,
+                    confirmedAt=now,
+                    attachmentCount=2,
+                )
+            ],
+            pagination=PaginationInfo.model_construct(cursor=None, hasMore=False),
+        )
+
+        body = ORJSONResponse(page).body
+
+        assert body == page.model_dump_json().encode()
+        assert b'"2026-01-02T03:04:05.123456Z"' in body
@@ -0,0 +1,76 @@
+"""Tests for Prometheus metrics collection."""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.api.page_cache import PageCache
+from app.domain.repositories.outbox_repository import OutboxQueueStats
+from app.infrastructure.enrichment.outbox_metrics import OutboxMetricsSampler
+
+
+def _value(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@asynccontextmanager
+async def _fake_session_context(role=None):
+    yield MagicMock()
+
+
+class TestOutboxMetricsSampler:
+    """Tests for the outbox gauge sampler."""
+
+    @pytest.mark.asyncio
+    async def test_sample_sets_depth_and_oldest_age(self):
+        """Counts are published per status, missing statuses read 0."""
+        stats = OutboxQueueStats(
+            counts_by_status={"PENDING": 7, "IN_PROGRESS": 2},
+            oldest_pending_run_at=datetime.now(timezone.utc) - timedelta(seconds=90),
+        )
+        repo = MagicMock()
+        repo.get_queue_stats = AsyncMock(return_value=stats)
+
+        module = "app.infrastructure.enrichment.outbox_metrics"
+        with patch(f"{module}.get_db_session_context", _fake_session_context), \
+             patch(f"{module}.SQLAlchemyOutboxRepository", return_value=repo):
+            await OutboxMetricsSampler().sample_once()
+
+        assert _value("litevault_outbox_jobs", status="PENDING") == 7
+        assert _value("litevault_outbox_jobs", status="IN_PROGRESS") == 2
+        assert _value("litevault_outbox_jobs", status="DEAD") == 0
+        assert 89 <= _value("litevault_outbox_oldest_pending_age_seconds") < 120
+
+    @pytest.mark.asyncio
+    async def test_empty_queue_has_zero_age(self):
+        """No runnable job means an age of 0, not a stale value."""
+        repo = MagicMock()
+        repo.get_queue_stats = AsyncMock(
+            return_value=OutboxQueueStats(counts_by_status={}, oldest_pending_run_at=None)
+        )
+
+        module = "app.infrastructure.enrichment.outbox_metrics"
+        with patch(f"{module}.get_db_session_context", _fake_session_context), \
+             patch(f"{module}.SQLAlchemyOutboxRepository", return_value=repo):
+            await OutboxMetricsSampler().sample_once()
+
+        assert _value("litevault_outbox_jobs", status="PENDING") == 0
+        assert _value("litevault_outbox_oldest_pending_age_seconds") == 0
+
+
+class TestCacheMetrics:
+    """Tests for page cache hit/miss counters."""
+
+    def test_counts_hits_and_misses(self):
+        """Lookups are counted under the cache's name."""
+        cache = PageCache(max_entries=4, name="test-cache")
+        cache.put("a", b"1")
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+
+        assert _value("litevault_cache_requests_total", cache="test-cache", result="hit") == 2
+        assert _value("litevault_cache_requests_total", cache="test-cache", result="miss") == 1
@@ -0,0 +1,148 @@
+"""Tests for the pure-ASGI request ID and query profiling middleware."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, text
+from starlette.requests import Request
+
+from app.api.dependencies import query_budget
+from app.api.middleware import (
+    QueryBudgetExceeded,
+    QueryProfileMiddleware,
+    RequestIdMiddleware,
+    get_request_id,
+)
+from app.config import settings
+
+
+def _make_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestIdMiddleware)
+
+    @app.get("/context")
+    async def context(request: Request) -> dict:
+        return {"var": get_request_id(), "state": request.state.request_id}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            for i in range(3):
+                yield f"{i}:{get_request_id()}\n".encode()
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    @app.get("/explicit")
+    async def explicit() -> JSONResponse:
+        return JSONResponse({}, headers={"X-Request-Id": "stale"})
+
+    return app
+
+
+@pytest.fixture
+async def client():
+    transport = ASGITransport(app=_make_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+class TestRequestIdMiddleware:
+    """Tests for RequestIdMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_generates_id_visible_to_handler(self, client: AsyncClient):
+        """A generated ID reaches the context var, request.state and the header."""
+        response = await client.get("/context")
+        request_id = response.headers["X-Request-Id"]
+        assert request_id.startswith("req-")
+        assert response.json() == {"var": request_id, "state": request_id}
+
+    @pytest.mark.asyncio
+    async def test_propagates_incoming_id(self, client: AsyncClient):
+        """An incoming X-Request-Id is reused."""
+        response = await client.get("/context", headers={"X-Request-Id": "abc-123"})
+        assert response.headers["X-Request-Id"] == "abc-123"
+        assert response.json()["var"] == "abc-123"
+
+    @pytest.mark.asyncio
+    async def test_streaming_response_keeps_context(self, client: AsyncClient):
+        """Streamed chunks pass through and still see the request ID."""
+        response = await client.get("/stream", headers={"X-Request-Id": "s-1"})
+        assert response.text == "0:s-1\n1:s-1\n2:s-1\n"
+        assert response.headers["X-Request-Id"] == "s-1"
+
+    @pytest.mark.asyncio
+    async def test_replaces_existing_header(self, client: AsyncClient):
+        """The header is set once, overriding any value the handler sent."""
+        response = await client.get("/explicit", headers={"X-Request-Id": "r-1"})
+        assert response.headers.get_list("X-Request-Id") == ["r-1"]
+
+    @pytest.mark.asyncio
+    async def test_context_is_reset_after_request(self, client: AsyncClient):
+        """The context var does not leak out of the request."""
+        await client.get("/context")
+        assert get_request_id() == ""
+
+
+def _make_profiled_app() -> FastAPI:
+    engine = create_engine("sqlite://")
+    app = FastAPI()
+    app.add_middleware(QueryProfileMiddleware)
+    app.add_middleware(RequestIdMiddleware)
+
+    @app.get("/queries/{n}", dependencies=[query_budget(3)])
+    async def run_queries(n: int) -> dict:
+        with engine.connect() as conn:
+            for _ in range(n):
+                conn.execute(text("SELECT 1"))
+        return {}
+
+    return app
+
+
+@pytest.fixture
+async def profiled_client():
+    transport = ASGITransport(app=_make_profiled_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+class TestQueryProfileMiddleware:
+    """Tests for per-request query counting and budgets."""
+
+    @pytest.mark.asyncio
+    async def test_server_timing_reports_statement_count(self, profiled_client: AsyncClient):
+        """Statements run by the handler show up in Server-Timing."""
+        response = await profiled_client.get("/queries/2")
+        assert response.status_code == 200
+        assert 'desc="2 queries"' in response.headers["Server-Timing"]
+
+    @pytest.mark.asyncio
+    async def test_budget_exceeded_raises_when_enforced(
+        self, profiled_client: AsyncClient, monkeypatch
+    ):
+        """Going over the declared budget fails the request in enforce mode."""
+        monkeypatch.setattr(settings, "db_query_budget_enforce", True)
+        with pytest.raises(QueryBudgetExceeded, match="ran 4 SQL statements"):
+            await profiled_client.get("/queries/4")
+
+    @pytest.mark.asyncio
+    async def test_budget_exceeded_only_warns_by_default(
+        self, profiled_client: AsyncClient, monkeypatch, caplog
+    ):
+        """Outside enforce mode the response is served and a warning logged."""
+        monkeypatch.setattr(settings, "db_query_budget_enforce", False)
+        response = await profiled_client.get("/queries/4")
+        assert response.status_code == 200
+        assert "budget 3" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_slow_sampled_request_dumps_statements(
+        self, profiled_client: AsyncClient, monkeypatch, caplog
+    ):
+        """Sampled slow requests log their statement list."""
+        monkeypatch.setattr(settings, "db_slow_request_sql_sample_rate", 1.0)
+        monkeypatch.setattr(settings, "http_slow_request_ms", 0)
+        await profiled_client.get("/queries/1")
+        assert "Slow request SQL" in caplog.text
+        assert "SELECT 1" in caplog.text
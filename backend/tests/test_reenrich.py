@@ -0,0 +1,74 @@
+"""Tests for the re-enrichment backfill selection and checkpoint."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cli.reenrich import _load_checkpoint, _save_checkpoint
+from app.infrastructure.persistence.models import ItemModel
+from app.infrastructure.persistence.repositories.item_repository_impl import (
+    SQLAlchemyItemRepository,
+)
+
+FILTERS = {"user_id": None, "confirmed_from": "2026-01-01T00:00:00+00:00", "version": None}
+
+
+class TestCheckpoint:
+    """Tests for checkpoint resume."""
+
+    def test_resumes_with_same_filters(self, tmp_path):
+        """A saved cursor is picked up by the next run."""
+        path = tmp_path / "checkpoint.json"
+        _save_checkpoint(path, {"filters": FILTERS, "after_id": "item-42", "queued": 42})
+
+        checkpoint = _load_checkpoint(path, FILTERS, restart=False)
+        assert (checkpoint["after_id"], checkpoint["queued"]) == ("item-42", 42)
+
+    def test_restart_ignores_checkpoint(self, tmp_path):
+        """--restart starts from the beginning."""
+        path = tmp_path / "checkpoint.json"
+        _save_checkpoint(path, {"filters": FILTERS, "after_id": "item-42", "queued": 42})
+
+        assert _load_checkpoint(path, FILTERS, restart=True)["after_id"] is None
+
+    def test_rejects_other_filters(self, tmp_path):
+        """A checkpoint is never applied to a different selection."""
+        path = tmp_path / "checkpoint.json"
+        _save_checkpoint(path, {"filters": FILTERS, "after_id": "item-42", "queued": 42})
+
+        with pytest.raises(SystemExit):
+            _load_checkpoint(path, {**FILTERS, "user_id": "user-1"}, restart=False)
+
+
+@pytest.mark.asyncio
+async def test_backfill_skips_manual_items(
+    client: AsyncClient, dev_user_headers: dict, db_session: AsyncSession
+) -> None:
+    """Items saved without AI are only selected for the embedding backfill."""
+    manual = await client.post(
+        "/api/v1/items",
+        json={"rawText": "Saved without AI", "enrich": False},
+        headers=dev_user_headers,
+    )
+    enriched = await client.post(
+        "/api/v1/items",
+        json={"rawText": "Enriched note"},
+        headers=dev_user_headers,
+    )
+    await db_session.execute(
+        update(ItemModel)
+        .where(ItemModel.id == enriched.json()["id"])
+        .values(status="ARCHIVED", enrichment_version="old")
+    )
+    await db_session.commit()
+
+    repo = SQLAlchemyItemRepository(db_session)
+    filters = {"user_id": dev_user_headers["X-Dev-User-Id"], "exclude_version": "new"}
+    assert await repo.list_ids_for_reenrichment_system(None, 10, **filters) == [
+        enriched.json()["id"]
+    ]
+    assert await repo.count_for_reenrichment_system(**filters) == 1
+    assert set(
+        await repo.list_ids_for_reenrichment_system(None, 10, ai_only=False, **filters)
+    ) == {manual.json()["id"], enriched.json()["id"]}
@@ -1,10 +1,21 @@
 """Search API integration tests."""
 
+from datetime import datetime, timezone
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import update
+
+from app.infrastructure.embeddings.provider_interface import content_hash, embedding_text
+from app.infrastructure.embeddings.stub_provider import MODEL_LABEL, hash_embedding
+from app.infrastructure.persistence.models.item_embedding_model import ItemEmbeddingModel
 from app.infrastructure.persistence.models.item_model import ItemModel
+from app.infrastructure.persistence.models.outbox_model import EnrichmentOutboxModel
+from app.infrastructure.persistence.models.user_model import UserModel
+from app.infrastructure.persistence.repositories.item_embedding_repository_impl import (
+    SQLAlchemyItemEmbeddingRepository,
+)
 
 
 @pytest.fixture
@@ -72,6 +83,20 @@ async def search_items(client: AsyncClient, dev_user_headers: dict, db_session:
     return items
 
 
+@pytest.fixture
+async def embedded_items(search_items: list, db_session: AsyncSession):
+    """Store stub embeddings for search_items, as the worker's embedding jobs would."""
+    repo = SQLAlchemyItemEmbeddingRepository(db_session)
+    for data in search_items:
+        item = await db_session.get(ItemModel, data["id"])
+        text = embedding_text(item.title, item.summary, item.raw_text)
+        await repo.upsert(
+            item.id, item.user_id, MODEL_LABEL, content_hash(text), hash_embedding(text)
+        )
+    await db_session.commit()
+    return search_items
+
+
 class TestSearchTagOnlyMode:
     """Tests for tag-only search mode (query starts with #)."""
 
@@ -280,6 +305,238 @@ class TestSearchPagination:
             assert items[i]["confirmedAt"] >= items[i + 1]["confirmedAt"]
 
 
+class TestSearchSemanticMode:
+    """Tests for semantic and hybrid search (stub embeddings)."""
+
+    async def test_confirm_queues_embedding_job(
+        self, search_items: list, db_session: AsyncSession
+    ):
+        """Confirming an item queues its embedding job."""
+        result = await db_session.execute(
+            select(EnrichmentOutboxModel.item_id).where(
+                EnrichmentOutboxModel.job_type == "embedding"
+            )
+        )
+        assert set(result.scalars().all()) == {item["id"] for item in search_items}
+
+    async def test_direct_save_queues_embedding_job(
+        self, client: AsyncClient, dev_user_headers: dict, db_session: AsyncSession
+    ):
+        """Items saved without AI are embedded too."""
+        response = await client.post(
+            "/api/v1/items",
+            json={"rawText": "Manual note about vector search", "enrich": False},
+            headers=dev_user_headers,
+        )
+        assert response.status_code == 201
+        result = await db_session.execute(
+            select(EnrichmentOutboxModel.job_type).where(
+                EnrichmentOutboxModel.item_id == response.json()["id"]
+            )
+        )
+        assert result.scalars().all() == ["embedding"]
+
+    async def test_semantic_ranks_nearest_first(
+        self, client: AsyncClient, embedded_items: list, dev_user_headers: dict
+    ):
+        """Semantic mode returns items close to the query, nearest first."""
+        response = await client.get(
+            "/api/v1/search?q=meetings%20deadlines&mode=semantic",
+            headers=dev_user_headers,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["mode"] == "semantic"
+        assert [item["title"] for item in data["items"]] == ["Work Meeting Notes"]
+
+    async def test_semantic_without_close_items_returns_empty(
+        self, client: AsyncClient, embedded_items: list, dev_user_headers: dict
+    ):
+        """Items beyond SEMANTIC_SEARCH_MAX_DISTANCE are not returned."""
+        response = await client.get(
+            "/api/v1/search?q=zzz%20qqq&mode=semantic",
+            headers=dev_user_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["items"] == []
+
+    async def test_hybrid_merges_vector_and_lexical_matches(
+        self, client: AsyncClient, embedded_items: list, dev_user_headers: dict
+    ):
+        """Hybrid mode ranks items matched both ways first."""
+        response = await client.get(
+            "/api/v1/search?q=work&mode=hybrid",
+            headers=dev_user_headers,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["mode"] == "hybrid"
+        assert [item["title"] for item in data["items"]] == [
+            "Work Meeting Notes",
+            "Personal Journal",
+        ]
+
+    async def test_ranked_pagination_with_cursor(
+        self, client: AsyncClient, embedded_items: list, dev_user_headers: dict
+    ):
+        """Ranked results page by offset cursor without duplicates."""
+        response = await client.get(
+            "/api/v1/search?q=work&mode=hybrid&limit=1",
+            headers=dev_user_headers,
+        )
+        data = response.json()
+        assert data["pagination"]["hasMore"] is True
+
+        response = await client.get(
+            f"/api/v1/search?q=work&mode=hybrid&limit=1&cursor={data['pagination']['cursor']}",
+            headers=dev_user_headers,
+        )
+        data2 = response.json()
+        assert data2["items"][0]["id"] != data["items"][0]["id"]
+        assert data2["pagination"]["hasMore"] is False
+
+    async def test_tag_query_ignores_mode(
+        self, client: AsyncClient, embedded_items: list, dev_user_headers: dict
+    ):
+        """'#' queries stay tag-only in every mode."""
+        response = await client.get(
+            "/api/v1/search?q=%23work&mode=semantic",
+            headers=dev_user_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["mode"] == "tag_only"
+
+
+NOISE_USERS = 50
+NOISE_ITEMS_PER_USER = 40
+
+
+@pytest.fixture
+async def noise_vectors(embedded_items: list, db_session: AsyncSession):
+    """Other users' archived items, embedded closer to the test query than ours.
+
+    The shared HNSW index fills its candidate list with these before it
+    reaches the test user's three vectors.
+    """
+    text = "Meetings deadlines\n\nMeetings and deadlines"
+    vector = hash_embedding(text)
+    now = datetime.now(timezone.utc)
+    users, items, embeddings = [], [], []
+    for n in range(NOISE_USERS):
+        user_id = f"noise-user-{n}"
+        users.append({"id": user_id, "email": f"{user_id}@test.local", "name": user_id})
+        for i in range(NOISE_ITEMS_PER_USER):
+            item_id = f"{user_id}-item-{i}"
+            items.append({
+                "id": item_id, "user_id": user_id, "raw_text": text, "title": "Meetings",
+                "status": "ARCHIVED", "tags": [], "confirmed_at": now,
+            })
+            embeddings.append({
+                "item_id": item_id, "user_id": user_id, "model": MODEL_LABEL,
+                "content_hash": content_hash(text), "embedding": vector,
+            })
+    await db_session.execute(insert(UserModel), users)
+    await db_session.execute(insert(ItemModel), items)
+    await db_session.execute(insert(ItemEmbeddingModel), embeddings)
+    await db_session.commit()
+    return embedded_items
+
+
+class TestSemanticSearchRecall:
+    """Per-user recall when many users share the vector index."""
+
+    async def test_small_user_finds_nearest_item(
+        self, client: AsyncClient, noise_vectors: list, dev_user_headers: dict
+    ):
+        """Other users' closer vectors do not crowd out a small user's results."""
+        response = await client.get(
+            "/api/v1/search?q=meetings%20deadlines&mode=semantic",
+            headers=dev_user_headers,
+        )
+        assert response.status_code == 200
+        assert [item["title"] for item in response.json()["items"]] == ["Work Meeting Notes"]
+
+    async def test_index_path_returns_only_the_users_items(
+        self, noise_vectors: list, db_session: AsyncSession
+    ):
+        """Users above the exact-search size go through the HNSW branch.
+
+        What the index finds depends on scan settings; it must never
+        return another user's items.
+        """
+        repo = SQLAlchemyItemEmbeddingRepository(db_session)
+        found = await repo.nearest(
+            "noise-user-0", hash_embedding("meetings"), 10, 2.0, exact_max_items=0
+        )
+        assert all(item_id.startswith("noise-user-0-") for item_id, _ in found)
+
+
+class TestSearchFacets:
+    """Tests for tag facets on search results."""
+
+    async def test_tag_search_facets_from_co_occurrence(
+        self, client: AsyncClient, search_items: list, dev_user_headers: dict
+    ):
+        """'#work' facets count the tags applied together with 'work'."""
+        response = await client.get(
+            "/api/v1/search?q=%23work",
+            headers=dev_user_headers,
+        )
+        assert response.status_code == 200
+        facets = response.json()["facets"]
+        assert [(f["name"], f["count"]) for f in facets] == [("meetings", 1)]
+
+    async def test_tag_search_facets_skip_deleted_tags(
+        self, client: AsyncClient, search_items: list, dev_user_headers: dict
+    ):
+        """A deleted tag matching the query adds no counts."""
+        response = await client.get("/api/v1/search?q=%23meet", headers=dev_user_headers)
+        assert [f["name"] for f in response.json()["facets"]] == ["work"]
+
+        tags = (await client.get("/api/v1/tags", headers=dev_user_headers)).json()["tags"]
+        [meetings] = [tag["id"] for tag in tags if tag["name"] == "meetings"]
+        response = await client.delete(f"/api/v1/tags/{meetings}", headers=dev_user_headers)
+        assert response.status_code == 204
+
+        response = await client.get("/api/v1/search?q=%23meet", headers=dev_user_headers)
+        assert response.json()["facets"] == []
+
+    async def test_hybrid_facets_count_candidates(
+        self, client: AsyncClient, embedded_items: list, dev_user_headers: dict
+    ):
+        response = await client.get(
+            "/api/v1/search?q=work&mode=hybrid",
+            headers=dev_user_headers,
+        )
+        facets = {f["name"]: f["count"] for f in response.json()["facets"]}
+        assert facets == {"work": 1, "meetings": 1, "personal": 1}
+
+    async def test_combined_facets_count_lexical_matches(
+        self, client: AsyncClient, search_items: list, dev_user_headers: dict
+    ):
+        """Default searches count the tags of the matching items."""
+        response = await client.get("/api/v1/search?q=work&limit=1", headers=dev_user_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["mode"] == "combined"
+        assert data["pagination"]["hasMore"] is True
+        facets = {f["name"]: f["count"] for f in data["facets"]}
+        assert facets == {"work": 1, "meetings": 1, "personal": 1}
+
+    async def test_no_facets_for_later_pages(
+        self, client: AsyncClient, search_items: list, dev_user_headers: dict
+    ):
+        # '#e' matches the tags of all three items
+        response = await client.get("/api/v1/search?q=%23e&limit=1", headers=dev_user_headers)
+        data = response.json()
+        assert data["facets"] is not None
+        response = await client.get(
+            f"/api/v1/search?q=%23e&limit=1&cursor={data['pagination']['cursor']}",
+            headers=dev_user_headers,
+        )
+        assert response.json()["facets"] is None
+
+
 class TestSearchAuth:
     """Tests for search authentication."""
 
@@ -0,0 +1,197 @@
+"""Tests for the local tag vocabulary and vocabulary-based suggestions."""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.domain.entities.item import Item
+from app.domain.entities.item_tag_suggestion import SuggestionSource
+from app.domain.entities.tag import Tag
+from app.domain.value_objects import ItemStatus
+from app.infrastructure.enrichment.worker import EnrichmentWorker
+from app.infrastructure.lru_cache import VersionedLRUCache
+from app.infrastructure.tagging.service import get_tag_vocabulary
+from app.infrastructure.tagging.vocabulary import TagVocabulary, item_text, tag_key, terms
+
+
+def _tag(tag_id: str, name: str, usage_count: int = 1) -> Tag:
+    return Tag(
+        id=tag_id,
+        user_id="user-1",
+        name=name,
+        name_lower=name.lower(),
+        usage_count=usage_count,
+    )
+
+
+TAGS = [
+    _tag("meetings", "meetings", 3),
+    _tag("work", "work", 4),
+    _tag("python", "python", 2),
+    _tag("ml", "Machine-Learning"),
+    _tag("recipes", "recipes"),
+]
+
+TAGGED_ITEMS = [
+    ("Weekly sync\n\nDiscussed roadmap and deadlines with the team", ["meetings", "work"]),
+    ("Standup notes\n\nTeam blockers and deadlines", ["meetings", "work"]),
+    ("Quarterly planning\n\nRoadmap review with the team", ["work", "meetings"]),
+    ("Asyncio tips\n\nUsing asyncio gather in scripts", ["python"]),
+    ("Type hints\n\nGeneric types and protocols", ["python"]),
+    ("Pasta\n\nTomato sauce with basil", ["recipes"]),
+    ("Random thought\n\nNothing here", []),
+    ("Sklearn pipelines\n\nTraining a classifier", ["ml", "python"]),
+]
+
+
+@pytest.fixture
+def vocabulary() -> TagVocabulary:
+    return TagVocabulary(TAGS, TAGGED_ITEMS)
+
+
+class TestTerms:
+    """Tests for text normalization."""
+
+    def test_terms_drop_stopwords_numbers_and_plurals(self):
+        assert terms("The 3 Meetings about roadmaps, class") == {"meeting", "roadmap", "class"}
+
+    def test_tag_key_ignores_case_separators_and_plurals(self):
+        assert tag_key("Machine-Learning") == tag_key("machine learnings")
+
+    def test_item_text_falls_back_to_raw_text(self):
+        assert item_text("Title", None, "Raw note") == "Title\nRaw note"
+        assert item_text("Title", "Summary", "Raw note") == "Title\nSummary"
+
+
+class TestTagVocabulary:
+    """Tests for ranking and normalizing against a user's tags."""
+
+    @pytest.mark.parametrize(
+        "name, expected",
+        [
+            ("Meeting", "meetings"),
+            ("machine learning", "Machine-Learning"),
+            ("Pythons", "python"),
+            ("meetingz", "meetings"),
+        ],
+    )
+    def test_closest_maps_variants_to_existing_tag(self, vocabulary, name, expected):
+        assert vocabulary.closest(name).name == expected
+
+    @pytest.mark.parametrize("name", ["cooking", "ml"])
+    def test_closest_leaves_new_names_alone(self, vocabulary, name):
+        """Unrelated and short names are not forced onto a tag."""
+        assert vocabulary.closest(name) is None
+
+    def test_rank_uses_words_of_tagged_items(self, vocabulary):
+        """Words seen only on a tag's items suggest it, without its name."""
+        scores = vocabulary.suggest("Writing asyncio code")
+        assert [s.tag.name for s in scores] == ["python"]
+        assert 0 < scores[0].confidence < 1
+
+    def test_rank_pulls_in_co_occurring_tags(self, vocabulary):
+        """Tags already on the item boost the tags they appear with."""
+        scores = vocabulary.rank("Something unrelated", ["meetings"])
+        assert scores[0].tag.name == "work"
+        assert scores[0].confidence == 0.5
+        assert "meetings" not in {s.tag.id for s in scores}
+
+    def test_name_in_text_is_confident(self, vocabulary):
+        [score] = vocabulary.suggest("Collected recipes", limit=1)
+        assert score.tag.name == "recipes"
+        assert score.confidence >= 0.9
+
+    def test_suggest_applies_threshold(self, vocabulary):
+        assert vocabulary.suggest("nothing at all") == []
+
+    def test_name_confidence_for_new_names(self):
+        assert TagVocabulary.name_confidence("cooking", "I like cooking") == 0.9
+        assert TagVocabulary.name_confidence("cooking", "Gardening notes") == 0.0
+
+
+class TestGetTagVocabulary:
+    """Tests for the per-process vocabulary cache."""
+
+    @pytest.mark.asyncio
+    async def test_loaded_once_per_library_version(self):
+        vocabulary = TagVocabulary(TAGS, [])
+        load = AsyncMock(return_value=vocabulary)
+        module = "app.infrastructure.tagging.service"
+        with patch(f"{module}.load_tag_vocabulary", load), \
+             patch(f"{module}.tag_vocabulary_cache", VersionedLRUCache(2, name="test")):
+            assert await get_tag_vocabulary(None, "user-1", 1) is vocabulary
+            assert await get_tag_vocabulary(None, "user-1", 1) is vocabulary
+            assert load.await_count == 1
+
+            await get_tag_vocabulary(None, "user-1", 2)
+            assert load.await_count == 2
+
+
+def _item(title: str, summary: str, tags: list[str] | None = None) -> Item:
+    now = datetime.now(timezone.utc)
+    return Item(
+        id="item-1",
+        user_id="user-1",
+        raw_text="Raw",
+        status=ItemStatus.READY_TO_CONFIRM,
+        created_at=now,
+        updated_at=now,
+        title=title,
+        summary=summary,
+        tags=tags or [],
+    )
+
+
+class TestWorkerTagSuggestions:
+    """Tests for EnrichmentWorker._tag_suggestions()."""
+
+    async def _suggest(self, vocabulary, item, names, known=None, meta=None):
+        with patch(
+            "app.infrastructure.enrichment.worker.get_tag_vocabulary",
+            AsyncMock(return_value=vocabulary),
+        ):
+            return await EnrichmentWorker()._tag_suggestions(
+                None, item, names, set() if known is None else known, meta
+            )
+
+    @pytest.mark.asyncio
+    async def test_llm_names_normalized_to_existing_tags(self, vocabulary):
+        item = _item("Team sync", "Roadmap and deadlines")
+        suggestions = await self._suggest(vocabulary, item, ["Meeting", "cooking"])
+
+        by_name = {s.suggested_name: s for s in suggestions}
+        assert by_name["meetings"].source == SuggestionSource.AI
+        assert by_name["meetings"].meta == {"suggested_as": "Meeting"}
+        assert by_name["meetings"].confidence > 0.5
+        assert by_name["cooking"].confidence == 0.0
+        # The vocabulary adds "work"; "meetings" is not suggested twice
+        assert by_name["work"].source == SuggestionSource.SYSTEM
+        assert len(suggestions) == len(by_name) == 3
+
+    @pytest.mark.asyncio
+    async def test_duplicates_collapse_and_known_names_skipped(self, vocabulary):
+        """Variants of one tag yield one suggestion; known names none."""
+        item = _item("Notes", "Nothing special", tags=["python"])
+        suggestions = await self._suggest(
+            vocabulary,
+            item,
+            ["Meeting", "meetings", "Pythons"],
+            known={"python"},
+            meta={"reenrichment": "v2"},
+        )
+
+        assert [s.suggested_name for s in suggestions if s.source == SuggestionSource.AI] == [
+            "meetings"
+        ]
+        assert all(s.meta["reenrichment"] == "v2" for s in suggestions)
+
+    @pytest.mark.asyncio
+    async def test_empty_vocabulary_keeps_llm_names(self):
+        item = _item("Title", "Summary about gardening")
+        suggestions = await self._suggest(TagVocabulary([], []), item, ["gardening", "plants"])
+
+        assert [(s.suggested_name, s.confidence) for s in suggestions] == [
+            ("gardening", 0.9),
+            ("plants", 0.0),
+        ]
@@ -483,3 +483,144 @@ class TestSoftDelete:
         # Total should decrease by 1
         assert total_after == total_before - 1
 
+
+
+class TestSuggestTags:
+    """Tests for POST /tags/suggestions endpoint."""
+
+    async def _save_note(
+        self, client: AsyncClient, headers: dict, text: str, tag_ids: list[str]
+    ) -> None:
+        response = await client.post(
+            "/api/v1/items",
+            json={"rawText": text, "enrich": False, "tagIds": tag_ids},
+            headers=headers,
+        )
+        assert response.status_code == 201
+
+    async def _create_tag(self, client: AsyncClient, headers: dict, name: str) -> str:
+        response = await client.post("/api/v1/tags", json={"name": name}, headers=headers)
+        return response.json()["id"]
+
+    async def test_suggests_existing_tags_from_tagged_notes(
+        self, client: AsyncClient, dev_user_headers: dict
+    ):
+        """Words of a user's tagged notes suggest their tags, with confidence."""
+        python_id = await self._create_tag(client, dev_user_headers, "python")
+        recipes_id = await self._create_tag(client, dev_user_headers, "recipes")
+        await self._save_note(
+            client, dev_user_headers, "Asyncio gather tricks", [python_id]
+        )
+        await self._save_note(
+            client, dev_user_headers, "Tomato sauce with basil", [recipes_id]
+        )
+
+        response = await client.post(
+            "/api/v1/tags/suggestions",
+            json={"text": "More asyncio experiments"},
+            headers=dev_user_headers,
+        )
+        assert response.status_code == 200
+        suggestions = response.json()["suggestions"]
+        assert [s["id"] for s in suggestions] == [python_id]
+        assert 0 < suggestions[0]["confidence"] <= 1
+
+    async def test_excludes_chosen_tags(
+        self, client: AsyncClient, dev_user_headers: dict
+    ):
+        """Tags already chosen are not suggested again."""
+        tag_id = await self._create_tag(client, dev_user_headers, "Recipes")
+
+        response = await client.post(
+            "/api/v1/tags/suggestions",
+            json={"text": "New recipes to try", "tagIds": [tag_id]},
+            headers=dev_user_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["suggestions"] == []
+
+    async def test_suggest_requires_auth(self, client: AsyncClient):
+        response = await client.post("/api/v1/tags/suggestions", json={"text": "x"})
+        assert response.status_code == 401
+
+
+class TestRelatedTags:
+    """Tests for GET /tags/:id/related (co-occurrence matrix)."""
+
+    async def _create_tag(self, client: AsyncClient, headers: dict, name: str) -> str:
+        response = await client.post("/api/v1/tags", json={"name": name}, headers=headers)
+        return response.json()["id"]
+
+    async def _save_note(self, client: AsyncClient, headers: dict, tag_ids: list[str]) -> str:
+        response = await client.post(
+            "/api/v1/items",
+            json={"rawText": "Note", "enrich": False, "tagIds": tag_ids},
+            headers=headers,
+        )
+        assert response.status_code == 201
+        return response.json()["id"]
+
+    async def _related(self, client: AsyncClient, headers: dict, tag_id: str) -> dict:
+        response = await client.get(f"/api/v1/tags/{tag_id}/related", headers=headers)
+        assert response.status_code == 200
+        return {tag["name"]: tag["itemCount"] for tag in response.json()["tags"]}
+
+    async def test_counts_items_sharing_tags(
+        self, client: AsyncClient, dev_user_headers: dict
+    ):
+        """Related tags are ordered by the number of shared items."""
+        work = await self._create_tag(client, dev_user_headers, "work")
+        meetings = await self._create_tag(client, dev_user_headers, "meetings")
+        ideas = await self._create_tag(client, dev_user_headers, "ideas")
+        await self._save_note(client, dev_user_headers, [work, meetings])
+        await self._save_note(client, dev_user_headers, [work, meetings, ideas])
+        await self._save_note(client, dev_user_headers, [ideas])
+
+        response = await client.get(f"/api/v1/tags/{work}/related", headers=dev_user_headers)
+        assert [tag["name"] for tag in response.json()["tags"]] == ["meetings", "ideas"]
+        assert await self._related(client, dev_user_headers, work) == {
+            "meetings": 2,
+            "ideas": 1,
+        }
+        assert await self._related(client, dev_user_headers, ideas) == {
+            "work": 1,
+            "meetings": 1,
+        }
+
+    async def test_edit_and_discard_update_counts(
+        self, client: AsyncClient, dev_user_headers: dict
+    ):
+        """Changing an item's tags or discarding it updates the matrix."""
+        work = await self._create_tag(client, dev_user_headers, "work")
+        meetings = await self._create_tag(client, dev_user_headers, "meetings")
+        first = await self._save_note(client, dev_user_headers, [work, meetings])
+        second = await self._save_note(client, dev_user_headers, [work, meetings])
+
+        response = await client.patch(
+            f"/api/v1/items/{first}",
+            json={"tags": ["work", "travel"]},
+            headers=dev_user_headers,
+        )
+        assert response.status_code == 200
+        assert await self._related(client, dev_user_headers, work) == {
+            "meetings": 1,
+            "travel": 1,
+        }
+
+        response = await client.patch(
+            f"/api/v1/items/{second}",
+            json={"action": "discard"},
+            headers=dev_user_headers,
+        )
+        assert response.status_code == 200
+        assert await self._related(client, dev_user_headers, work) == {"travel": 1}
+        assert await self._related(client, dev_user_headers, meetings) == {}
+
+    async def test_related_unknown_tag(
+        self, client: AsyncClient, dev_user_headers: dict
+    ):
+        response = await client.get(
+            "/api/v1/tags/00000000-0000-0000-0000-000000000000/related",
+            headers=dev_user_headers,
+        )
+        assert response.status_code == 404
@@ -0,0 +1,166 @@
+"""Tests for image thumbnail derivatives."""
+
+import io
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from app.infrastructure.enrichment.worker import EnrichmentWorker
+from app.infrastructure.storage.thumbnails import (
+    ThumbnailError,
+    generate_thumbnail,
+    render_thumbnail,
+    thumbnail_key,
+)
+
+
+def _image_bytes(size: tuple[int, int], image_format: str = "JPEG", mode: str = "RGB") -> bytes:
+    output = io.BytesIO()
+    Image.new(mode, size, color="red").save(output, format=image_format)
+    return output.getvalue()
+
+
+class TestRenderThumbnail:
+    """Tests for render_thumbnail."""
+
+    def test_fits_bounding_box_and_keeps_aspect_ratio(self):
+        """Output fits max_px on the longest edge."""
+        data = render_thumbnail(io.BytesIO(_image_bytes((2000, 1000))), max_px=320)
+
+        with Image.open(io.BytesIO(data)) as thumb:
+            assert thumb.format == "WEBP"
+            assert thumb.size == (320, 160)
+
+    def test_jpeg_output_drops_alpha(self):
+        """Transparent PNGs are flattened for JPEG output."""
+        source = io.BytesIO(_image_bytes((500, 500), "PNG", "RGBA"))
+        data = render_thumbnail(source, max_px=100, image_format="JPEG")
+
+        with Image.open(io.BytesIO(data)) as thumb:
+            assert thumb.format == "JPEG"
+            assert thumb.mode == "RGB"
+
+    def test_rejects_oversized_source(self):
+        """Originals above the pixel limit are refused before decoding."""
+        source = io.BytesIO(_image_bytes((1000, 1000)))
+        with pytest.raises(ThumbnailError):
+            render_thumbnail(source, max_px=100, max_source_pixels=500_000)
+
+    def test_rejects_non_image(self):
+        """Undecodable input raises ThumbnailError."""
+        with pytest.raises(ThumbnailError):
+            render_thumbnail(io.BytesIO(b"not an image"), max_px=100)
+
+
+class TestGenerateThumbnail:
+    """Tests for generate_thumbnail storage flow."""
+
+    def test_reuses_existing_thumbnail(self):
+        """An already-derived thumbnail is not downloaded or rendered again."""
+        module = "app.infrastructure.storage.thumbnails"
+        with patch(f"{module}.head_object", return_value={"content_length": 10}), \
+             patch(f"{module}.download_object_to_file") as mock_download, \
+             patch(f"{module}.put_object") as mock_put:
+            key = generate_thumbnail("user/upload/photo.jpg")
+
+        assert key == thumbnail_key("user/upload/photo.jpg")
+        mock_download.assert_not_called()
+        mock_put.assert_not_called()
+
+    def test_streams_original_and_stores_thumbnail(self):
+        """The original is streamed to a file and the thumbnail stored under the derived key."""
+        original = _image_bytes((800, 600))
+
+        def fake_download(object_key, fileobj):
+            fileobj.write(original)
+
+        module = "app.infrastructure.storage.thumbnails"
+        with patch(f"{module}.head_object", return_value=None), \
+             patch(f"{module}.download_object_to_file", side_effect=fake_download), \
+             patch(f"{module}.put_object") as mock_put:
+            key = generate_thumbnail("user/upload/photo.jpg")
+
+        assert key == "derived/thumb/user/upload/photo.jpg.webp"
+        stored_key, body, content_type = mock_put.call_args.args
+        assert stored_key == key
+        assert content_type == "image/webp"
+        with Image.open(io.BytesIO(body)) as thumb:
+            assert max(thumb.size) == 320
+
+
+@asynccontextmanager
+async def _fake_session_context(role=None):
+    yield MagicMock()
+
+
+class TestThumbnailJob:
+    """Tests for the worker's thumbnail job handling."""
+
+    def _job(self, attempt_count: int = 1):
+        return SimpleNamespace(
+            id="job-1", item_id="item-1", upload_id="u1",
+            job_type="thumbnail", attempt_count=attempt_count,
+            claimed_at=datetime.now(timezone.utc),
+        )
+
+    async def _run(self, generate, session=None):
+        upload = SimpleNamespace(
+            id="u1", object_key="k1", status="COMPLETED", kind="image", thumb_key=None
+        )
+        upload_repo = MagicMock()
+        upload_repo.get_by_id_system = AsyncMock(return_value=upload)
+        upload_repo.set_thumb_key = AsyncMock(return_value=2)
+        outbox_repo = MagicMock()
+        outbox_repo.mark_completed = AsyncMock()
+        outbox_repo.mark_dead = AsyncMock()
+        outbox_repo.mark_failed = AsyncMock()
+        if session is None:
+            session = MagicMock()
+            session.commit = AsyncMock()
+
+        module = "app.infrastructure.enrichment.worker"
+        with patch(f"{module}.get_db_session_context", _fake_session_context), \
+             patch(f"{module}.SQLAlchemyOutboxRepository", return_value=outbox_repo), \
+             patch(f"{module}.SQLAlchemyUploadRepository", return_value=upload_repo), \
+             patch(f"{module}.generate_thumbnail", generate):
+            await EnrichmentWorker()._process_thumbnail_job(self._job(), session, outbox_repo)
+        return upload_repo, outbox_repo
+
+    @pytest.mark.asyncio
+    async def test_records_thumbnail_for_shared_object(self):
+        """A successful job stores thumb_key on every upload sharing the object."""
+        upload_repo, outbox_repo = await self._run(
+            MagicMock(return_value="derived/thumb/k1.webp")
+        )
+
+        upload_repo.set_thumb_key.assert_awaited_once_with("k1", "derived/thumb/k1.webp")
+        outbox_repo.mark_completed.assert_awaited_once_with("job-1")
+
+    @pytest.mark.asyncio
+    async def test_claim_committed_before_image_work(self):
+        """No connection is held while the thumbnail is generated."""
+        committed = []
+
+        def generate(object_key):
+            committed.append(session.commit.await_count)
+            return "derived/thumb/k1.webp"
+
+        session = MagicMock()
+        session.commit = AsyncMock()
+        _, outbox_repo = await self._run(generate, session)
+
+        assert committed == [1]
+        outbox_repo.mark_completed.assert_awaited_once_with("job-1")
+
+    @pytest.mark.asyncio
+    async def test_undecodable_image_is_not_retried(self):
+        """ThumbnailError marks the job dead immediately."""
+        _, outbox_repo = await self._run(MagicMock(side_effect=ThumbnailError("bad")))
+
+        outbox_repo.mark_dead.assert_awaited_once()
+        assert outbox_repo.mark_dead.call_args.args[1] == "THUMBNAIL_UNSUPPORTED"
+        outbox_repo.mark_failed.assert_not_called()
@@ -0,0 +1,186 @@
+"""Tests for the upload reaper and batched object deletion."""
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.infrastructure.storage.s3_client import DELETE_OBJECTS_MAX_KEYS, delete_objects
+from app.infrastructure.storage.upload_reaper import UploadReaper
+
+
+class TestDeleteObjects:
+    """Tests for delete_objects batching."""
+
+    def test_splits_keys_into_max_size_batches(self):
+        """Keys are sent in chunks of at most 1,000 per DeleteObjects call."""
+        client = MagicMock()
+        client.delete_objects.return_value = {}
+        keys = [f"user/{i}/file.txt" for i in range(DELETE_OBJECTS_MAX_KEYS * 2 + 5)]
+
+        with patch("app.infrastructure.storage.s3_client.get_s3_client", return_value=client):
+            failed = delete_objects(keys)
+
+        assert failed == []
+        assert client.delete_objects.call_count == 3
+        sizes = [
+            len(call.kwargs["Delete"]["Objects"])
+            for call in client.delete_objects.call_args_list
+        ]
+        assert sizes == [DELETE_OBJECTS_MAX_KEYS, DELETE_OBJECTS_MAX_KEYS, 5]
+
+    def test_reports_failed_keys_but_ignores_missing(self):
+        """Per-key errors are returned, except NoSuchKey which counts as deleted."""
+        client = MagicMock()
+        client.delete_objects.return_value = {
+            "Errors": [
+                {"Key": "a", "Code": "NoSuchKey", "Message": "missing"},
+                {"Key": "b", "Code": "AccessDenied", "Message": "denied"},
+            ]
+        }
+
+        with patch("app.infrastructure.storage.s3_client.get_s3_client", return_value=client):
+            failed = delete_objects(["a", "b", "c"])
+
+        assert failed == ["b"]
+
+    def test_empty_key_list_makes_no_calls(self):
+        """No request is made when there is nothing to delete."""
+        client = MagicMock()
+        with patch("app.infrastructure.storage.s3_client.get_s3_client", return_value=client):
+            assert delete_objects([]) == []
+        client.delete_objects.assert_not_called()
+
+
+@asynccontextmanager
+async def _fake_session_context(role=None):
+    yield MagicMock()
+
+
+class TestUploadReaper:
+    """Tests for UploadReaper purge logic."""
+
+    @pytest.mark.asyncio
+    async def test_purge_skips_rows_whose_objects_failed(self):
+        """Rows are hard-deleted only when their object was removed."""
+        uploads = [
+            SimpleNamespace(id="u1", object_key="k1", thumb_key=None),
+            SimpleNamespace(id="u2", object_key="k2", thumb_key=None),
+        ]
+        upload_repo = MagicMock()
+        upload_repo.list_reapable = AsyncMock(return_value=list(uploads))
+        upload_repo.get_by_ids_for_update_system = AsyncMock(return_value=[])
+        upload_repo.hard_delete_many = AsyncMock(return_value=1)
+        upload_repo.count_object_references = AsyncMock(return_value={})
+        attachment_repo = MagicMock()
+        attachment_repo.list_deleted_before = AsyncMock(return_value=[])
+        attachment_repo.hard_delete_by_upload_ids = AsyncMock(return_value=0)
+
+        module = "app.infrastructure.storage.upload_reaper"
+        with patch(f"{module}.get_db_session_context", _fake_session_context), \
+             patch(f"{module}.SQLAlchemyUploadRepository", return_value=upload_repo), \
+             patch(f"{module}.SQLAlchemyItemAttachmentRepository", return_value=attachment_repo), \
+             patch(f"{module}.delete_objects", return_value=["k2"]):
+            scanned, purged, failed = await UploadReaper()._purge_batch(MagicMock(), 10)
+
+        assert (scanned, purged, failed) == (2, 1, 1)
+        upload_repo.hard_delete_many.assert_awaited_once_with(["u1"])
+        attachment_repo.hard_delete_by_upload_ids.assert_awaited_once_with(["u1"])
+
+    @pytest.mark.asyncio
+    async def test_purge_includes_uploads_of_deleted_attachments(self):
+        """Uploads whose attachment was soft-deleted are purged too."""
+        upload_repo = MagicMock()
+        upload_repo.list_reapable = AsyncMock(return_value=[])
+        upload_repo.get_by_ids_for_update_system = AsyncMock(
+            return_value=[SimpleNamespace(id="u3", object_key="k3", thumb_key=None)]
+        )
+        upload_repo.hard_delete_many = AsyncMock(return_value=1)
+        upload_repo.count_object_references = AsyncMock(return_value={})
+        attachment_repo = MagicMock()
+        attachment_repo.list_deleted_before = AsyncMock(
+            return_value=[SimpleNamespace(upload_id="u3")]
+        )
+        attachment_repo.hard_delete_by_upload_ids = AsyncMock(return_value=1)
+
+        module = "app.infrastructure.storage.upload_reaper"
+        with patch(f"{module}.get_db_session_context", _fake_session_context), \
+             patch(f"{module}.SQLAlchemyUploadRepository", return_value=upload_repo), \
+             patch(f"{module}.SQLAlchemyItemAttachmentRepository", return_value=attachment_repo), \
+             patch(f"{module}.delete_objects", return_value=[]) as mock_delete:
+            scanned, purged, failed = await UploadReaper()._purge_batch(MagicMock(), 10)
+
+        assert (scanned, purged, failed) == (1, 1, 0)
+        upload_repo.get_by_ids_for_update_system.assert_awaited_once_with(["u3"])
+        mock_delete.assert_called_once_with(["k3"])
+
+    @pytest.mark.asyncio
+    async def test_purge_keeps_objects_still_referenced(self):
+        """Shared objects survive until no other upload references them."""
+        uploads = [
+            SimpleNamespace(id="u1", object_key="shared", thumb_key=None),
+            SimpleNamespace(id="u2", object_key="solo", thumb_key=None),
+            SimpleNamespace(id="u3", object_key="solo", thumb_key=None),
+        ]
+        upload_repo = MagicMock()
+        upload_repo.list_reapable = AsyncMock(return_value=list(uploads))
+        upload_repo.get_by_ids_for_update_system = AsyncMock(return_value=[])
+        upload_repo.hard_delete_many = AsyncMock(return_value=3)
+        upload_repo.count_object_references = AsyncMock(return_value={"shared": 1})
+        attachment_repo = MagicMock()
+        attachment_repo.list_deleted_before = AsyncMock(return_value=[])
+        attachment_repo.hard_delete_by_upload_ids = AsyncMock(return_value=0)
+
+        module = "app.infrastructure.storage.upload_reaper"
+        with patch(f"{module}.get_db_session_context", _fake_session_context), \
+             patch(f"{module}.SQLAlchemyUploadRepository", return_value=upload_repo), \
+             patch(f"{module}.SQLAlchemyItemAttachmentRepository", return_value=attachment_repo), \
+             patch(f"{module}.delete_objects", return_value=[]) as mock_delete:
+            scanned, purged, failed = await UploadReaper()._purge_batch(MagicMock(), 10)
+
+        assert (scanned, purged, failed) == (3, 3, 0)
+        upload_repo.count_object_references.assert_awaited_once_with(
+            ["shared", "solo"], ["u1", "u2", "u3"]
+        )
+        mock_delete.assert_called_once_with(["solo"])
+        upload_repo.hard_delete_many.assert_awaited_once_with(["u1", "u2", "u3"])
+
+    @pytest.mark.asyncio
+    async def test_purge_deletes_thumbnails_with_originals(self):
+        """Derived thumbnails are deleted together with unreferenced originals."""
+        upload_repo = MagicMock()
+        upload_repo.list_reapable = AsyncMock(
+            return_value=[SimpleNamespace(id="u1", object_key="k1", thumb_key="derived/thumb/k1.webp")]
+        )
+        upload_repo.get_by_ids_for_update_system = AsyncMock(return_value=[])
+        upload_repo.hard_delete_many = AsyncMock(return_value=1)
+        upload_repo.count_object_references = AsyncMock(return_value={})
+        attachment_repo = MagicMock()
+        attachment_repo.list_deleted_before = AsyncMock(return_value=[])
+        attachment_repo.hard_delete_by_upload_ids = AsyncMock(return_value=0)
+
+        module = "app.infrastructure.storage.upload_reaper"
+        with patch(f"{module}.get_db_session_context", _fake_session_context), \
+             patch(f"{module}.SQLAlchemyUploadRepository", return_value=upload_repo), \
+             patch(f"{module}.SQLAlchemyItemAttachmentRepository", return_value=attachment_repo), \
+             patch(f"{module}.delete_objects", return_value=[]) as mock_delete:
+            await UploadReaper()._purge_batch(MagicMock(), 10)
+
+        mock_delete.assert_called_once_with(["k1", "derived/thumb/k1.webp"])
+
+    @pytest.mark.asyncio
+    async def test_run_once_reconciles_counts_page_by_page(self):
+        """Reconciliation walks item pages until the keyset is exhausted."""
+        reaper = UploadReaper()
+        reaper._expire_batch = AsyncMock(return_value=0)
+        reaper._purge_batch = AsyncMock(return_value=(0, 0, 0))
+        reaper._reconcile_batch = AsyncMock(
+            side_effect=[("item-500", 2), ("item-1000", 0), (None, 0)]
+        )
+
+        result = await reaper.run_once()
+
+        assert result.reconciled == 2
+        after_ids = [call.args[0] for call in reaper._reconcile_batch.await_args_list]
+        assert after_ids == [None, "item-500", "item-1000"]
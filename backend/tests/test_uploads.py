@@ -4,6 +4,7 @@ import pytest
 from unittest.mock import patch, MagicMock
 from httpx import AsyncClient
 from datetime import datetime, timezone, timedelta
+from uuid import uuid4
 
 from app.main import app
 from app.config import settings
@@ -176,6 +177,79 @@ class TestCompleteUpload:
         assert response.json()["detail"]["code"] == "UPLOAD_NOT_FOUND"
 
 
+class TestUploadDedup:
+    """Tests for checksum-based upload dedup."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_upload_reuses_stored_object(self, client: AsyncClient):
+        """A second upload of identical content skips the PUT and shares the object."""
+        checksum = f"sha256:{uuid4().hex}"
+        payload = {
+            "filename": "repeat.pdf",
+            "mimeType": "application/pdf",
+            "sizeBytes": 4096,
+            "kind": "file",
+            "checksum": checksum,
+        }
+        with patch("app.application.uploads.upload_service.generate_presigned_put_url") as mock_put, \
+             patch("app.application.uploads.upload_service.head_object") as mock_head:
+            
+            mock_put.return_value = {
+                "presigned_url": "http://minio:9000/test?sig=abc",
+                "headers_to_include": {"Content-Type": "application/pdf", "Content-Length": "4096"},
+                "expires_in_seconds": 3600,
+            }
+            mock_head.return_value = {
+                "content_length": 4096,
+                "content_type": "application/pdf",
+                "etag": '"test-etag"',
+            }
+            
+            item_response = await client.post(
+                "/api/v1/items",
+                json={"rawText": "Test item for dedup", "enrich": False},
+                headers={"X-Dev-User-Id": TEST_USER_ID},
+            )
+            item_id = item_response.json()["id"]
+            
+            # First upload goes through the normal PUT flow
+            first = await client.post(
+                "/api/v1/uploads/initiate",
+                json=payload,
+                headers={"X-Dev-User-Id": TEST_USER_ID},
+            )
+            assert first.status_code == 201
+            assert first.json()["deduplicated"] is False
+            await client.post(
+                "/api/v1/uploads/complete",
+                json={"uploadId": first.json()["uploadId"], "itemId": item_id},
+                headers={"X-Dev-User-Id": TEST_USER_ID},
+            )
+            
+            # Second upload of the same content is deduplicated
+            second = await client.post(
+                "/api/v1/uploads/initiate",
+                json=payload,
+                headers={"X-Dev-User-Id": TEST_USER_ID},
+            )
+            assert second.status_code == 201
+            data = second.json()
+            assert data["deduplicated"] is True
+            assert data["presignedPutUrl"] is None
+            assert data["objectKey"] == first.json()["objectKey"]
+            assert data["uploadId"] != first.json()["uploadId"]
+            assert mock_put.call_count == 1
+            
+            # Completing links a new attachment to the shared object
+            complete = await client.post(
+                "/api/v1/uploads/complete",
+                json={"uploadId": data["uploadId"], "itemId": item_id},
+                headers={"X-Dev-User-Id": TEST_USER_ID},
+            )
+            assert complete.status_code == 200
+            assert complete.json()["attachment"]["itemId"] == item_id
+
+
 class TestGetUpload:
     """Tests for GET /uploads/{id}."""
 
@@ -324,6 +398,62 @@ class TestDownloadUrl:
             assert "expiresAt" in data
             assert data["filename"] == "download-test.pdf"
 
+    @pytest.mark.asyncio
+    async def test_thumb_variant_falls_back_to_original(self, client: AsyncClient):
+        """variant=thumb serves the original until the thumbnail job has run."""
+        with patch("app.application.uploads.upload_service.generate_presigned_put_url") as mock_put, \
+             patch("app.application.uploads.upload_service.head_object") as mock_head, \
+             patch("app.application.uploads.upload_service.generate_presigned_get_url") as mock_get:
+            
+            mock_put.return_value = {
+                "presigned_url": "http://minio:9000/test?sig=abc",
+                "headers_to_include": {"Content-Type": "image/png", "Content-Length": "2048"},
+                "expires_in_seconds": 3600,
+            }
+            mock_head.return_value = {
+                "content_length": 2048,
+                "content_type": "image/png",
+                "etag": '"test-etag"',
+            }
+            mock_get.return_value = {
+                "presigned_url": "http://minio:9000/test?sig=download",
+                "expires_in_seconds": 3600,
+            }
+            
+            init_response = await client.post(
+                "/api/v1/uploads/initiate",
+                json={
+                    "filename": "photo.png",
+                    "mimeType": "image/png",
+                    "sizeBytes": 2048,
+                    "kind": "image",
+                },
+                headers={"X-Dev-User-Id": TEST_USER_ID},
+            )
+            upload_id = init_response.json()["uploadId"]
+            item_response = await client.post(
+                "/api/v1/items",
+                json={"rawText": "Item for thumbnail test", "enrich": False},
+                headers={"X-Dev-User-Id": TEST_USER_ID},
+            )
+            item_id = item_response.json()["id"]
+            complete_response = await client.post(
+                "/api/v1/uploads/complete",
+                json={"uploadId": upload_id, "itemId": item_id},
+                headers={"X-Dev-User-Id": TEST_USER_ID},
+            )
+            attachment_id = complete_response.json()["attachment"]["id"]
+            
+            response = await client.get(
+                f"/api/v1/attachments/{attachment_id}/download_url",
+                params={"variant": "thumb"},
+                headers={"X-Dev-User-Id": TEST_USER_ID},
+            )
+            
+            assert response.status_code == 200
+            assert response.json()["variant"] == "original"
+            assert mock_get.call_args.kwargs["object_key"] == init_response.json()["objectKey"]
+
 
 class TestListAttachments:
     """Tests for GET /items/{id}/attachments."""
@@ -88,6 +88,12 @@ export function ItemDetailModal({
     const [loadingAttachments, setLoadingAttachments] = useState(false);
     const { listAttachments } = useUpload();
 
+    // Full text (library list only provides a preview for long items)
+    const [fullRawText, setFullRawText] = useState<string | null>(null);
+    const [loadingFullText, setLoadingFullText] = useState(false);
+    const fullRawTextRef = useRef<string | null>(null);
+    const rawText = fullRawText ?? item.rawText;
+
     // Edit form state
     const [editTitle, setEditTitle] = useState(item.title || '');
     const [editSummary, setEditSummary] = useState(item.summary || '');
@@ -104,11 +110,15 @@ export function ItemDetailModal({
     // Reset to edit mode when modal opens
     useEffect(() => {
         if (isOpen) {
+            if (prevItemIdRef.current !== item.id) {
+                fullRawTextRef.current = null;
+                setFullRawText(null);
+            }
             setIsEditing(true);
             setEditTitle(item.title || '');
             setEditSummary(item.summary || '');
             setEditTags(item.tags.map(t => t.name));
-            setEditOriginalText(item.rawText);
+            setEditOriginalText(fullRawTextRef.current ?? item.rawText);
             setError(null);
 
             // Only clear URLs and attachments when switching to a different item
@@ -118,6 +128,23 @@ export function ItemDetailModal({
                 setDownloadUrls({});
                 setFetchedAttachments([]);
 
+                // Fetch full text so edits never save a truncated preview
+                if (item.rawTextTruncated) {
+                    setLoadingFullText(true);
+                    apiClient.getItem(item.id)
+                        .then(full => {
+                            fullRawTextRef.current = full.rawText;
+                            setFullRawText(full.rawText);
+                            setEditOriginalText(full.rawText);
+                        })
+                        .catch(err => {
+                            console.error('Failed to fetch item text:', err);
+                        })
+                        .finally(() => {
+                            setLoadingFullText(false);
+                        });
+                }
+
                 // Fetch attachments if item has any
                 if (item.attachmentCount && item.attachmentCount > 0) {
                     setLoadingAttachments(true);
@@ -158,7 +185,7 @@ export function ItemDetailModal({
         setEditTitle(item.title || '');
         setEditSummary(item.summary || '');
         setEditTags(item.tags.map(t => t.name));
-        setEditOriginalText(item.rawText);
+        setEditOriginalText(rawText);
         setError(null);
         setIsEditing(true);
     };
@@ -246,6 +273,7 @@ export function ItemDetailModal({
                 title: editTitle || null,
                 summary: editSummary || null,
                 rawText: editOriginalText,
+                rawTextTruncated: false,
                 tags: editTags.map(name => ({
                     id: '',
                     name,
@@ -373,6 +401,7 @@ export function ItemDetailModal({
                                     onChange={(e) => setEditOriginalText(e.target.value)}
                                     placeholder="Enter text..."
                                     rows={8}
+                                    disabled={loadingFullText}
                                     className="resize-y font-mono text-sm leading-relaxed"
                                 />
                             </div>
@@ -433,7 +462,7 @@ export function ItemDetailModal({
 
                             {/* Raw Content (scrollable) */}
                             <div className="prose prose-sm max-w-none text-muted-foreground max-h-60 overflow-y-auto">
-                                {item.rawText.split('\n').map((line, i) => (
+                                {rawText.split('\n').map((line, i) => (
                                     <p key={i} className="mb-2 last:mb-0">
                                         {line}
                                     </p>
@@ -548,7 +577,7 @@ export function ItemDetailModal({
                             </Button>
                             <Button
                                 onClick={handleSave}
-                                disabled={isSaving}
+                                disabled={isSaving || loadingFullText}
                                 className="bg-primary text-primary-foreground hover:bg-primary/90 shadow-sm"
                             >
                                 {isSaving
@@ -65,7 +65,8 @@ export interface RetryResponse {
 
 export interface LibraryItemResponse {
     id: string;
-    rawText: string;
+    rawText: string;  // Preview, cut when rawTextTruncated
+    rawTextTruncated?: boolean;
     title: string | null;
     summary: string | null;
     tags: TagInItem[];
@@ -9,16 +9,18 @@ export interface InitiateUploadRequest {
     sizeBytes: number;
     kind: 'image' | 'file';
     itemId?: string;
+    checksum?: string;
     idempotencyKey?: string;
 }
 
 export interface InitiateUploadResponse {
     uploadId: string;
     objectKey: string;
-    presignedPutUrl: string;
+    presignedPutUrl: string | null; // null when content was deduplicated
     headersToInclude: Record<string, string>;
     expiresAt: string;
     status: string;
+    deduplicated?: boolean;
 }
 
 export interface CompleteUploadRequest {
@@ -55,6 +57,7 @@ export interface CompleteUploadResponse {
 
 export interface DownloadUrlResponse {
     downloadUrl: string;
+    variant?: 'original' | 'thumb';
     expiresAt: string;
     filename: string;
     mimeType: string;
@@ -94,6 +97,18 @@ export function getFileKind(mimeType: string): 'image' | 'file' {
     return mimeType.startsWith('image/') ? 'image' : 'file';
 }
 
+// Helper: content hash used for server-side dedup (undefined if unavailable)
+export async function sha256Checksum(buffer: ArrayBuffer): Promise<string | undefined> {
+    if (typeof crypto === 'undefined' || !crypto.subtle) {
+        return undefined; // Insecure context: upload without dedup
+    }
+    const digest = await crypto.subtle.digest('SHA-256', buffer);
+    const hex = Array.from(new Uint8Array(digest))
+        .map(b => b.toString(16).padStart(2, '0'))
+        .join('');
+    return `sha256:${hex}`;
+}
+
 // Constants
 export const ALLOWED_MIME_TYPES = [
     'image/jpeg',
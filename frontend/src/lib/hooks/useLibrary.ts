@@ -33,6 +33,7 @@ function parseLibraryItem(item: LibraryResponse['items'][0]): Item {
         updatedAt: new Date(item.createdAt), // Not in response, use createdAt
         confirmedAt: item.confirmedAt ? new Date(item.confirmedAt) : null,
         attachmentCount: item.attachmentCount,
+        rawTextTruncated: item.rawTextTruncated,
     };
 }
 
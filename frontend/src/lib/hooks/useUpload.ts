@@ -2,6 +2,7 @@
  * useUpload hook for file upload workflow.
  * 
  * Handles: initiate → PUT to presigned URL → complete
+ * (the PUT is skipped when the server already has identical content)
  */
 
 import { useState, useCallback } from 'react';
@@ -13,6 +14,7 @@ import {
     AttachmentListItem,
     DownloadUrlResponse,
     getFileKind,
+    sha256Checksum,
     validateFile,
     UploadError,
 } from '@/lib/api/uploads';
@@ -81,6 +83,10 @@ export function useUpload(): UseUploadResult {
             // Get auth headers for API calls
             const authHeaders = await getAuthHeaders();
 
+            // Read file as ArrayBuffer to prevent browser from setting Content-Type
+            const fileBuffer = await file.arrayBuffer();
+            const checksum = await sha256Checksum(fileBuffer);
+
             // Step 1: Initiate upload
             const initResponse = await fetch(`${API_BASE_URL}/api/v1/uploads/initiate`, {
                 method: 'POST',
@@ -93,6 +99,7 @@ export function useUpload(): UseUploadResult {
                     mimeType: file.type,
                     sizeBytes: file.size,
                     kind: getFileKind(file.type),
+                    checksum,
                 }),
             });
 
@@ -112,28 +119,28 @@ export function useUpload(): UseUploadResult {
                 uploadId: initData.uploadId,
             });
 
-            // Step 2: PUT file to presigned URL
-            // Read file as ArrayBuffer to prevent browser from setting Content-Type
-            const fileBuffer = await file.arrayBuffer();
-
-            // Create headers explicitly to ensure they match what was signed
-            const putHeaders = new Headers();
-            Object.entries(initData.headersToInclude).forEach(([key, value]) => {
-                putHeaders.set(key, value);
-            });
-
-            const putResponse = await fetch(initData.presignedPutUrl, {
-                method: 'PUT',
-                headers: putHeaders,
-                body: fileBuffer,
-                mode: 'cors',
-            });
-
-            if (!putResponse.ok) {
-                throw new UploadError('PUT_FAILED', 'Failed to upload file to storage');
+            // Step 2: PUT file to presigned URL (skipped when already stored)
+            let etag: string | null = null;
+            if (initData.presignedPutUrl) {
+                // Create headers explicitly to ensure they match what was signed
+                const putHeaders = new Headers();
+                Object.entries(initData.headersToInclude).forEach(([key, value]) => {
+                    putHeaders.set(key, value);
+                });
+
+                const putResponse = await fetch(initData.presignedPutUrl, {
+                    method: 'PUT',
+                    headers: putHeaders,
+                    body: fileBuffer,
+                    mode: 'cors',
+                });
+
+                if (!putResponse.ok) {
+                    throw new UploadError('PUT_FAILED', 'Failed to upload file to storage');
+                }
+
+                etag = putResponse.headers.get('ETag');
             }
-
-            const etag = putResponse.headers.get('ETag');
             updateUpload(file, { status: 'completing', progress: 80 });
 
             // Step 3: Complete upload
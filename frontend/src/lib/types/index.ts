@@ -57,6 +57,7 @@ export interface Item {
     updatedAt: Date;
     confirmedAt: Date | null;
     attachmentCount?: number;  // From list endpoints
+    rawTextTruncated?: boolean;  // From library list (rawText is a preview)
     attachments?: AttachmentInfo[];  // From detail endpoint
 }
 